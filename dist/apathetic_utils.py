@@ -0,0 +1,11582 @@
+#!/usr/bin/env python3
+"""
+apathetic_utils — When stdlib is almost enough.
+This stitched version is auto-generated from modular sources.
+Version: 0.5.2
+Commit: unknown (local build)
+Built: 2026-10-18 21:39:05 UTC
+"""
+# apathetic_utils — When stdlib is almost enough.
+# ============LICENSE=============
+# License: MIT-a-NOAI
+# Full text: https://github.com/apathetic-tools/python-utils/blob/main/LICENSE
+# ================================
+# Version: 0.5.2
+# Commit: unknown (local build)
+# Build Date: 2026-10-18 21:39:05 UTC
+# Repo: https://github.com/apathetic-tools/python-utils
+# Build Tool: serger — 0.5.2 — unknown (local build) — 2026-10-18 21:39:05 UTC
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import hashlib
+import importlib
+import importlib.machinery
+import importlib.util
+import inspect
+import itertools
+import json
+import logging
+import marshal
+import os
+import pickle
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from fnmatch import translate
+from functools import partial
+from io import StringIO
+from itertools import zip_longest
+from pathlib import Path
+from types import FrameType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    TextIO,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from types import CodeType, ModuleType
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pytest
+from collections.abc import Iterator
+from concurrent.futures import Future
+from types import UnionType
+from typing import (
+    Literal,
+    NamedTuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from typing_extensions import NotRequired
+
+
+__version__ = "0.5.2"
+__commit__ = "unknown (local build)"
+__build_date__ = "2026-10-18 21:39:05 UTC"
+__STITCHED__ = True
+__STITCH_SOURCE__ = "serger"
+__package__ = "apathetic_utils"
+
+
+# === apathetic_logging.constants ===
+# src/apathetic_logging/constants.py
+"""Constants for Apathetic Logging."""
+
+
+class ApatheticLogging_Internal_Constants:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Constants for apathetic logging functionality.
+
+    This class contains all constant values used by apathetic_logging.
+    It's kept separate for organizational purposes.
+    """
+
+    DEFAULT_APATHETIC_LOG_LEVEL: str = "detail"
+    """Default log level when no other source is found."""
+
+    DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS: ClassVar[list[str]] = ["LOG_LEVEL"]
+    """Default environment variable names to check for log level."""
+
+    INHERIT_LEVEL: int = logging.NOTSET
+    """INHERIT level (0) - logger inherits level from parent.
+
+    This is the preferred constant name. Use INHERIT_LEVEL in new code.
+    Equivalent to stdlib logging.NOTSET.
+    """
+
+    NOTSET_LEVEL: int = INHERIT_LEVEL
+    """NOTSET level (0) - logger inherits level from parent.
+
+    Alias for INHERIT_LEVEL, kept for compatibility with stdlib
+    logging.NOTSET terminology. Use INHERIT_LEVEL in new code for clarity.
+    """
+
+    ROOT_ALLOW_ALL_LEVEL: int = logging.NOTSET
+    """Root logger accepts all messages level (0).
+
+    When the root logger is set to this level, it accepts all messages
+    without filtering, regardless of severity. This is stdlib logging behavior:
+    a logger set to NOTSET (0) processes all messages (unlike child loggers
+    which inherit from parent when NOTSET).
+
+    Note: Use ROOT_ALLOW_ALL_LEVEL when explicitly setting root to accept
+    all messages for clarity. Equivalent to logging.NOTSET.
+    """
+
+    # levels must be careful not to equal 0 to avoid INHERIT_LEVEL (i.e. NOTSET)
+    TEST_LEVEL: int = logging.DEBUG - 8
+    """Most verbose level, bypasses capture."""
+
+    TRACE_LEVEL: int = logging.DEBUG - 5
+    """More verbose than DEBUG."""
+
+    DETAIL_LEVEL: int = logging.INFO - 5
+    """More detailed than INFO."""
+
+    BRIEF_LEVEL: int = logging.INFO + 5
+    """Less detailed than INFO."""
+
+    SILENT_LEVEL: int = logging.CRITICAL + 1
+    """Disables all logging (one above the highest builtin level)."""
+
+    # Standard library logging levels (exposed for convenience and consistency)
+    DEBUG_LEVEL: int = logging.DEBUG
+    """Standard library DEBUG level (10)."""
+
+    INFO_LEVEL: int = logging.INFO
+    """Standard library INFO level (20)."""
+
+    WARNING_LEVEL: int = logging.WARNING
+    """Standard library WARNING level (30)."""
+
+    ERROR_LEVEL: int = logging.ERROR
+    """Standard library ERROR level (40)."""
+
+    CRITICAL_LEVEL: int = logging.CRITICAL
+    """Standard library CRITICAL level (50)."""
+
+    LEVEL_ORDER: ClassVar[list[str]] = [
+        "test",  # most verbose, bypasses capture for debugging tests
+        "trace",
+        "debug",
+        "detail",
+        "info",
+        "brief",
+        "warning",
+        "error",
+        "critical",
+        "silent",  # disables all logging
+    ]
+    """Ordered list of log level names from most to least verbose."""
+
+    class ANSIColors:
+        """A selection of ANSI color code constants.
+
+        For a comprehensive reference on ANSI escape codes and color support,
+        see: https://en.wikipedia.org/wiki/ANSI_escape_code#Colors
+        """
+
+        RESET: str = "\033[0m"
+        """Reset ANSI color codes."""
+
+        CYAN: str = "\033[36m"
+        """Cyan ANSI color code."""
+
+        YELLOW: str = "\033[93m"  # or \033[33m
+        """Yellow ANSI color code."""
+
+        RED: str = "\033[91m"  # or \033[31m # or background \033[41m
+        """Red ANSI color code."""
+
+        GREEN: str = "\033[92m"  # or \033[32m
+        """Green ANSI color code."""
+
+        GRAY: str = "\033[90m"
+        """Gray ANSI color code."""
+
+    TAG_STYLES: ClassVar[dict[str, tuple[str, str]]] = {
+        "TEST": (ANSIColors.GRAY, "[TEST]"),
+        "TRACE": (ANSIColors.GRAY, "[TRACE]"),
+        "DEBUG": (ANSIColors.CYAN, "[DEBUG]"),
+        "WARNING": ("", "⚠️ "),
+        "ERROR": ("", "❌ "),
+        "CRITICAL": ("", "💥 "),
+    }
+    """Mapping of level names to (color_code, tag_text) tuples."""
+
+    TARGET_PYTHON_VERSION: tuple[int, int] | None = None
+    """Target Python version (major, minor).
+
+    If None, target version checks are disabled by default.
+    """
+
+    DEFAULT_PROPAGATE: bool = True
+    """Default propagate setting for loggers.
+
+    When True, loggers propagate messages to parent loggers, allowing
+    centralized control via root logger. Only root logger has handlers
+    to avoid duplicate messages.
+    """
+
+    DEFAULT_MANAGE_HANDLERS: bool = True
+    """Default value for manage_handlers parameter in setPropagate().
+
+    When True (default), setPropagate() automatically manages apathetic
+    handlers based on propagate setting. When False, only sets propagate
+    without managing handlers. In compat_mode, this may default to False.
+    """
+
+    ROOT_LOGGER_KEY: str = ""
+    """Key used to retrieve the root logger via logging.getLogger("").
+
+    The root logger is retrieved using an empty string as the logger name.
+    """
+
+    ROOT_LOGGER_NAME: str = "root"
+    """Name attribute of the root logger instance.
+
+    Note: logging.getLogger("") returns the root logger, but its .name
+    attribute is "root" (not ""). This constant represents the actual
+    name attribute value of the root logger instance.
+    """
+
+    DEFAULT_REPLACE_ROOT_LOGGER: bool = True
+    """Default value for whether to replace root logger if it's not the correct type.
+
+    When True (default), extendLoggingModule() will replace the root logger
+    if it's not an instance of the apathetic logger class, ensuring the root
+    logger has apathetic logger methods like manageHandlers(), trace(), etc.
+    When False, the root logger will not be replaced, allowing applications
+    to use their own custom logger class for the root logger.
+    """
+
+    DEFAULT_PORT_HANDLERS: bool = True
+    """Default value for whether to port handlers when replacing a logger.
+
+    When True (default), handlers from the old logger are ported to the new logger,
+    preserving existing configuration. When False, the new apathetic logger manages
+    its own handlers via manageHandlers() (may conflict with ported handlers).
+    """
+
+    DEFAULT_PORT_LEVEL: bool = True
+    """Default value for whether to port level when replacing a logger.
+
+    When True (default), the log level is ported from the old logger to the new
+    logger, preserving existing configuration. When False, the new logger uses
+    apathetic defaults (determineLogLevel() for root logger, INHERIT_LEVEL for
+    leaf loggers). Note: User-provided level parameters in getLogger/getLoggerOfType
+    take precedence over ported level.
+    """
+
+
+# === apathetic_logging.dual_stream_handler ===
+# src/apathetic_logging/dual_stream_handler.py
+"""DualStreamHandler class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.Handler documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the DualStreamHandler nested class.
+
+    This class contains the DualStreamHandler implementation as a nested class.
+    When mixed into apathetic_logging, it provides apathetic_logging.DualStreamHandler.
+    """
+
+    class DualStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+        """Send info to stdout, everything else to stderr.
+
+        INFO, BRIEF, and DETAIL go to stdout (normal program output).
+        TRACE, DEBUG, WARNING, ERROR, and CRITICAL go to stderr
+        (diagnostic/error output).
+        When logger level is TEST, TEST/TRACE/DEBUG messages bypass capture
+        by writing to sys.__stderr__ instead of sys.stderr. This allows
+        debugging tests without breaking output assertions while still being
+        capturable by subprocess.run(capture_output=True).
+        WARNING, ERROR, and CRITICAL always use normal stderr, even in TEST mode.
+        """
+
+        enable_color: bool = False
+        """Enable ANSI color output for log messages."""
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            """Initialize the dual stream handler. super().__init__() to StreamHandler.
+
+            Args:
+                *args: Additional positional arguments (for future-proofing)
+                **kwargs: Additional keyword arguments (for future-proofing)
+            """
+            # default to stdout, overridden per record in emit()
+            super().__init__(*args, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+
+        def emit(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> None:
+            """Routes based on log level and handles colorization.
+
+            Features:
+            - Routes messages to stdout or stderr based on log level:
+              - DETAIL, INFO, and BRIEF → stdout (normal program output)
+              - TRACE, DEBUG, WARNING, ERROR, and CRITICAL → stderr
+                (diagnostic/error output)
+            - In TEST mode, TEST/TRACE/DEBUG messages bypass pytest capture
+              by writing to sys.__stderr__ instead of sys.stderr
+            - Sets enable_color attribute on record for TagFormatter integration
+
+            Args:
+                record: The LogRecord to emit
+                *args: Additional positional arguments (for future-proofing)
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            logging.Handler.emit() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
+            """
+            # Import here to avoid circular dependency
+
+            _constants = ApatheticLogging_Internal_Constants
+            level = record.levelno
+
+            # Check if logger is in TEST mode (bypass capture for verbose levels)
+            logger_name = record.name
+            # from .get_logger import (
+            #     ApatheticLogging_Internal_GetLogger,
+            # )
+
+            # logger_instance = ApatheticLogging_Internal_GetLogger.getLogger(
+            #     logger_name, extend=False
+            # )
+            # can't use internal getLogger() here
+            #   because then it will call extendLoggingModule again
+            logger_instance = logging.getLogger(logger_name)
+
+            # Use duck typing to check if this is our Logger class
+            # (has test() method) to avoid circular dependency
+            has_test_method = hasattr(logger_instance, "test") and callable(
+                getattr(logger_instance, "test", None)
+            )
+            # Use effective level (not explicit level) to detect TEST mode,
+            # so child loggers that inherit TEST level from parent are correctly
+            # detected
+            is_test_mode = has_test_method and logger_instance.getEffectiveLevel() == (
+                _constants.TEST_LEVEL
+            )
+
+            # Determine target stream
+            if level >= logging.WARNING:
+                # WARNING, ERROR, CRITICAL → stderr (always, even in TEST mode)
+                # This ensures they still break tests as expected
+                self.stream = sys.stderr
+            elif level <= logging.DEBUG:
+                # TEST, TRACE, DEBUG → stderr (normal) or __stderr__ (TEST mode bypass)
+                # Use __stderr__ so they bypass pytest capsys but are still
+                # capturable by subprocess.run(capture_output=True)
+                if is_test_mode:
+                    self.stream = sys.__stderr__
+                else:
+                    self.stream = sys.stderr
+            else:
+                # DETAIL, INFO, BRIEF → stdout (normal program output)
+                self.stream = sys.stdout
+
+            # used by TagFormatter
+            record.enable_color = getattr(self, "enable_color", False)
+
+            super().emit(record, *args, **kwargs)
+
+
+# === apathetic_logging.registry_data ===
+# src/apathetic_logging/registry_data.py
+"""Registry for configurable log level settings."""
+
+
+class ApatheticLogging_Internal_RegistryData:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides registry storage for configurable settings.
+
+    This class contains class-level attributes for storing registered configuration
+    values. When mixed into apathetic_logging, it provides centralized storage for
+    log level environment variables, default log level, logger name, target
+    Python version, and propagate setting.
+
+    Other mixins access these registries via direct class reference:
+    ``ApatheticLogging_Internal_RegistryData.registered_internal_*``
+    """
+
+    # Registry for configurable log level settings
+    # These are class-level attributes to avoid module-level namespace pollution
+    # Public but marked with _internal_ to indicate internal use by other mixins
+    registered_internal_log_level_env_vars: list[str] | None = None
+    """Environment variable names to check for log level configuration.
+
+    If None, falls back to DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS from constants.py.
+    The environment variables are checked in order, and the first non-empty value
+    found is used. Set via registerLogLevelEnvVars() or register_log_level_env_vars().
+    """
+    registered_internal_default_log_level: str | None = None
+    """Default log level to use when no other source is found.
+
+    If None, falls back to DEFAULT_APATHETIC_LOG_LEVEL from constants.py.
+    Used when no environment variable is set and no root log level is provided.
+    Set via registerDefaultLogLevel() or register_default_log_level().
+    """
+    registered_internal_logger_name: str | None = None
+    """Registered logger name to use for logger name inference.
+
+    If None, logger names are inferred from the calling module's __package__
+    attribute. When set, this value is returned by getDefaultLoggerName() instead
+    of inferring from the call stack. Set via registerLogger() or register_logger().
+    """
+    registered_internal_target_python_version: tuple[int, int] | None = None
+    """Target Python version (major, minor) for compatibility checking.
+
+    If None, falls back to TARGET_PYTHON_VERSION from constants.py.
+    Used to validate function calls against target version, not just runtime version.
+    """
+    registered_internal_propagate: bool | None = None
+    """Propagate setting for loggers.
+
+    If None, falls back to DEFAULT_PROPAGATE from constants.py.
+    When True, loggers propagate messages to parent loggers, allowing
+    centralized control via root logger.
+    """
+    registered_internal_compatibility_mode: bool | None = None
+    """Compatibility mode setting for stdlib drop-in replacement.
+
+    If None, defaults to False (current improved behavior).
+    When True, restores stdlib-compatible behavior where possible
+    (e.g., getLogger(None) returns root logger).
+    Set via registerCompatibilityMode() or register_compatibility_mode().
+    """
+    registered_internal_replace_root_logger: bool | None = None
+    """Whether to replace root logger if it's not the correct type.
+
+    If None, defaults to DEFAULT_REPLACE_ROOT_LOGGER from constants.py
+    (True by default - replace root logger to ensure it's an apathetic logger).
+    When False, extendLoggingModule() will not replace the root logger, allowing
+    applications to use their own custom logger class for the root logger.
+    Set via registerReplaceRootLogger() or register_replace_root_logger().
+    """
+    registered_internal_port_handlers: bool | None = None
+    """Whether to port handlers when replacing a logger.
+
+    If None, defaults to DEFAULT_PORT_HANDLERS from constants.py
+    (True by default - port handlers to preserve existing configuration).
+    When False, new logger manages its own handlers via manageHandlers().
+    Set via registerPortHandlers() or register_port_handlers().
+    """
+    registered_internal_port_level: bool | None = None
+    """Whether to port level when replacing a logger.
+
+    If None, defaults to DEFAULT_PORT_LEVEL from constants.py
+    (True by default - port level to preserve existing configuration).
+    When False, the new logger uses apathetic defaults (determineLogLevel()
+    for root, INHERIT_LEVEL for leaf loggers). Note: User-provided level
+    parameters in getLogger/getLoggerOfType take precedence over ported level.
+    Set via registerPortLevel() or register_port_level().
+    """
+
+
+# === apathetic_logging.logging_utils ===
+# src/apathetic_logging/logging_utils.py
+"""Logging utilities for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides helper functions for the standard logging module.
+
+    This class contains utility functions that operate directly on or replace
+    standard library `logging.*` utilities and functions. These helpers extend
+    or wrap the built-in logging module functionality to provide enhanced
+    capabilities or safer alternatives.
+
+    When mixed into apathetic_logging, it provides utility functions that
+    interact with Python's standard logging module.
+    """
+
+    _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
+
+    @staticmethod
+    def _getCompatibilityMode() -> bool:
+        """Get the compatibility mode setting from registry.
+
+        Returns the registered compatibility mode setting, or False (improved
+        behavior) if not registered. This is an internal helper to avoid
+        circular imports (registry.py imports from logging_utils.py).
+
+        Returns:
+            Compatibility mode setting (True or False).
+            Defaults to False if not registered.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        return (
+            _registry_data.registered_internal_compatibility_mode
+            if _registry_data.registered_internal_compatibility_mode is not None
+            else False
+        )
+
+    @staticmethod
+    def getLevelName(
+        level: int | str, *args: Any, strict: bool = False, **kwargs: Any
+    ) -> str | int:
+        """Return the textual or numeric representation of a logging level.
+
+        Behavior depends on compatibility mode (set via `registerCompatibilityMode()`):
+
+        - Value-add: Uppercases string inputs before processing
+
+        **Compatibility mode disabled (`compat_mode=False`, default):**
+        - Accepts both integer and string input
+        - For string input: validates level exists and returns canonical
+          level name string
+        - For integer input: returns level name as string (never returns `int`)
+        - Optional strict mode to raise `ValueError` for unknown integer levels
+
+        For string→int conversion, use `getLevelNumber()` instead.
+
+        **Compatibility mode enabled (`compat_mode=True`):**
+        - Behaves like stdlib `logging.getLevelName()` (bidirectional)
+        - Returns `str` for integer input, `int` for string input (known levels)
+        - Returns `"Level {level}"` string for unknown levels
+
+        Args:
+            level: Log level as integer or string name
+            *args: Additional positional arguments (for future-proofing)
+            strict: If True, raise ValueError for unknown levels. If False (default),
+                returns "Level {level}" format for unknown integer levels (matching
+                stdlib behavior). Only used when compatibility mode is disabled and
+                level is an integer.
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            - Compatibility mode enabled: `str | int` (bidirectional like stdlib)
+            - Compatibility mode disabled: `str` (always string; string input
+              is validated and returns canonical name, int input is converted
+              to name)
+
+        Raises:
+            ValueError: If string level cannot be resolved to a known level
+                (non-compat mode), or if strict=True and level is an integer
+                that cannot be resolved to a known level name
+
+        Example:
+            >>> # Compatibility mode enabled (stdlib-like behavior):
+            >>> from apathetic_logging import registerCompatibilityMode
+            >>> registerCompatibilityMode(compat_mode=True)
+            >>> getLevelName(10)  # int input
+            "DEBUG"
+            >>> getLevelName("DEBUG")  # string input
+            10
+            >>> getLevelName("debug")  # case-insensitive, uppercased
+            10
+
+            >>> # Compatibility mode disabled (improved behavior):
+            >>> registerCompatibilityMode(compat_mode=False)
+            >>> getLevelName(10)
+            "DEBUG"
+            >>> getLevelName("DEBUG")  # Validates and returns canonical name
+            "DEBUG"
+            >>> getLevelName("debug")  # Validates and returns canonical name
+            "DEBUG"
+            >>> getLevelName("UNKNOWN")  # Unknown string raises ValueError
+            ValueError: Unknown log level: 'UNKNOWN'
+
+        See Also:
+            getLevelNumber() - Convert string to int (when compat mode disabled)
+            registerCompatibilityMode() - Enable/disable compatibility mode
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLevelName
+        """
+        # Check compatibility mode from registry
+        compat_mode = ApatheticLogging_Internal_LoggingUtils._getCompatibilityMode()
+
+        # Use unidirectional functions to avoid duplication
+        if compat_mode and isinstance(level, str):
+            # Compatibility mode with string input → return int (like stdlib)
+            return ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+
+        # All other cases: return string (compat mode with int, or non-compat mode)
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(
+            level, *args, strict=strict, **kwargs
+        )
+
+    @staticmethod
+    def getLevelNumber(level: str | int) -> int:
+        """Convert a log level name to its numeric value.
+
+        Recommended way to convert string level names to integers. This function
+        explicitly performs string->int conversion, unlike `getLevelName()` which
+        has bidirectional behavior for backward compatibility.
+
+        Handles all levels registered via logging.addLevelName() (including
+        standard library levels, custom apathetic levels, and user-registered levels).
+
+        Args:
+            level: Log level as string name (case-insensitive) or integer
+
+        Returns:
+            Integer level value
+
+        Raises:
+            ValueError: If level cannot be resolved to a known level
+
+        Example:
+            >>> getLevelNumber("DEBUG")
+            10
+            >>> getLevelNumber("TRACE")
+            5
+            >>> getLevelNumber(20)
+            20
+            >>> getLevelNumber("UNKNOWN")
+            ValueError: Unknown log level: 'UNKNOWN'
+
+        See Also:
+            getLevelName() - Convert int to string (intended use)
+        """
+        if isinstance(level, int):
+            return level
+
+        level_str = level.upper()
+
+        # Use getattr() to find level constants registered via logging.addLevelName():
+        # - Standard library levels (DEBUG, INFO, etc.) - registered by default
+        # - Custom apathetic levels (TEST, TRACE, etc.)
+        #   registered via extendLoggingModule()
+        # - User-registered levels via our addLevelName() method
+        #   (but not stdlib's logging.addLevelName() which doesn't set attribute)
+        # - User-registered levels via setattr(logging, level_str, value)
+        resolved = getattr(logging, level_str, None)
+        if isinstance(resolved, int):
+            return resolved
+
+        # Unknown level: always raise
+        msg = f"Unknown log level: {level_str!r}"
+        raise ValueError(msg)
+
+    @staticmethod
+    def getLevelNameStr(
+        level: int | str, *args: Any, strict: bool = False, **kwargs: Any
+    ) -> str:
+        """Convert a log level to its string name representation.
+
+        Unidirectional function that always returns a string. This is the recommended
+        way to convert log levels to strings when you want guaranteed string output
+        without compatibility mode behavior.
+
+        Unlike `getLevelName()` which has compatibility mode and bidirectional
+        behavior, this function always returns a string:
+        - Integer input: converts to level name string (returns "Level {level}"
+          for unknown levels unless strict=True)
+        - String input: validates level exists, then returns uppercased string
+
+        Handles all levels registered via logging.addLevelName() (including
+        standard library levels, custom apathetic levels, and user-registered levels).
+
+        Args:
+            level: Log level as integer or string name (case-insensitive)
+            *args: Additional positional arguments (for future-proofing)
+            strict: If True, raise ValueError for unknown integer levels.
+                If False (default), returns "Level {level}" format for unknown
+                integer levels (matching stdlib behavior).
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            Level name as uppercase string
+
+        Raises:
+            ValueError: If string level cannot be resolved to a known level,
+                or if strict=True and integer level cannot be resolved to a
+                known level
+
+        Example:
+            >>> getLevelNameStr(10)
+            "DEBUG"
+            >>> getLevelNameStr(5)
+            "TRACE"
+            >>> getLevelNameStr("DEBUG")
+            "DEBUG"
+            >>> getLevelNameStr("debug")
+            "DEBUG"
+            >>> getLevelNameStr(999)  # Unknown integer, strict=False (default)
+            "Level 999"
+            >>> getLevelNameStr(999, strict=True)  # Unknown integer, strict=True
+            ValueError: Unknown log level: 999
+            >>> getLevelNameStr("UNKNOWN")
+            ValueError: Unknown log level: 'UNKNOWN'
+
+        See Also:
+            getLevelNumber() - Convert string to int (complementary function)
+            getLevelName() - Bidirectional conversion with compatibility mode
+        """
+        # If string input, validate it exists and return canonical name
+        if isinstance(level, str):
+            # Validate level exists (raises ValueError if not)
+            ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+            return level.upper()
+
+        # Integer input: convert to level name string
+        result = logging.getLevelName(level, *args, **kwargs)
+        # logging.getLevelName always returns str for int input
+
+        # If input was int and result is "Level {level}" format and strict is on, raise
+        if result.startswith("Level ") and strict:
+            msg = f"Unknown log level: {level}"
+            raise ValueError(msg)
+
+        # level name or (strict=False) "Level {int}"
+        return result
+
+    @staticmethod
+    def hasLogger(logger_name: str) -> bool:
+        """Check if a logger exists in the logging manager's registry.
+
+        Args:
+            logger_name: The name of the logger to check.
+
+        Returns:
+            True if the logger exists in the registry, False otherwise.
+        """
+        return logger_name in logging.Logger.manager.loggerDict
+
+    @staticmethod
+    def isRootLoggerInstantiated() -> bool:
+        """Check if the root logger has been instantiated/accessed yet.
+
+        The root logger is created lazily by Python's logging module. This function
+        checks if it has been instantiated without creating it as a side effect.
+
+        This is useful to distinguish between:
+        - Fresh root logger: Never accessed, ready to be configured with defaults
+        - Existing root logger: Already created/accessed, should preserve its state
+
+        Returns:
+            True if the root logger has been instantiated (exists in manager registry),
+            False if it's fresh and ready for configuration with defaults.
+
+        Note:
+            This function queries the **current state** of the logging registry, not
+            user intent. It returns True if ANY code (user, third-party library, or
+            stdlib) has accessed the root logger. To check if the USER explicitly
+            configured the root logger via ensureRootLogger(), use the module-level
+            flag _root_logger_user_configured instead.
+
+            Calling logging.getLogger("") after this returns False will instantiate
+            the root logger, so timing matters. This check should be done before any
+            code that accesses the root logger.
+
+        Example:
+            >>> if not isRootLoggerInstantiated():
+            ...     # Root logger is fresh, apply our defaults
+            ...     root.setLevel(determineLogLevel())
+            ... else:
+            ...     # Root logger already exists, port its state
+            ...     portLoggerState(old_root, new_root, port_level=True)
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        return ApatheticLogging_Internal_LoggingUtils.hasLogger(
+            _constants.ROOT_LOGGER_KEY
+        )
+
+    @staticmethod
+    def reconnectChildLoggers(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Reconnect child loggers from old logger to new logger.
+
+        When a logger is replaced, child loggers maintain a direct reference
+        to their parent. This function updates all child loggers to point to
+        the new logger instance.
+
+        Args:
+            old_logger: The logger being replaced.
+            new_logger: The new logger that should become the parent.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        for logger_name, logger in logging.Logger.manager.loggerDict.items():
+            # Skip if not a Logger instance
+            if not isinstance(logger, logging.Logger):
+                continue
+
+            # Skip the new logger itself
+            if logger is new_logger:
+                continue
+
+            # For root logger replacement, skip if logger name is root logger
+            # key/name (shouldn't happen, but be safe)
+            old_logger_name = old_logger.name
+            root_names = {_constants.ROOT_LOGGER_KEY, _constants.ROOT_LOGGER_NAME}
+            if old_logger_name in root_names and logger_name in root_names:
+                continue
+
+            # Check if this logger's parent is the old logger
+            # For root logger, any logger with a name is a child
+            # For named loggers, children have names starting with parent_name + "."
+            is_child = False
+            if old_logger_name in root_names:
+                # Root logger - any logger with a name is a child
+                is_child = logger_name not in root_names
+            else:
+                # Named logger - child names start with parent_name + "."
+                is_child = logger_name.startswith(old_logger_name + ".")
+
+            if is_child and logger.parent is old_logger:
+                logger.parent = new_logger
+
+    @staticmethod
+    def _portPropagateAndDisabled(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Port propagate and disabled state from old logger to new logger."""
+        # Use setPropagate() if available to set the _propagate_explicit flag
+        # (prevents _applyPropagateSetting() from overriding ported value)
+        if hasattr(new_logger, "setPropagate"):
+            new_logger.setPropagate(old_logger.propagate)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        else:
+            new_logger.propagate = old_logger.propagate
+        new_logger.disabled = old_logger.disabled
+
+    @staticmethod
+    def _portHandlers(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Port handlers from old logger to new logger."""
+        old_handlers = list(old_logger.handlers)  # Copy list
+        for handler in old_handlers:
+            new_logger.addHandler(handler)
+
+    @staticmethod
+    def _portLevel(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Port level from old logger to new logger."""
+        old_level = old_logger.level
+        # Validate level if it's an apathetic logger (has validateLevel)
+        if hasattr(new_logger, "validateLevel"):
+            try:
+                new_logger.validateLevel(old_level)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+            except ValueError:
+                # Invalid level - fall back to apathetic default
+                return
+
+        # Set the level - NOTSET/INHERIT_LEVEL (0) is always allowed
+        if hasattr(new_logger, "setLevel"):
+            new_logger.setLevel(old_level)
+        else:
+            new_logger.level = old_level
+
+    @staticmethod
+    def _setApatheticDefaults(
+        new_logger: logging.Logger,
+    ) -> None:
+        """Set apathetic defaults for logger level."""
+        _constants = ApatheticLogging_Internal_Constants
+        root_names = {_constants.ROOT_LOGGER_KEY, _constants.ROOT_LOGGER_NAME}
+        is_root = new_logger.name in root_names
+        if is_root:
+            # Root logger: use determineLogLevel() if available
+            if hasattr(new_logger, "determineLogLevel"):
+                level_name = new_logger.determineLogLevel()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+                new_logger.setLevel(level_name)  # pyright: ignore[reportUnknownArgumentType]
+            else:
+                # Fallback: use INHERIT_LEVEL (though root has no parent)
+                new_logger.setLevel(_constants.INHERIT_LEVEL)
+        # Leaf logger: use INHERIT_LEVEL to inherit from parent
+        elif hasattr(new_logger, "setLevel"):
+            new_logger.setLevel(_constants.INHERIT_LEVEL)
+        else:
+            new_logger.level = _constants.INHERIT_LEVEL
+
+    @staticmethod
+    def portLoggerState(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+        *,
+        port_handlers: bool | None = None,
+        port_level: bool | None = None,
+    ) -> None:
+        """Port state from old logger to new logger.
+
+        Ports propagate and disabled state always. Optionally ports handlers
+        and level based on parameters. When not porting level, uses apathetic
+        defaults: determineLogLevel() for root logger, INHERIT_LEVEL for leaf loggers.
+
+        After porting (or not porting) handlers, calls manageHandlers() if the new
+        logger supports it, to ensure apathetic handlers are set up appropriately
+        based on propagate setting. This ensures root logger always has a handler,
+        and child loggers with propagate=False get handlers as needed. manageHandlers()
+        only manages DualStreamHandler instances, so it won't interfere with ported
+        user handlers.
+
+        Finally, reconnects child loggers from the old logger to the new logger,
+        ensuring child loggers point to the new logger instance after replacement.
+
+        Args:
+            old_logger: The logger being replaced.
+            new_logger: The new logger to port state to.
+            port_handlers: Whether to port handlers. If None, checks registry setting
+                or defaults to True. When True, handlers from old logger are ported.
+                When False, new logger manages its own handlers via manageHandlers().
+                In both cases, manageHandlers() is called to ensure apathetic handlers
+                are set up if needed.
+            port_level: Whether to port level. If None, checks registry setting or
+                defaults to True. When True, level from old logger is ported.
+                When False, uses apathetic defaults (determineLogLevel() for root,
+                INHERIT_LEVEL for leaf loggers). Note: User-provided level parameters
+                in getLogger/getLoggerOfType take precedence over ported level.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        # Always port propagate and disabled
+        ApatheticLogging_Internal_LoggingUtils._portPropagateAndDisabled(
+            old_logger, new_logger
+        )
+
+        # Resolve port_handlers parameter
+        if port_handlers is None:
+            port_handlers = (
+                _registry_data.registered_internal_port_handlers
+                if _registry_data.registered_internal_port_handlers is not None
+                else _constants.DEFAULT_PORT_HANDLERS
+            )
+
+        # Port handlers if requested
+        if port_handlers:
+            ApatheticLogging_Internal_LoggingUtils._portHandlers(old_logger, new_logger)
+
+        # After porting (or not porting) handlers, ensure apathetic handlers are set up
+        # if the logger supports manageHandlers(). This ensures root logger always has
+        # a handler, and child loggers with propagate=False get handlers as needed.
+        # manageHandlers() only manages DualStreamHandler instances, so it won't
+        # interfere with ported user handlers.
+        if hasattr(new_logger, "manageHandlers"):
+            new_logger.manageHandlers()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+        # Resolve port_level parameter
+        if port_level is None:
+            port_level = (
+                _registry_data.registered_internal_port_level
+                if _registry_data.registered_internal_port_level is not None
+                else _constants.DEFAULT_PORT_LEVEL
+            )
+
+        # Port level if requested, otherwise use apathetic defaults
+        if port_level:
+            ApatheticLogging_Internal_LoggingUtils._portLevel(old_logger, new_logger)
+        else:
+            ApatheticLogging_Internal_LoggingUtils._setApatheticDefaults(new_logger)
+
+        # Reconnect child loggers from old logger to new logger
+        # This ensures child loggers point to the new logger instance after replacement
+        ApatheticLogging_Internal_LoggingUtils.reconnectChildLoggers(
+            old_logger, new_logger
+        )
+
+    @staticmethod
+    def removeLogger(logger_name: str) -> None:
+        """Remove a logger from the logging manager's registry.
+
+        Args:
+            logger_name: The name of the logger to remove.
+        """
+        logging.Logger.manager.loggerDict.pop(logger_name, None)
+
+    @staticmethod
+    def _extractTopLevelPackage(package: str | None) -> str | None:
+        """Extract top-level package name from package string.
+
+        Args:
+            package: Package string (e.g., "myapp.submodule") or None
+
+        Returns:
+            Top-level package name (e.g., "myapp") or None if package is None
+        """
+        if package is None:
+            return None
+        if "." in package:
+            return package.split(".", 1)[0]
+        return package
+
+    @staticmethod
+    def _inferFromFrame(skip_frames: int, frame: FrameType | None) -> str | None:
+        """Infer logger name from caller's frame.
+
+        Args:
+            skip_frames: Number of frames to skip to get to actual caller
+            frame: Frame to start from, or None
+
+        Returns:
+            Inferred logger name or None if cannot be inferred
+        """
+        if frame is None:
+            return None
+        try:
+            # Skip the specified number of frames to get to the actual caller
+            caller_frame = frame.f_back
+            for _ in range(skip_frames):
+                if caller_frame is None:
+                    break
+                caller_frame = caller_frame.f_back
+            if caller_frame is None:
+                return None
+            caller_package = caller_frame.f_globals.get("__package__")
+            return ApatheticLogging_Internal_LoggingUtils._extractTopLevelPackage(
+                caller_package
+            )
+        finally:
+            del frame
+
+    @staticmethod
+    def getDefaultLoggerName(
+        logger_name: str | None = None,
+        *,
+        check_registry: bool = True,
+        skip_frames: int = 1,
+        raise_on_error: bool = False,
+        infer: bool = True,
+        register: bool = False,
+    ) -> str | None:
+        """Get default logger name with optional inference from caller's frame.
+
+        This function handles the common pattern of:
+        1. Using explicit name if provided
+        2. Checking registry if requested
+        3. Inferring from caller's frame if needed (when infer=True)
+        4. Storing inferred name in registry (when register=True)
+        5. Returning None or raising error if still unresolved
+
+        Args:
+            logger_name: Explicit logger name, or None to infer.
+            check_registry: If True, check registry before inferring. Use False
+                when the caller should actively determine the name from current
+                context (e.g., registerLogger() which should re-infer even
+                if a name is already registered). Use True when the caller should
+                use a previously registered name if available (e.g., getLogger()
+                which should use the registered name).
+            skip_frames: Number of frames to skip from this function to get to
+                the actual caller. Default is 1 (skips this function's frame).
+            raise_on_error: If True, raise RuntimeError if logger name cannot be
+                resolved. If False (default), return None instead. Use True when
+                a logger name is required (e.g., when creating a logger).
+            infer: If True (default), attempt to infer logger name from caller's
+                frame when not found in registry. If False, skip inference and
+                return None if not found in registry.
+            register: If True, store inferred name in registry. If False (default),
+                do not modify registry. Note: Explicit names are never stored regardless
+                of this parameter.
+
+        Returns:
+            Resolved logger name, or None if cannot be resolved and
+            raise_on_error=False.
+
+        Raises:
+            RuntimeError: If logger name cannot be resolved and raise_on_error=True.
+        """
+        # Import locally to avoid circular import
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        # If explicit name provided, return it (never store explicit names)
+        # Note: Empty string ("") is a special case - it represents the root logger
+        # and is returned as-is to match standard library behavior.
+        if logger_name is not None:
+            return logger_name
+
+        # Check registry if requested
+        if check_registry:
+            registered_name = _registry_data.registered_internal_logger_name
+            if registered_name is not None:
+                return registered_name
+
+        # Try to infer from caller's frame if inference is enabled
+        if not infer:
+            # Inference disabled - return None or raise error
+            if raise_on_error:
+                error_msg = (
+                    "Cannot resolve logger name: not in registry and inference "
+                    "is disabled. Please call registerLogger() with an "
+                    "explicit logger name or enable inference."
+                )
+                raise RuntimeError(error_msg)
+            return None
+
+        # Get current frame (this function's frame) and skip to caller
+        frame = inspect.currentframe()
+        inferred_name = ApatheticLogging_Internal_LoggingUtils._inferFromFrame(
+            skip_frames, frame
+        )
+
+        # Store inferred name in registry if requested
+        if inferred_name is not None and register:
+            _registry_data.registered_internal_logger_name = inferred_name
+
+        # Return inferred name or handle error
+        if inferred_name is not None:
+            return inferred_name
+
+        # Handle error case
+        if raise_on_error:
+            error_msg = (
+                "Cannot auto-infer logger name: __package__ is not set in the "
+                "calling module. Please call registerLogger() with an "
+                "explicit logger name."
+            )
+            raise RuntimeError(error_msg)
+
+        return None
+
+    @staticmethod
+    def checkPythonVersionRequirement(
+        required_version: tuple[int, int],
+        function_name: str,
+    ) -> None:
+        """Check if the target or runtime Python version meets the requirement.
+
+        This method validates that a function requiring a specific Python version
+        can be called safely. It checks:
+        1. Target version (if set via registerTargetPythonVersion), otherwise
+           falls back to TARGET_PYTHON_VERSION from constants
+        2. Runtime version (as a safety net to catch actual runtime issues)
+
+        This allows developers to catch version incompatibilities during development
+        even when running on a newer Python version than their target.
+
+        Args:
+            required_version: Target Python version required (major, minor) tuple
+            function_name: Name of the function being checked (for error messages)
+
+        Raises:
+            NotImplementedError: If target version or runtime version doesn't meet
+                the requirement. Error message includes guidance on raising target
+                version if applicable.
+
+        Example:
+            >>> checkPythonVersionRequirement((3, 11), "get_level_names_mapping")
+            # Raises if target version < 3.11 or runtime version < 3.11
+        """
+        # Import locally to avoid circular imports
+
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        # Determine effective target version
+        # If target version is set, use it; otherwise fall back to TARGET_PYTHON_VERSION
+        target_version = _registry_data.registered_internal_target_python_version
+        if target_version is None:
+            target_version = _constants.TARGET_PYTHON_VERSION
+
+        # Check target version first (primary check)
+        # Skip check if target_version is None (checks disabled)
+        if target_version is not None and target_version < required_version:
+            req_major, req_minor = required_version
+            tgt_major, tgt_minor = target_version
+            msg = (
+                f"{function_name} requires Python {req_major}.{req_minor}+, "
+                f"but target version is {tgt_major}.{tgt_minor}. "
+                f"To use this function, call "
+                f"registerTargetPythonVersion(({req_major}, {req_minor})) "
+                f"or raise your target version to at least {req_major}.{req_minor}."
+            )
+            raise NotImplementedError(msg)
+
+        # Check runtime version as safety net
+        runtime_version = (sys.version_info.major, sys.version_info.minor)
+        if runtime_version < required_version:
+            req_major, req_minor = required_version
+            rt_major, rt_minor = runtime_version
+            msg = (
+                f"{function_name} requires Python {req_major}.{req_minor}+, "
+                f"but runtime version is {rt_major}.{rt_minor}. "
+                f"This function is not available in your Python version."
+            )
+            raise NotImplementedError(msg)
+
+
+# === apathetic_logging.logging_root ===
+# src/apathetic_logging/logging_root.py
+"""Root logger convenience API for applications using root logger as source of truth.
+
+This module provides a set of functions that operate on the root logger directly.
+This API is designed for applications that use the root logger as the single source
+of truth for log levels, with child loggers inheriting via NOTSET/INHERIT_LEVEL.
+
+By providing a complete root-logger-specific API, we prevent users from accidentally
+mixing root logger operations with child logger operations, which can lead to hard
+to trace bugs.
+"""
+
+
+class ApatheticLogging_Internal_LoggingRoot:  # noqa: N801
+    """Mixin providing root logger convenience methods.
+
+    These functions operate directly on the root logger and provide utilities
+    for applications that use root logger as the single source of truth for
+    log levels.
+
+    This prevents users from accidentally using child logger methods when they
+    meant to use root logger methods, which is a common source of hard-to-trace bugs.
+    """
+
+    @staticmethod
+    def getRootLogger() -> logging.Logger:  # May be Logger or RootLogger
+        """Return the root logger instance.
+
+        This is the primary way to access the root logger. It's more explicit
+        and discoverable than using ``logging.getLogger("")`` or
+        ``getLogger("")``.
+
+        The root logger may be either:
+        - An ``apathetic_logging.Logger`` if it was created after
+          ``extendLoggingModule()`` was called (expected/common case)
+        - A standard ``logging.RootLogger`` if it was created before
+          ``extendLoggingModule()`` was called (fallback, see ROADMAP.md)
+
+        Returns:
+            The root logger instance (either ``apathetic_logging.Logger`` or
+            ``logging.RootLogger``).
+
+        Example:
+            >>> from apathetic_logging import getRootLogger
+            >>> root = getRootLogger()
+            >>> root.setLevel("debug")
+            >>> root.info("This logs to the root logger")
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        return logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+    @staticmethod
+    def getRootLevel() -> int:
+        """Return the current explicit log level set on the root logger.
+
+        This is the level set on the root logger itself, not considering any
+        parent (the root logger has no parent). For the effective level (which
+        would be the same for root), use getEffectiveRootLevel().
+
+        Returns:
+            Integer log level value. Returns logging.NOTSET (0) if root logger
+            has not had its level explicitly set.
+
+        Example:
+            >>> getRootLevel()
+            10  # DEBUG
+            >>> getRootLevelName()
+            "DEBUG"
+
+        See Also:
+            getEffectiveRootLevel() - Returns effective level (same as explicit
+                for root)
+            getEffectiveRootLevelName() - Returns name of effective level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        return root.level
+
+    @staticmethod
+    def getRootLevelName() -> str:
+        """Return the name of the current explicit log level on the root logger.
+
+        Returns the name of the level set on the root logger itself (e.g., "DEBUG",
+        "INFO", "NOTSET"). For the name of the effective level, use
+        getEffectiveRootLevelName().
+
+        Returns:
+            Level name as uppercase string (e.g., "DEBUG", "TRACE", "NOTSET").
+
+        Raises:
+            ValueError: If the level value is unknown (should not happen with
+                standard and registered levels).
+
+        Example:
+            >>> getRootLevelName()
+            "DEBUG"
+            >>> getRootLevel()
+            10
+
+        See Also:
+            getRootLevel() - Returns numeric level value
+            getEffectiveRootLevelName() - Returns name of effective level
+        """
+        level = ApatheticLogging_Internal_LoggingRoot.getRootLevel()
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(level)
+
+    @staticmethod
+    def getEffectiveRootLevel() -> int:
+        """Return the effective log level on the root logger.
+
+        For the root logger, this is the same as the explicit level since the
+        root logger has no parent to inherit from. This method exists for API
+        completeness and symmetry with Logger.getEffectiveLevel().
+
+        Returns:
+            Integer log level value.
+
+        Example:
+            >>> getEffectiveRootLevel()
+            10  # DEBUG
+
+        See Also:
+            getRootLevel() - Returns explicit level on root
+            getEffectiveRootLevelName() - Returns name of effective level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        return root.getEffectiveLevel()
+
+    @staticmethod
+    def getEffectiveRootLevelName() -> str:
+        """Return the name of the effective log level on the root logger.
+
+        For the root logger, this is the same as the explicit level name.
+        This method exists for API completeness and symmetry with
+        Logger.getEffectiveLevelName().
+
+        Returns:
+            Level name as uppercase string (e.g., "DEBUG", "TRACE", "NOTSET").
+
+        Example:
+            >>> getEffectiveRootLevelName()
+            "DEBUG"
+
+        See Also:
+            getRootLevelName() - Returns name of explicit level
+            getEffectiveRootLevel() - Returns numeric effective level
+        """
+        level = ApatheticLogging_Internal_LoggingRoot.getEffectiveRootLevel()
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(level)
+
+    @staticmethod
+    def setRootLevel(  # noqa: PLR0912
+        level: str | int,
+        *,
+        apply_to_children: bool = True,
+        set_children_to_level: bool = True,
+        root: logging.Logger | None = None,
+    ) -> None:
+        """Set the log level on the root logger and optionally on child loggers.
+
+        This is the recommended way to set log levels in a CLI application,
+        as it ensures all loggers (including those from libraries) use the
+        same level. When propagation is enabled (default), child loggers
+        inherit from root, so setting root level affects all loggers.
+
+        Args:
+            level: The log level to set, as a string name (case-insensitive)
+                or integer value. Supports standard levels (DEBUG, INFO, etc.)
+                and custom levels (TRACE, DETAIL, BRIEF, SILENT).
+            apply_to_children: If True (default), also sets level on any child
+                loggers that are not NOTSET. This handles loggers that were
+                created before the root level was set. If False, only sets
+                level on the root logger.
+            set_children_to_level: If True (default), sets child loggers to
+                the same level as root. If False, sets child loggers to NOTSET
+                so they inherit from root. Only used when apply_to_children=True.
+            root: The logger to use as the root. If None (default), uses the
+                actual root logger (logging.getLogger(ROOT_LOGGER_KEY)).
+                Can pass any logger to work on its children instead.
+
+        Example:
+            >>> from apathetic_logging import setRootLevel
+            >>> # Set root level - all loggers inherit
+            >>> setRootLevel("debug")
+            >>> # Set root level and reset all child loggers to NOTSET
+            >>> setRootLevel("info", set_children_to_level=False)
+            >>> # Set level on a specific logger and its children
+            >>> my_logger = getLogger("myapp")
+            >>> setRootLevel("warning", root=my_logger)
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Get root logger (or use provided one)
+        # Note: logging.getLogger("") returns the root logger, but its .name is "root"
+        # We need to check for both "" and "root" as root logger names
+        if root is None:
+            root_logger = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        else:
+            root_logger = root
+
+        # Set level on root logger
+        root_logger.setLevel(level_int)
+
+        # Optionally apply to children
+        if apply_to_children:
+            root_name = root_logger.name
+            # Find all child loggers
+            # Children are loggers whose name starts with root_name + "."
+            # (or any logger if root_name is "")
+            for logger_name, logger in logging.Logger.manager.loggerDict.items():
+                # Skip if not a Logger instance
+                if not isinstance(logger, logging.Logger):
+                    continue
+
+                # Skip the root logger itself
+                if logger is root_logger:
+                    continue
+
+                # Check if this is a child of root
+                is_child = False
+                # Root logger can have name "" or "root" depending on Python version
+                root_names = {_constants.ROOT_LOGGER_KEY, _constants.ROOT_LOGGER_NAME}
+                if root_name in root_names:
+                    # Root logger - any logger with a name is a child
+                    is_child = logger_name not in {
+                        _constants.ROOT_LOGGER_KEY,
+                        _constants.ROOT_LOGGER_NAME,
+                    }
+                else:
+                    # Named root - child names start with root_name + "."
+                    is_child = logger_name.startswith(root_name + ".")
+
+                if is_child and logger.level != _constants.INHERIT_LEVEL:
+                    # This child has an explicit level set
+                    if set_children_to_level:
+                        # Set child to same level as root
+                        logger.setLevel(level_int)
+                    else:
+                        # Set child to INHERIT_LEVEL (i.e. NOTSET) so it
+                        # inherits from root
+                        logger.setLevel(_constants.INHERIT_LEVEL)
+
+    @staticmethod
+    def setRootLevelMinimum(level: str | int) -> None:
+        """Set root logger level only if more verbose than current level.
+
+        This is a convenience method that prevents downgrades from more verbose
+        to less verbose levels.
+
+        Args:
+            level: The log level to potentially set, as a string name
+                (case-insensitive) or integer value.
+
+        Example:
+            >>> setRootLevelMinimum("DEBUG")
+            >>> # Root at DEBUG
+            >>> setRootLevelMinimum("INFO")
+            >>> # Still at DEBUG (more verbose is kept)
+
+        See Also:
+            setRootLevel() - Set level unconditionally
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Get root logger
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        current_level = root.getEffectiveLevel()
+
+        # Only set if new level is more verbose (lower numeric value)
+        if level_int < current_level:
+            root.setLevel(level_int)
+
+    @staticmethod
+    @contextmanager
+    def useRootLevel(
+        level: str | int,
+        *,
+        minimum: bool = False,
+    ) -> Generator[None, None, None]:
+        """Context manager to temporarily set root logger level.
+
+        Sets the root logger to a specific level for the duration of the with block,
+        then restores the previous level. Useful for temporarily increasing verbosity
+        for debugging or testing.
+
+        Args:
+            level: The temporary log level to use, as a string name
+                (case-insensitive) or integer value.
+            minimum: If True, only applies the level if it's more verbose
+                (lower numeric value) than the current effective level. If False
+                (default), always sets the level. When minimum=True, the
+                comparison is against the effective level (which considers parent
+                inheritance, though root has no parent).
+
+        Yields:
+            None
+
+        Example:
+            >>> setRootLevel("INFO")
+            >>> with useRootLevel("DEBUG"):
+            ...     debug_logger.debug("This is logged at DEBUG")
+            >>> # Back to INFO level
+
+            >>> # Only debug if not already at DEBUG
+            >>> with useRootLevel("DEBUG", minimum=True):
+            ...     pass
+
+        See Also:
+            useRootLevelMinimum() - Convenience for useRootLevel(level, minimum=True)
+            setRootLevel() - Permanently set level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Get root logger
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        # Cast to Any to handle _last_stream_ids attribute that exists at runtime
+        root_any: Any = root
+        old_level = root.level
+
+        # Check minimum condition if requested
+        if minimum:
+            current_effective = root.getEffectiveLevel()
+            # Only set if more verbose (lower numeric value)
+            if level_int >= current_effective:
+                # Not more verbose, don't change level
+                yield
+                return
+
+        try:
+            # Set temporary level
+            root.setLevel(level_int)
+            yield
+        finally:
+            # Restore original level
+            root.setLevel(old_level)
+            # Update stream cache state to fix .plan/062 bug where stale stream IDs
+            # cause handler rebuild loops in stitched mode on sequential context
+            # manager use. We set it to the current streams (not None) to signal
+            # valid state while allowing detection of stream changes on next use.
+            root_any._last_stream_ids = (sys.stdout, sys.stderr)  # noqa: SLF001
+
+    @staticmethod
+    @contextmanager
+    def useRootLevelMinimum(level: str | int) -> Generator[None, None, None]:
+        """Context manager to temporarily set root level only if more verbose.
+
+        Convenience context manager equivalent to useRootLevel(level, minimum=True).
+        Only applies the level if it's more verbose than the current effective level.
+
+        Args:
+            level: The temporary log level to potentially use, as a string name
+                (case-insensitive) or integer value.
+
+        Yields:
+            None
+
+        Example:
+            >>> with useRootLevelMinimum("DEBUG"):
+            ...     # DEBUG level active only if not already more verbose
+            ...     pass
+
+        See Also:
+            useRootLevel() - For unconditional temporary level change
+        """
+        with ApatheticLogging_Internal_LoggingRoot.useRootLevel(level, minimum=True):
+            yield
+
+    @staticmethod
+    def isRootEnabledFor(level: str | int) -> bool:
+        """Check if root logger would process messages at the given level.
+
+        Returns True if the root logger's effective level would allow messages
+        at the given level to be processed. Useful for conditional expensive
+        operations that should only run if logging is enabled.
+
+        Args:
+            level: Log level to check, as a string name (case-insensitive)
+                or integer value.
+
+        Returns:
+            True if messages at this level would be processed, False otherwise.
+
+        Example:
+            >>> setRootLevel("INFO")
+            >>> isRootEnabledFor("DEBUG")
+            False
+            >>> isRootEnabledFor("INFO")
+            True
+            >>> isRootEnabledFor("WARNING")
+            True
+
+        See Also:
+            getRootLevel() - Get current root level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        return root.isEnabledFor(level_int)
+
+    @staticmethod
+    def logRootDynamic(
+        level: str | int,
+        msg: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Log a message to root logger with dynamically provided level.
+
+        This allows logging with a level that is determined at runtime rather
+        than compile time. Useful when the logging level comes from user input,
+        configuration, or other dynamic sources.
+
+        Args:
+            level: Log level as string name (case-insensitive) or integer value.
+            msg: The log message.
+            *args: Arguments for message formatting (e.g., for % formatting).
+            **kwargs: Additional keyword arguments for logging (exc_info,
+                stack_info, etc.).
+
+        Example:
+            >>> level = "DEBUG"
+            >>> logRootDynamic(level, "Message at %s level", level)
+            >>> logRootDynamic(logging.DEBUG, "Direct integer level")
+
+        See Also:
+            getRootLogger() - Get root logger for standard logging methods
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        root.log(level_int, msg, *args, **kwargs)
+
+
+# === apathetic_logging.logging_std_camel ===
+# src/apathetic_logging/logging_std_camel.py
+"""Camel case convenience functions for standard logging module.
+
+This module provides direct wrappers for stdlib logging.* namespace functions
+with no additional logic or "smarts". These are simple pass-through functions
+that maintain camelCase naming for compatibility.
+
+For utility functions with additional logic (e.g., setRootLevel), see
+logging_utils.py instead.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_StdCamelCase:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides camelCase convenience functions for logging.*.
+
+    This class contains camelCase wrapper functions for standard library
+    `logging.*` functions that use camelCase naming. These wrappers provide
+    direct compatibility with the standard logging module interface while
+    maintaining full compatibility with the underlying logging module functions.
+
+    When mixed into apathetic_logging, it provides camelCase functions
+    that match the standard logging module functions (e.g., `basicConfig`,
+    `addLevelName`, `setLoggerClass`, `getLogger`).
+    """
+
+    # --- Configuration Functions ---
+
+    @staticmethod
+    def basicConfig(*args: Any, **kwargs: Any) -> None:
+        """Do basic configuration for the logging system.
+
+        This function does nothing if the root logger already has handlers
+        configured, unless the keyword argument *force* is set to ``True``.
+        It is a convenience method intended for use by simple scripts
+        to do one-shot configuration of the logging package.
+
+        The default behaviour is to create a StreamHandler which writes to
+        sys.stderr, set a formatter using the BASIC_FORMAT format string, and
+        add the handler to the root logger.
+
+        A number of optional keyword arguments may be specified, which can alter
+        the default behaviour.
+
+        Wrapper for logging.basicConfig with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.basicConfig
+        """
+        logging.basicConfig(*args, **kwargs)
+
+    @staticmethod
+    def captureWarnings(
+        capture: bool,  # noqa: FBT001
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Redirect warnings to the logging package.
+
+        If capture is true, redirect all warnings to the logging package.
+        If capture is False, ensure that warnings are not redirected to logging
+        but to their original destinations.
+
+        Wrapper for logging.captureWarnings with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.captureWarnings
+        """
+        logging.captureWarnings(capture, *args, **kwargs)
+
+    @staticmethod
+    def shutdown(*args: Any, **kwargs: Any) -> None:
+        """Perform any cleanup actions in the logging system.
+
+        Perform any cleanup actions in the logging system (e.g. flushing
+        buffers). Should be called at application exit.
+
+        Wrapper for logging.shutdown with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.shutdown
+        """
+        logging.shutdown(*args, **kwargs)
+
+    # --- Level Management Functions ---
+
+    @staticmethod
+    def addLevelName(level: int, level_name: str, *args: Any, **kwargs: Any) -> None:
+        """Associate a level name with a numeric level.
+
+        Associate 'level_name' with 'level'. This is used when converting
+        levels to text during message formatting.
+
+        Wrapper for logging.addLevelName with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.addLevelName
+        """
+        logging.addLevelName(level, level_name, *args, **kwargs)
+
+    @staticmethod
+    def getLevelName(level: int, *args: Any, **kwargs: Any) -> str | int:
+        """Return the textual or numeric representation of a logging level.
+
+        If the level is one of the predefined levels (CRITICAL, ERROR, WARNING,
+        INFO, DEBUG) then you get the corresponding string. If you have
+        associated levels with names using addLevelName then the name you have
+        associated with 'level' is returned.
+
+        If a numeric value corresponding to one of the defined levels is passed
+        in, the corresponding string representation is returned.
+
+        If a string representation of the level is passed in, the corresponding
+        numeric value is returned.
+
+        If no matching numeric or string value is passed in, the string
+        'Level %s' % level is returned.
+
+        Wrapper for logging.getLevelName with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLevelName
+        """
+        return logging.getLevelName(level, *args, **kwargs)
+
+    @staticmethod
+    def getLevelNamesMapping(*args: Any, **kwargs: Any) -> dict[int, str]:
+        """Return a mapping of all level names to their numeric values.
+
+        **Requires Python 3.11+**
+
+        Wrapper for logging.getLevelNamesMapping with camelCase naming.
+
+        https://docs.python.org/3.11/library/logging.html#logging.getLevelNamesMapping
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _logging_utils.checkPythonVersionRequirement((3, 11), "getLevelNamesMapping")
+        return logging.getLevelNamesMapping(*args, **kwargs)  # type: ignore[attr-defined,no-any-return]
+
+    @staticmethod
+    def disable(level: int = 50, *args: Any, **kwargs: Any) -> None:
+        """Disable all logging calls of severity 'level' and below.
+
+        Wrapper for logging.disable with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.disable
+        """
+        logging.disable(level, *args, **kwargs)
+
+    # --- Logger Management Functions ---
+
+    @staticmethod
+    def getLogger(
+        name: str | None = None, *_args: Any, **_kwargs: Any
+    ) -> logging.Logger:
+        """Return a logger with the specified name, creating it if necessary.
+
+        If no name is specified, return the root logger.
+
+        Returns an logging.Logger instance.
+
+        Wrapper for logging.getLogger with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogger
+        """
+        return logging.getLogger(name)
+
+    @staticmethod
+    def getLoggerClass(*args: Any, **kwargs: Any) -> type[logging.Logger]:
+        """Return the class to be used when instantiating a logger.
+
+        Wrapper for logging.getLoggerClass with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLoggerClass
+        """
+        return logging.getLoggerClass(*args, **kwargs)
+
+    @staticmethod
+    def setLoggerClass(klass: type[logging.Logger], *args: Any, **kwargs: Any) -> None:
+        """Set the class to be used when instantiating a logger.
+
+        The class should define __init__() such that only a name argument is
+        required, and the __init__() should call Logger.__init__().
+
+        Args:
+            klass (logger class): The logger class to use.
+            *args: Additional positional arguments (for future-proofing).
+            **kwargs: Additional keyword arguments (for future-proofing).
+
+        Wrapper for logging.setLoggerClass with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.setLoggerClass
+        """
+        logging.setLoggerClass(klass, *args, **kwargs)
+
+    # --- Handler Management Functions ---
+
+    @staticmethod
+    def getHandlerByName(
+        name: str, *args: Any, **kwargs: Any
+    ) -> logging.Handler | None:
+        """Get a handler with the specified name, or None if there isn't one.
+
+        **Requires Python 3.12+**
+
+        Wrapper for logging.getHandlerByName with camelCase naming.
+
+        https://docs.python.org/3.12/library/logging.html#logging.getHandlerByName
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _logging_utils.checkPythonVersionRequirement((3, 12), "getHandlerByName")
+        return logging.getHandlerByName(name, *args, **kwargs)  # type: ignore[attr-defined,no-any-return]
+
+    @staticmethod
+    def getHandlerNames(*args: Any, **kwargs: Any) -> list[str]:
+        """Return all known handler names as an immutable set.
+
+        **Requires Python 3.12+**
+
+        Wrapper for logging.getHandlerNames with camelCase naming.
+
+        https://docs.python.org/3.12/library/logging.html#logging.getHandlerNames
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _logging_utils.checkPythonVersionRequirement((3, 12), "getHandlerNames")
+        return logging.getHandlerNames(*args, **kwargs)  # type: ignore[attr-defined,no-any-return]
+
+    # --- Factory Functions ---
+
+    @staticmethod
+    def getLogRecordFactory(
+        *args: Any, **kwargs: Any
+    ) -> Callable[..., logging.LogRecord]:
+        """Return the factory to be used when instantiating a log record.
+
+        Wrapper for logging.getLogRecordFactory with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogRecordFactory
+        """
+        return logging.getLogRecordFactory(*args, **kwargs)
+
+    @staticmethod
+    def setLogRecordFactory(
+        factory: Callable[..., logging.LogRecord], *args: Any, **kwargs: Any
+    ) -> None:
+        """Set the factory to be used when instantiating a log record.
+
+        :param factory: A callable which will be called to instantiate
+        a log record.
+
+        Wrapper for logging.setLogRecordFactory with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.setLogRecordFactory
+        """
+        logging.setLogRecordFactory(factory, *args, **kwargs)
+
+    @staticmethod
+    def makeLogRecord(
+        dict: dict[str, Any],  # noqa: A002  # Required to match stdlib logging.makeLogRecord signature
+        *args: Any,
+        **kwargs: Any,
+    ) -> logging.LogRecord:
+        """Make a LogRecord whose attributes are defined by a dictionary.
+
+        This function is useful for converting a logging event received over
+        a socket connection (which is sent as a dictionary) into a LogRecord
+        instance.
+
+        Wrapper for logging.makeLogRecord with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.makeLogRecord
+        """
+        return logging.makeLogRecord(dict, *args, **kwargs)
+
+    # --- Logging Functions ---
+
+    @staticmethod
+    def critical(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'CRITICAL' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.critical with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.critical
+        """
+        logging.critical(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def debug(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'DEBUG' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.debug with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.debug
+        """
+        logging.debug(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def error(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'ERROR' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.error with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.error
+        """
+        logging.error(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def exception(msg: str, *args: Any, exc_info: bool = True, **kwargs: Any) -> None:
+        """Log a message with severity 'ERROR' on the root logger, with exception info.
+
+        If the logger has no handlers, basicConfig() is called to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.exception with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.exception
+        """
+        logging.exception(msg, *args, exc_info=exc_info, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def fatal(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'CRITICAL' on the root logger.
+
+        Don't use this function, use critical() instead.
+
+        Wrapper for logging.fatal with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.fatal
+        """
+        logging.fatal(msg, *args, **kwargs)
+
+    @staticmethod
+    def info(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'INFO' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.info with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.info
+        """
+        logging.info(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def log(level: int, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with the integer severity 'level' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.log with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.log
+        """
+        logging.log(level, msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def warn(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'WARNING' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.warn with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.warn
+        """
+        logging.warning(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def warning(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'WARNING' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.warning with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.warning
+        """
+        logging.warning(msg, *args, **kwargs)  # noqa: LOG015
+
+    # --- Utility Functions ---
+
+    @staticmethod
+    def currentframe(*args: Any, **kwargs: Any) -> FrameType | None:
+        """Return the frame object for the caller's stack frame.
+
+        Wrapper for logging.currentframe with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.currentframe
+        """
+        return logging.currentframe(*args, **kwargs)
+
+
+# === apathetic_logging.safe_logging ===
+# src/apathetic_logging/safe_logging.py
+"""Safe logging utilities for Apathetic Logging."""
+
+
+# Lazy, safe import — avoids patched time modules
+#   in environments like pytest or eventlet
+_apatheticlogging_internal_real_time = importlib.import_module("time")
+
+
+class ApatheticLogging_Internal_SafeLogging:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides safe logging utilities.
+
+    This class contains both safeLog and safeTrace implementations as static
+    methods. When mixed into apathetic_logging, it provides:
+    - apathetic_logging.safeLog
+    - apathetic_logging.safeTrace
+    - apathetic_logging.makeSafeTrace
+    """
+
+    @staticmethod
+    def isSafeTraceEnabled() -> bool:  # noqa: PLR0911
+        """Check if safe trace should be enabled.
+
+        Safe trace is enabled when:
+        1. SAFE_TRACE env var is set to "1", "true", or "yes"
+        2. LOG_LEVEL env var (case insensitive) is "TRACE" or "TEST"
+        3. LOG_LEVEL numeric value <= TRACE_LEVEL numeric value
+
+        Returns:
+            True if safe trace should be enabled, False otherwise.
+        """
+        # Check SAFE_TRACE env var
+        safe_trace_env = os.getenv("SAFE_TRACE", "").lower()
+        if safe_trace_env in {"1", "true", "yes"}:
+            return True
+
+        # Check LOG_LEVEL env var
+        log_level_env = os.getenv("LOG_LEVEL", "")
+        if not log_level_env:
+            return False
+
+        log_level_upper = log_level_env.upper()
+
+        # Check if LOG_LEVEL is "TRACE" or "TEST" (case insensitive)
+        if log_level_upper in {"TRACE", "TEST"}:
+            return True
+
+        # Check if LOG_LEVEL numeric value <= TRACE_LEVEL
+        # First try to parse as integer directly
+        try:
+            log_level_numeric = int(log_level_env)
+            if log_level_numeric <= ApatheticLogging_Internal_Constants.TRACE_LEVEL:
+                return True
+        except ValueError:
+            # Not a numeric string, try to look up in logging module
+            # This handles cases like "DEBUG", "INFO", etc.
+            try:
+                level_attr = getattr(logging, log_level_upper, None)
+                if (
+                    isinstance(level_attr, int)
+                    and level_attr <= ApatheticLogging_Internal_Constants.TRACE_LEVEL
+                ):
+                    return True
+            except Exception:  # noqa: BLE001, S110
+                # If anything goes wrong, just ignore this check
+                pass
+
+        return False
+
+    SAFE_TRACE_ENABLED: ClassVar[bool] = isSafeTraceEnabled()
+    """Enable safe trace diagnostics.
+
+    Controlled by:
+    - SAFE_TRACE env var (set to "1", "true", or "yes")
+    - LOG_LEVEL env var (case insensitive) set to "TRACE" or "TEST"
+    - LOG_LEVEL numeric value <= TRACE_LEVEL numeric value
+
+    This can be overridden by tests by assigning directly to this class attribute.
+    """
+
+    @staticmethod
+    def safeLog(msg: str) -> None:
+        """Emergency logger that never fails."""
+        stream = cast("TextIO", sys.__stderr__)
+        try:
+            print(msg, file=stream)
+        except Exception:  # noqa: BLE001
+            # As final guardrail — never crash during crash reporting
+            with suppress(Exception):
+                stream.write(f"[INTERNAL] {msg}\n")
+
+    @staticmethod
+    def makeSafeTrace(icon: str = "🧪") -> Callable[..., Any]:
+        """Create a trace function with a custom icon. Assign it to a variable.
+
+        Args:
+            icon: Emoji prefix/suffix for easier visual scanning
+
+        Returns:
+            A callable trace function
+        """
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        def localTrace(label: str, *args: Any) -> Any:
+            return _safe_logging.safeTrace(label, *args, icon=icon)
+
+        return localTrace
+
+    @staticmethod
+    def safeTrace(label: str, *args: Any, icon: str = "🧪") -> None:
+        """Emit a synchronized, flush-safe diagnostic line.
+
+        Mainly for troubleshooting and tests, avoids the
+        logging framework and capture systems, can work even
+        pre-logging framework initialization.
+
+        Args:
+            label: Short identifier or context string.
+            *args: Optional values to append.
+            icon: Emoji prefix/suffix for easier visual scanning.
+
+        """
+        # Check class attribute to allow tests to override it
+        if not ApatheticLogging_Internal_SafeLogging.SAFE_TRACE_ENABLED:
+            return
+
+        ts = _apatheticlogging_internal_real_time.monotonic()
+        # builtins.print more reliable than sys.stdout.write + sys.stdout.flush
+        builtins.print(
+            f"{icon} [SAFE TRACE {ts:.6f}] {label}",
+            *args,
+            file=sys.__stderr__,
+            flush=True,
+        )
+
+
+# === apathetic_logging.registry ===
+# src/apathetic_logging/registry.py
+"""Registry functionality for Apathetic Logging."""
+
+
+class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides registration methods.
+
+    This class contains static methods for registering configuration values.
+    When mixed into apathetic_logging, it provides registration methods for
+    log level environment variables, default log level, logger name, and
+    target Python version.
+
+    Registry storage is provided by ``ApatheticLogging_Internal_RegistryData``.
+
+    **Static Methods:**
+    - ``registerDefaultLogLevel()``: Register the default log level
+    - ``registerLogLevelEnvVars()``: Register environment variable names
+    - ``registerLogger()``: Register a logger (public API)
+    - ``registerTargetPythonVersion()``: Register target Python version
+    - ``registerPropagate()``: Register propagate setting
+    - ``registerCompatibilityMode()``: Register compatibility mode setting
+    """
+
+    _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
+
+    @staticmethod
+    def registerDefaultLogLevel(default_level: str | None) -> None:
+        """Register the default log level to use when no other source is found.
+
+        Args:
+            default_level: Default log level name (e.g., "info", "warning").
+                If None, returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import ApatheticLogging
+            >>> apathetic_logging.registerDefaultLogLevel("warning")
+        """
+        if default_level is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_default_log_level = default_level
+        _safe_logging.safeTrace(
+            "registerDefaultLogLevel() called",
+            f"default_level={default_level}",
+        )
+
+    @staticmethod
+    def registerLogLevelEnvVars(env_vars: list[str] | None) -> None:
+        """Register environment variable names to check for log level.
+
+        The environment variables will be checked in order, and the first
+        non-empty value found will be used.
+
+        Args:
+            env_vars: List of environment variable names to check
+                (e.g., ["SERGER_LOG_LEVEL", "LOG_LEVEL"]).
+                If None, returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import ApatheticLogging
+            >>> apathetic_logging.registerLogLevelEnvVars(
+            ...     ["MYAPP_LOG_LEVEL", "LOG_LEVEL"]
+            ... )
+        """
+        if env_vars is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_log_level_env_vars = env_vars
+        _safe_logging.safeTrace(
+            "registerLogLevelEnvVars() called",
+            f"env_vars={env_vars}",
+        )
+
+    @staticmethod
+    def registerLogger(
+        logger_name: str | None = None,
+        logger_class: type[ApatheticLogging_Internal_Registry._LoggerType]
+        | None = None,
+        *,
+        target_python_version: tuple[int, int] | None = None,
+        log_level_env_vars: list[str] | None = None,
+        default_log_level: str | None = None,
+        propagate: bool | None = None,
+        compat_mode: bool | None = None,
+        replace_root: bool | None = None,
+    ) -> None:
+        """Register a logger for use by getLogger().
+
+        This is the public API for registering a logger. It registers the logger
+        name and extends the logging module with custom levels if needed.
+
+        If logger_name is not provided, the top-level package is automatically
+        extracted from the calling module's __package__ attribute.
+
+        If logger_class is provided and has an ``extendLoggingModule()``
+        method, it will be called to extend the logging module with custom
+        levels and set the logger class. If logger_class is provided but does
+        not have ``extendLoggingModule()``, ``logging.setLoggerClass()``
+        will be called directly to set the logger class. If logger_class is not
+        provided, nothing is done with the logger class (the default ``Logger``
+        is already extended at import time).
+
+        **Important**: If you're using a custom logger class that has
+        ``extendLoggingModule()``, do not call ``logging.setLoggerClass()``
+        directly. Instead, pass the class to ``registerLogger()`` and let
+        ``extendLoggingModule()`` handle setting the logger class. This
+        ensures consistent behavior and avoids class identity issues in
+        stitched mode.
+
+        Args:
+            logger_name: The name of the logger to retrieve (e.g., "myapp").
+                If None, extracts the top-level package from __package__.
+            logger_class: Optional logger class to use. If provided and the class
+                has an ``extendLoggingModule()`` method, it will be called.
+                If the class doesn't have that method, ``logging.setLoggerClass()``
+                will be called directly. If None, nothing is done (default Logger
+                is already set up at import time).
+            target_python_version: Optional target Python version (major, minor)
+                tuple. If provided, sets the target Python version in the registry
+                permanently. Defaults to None (no change).
+            log_level_env_vars: Optional list of environment variable names to
+                check for log level. If provided, sets the log level environment
+                variables in the registry permanently. Defaults to None (no change).
+            default_log_level: Optional default log level name. If provided, sets
+                the default log level in the registry permanently. Defaults to None
+                (no change).
+            propagate: Optional propagate setting. If provided, sets the propagate
+                value in the registry permanently. If None, uses registered propagate
+                setting or falls back to DEFAULT_PROPAGATE from constants.py.
+                Defaults to None (no change).
+            compat_mode: Optional compatibility mode setting. If provided, sets
+                the compatibility mode in the registry permanently. When True, restores
+                stdlib-compatible behavior where possible (e.g., getLogger(None) returns
+                root logger). If None, uses registered compatibility mode setting or
+                defaults to False (improved behavior). Defaults to None (no change).
+            replace_root: Optional setting for whether to replace root logger.
+                If provided, passes this value to extendLoggingModule() when extending
+                the logging module. If None, uses registry setting or constant default.
+                Only used when logger_class has an extendLoggingModule() method.
+
+        Example:
+            >>> # Explicit registration with default Logger (already extended)
+            >>> from apathetic_logging import registerLogger
+            >>> registerLogger("myapp")
+
+            >>> # Auto-infer from __package__
+            >>> registerLogger()
+            ...     # Uses top-level package from __package__
+
+            >>> # Register with custom logger class (has extendLoggingModule)
+            >>> from apathetic_logging import Logger
+            >>> class AppLogger(Logger):
+            ...     pass
+            >>> # Don't call AppLogger.extendLoggingModule() or
+            >>> # logging.setLoggerClass() directly - registerLogger() handles it
+            >>> registerLogger("myapp", AppLogger)
+
+            >>> # Register with any logger class (no extendLoggingModule)
+            >>> import logging
+            >>> class SimpleLogger(logging.Logger):
+            ...     pass
+            >>> registerLogger("myapp", SimpleLogger)  # Sets logger class directly
+        """
+        _registry = ApatheticLogging_Internal_Registry
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        # Handle convenience parameters that set registry values
+        _registry.registerTargetPythonVersion(target_python_version)
+        _registry.registerLogLevelEnvVars(log_level_env_vars)
+        _registry.registerDefaultLogLevel(default_log_level)
+        _registry.registerPropagate(propagate=propagate)
+        _registry.registerCompatibilityMode(compat_mode=compat_mode)
+        _registry.registerReplaceRootLogger(replace_root=replace_root)
+
+        # Import Logger locally to avoid circular import
+
+        # Track if name was auto-inferred
+        was_explicit = logger_name is not None
+
+        # Resolve logger name (with inference if needed)
+        # skip_frames=1 because: registerLogger -> getDefaultLoggerName -> caller
+        # check_registry=False because registerLogger() should actively determine
+        # the name from the current context, not return an old registered name. This
+        # allows re-inferring from __package__ if the package context has changed.
+        # raise_on_error=True because registerLogger() requires a logger name.
+        # register=True because registerLogger() should store the resolved name.
+        resolved_name = _logging_utils.getDefaultLoggerName(
+            logger_name,
+            check_registry=False,
+            skip_frames=1,
+            raise_on_error=True,
+            infer=True,
+            register=True,
+        )
+
+        if logger_class is not None:
+            # extendLoggingModule will call setLoggerClass for those that support it
+            if hasattr(logger_class, "extendLoggingModule"):
+                logger_class.extendLoggingModule(replace_root=replace_root)  # type: ignore[attr-defined]
+            else:
+                # stdlib unwrapped
+                logging.setLoggerClass(logger_class)
+
+        # registerLogger always stores the result (explicit or inferred)
+        _registry_data.registered_internal_logger_name = resolved_name
+
+        _safe_logging.safeTrace(
+            "registerLogger() called",
+            f"name={resolved_name}",
+            f"auto_inferred={not was_explicit}",
+            f"logger_class={logger_class.__name__ if logger_class else None}",
+        )
+
+    @staticmethod
+    def registerTargetPythonVersion(version: tuple[int, int] | None) -> None:
+        """Register the target Python version for compatibility checking.
+
+        This sets the target Python version that will be used to validate
+        function calls. If a function requires a Python version newer than
+        the target version, it will raise a NotImplementedError even if
+        the runtime version is sufficient.
+
+        If not set, the library defaults to TARGET_PYTHON_VERSION (3, 10) from
+        constants.py. This allows developers to catch version incompatibilities
+        during development even when running on a newer Python version than
+        their target.
+
+        Args:
+            version: Target Python version as (major, minor) tuple
+                (e.g., (3, 10) or (3, 11)). If None, returns immediately
+                without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerTargetPythonVersion
+            >>> registerTargetPythonVersion((3, 10))
+            >>> # Now functions requiring 3.11+ will raise if called
+
+        Note:
+            The runtime version is still checked as a safety net. If the
+            runtime version is older than required, the function will still
+            raise an error even if the target version is sufficient.
+        """
+        if version is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_target_python_version = version
+        _safe_logging.safeTrace(
+            "registerTargetPythonVersion() called",
+            f"version={version[0]}.{version[1]}",
+        )
+
+    @staticmethod
+    def registerPropagate(*, propagate: bool | None) -> None:
+        """Register the propagate setting for loggers.
+
+        This sets the default propagate value that will be used when creating
+        loggers. If not set, the library defaults to DEFAULT_PROPAGATE (True)
+        from constants.py.
+
+        When propagate is True, loggers propagate messages to parent loggers,
+        allowing centralized control via root logger.
+
+        Args:
+            propagate: Propagate setting (True or False). If None, returns
+                immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerPropagate
+            >>> registerPropagate(propagate=True)
+            >>> # Now new loggers will propagate by default
+        """
+        if propagate is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_propagate = propagate
+        _safe_logging.safeTrace(
+            "registerPropagate() called",
+            f"propagate={propagate}",
+        )
+
+    @staticmethod
+    def registerCompatibilityMode(*, compat_mode: bool | None) -> None:
+        """Register the compatibility mode setting for stdlib drop-in replacement.
+
+        This sets the compatibility mode that will be used when creating loggers.
+        If not set, the library defaults to False (improved behavior).
+
+        When compat_mode is True, restores stdlib-compatible behavior where
+        possible (e.g., getLogger(None) returns root logger instead of auto-inferring).
+
+        Args:
+            compat_mode: Compatibility mode setting (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerCompatibilityMode
+            >>> registerCompatibilityMode(compat_mode=True)
+            >>> # Now getLogger(None) returns root logger (stdlib behavior)
+        """
+        if compat_mode is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_compatibility_mode = compat_mode
+        _safe_logging.safeTrace(
+            "registerCompatibilityMode() called",
+            f"compat_mode={compat_mode}",
+        )
+
+    @staticmethod
+    def registerReplaceRootLogger(*, replace_root: bool | None) -> None:
+        """Register whether to replace root logger if it's not the correct type.
+
+        This sets whether extendLoggingModule() should replace the root logger
+        if it's not an instance of the apathetic logger class. If not set, the
+        library defaults to DEFAULT_REPLACE_ROOT_LOGGER from constants.py
+        (True by default - replace root logger to ensure it's an apathetic logger).
+
+        When replace_root is False, extendLoggingModule() will not replace the
+        root logger, allowing applications to use their own custom logger class
+        for the root logger. This is useful when:
+        - Using apathetic logging through a library (like utils) but wanting a
+          different logger class for the root logger
+        - Having your own custom logger class that inherits from logging.Logger
+          and wanting to use it for the root logger
+
+        Args:
+            replace_root: Whether to replace root logger (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerReplaceRootLogger
+            >>> # Disable root logger replacement to use your own logger class
+            >>> registerReplaceRootLogger(replace_root=False)
+            >>> # Now extendLoggingModule() won't replace the root logger
+        """
+        if replace_root is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_replace_root_logger = replace_root
+        _safe_logging.safeTrace(
+            "registerReplaceRootLogger() called",
+            f"replace_root={replace_root}",
+        )
+
+    @staticmethod
+    def registerPortHandlers(*, port_handlers: bool | None) -> None:
+        """Register whether to port handlers when replacing a logger.
+
+        This sets whether logger replacement should port handlers from the old
+        logger to the new logger. If not set, the library defaults to
+        DEFAULT_PORT_HANDLERS from constants.py (True by default - port handlers
+        to preserve existing configuration).
+
+        When port_handlers is True, handlers from the old logger are ported to
+        the new logger. When False, the new logger manages its own handlers via
+        manageHandlers() (may conflict with ported handlers).
+
+        Args:
+            port_handlers: Whether to port handlers (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerPortHandlers
+            >>> # Enable handler porting to preserve existing handlers
+            >>> registerPortHandlers(port_handlers=True)
+            >>> # Now logger replacement will port handlers
+        """
+        if port_handlers is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_port_handlers = port_handlers
+        _safe_logging.safeTrace(
+            "registerPortHandlers() called",
+            f"port_handlers={port_handlers}",
+        )
+
+    @staticmethod
+    def registerPortLevel(*, port_level: bool | None) -> None:
+        """Register whether to port level when replacing a logger.
+
+        This sets whether logger replacement should port the log level from the
+        old logger to the new logger. If not set, the library defaults to
+        DEFAULT_PORT_LEVEL from constants.py (True by default - port level to
+        preserve existing configuration).
+
+        When port_level is True (default), the log level is ported from the old
+        logger. When False, the new logger uses apathetic defaults:
+        - Root logger: uses determineLogLevel() to get a sensible default
+        - Leaf loggers: use INHERIT_LEVEL (NOTSET) to inherit from parent
+        Note: User-provided level parameters in getLogger/getLoggerOfType take
+        precedence over ported level.
+
+        Args:
+            port_level: Whether to port level (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerPortLevel
+            >>> # Enable level porting to preserve existing level
+            >>> registerPortLevel(port_level=True)
+            >>> # Now logger replacement will port level
+        """
+        if port_level is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_port_level = port_level
+        _safe_logging.safeTrace(
+            "registerPortLevel() called",
+            f"port_level={port_level}",
+        )
+
+    @staticmethod
+    def getLogLevelEnvVars() -> list[str]:
+        """Get the environment variable names to check for log level.
+
+        Returns the registered environment variable names, or the default
+        environment variables if none are registered.
+
+        Returns:
+            List of environment variable names to check for log level.
+            Defaults to ["LOG_LEVEL"] if not registered.
+
+        Example:
+            >>> from apathetic_logging import getLogLevelEnvVars
+            >>> env_vars = getLogLevelEnvVars()
+            >>> print(env_vars)
+            ["LOG_LEVEL"]
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_log_level_env_vars
+            or _constants.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
+        )
+
+    @staticmethod
+    def getDefaultLogLevel() -> str:
+        """Get the default log level.
+
+        Returns the registered default log level, or the module default
+        if none is registered.
+
+        Returns:
+            Default log level name (e.g., "detail", "info").
+            Defaults to "detail" if not registered.
+
+        Example:
+            >>> from apathetic_logging import getDefaultLogLevel
+            >>> level = getDefaultLogLevel()
+            >>> print(level)
+            "detail"
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_default_log_level
+            or _constants.DEFAULT_APATHETIC_LOG_LEVEL
+        )
+
+    @staticmethod
+    def getRegisteredLoggerName() -> str | None:
+        """Get the registered logger name.
+
+        Returns the registered logger name, or None if no logger name
+        has been registered. Unlike getDefaultLoggerName(), this does not
+        perform inference - it only returns the explicitly registered value.
+
+        Returns:
+            Registered logger name, or None if not registered.
+
+        Example:
+            >>> from apathetic_logging import getRegisteredLoggerName
+            >>> name = getRegisteredLoggerName()
+            >>> if name is None:
+            ...     print("No logger name registered")
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return _registry_data.registered_internal_logger_name
+
+    @staticmethod
+    def getTargetPythonVersion() -> tuple[int, int] | None:
+        """Get the target Python version.
+
+        Returns the registered target Python version, or the minimum
+        supported version if none is registered.
+
+        Returns:
+            Target Python version as (major, minor) tuple, or None if
+            no version is registered and TARGET_PYTHON_VERSION is None
+            (checks disabled).
+
+        Example:
+            >>> from apathetic_logging import getTargetPythonVersion
+            >>> version = getTargetPythonVersion()
+            >>> print(version)
+            (3, 10)  # or None if checks are disabled
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_target_python_version
+            or _constants.TARGET_PYTHON_VERSION
+        )
+
+    @staticmethod
+    def getDefaultPropagate() -> bool:
+        """Get the default propagate setting.
+
+        Returns the registered propagate setting, or the module default
+        (DEFAULT_PROPAGATE) from constants.py if not registered.
+
+        Returns:
+            Default propagate setting (True or False).
+
+        Example:
+            >>> from apathetic_logging import getDefaultPropagate
+            >>> propagate = getDefaultPropagate()
+            >>> print(propagate)
+            True
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_propagate
+            if _registry_data.registered_internal_propagate is not None
+            else _constants.DEFAULT_PROPAGATE
+        )
+
+    @staticmethod
+    def getCompatibilityMode() -> bool:
+        """Get the compatibility mode setting.
+
+        Returns the registered compatibility mode setting, or False (improved
+        behavior) if not registered.
+
+        Returns:
+            Compatibility mode setting (True or False).
+            Defaults to False if not registered.
+
+        Example:
+            >>> from apathetic_logging import getCompatibilityMode
+            >>> compat_mode = getCompatibilityMode()
+            >>> print(compat_mode)
+            False
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_compatibility_mode
+            if _registry_data.registered_internal_compatibility_mode is not None
+            else False
+        )
+
+
+# === apathetic_logging.tag_formatter ===
+# src/apathetic_logging/tag_formatter.py
+"""TagFormatter class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.Formatter documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_TagFormatter:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the TagFormatter nested class.
+
+    This class contains the TagFormatter implementation as a nested class.
+    When mixed into apathetic_logging, it provides apathetic_logging.TagFormatter.
+    """
+
+    class TagFormatter(logging.Formatter):
+        """Formatter that adds level tags to log messages.
+
+        Adds colored or plain text tags (e.g., [DEBUG], [ERROR]) based on
+        log level. Color support is controlled by the enable_color attribute
+        on the LogRecord.
+        """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            """Initialize the TagFormatter.
+
+            Wrapper for logging.Formatter.__init__ with future-proofing.
+            """
+            super().__init__(*args, **kwargs)
+
+        def format(
+            self,
+            record: logging.LogRecord,
+            *args: Any,
+            **kwargs: Any,
+        ) -> str:
+            """Format a log record with level tag prefix.
+
+            Args:
+                record: LogRecord to format
+                *args: Additional positional arguments (for future-proofing)
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            Returns:
+                Formatted message with optional level tag prefix
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            tag_color, tag_text = _constants.TAG_STYLES.get(record.levelname, ("", ""))
+            msg = super().format(record, *args, **kwargs)
+            if tag_text:
+                if getattr(record, "enable_color", False) and tag_color:
+                    prefix = f"{tag_color}{tag_text}{_constants.ANSIColors.RESET}"
+                else:
+                    prefix = tag_text
+                return f"{prefix} {msg}"
+            return msg
+
+
+# === apathetic_logging.logger ===
+# src/apathetic_logging/logger.py
+"""Core Logger implementation for Apathetic Logging.
+
+See https://docs.python.org/3/library/logging.html#logging.Logger for the
+complete list of standard library Logger methods that are extended by this class.
+
+Docstrings are adapted from the standard library logging.Logger documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Core Logger implementation for all Apathetic tools.
+
+    This class contains the core Logger implementation.
+    It provides all the custom methods and functionality for apathetic logging.
+    """
+
+    enable_color: bool = False
+    """Enable ANSI color output for log messages."""
+
+    _logging_module_extended: bool = False
+
+    # if stdout or stderr are redirected, we need to repoint
+    _last_stream_ids: tuple[TextIO, TextIO] | None = None
+
+    DEFAULT_STACKLEVEL = 2
+    """Default stacklevel for errorIfNotDebug/criticalIfNotDebug methods."""
+
+    def __init__(
+        self,
+        name: str,
+        level: int | None = ApatheticLogging_Internal_Constants.INHERIT_LEVEL,
+        *,
+        enable_color: bool | None = None,
+        propagate: bool | None = None,
+    ) -> None:
+        """Initialize the logger.
+
+        Sets up color support and log propagation. Loggers default to INHERIT_LEVEL
+        (i.e. NOTSET) to inherit level from root logger. Defaults to propagate=True for
+        root logger architecture.
+
+        **Contract with getLoggerOfType():** The propagate setting follows a two-phase
+        initialization pattern when propagate=None:
+        1. __init__ sets _propagate_explicit=False to indicate the value was not
+           explicitly provided by the user.
+        2. After logger creation, getLoggerOfType() calls _applyPropagateSetting(),
+           which checks _propagate_explicit and applies the registry or default value.
+        This allows explicit user overrides (propagate=True/False in __init__) to take
+        precedence over registry/default values set later via _applyPropagateSetting().
+
+        Args:
+            name: Logger name
+            level: Initial logging level. If None, auto-resolves via
+                determineLogLevel(). If INHERIT_LEVEL (i.e. NOTSET)
+                (default), inherits from root logger. Otherwise, sets
+                explicit level.
+            enable_color: Force color output on/off, or None for auto-detect
+            propagate: Propagate setting. If None, uses registered setting or
+                defaults to True. If True, messages propagate to parent loggers.
+
+        """
+        # it is too late to call extendLoggingModule
+
+        _constants = ApatheticLogging_Internal_Constants
+        super().__init__(name, _constants.INHERIT_LEVEL if level is None else level)
+
+        # Handle None level - auto-resolve via determineLogLevel
+        if level is None:
+            # Initialize with INHERIT_LEVEL (i.e. NOTSET) first, then resolve
+            self.setLevel(self.determineLogLevel())
+
+        # detect color support once per instance
+        self.enable_color = (
+            enable_color
+            if enable_color is not None
+            else type(self).determineColorEnabled()
+        )
+
+        # Set propagate - use provided value, or will be set by _applyPropagateSetting
+        if propagate is not None:
+            self.setPropagate(propagate)
+        else:
+            self._propagate_explicit = False  # Will be set by _applyPropagateSetting
+
+        # handler attachment will happen in _log() with manageHandlers()
+
+    def _rebuildAppatheticHandlers(self) -> None:
+        """Rebuild apathetic handlers for this logger.
+
+        Removes existing DualStreamHandler instances and creates a new one.
+        Updates _last_stream_ids to track current stdout/stderr.
+
+        This is called by manageHandlers() when handlers need to be rebuilt.
+
+        """
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        _tag_formatter = ApatheticLogging_Internal_TagFormatter
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        # Remove existing apathetic handlers. In unusual circumstances (e.g., when
+        # test fixtures create a new root logger and copy handlers), there might be
+        # multiple stale handlers from copies. Remove them defensively to ensure
+        # we don't end up with handlers pointing to old stdout/stderr.
+        for handler in list(self.handlers):  # Copy list to avoid mutation issues
+            if isinstance(handler, _dual_stream_handler.DualStreamHandler):
+                self.removeHandler(handler)
+                if hasattr(handler, "close"):
+                    handler.close()
+
+        # Add new apathetic handler
+        h = _dual_stream_handler.DualStreamHandler()
+        h.setFormatter(_tag_formatter.TagFormatter("%(message)s"))
+        h.enable_color = self.enable_color
+        self.addHandler(h)
+        self._last_stream_ids = (sys.stdout, sys.stderr)
+        _safe_logging.safeTrace(
+            "manageHandlers()",
+            f"rebuilt_handlers={self.handlers}",
+        )
+
+    def manageHandlers(self, *, manage_handlers: bool | None = None) -> None:
+        """Manage apathetic handlers for this logger.
+
+        Root logger always gets an apathetic handler. Child loggers only get
+        apathetic handlers if they're not propagating (propagate=False),
+        otherwise they rely on root logger's handler via propagation.
+
+        Only manages DualStreamHandler instances. User-added handlers are
+        left untouched.
+
+        Rebuilds handlers if they're missing or if stdout/stderr have changed.
+
+        Args:
+            manage_handlers: If True, manage handlers (even in compat mode).
+                If None, checks compatibility mode: in compat mode, handlers are
+                not managed unless explicitly enabled. If False, returns early
+                without managing handlers. Defaults to None.
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve manage_handlers parameter
+        if manage_handlers is None:
+            # Check compatibility mode - in compat mode, don't manage handlers
+            # unless explicitly requested
+
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+            compat_mode = _logging_utils._getCompatibilityMode()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+            if compat_mode:
+                # In compat mode, don't manage handlers by default
+                return
+
+            # Not in compat mode, use default from constants
+            manage_handlers = _constants.DEFAULT_MANAGE_HANDLERS
+
+        # Return early if management is disabled
+        if not manage_handlers:
+            return
+
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+
+        # Identify apathetic handlers
+        apathetic_handlers = [
+            h
+            for h in self.handlers
+            if isinstance(h, _dual_stream_handler.DualStreamHandler)
+        ]
+
+        # Propagating child loggers should not have apathetic handlers
+        # Only remove handlers if we previously managed them (indicated by
+        # _last_stream_ids being set), to avoid removing manually-added handlers
+        # Root logger can have name "" (ROOT_LOGGER_KEY) or "root" (ROOT_LOGGER_NAME)
+        is_root = self.name in {
+            _constants.ROOT_LOGGER_KEY,
+            _constants.ROOT_LOGGER_NAME,
+        }
+        if not is_root and self.propagate:
+            # Only remove apathetic handlers if we previously managed them
+            # (indicated by _last_stream_ids being set)
+            if self._last_stream_ids is not None and apathetic_handlers:
+                # We previously managed handlers for this logger, remove them
+                for handler in apathetic_handlers:
+                    self.removeHandler(handler)
+            return
+
+        # Root logger or non-propagating child logger - ensure it has an
+        # apathetic handler. Check if rebuild is needed (missing handler or
+        # streams changed)
+        needs_rebuild = (
+            not apathetic_handlers
+            or (
+                self._last_stream_ids is not None
+                and (
+                    self._last_stream_ids[0] is not sys.stdout
+                    or self._last_stream_ids[1] is not sys.stderr
+                )
+            )
+            or self._last_stream_ids is None
+        )
+
+        if needs_rebuild:
+            self._rebuildAppatheticHandlers()
+
+    def _log(  # type: ignore[override]
+        self,
+        level: int,
+        msg: str,
+        args: tuple[Any, ...],
+        **kwargs: Any,
+    ) -> None:
+        """Log a message with the specified level.
+
+        Changed:
+        - Automatically manages handlers via manageHandlers()
+
+        Args:
+            level: The numeric logging level
+            msg: The message format string
+            args: Arguments for the message format string
+            **kwargs: Additional keyword arguments passed to the base implementation
+
+        Wrapper for logging.Logger._log.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger._log
+
+        """
+        self.manageHandlers()
+        super()._log(level, msg, args, **kwargs)
+
+    def setLevel(
+        self,
+        level: int | str,
+        *,
+        minimum: bool | None = False,
+    ) -> None:
+        """Set the logging level of this logger.
+
+        Changed:
+        - Accepts both int and str level values (case-insensitive for strings)
+        - Automatically resolves string level names to numeric values
+        - Supports custom level names (TEST, TRACE, BRIEF, DETAIL, SILENT)
+        - Validates that custom levels are registered properly (no duplicate
+          numeric level values via addLevelName)
+        - In compatibility mode, accepts any level value (including 0 and negative)
+          matching stdlib behavior.
+        - Added `minimum` parameter: if True, only sets the level if it's more
+          verbose (lower numeric value) than the current level
+
+        Args:
+            level: The logging level, either as an integer or a string name
+                (case-insensitive). Standard levels (DEBUG, INFO, WARNING, ERROR,
+                CRITICAL) and custom levels (TEST, TRACE, BRIEF, DETAIL, SILENT)
+                are supported. Use 0/NOTSET to inherit level from parent logger.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). Defaults to False. None is accepted and treated
+                as False.
+
+        Wrapper for logging.Logger.setLevel.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.setLevel
+
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve string to integer if needed using utility function
+        level_name: str | None = None
+        if isinstance(level, str):
+            level_name = level
+            level = _logging_utils.getLevelNumber(level)
+
+        # Handle minimum level logic (None is treated as False)
+        if minimum:
+            current_level = self.getEffectiveLevel()
+            # Lower number = more verbose, so only set if new level is more verbose
+            if level >= current_level:
+                # Don't downgrade - keep current level
+                return
+
+        # Validate level only if it's <= 0 in improved mode
+        # (validate that custom negative levels are not used)
+        self.validateLevel(level, level_name=level_name)
+
+        super().setLevel(level)
+        # Clear the isEnabledFor cache when level changes, as cached values
+        # may be stale (e.g., if level was TRACE and cached isEnabledFor(TRACE)=True,
+        # then changing to DEBUG should invalidate that cache entry)
+        if hasattr(self, "_cache"):
+            self._cache.clear()  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+
+    def setLevelMinimum(self, level: int | str) -> None:
+        """Set the logging level only if it's more verbose than the current level.
+
+        This convenience method is equivalent to calling
+        ``setLevel(level, minimum=True)``. It prevents downgrading from a more
+        verbose level (e.g., TRACE) to a less verbose one (e.g., DEBUG).
+
+        Args:
+            level: The logging level, either as an integer or a string name
+                (case-insensitive). Standard levels (DEBUG, INFO, WARNING, ERROR,
+                CRITICAL) and custom levels (TEST, TRACE, BRIEF, DETAIL, SILENT)
+                are supported.
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> logger.setLevel("TRACE")
+            >>> # This won't downgrade from TRACE to DEBUG
+            >>> logger.setLevelMinimum("DEBUG")
+            >>> assert logger.levelName == "TRACE"  # Still TRACE
+            >>> # This will upgrade from INFO to DEBUG
+            >>> logger.setLevel("INFO")
+            >>> logger.setLevelMinimum("DEBUG")
+            >>> assert logger.levelName == "DEBUG"  # Upgraded to DEBUG
+
+        """
+        self.setLevel(level, minimum=True)
+
+    def setLevelInherit(self) -> None:
+        """Set the logger to inherit its level from the parent logger.
+
+        This convenience method is equivalent to calling ``setLevel(0)`` or
+        ``setLevel(INHERIT_LEVEL)`` or ``setLevel("NOTSET")``. It explicitly
+        sets the logger to INHERIT_LEVEL (i.e. NOTSET) so it inherits its
+        effective level from the root logger or parent logger.
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> logger.setLevel("DEBUG")
+            >>> # Set to inherit from root logger
+            >>> logger.setLevelInherit()
+            >>> assert logger.levelName == "NOTSET"
+            >>> assert logger.effectiveLevel == root.level  # Inherits from root
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        self.setLevel(_constants.INHERIT_LEVEL)
+
+    def setPropagate(
+        self,
+        propagate: bool,  # noqa: FBT001
+        *,
+        manage_handlers: bool | None = None,
+    ) -> None:
+        """Set the propagate setting for this logger.
+
+        When propagate is True, messages are passed to handlers of higher level
+        (ancestor) loggers, in addition to any handlers attached to this logger.
+        When False, messages are not passed to handlers of ancestor loggers.
+
+        Args:
+            propagate: If True, messages propagate to parent loggers. If False,
+                messages only go to this logger's handlers.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Wrapper for logging.Logger.propagate attribute.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.propagate
+
+        """
+        self.propagate = propagate
+        self._propagate_explicit = True  # Mark as explicitly set
+
+        # Always call manageHandlers - it will handle the manage_handlers parameter
+        self.manageHandlers(manage_handlers=manage_handlers)
+
+    def setLevelAndPropagate(
+        self,
+        level: int | str,
+        *,
+        minimum: bool | None = False,
+        manage_handlers: bool | None = None,
+    ) -> None:
+        """Set the logging level and propagate setting together in a smart way.
+
+        This convenience method combines setLevel() and setPropagate() with
+        intelligent defaults:
+        - If level is INHERIT_LEVEL (NOTSET): sets propagate=True
+        - If level is a specific level: sets propagate=False
+        - On root logger: only sets level (propagate is unchanged)
+
+        This matches common use cases: when inheriting level, you typically
+        want to propagate to parent handlers. When setting an explicit level,
+        you typically want isolated logging with your own handler.
+
+        Args:
+            level: The logging level, either as an integer or a string name
+                (case-insensitive). Standard levels (DEBUG, INFO, WARNING, ERROR,
+                CRITICAL) and custom levels (TEST, TRACE, BRIEF, DETAIL, SILENT)
+                are supported. Use INHERIT_LEVEL (0) or "NOTSET" to inherit.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). Defaults to False. None is accepted and treated
+                as False.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> # Set to inherit level and propagate to root
+            >>> logger.setLevelAndPropagate(INHERIT_LEVEL)
+            >>> # Set explicit level and disable propagation (isolated logging)
+            >>> logger.setLevelAndPropagate("debug")
+
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve string to integer if needed using utility function
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Set the level first
+        self.setLevel(level_int, minimum=minimum)
+
+        # Determine propagate setting based on level
+        # Only set propagate if not root logger
+        # Root logger can have name "" (ROOT_LOGGER_KEY) or "root" (ROOT_LOGGER_NAME)
+        is_root = self.name in {
+            _constants.ROOT_LOGGER_KEY,
+            _constants.ROOT_LOGGER_NAME,
+        }
+        if not is_root:
+            if level_int == _constants.INHERIT_LEVEL:
+                # INHERIT_LEVEL -> propagate=True
+                self.setPropagate(True, manage_handlers=manage_handlers)
+            else:
+                # Specific level -> propagate=False
+                self.setPropagate(False, manage_handlers=manage_handlers)
+        # Root logger: propagate is unchanged (root always has handlers)
+
+    @classmethod
+    def determineColorEnabled(cls) -> bool:
+        """Return True if colored output should be enabled."""
+        # Respect explicit overrides
+        if "NO_COLOR" in os.environ:
+            return False
+        if os.getenv("FORCE_COLOR", "").lower() in {"1", "true", "yes"}:
+            return True
+
+        # Auto-detect: use color if output is a TTY
+        return sys.stdout.isatty()
+
+    @staticmethod
+    def validateLevel(
+        level: int,
+        *,
+        level_name: str | None = None,
+    ) -> None:
+        """Validate that a level value is not negative (>= 0).
+
+        Custom levels with values < 0 (negative) are discouraged by PEP 282.
+        Level 0 (NOTSET/INHERIT_LEVEL) is allowed - it causes loggers to
+        inherit from parent loggers. For custom levels to not be confusing,
+        duplicate numeric values are prevented via addLevelName() validation.
+
+        In compatibility mode, validation is skipped (all levels are accepted).
+
+        Args:
+            level: The numeric level value to validate
+            level_name: Optional name for the level (for error messages).
+                If None, will attempt to get from getLevelName()
+
+        Raises:
+            ValueError: If level < 0 (negative levels are discouraged)
+
+        Example:
+            >>> Logger.validateLevel(5, level_name="TRACE")
+            >>> Logger.validateLevel(0, level_name="NOTSET")  # OK - allows inheritance
+            >>> Logger.validateLevel(-5, level_name="NEGATIVE")
+            ValueError: Level 'NEGATIVE' has value -5, which is < 0...
+
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Check compatibility mode
+        compat_mode = _logging_utils._getCompatibilityMode()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+        if compat_mode:
+            return
+
+        if level < _constants.INHERIT_LEVEL:
+            if level_name is None:
+                level_name = _logging_utils.getLevelNameStr(level)
+            msg = (
+                f"Level '{level_name}' has value {level}, "
+                "which is < 0. This is discouraged by PEP 282 and"
+                " results can lead to unexpected behavior."
+            )
+            raise ValueError(msg)
+
+    @staticmethod
+    def addLevelName(level: int, level_name: str) -> None:
+        """Associate a level name with a numeric level.
+
+        Changed:
+        - Validates that level is not negative (>= 0) to prevent issues per PEP 282
+        - Checks for duplicate numeric level values to prevent confusion
+        - Sets logging.<LEVEL_NAME> attribute for convenience, matching the
+          pattern of built-in levels (logging.DEBUG, logging.INFO, etc.)
+        - Sets apathetic_logging.<LEVEL_NAME>_LEVEL attribute for consistency
+          with constant naming pattern (e.g., apathetic_logging.TRACE_LEVEL,
+          apathetic_logging.CUSTOM_LEVEL)
+        - Validates existing attributes to ensure consistency
+
+        Args:
+            level: The numeric level value (must be >= 0 and not already used
+                by another level name to avoid confusion)
+            level_name: The name to associate with this level
+
+        Raises:
+            ValueError: If level < 0 (negative levels are discouraged by PEP 282)
+            ValueError: If a different level name already has this numeric value
+            ValueError: If logging.<LEVEL_NAME> already exists with a different value
+            ValueError: If apathetic_logging.<LEVEL_NAME>_LEVEL already exists
+                with a different value
+
+        Wrapper for logging.addLevelName.
+
+        https://docs.python.org/3.10/library/logging.html#logging.addLevelName
+
+        """
+        # Validate level is not negative
+        ApatheticLogging_Internal_LoggerCore.validateLevel(level, level_name=level_name)
+
+        # Check for duplicate numeric level values
+        # Get the existing name for this level value
+        existing_name = logging.getLevelName(level)
+        # Check if this level value is already registered to a different name
+        # (getLevelName returns "Level {n}" format for unknown levels)
+        if not existing_name.startswith("Level ") and existing_name != level_name:
+            msg = (
+                f"Level value {level} is already registered as '{existing_name}'. "
+                f"Cannot register as '{level_name}'. "
+                "Each level value must have a unique name to avoid confusion."
+            )
+            raise ValueError(msg)
+
+        # Check if attribute already exists in logging namespace and validate it
+        existing_value = getattr(logging, level_name, None)
+        if existing_value is not None:
+            # If it exists, it must be a valid level value (positive integer)
+            if not isinstance(existing_value, int):
+                msg = (
+                    f"Cannot set logging.{level_name}: attribute already exists "
+                    f"with non-integer value {existing_value!r}. "
+                    "Level attributes must be integers."
+                )
+                raise ValueError(msg)
+            # Validate existing value is positive
+            ApatheticLogging_Internal_LoggerCore.validateLevel(
+                existing_value,
+                level_name=level_name,
+            )
+            if existing_value != level:
+                msg = (
+                    f"Cannot set logging.{level_name}: attribute already exists "
+                    f"with different value {existing_value} "
+                    f"(trying to set {level}). "
+                    "Level attributes must match the level value."
+                )
+                raise ValueError(msg)
+            # If it exists and matches, we can proceed (idempotent)
+
+        # Get apathetic_logging namespace class
+        namespace_module = sys.modules.get("apathetic_logging")
+        namespace_class = None
+        if namespace_module is not None:
+            namespace_class = getattr(namespace_module, "apathetic_logging", None)
+
+        # Use _LEVEL suffix for apathetic_logging namespace to match constant pattern
+        # (e.g., apathetic_logging.TRACE_LEVEL instead of apathetic_logging.TRACE)
+        apathetic_level_name = f"{level_name}_LEVEL"
+
+        # Check if attribute already exists in apathetic_logging namespace
+        # and validate it
+        if namespace_class is not None:
+            existing_apathetic_value = getattr(
+                namespace_class,
+                apathetic_level_name,
+                None,
+            )
+            if existing_apathetic_value is not None:
+                # If it exists, it must be a valid level value (positive integer)
+                if not isinstance(existing_apathetic_value, int):
+                    msg = (
+                        f"Cannot set apathetic_logging.{apathetic_level_name}: "
+                        f"attribute already exists with non-integer value "
+                        f"{existing_apathetic_value!r}. "
+                        "Level attributes must be integers."
+                    )
+                    raise ValueError(msg)
+                # Validate existing value is positive
+                ApatheticLogging_Internal_LoggerCore.validateLevel(
+                    existing_apathetic_value,
+                    level_name=level_name,
+                )
+                if existing_apathetic_value != level:
+                    msg = (
+                        f"Cannot set apathetic_logging.{apathetic_level_name}: "
+                        f"attribute already exists with different value "
+                        f"{existing_apathetic_value} (trying to set {level}). "
+                        "Level attributes must match the level value."
+                    )
+                    raise ValueError(msg)
+                # If it exists and matches, we can proceed (idempotent)
+
+        logging.addLevelName(level, level_name)
+        # Set convenience attribute matching built-in levels (logging.DEBUG, etc.)
+        setattr(logging, level_name, level)
+
+        # Set convenience attribute on apathetic_logging namespace class
+        # with _LEVEL suffix to match constant pattern
+        # (e.g., apathetic_logging.TRACE_LEVEL, apathetic_logging.CUSTOM_LEVEL)
+        if namespace_class is not None:
+            setattr(namespace_class, apathetic_level_name, level)
+
+    @classmethod
+    def extendLoggingModule(
+        cls,
+        *,
+        replace_root: bool | None = None,
+        port_handlers: bool | None = None,
+        port_level: bool | None = None,
+    ) -> bool:
+        """The return value tells you if we ran or not.
+        If it is False and you're calling it via super(),
+        you can likely skip your code too.
+
+        Args:
+            replace_root: Whether to replace the root logger if it's not the correct
+                type. If None (default), checks the registry setting (set via
+                registerReplaceRootLogger()). If not set in registry, defaults to True
+                for backward compatibility. When False, the root logger will not be
+                replaced, allowing applications to use their own custom logger class
+                for the root logger. Note: This parameter is overridden if the user
+                has explicitly called ensureRootLogger(), which sets the
+                _root_logger_user_configured flag. In that case, the root logger will
+                never be replaced, regardless of the replace_root setting.
+            port_handlers: Whether to port handlers from the old root logger to the
+                new logger. If None (default), checks the registry setting (set via
+                registerPortHandlers()). If not set in registry, defaults to True
+                (DEFAULT_PORT_HANDLERS from constants.py). When False, the new
+                logger manages its own handlers via manageHandlers().
+            port_level: Whether to port level from the old root logger to the new
+                logger. If None (default), uses smart detection: if the root logger
+                was never instantiated (fresh), uses determineLogLevel() to apply
+                registered defaults; if the root logger was already accessed, respects
+                the registry setting (set via registerPortLevel()), defaulting to True
+                (DEFAULT_PORT_LEVEL from constants.py). This allows registered defaults
+                to apply cleanly during initialization, while respecting user
+                configuration of the root logger before extendLoggingModule() is called.
+                When explicitly False, always uses determineLogLevel(). When explicitly
+                True, always preserves the old level.
+
+        Note:
+            This method respects the _root_logger_user_configured flag set by
+            ensureRootLogger(). This flag represents user **intent** to control the
+            root logger, which is distinct from whether the root logger has been
+            **instantiated** (see isRootLoggerInstantiated()). The flag is sticky
+            and persists even if the root logger is later removed, ensuring that
+            if a user explicitly called ensureRootLogger(), subsequent calls to
+            extendLoggingModule() will never replace the root logger.
+
+        Note for tests:
+            When testing isinstance checks on logger instances, use
+            ``logging.getLoggerClass()`` instead of direct class references
+            (e.g., ``mod_alogs.Logger``). This works reliably in both package
+            and stitched runtime modes because it uses the actual class object
+            that was set via ``logging.setLoggerClass()``, rather than a class
+            reference from the import shim which may have different object identity
+            in stitched mode.
+
+        Example:
+                # ✅ Good: Works in both package and stitched modes
+                assert isinstance(logger, logging.getLoggerClass())
+
+                # ❌ May fail in stitched mode due to class identity differences
+                assert isinstance(logger, mod_alogs.Logger)
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        # Check if this specific class has already extended the module
+        # (not inherited from base class)
+        already_extended = getattr(cls, "_logging_module_extended", False)
+
+        # Always set the logger class to cls, even if already extended.
+        # This allows subclasses to override the logger class.
+        # stdlib unwrapped
+        logging.setLoggerClass(cls)
+
+        # Register custom levels EARLY (before root logger replacement)
+        # This ensures determineLogLevel() can return custom level names
+        # when applying defaults via _setApatheticDefaults() during root replacement
+        if not already_extended:
+            # Sanity check: validate TAG_STYLES keys are in LEVEL_ORDER
+            if __debug__:
+                _tag_levels = set(_constants.TAG_STYLES.keys())
+                _known_levels = {lvl.upper() for lvl in _constants.LEVEL_ORDER}
+                if not _tag_levels <= _known_levels:
+                    _msg = "TAG_STYLES contains unknown levels"
+                    raise AssertionError(_msg)
+
+            # Register custom levels with validation
+            # addLevelName() also sets logging.TEST, logging.TRACE, etc. attributes
+            cls.addLevelName(_constants.TEST_LEVEL, "TEST")
+            cls.addLevelName(_constants.TRACE_LEVEL, "TRACE")
+            cls.addLevelName(_constants.DETAIL_LEVEL, "DETAIL")
+            cls.addLevelName(_constants.BRIEF_LEVEL, "BRIEF")
+            cls.addLevelName(_constants.SILENT_LEVEL, "SILENT")
+
+        # Check if root logger exists and needs to be replaced
+        # This handles the case where root logger was created before
+        # extendLoggingModule() was called (e.g., if stdlib logging was imported first)
+        # We always check if root logger needs replacement (even if already_extended),
+        # but only replace on first call OR if root logger is wrong type
+        # Determine if we should replace the root logger
+        # Check parameter first, then registry, then default from constants
+        if replace_root is None:
+            _registry_data = ApatheticLogging_Internal_RegistryData
+            _registered_replace_root = (
+                _registry_data.registered_internal_replace_root_logger
+            )
+            replace_root = (
+                _registered_replace_root
+                if _registered_replace_root is not None
+                else _constants.DEFAULT_REPLACE_ROOT_LOGGER
+            )
+
+        # Check if user has explicitly configured the root logger via
+        # ensureRootLogger(). If they have, respect their choice and don't touch it.
+        # Use the main apathetic_logging module, not the logger submodule
+        # (important for stitched mode where there's only one module)
+        #
+        # NOTE: This checks _root_logger_user_configured (user INTENT), not
+        # isRootLoggerInstantiated() (current STATE). These are fundamentally
+        # different:
+        # - _root_logger_user_configured: True if user called ensureRootLogger()
+        # - isRootLoggerInstantiated(): True if ANY code accessed the root logger
+        # We MUST use the flag here to avoid replacing a root logger that was
+        # created by third-party code when the user didn't explicitly configure it.
+        namespace_module = sys.modules.get("apathetic_logging")
+        user_configured_root = getattr(
+            namespace_module, "_root_logger_user_configured", False
+        )
+
+        # Check if root logger was already instantiated BEFORE getting it
+        # (getting it will create it if it doesn't exist)
+        # This is used to determine whether to port level or apply defaults.
+
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        root_was_instantiated = _logging_utils.isRootLoggerInstantiated()
+
+        # Get root logger directly (logging.root or from registry)
+        root_logger = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+        # Determine if we should replace the root logger
+        # Only replace if:
+        # 1. replace_root is True (parameter, registry, or default)
+        # 2. User has NOT explicitly configured root via ensureRootLogger()
+        # 3. Either on first call (not already_extended) OR root logger is wrong type
+        #
+        # The _root_logger_user_configured flag is critical here: if True, we NEVER
+        # replace the root logger, ensuring that user intent via ensureRootLogger()
+        # is always respected. This differs from isRootLoggerInstantiated(), which
+        # can be True if third-party code accessed the root logger.
+        should_replace_root = (
+            replace_root
+            and not user_configured_root
+            and (not already_extended or not isinstance(root_logger, cls))
+        )
+        if should_replace_root:
+            # Root logger is wrong type - need to replace it
+            # Remove old root logger from registry
+
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+            # Remove from registry
+            _logging_utils.removeLogger(_constants.ROOT_LOGGER_KEY)
+
+            # Clear logging.root (root logger is stored there as a module-level
+            # variable). This is necessary because logging.getLogger("") returns
+            # logging.root directly.
+            if hasattr(logging, "root"):
+                logging.root = None  # type: ignore[assignment]
+
+            # Create new root logger using the manager's getLogger method
+            # The logger class is already set to cls (line 687), so this will create
+            # a logger of type cls. We use the manager directly because it handles
+            # root logger creation properly even when logging.root is None.
+            # Note: We don't use _getOrCreateLoggerOfType() here because:
+            # 1. It would call _setLoggerClassTemporarily() which is unnecessary
+            #    since we've already set the logger class to cls
+            # 2. The manager's getLogger() is the most direct way to create a root
+            #    logger
+            # 3. This avoids any potential issues with logging.root being None
+            new_root_logger = logging.Logger.manager.getLogger(
+                _constants.ROOT_LOGGER_KEY
+            )
+
+            # Ensure root logger has correct name ("root" not "")
+            # Python's logging module sets root logger name to "root" even though
+            # it's retrieved with "". We need to ensure our replacement maintains
+            # this behavior.
+            if new_root_logger.name != _constants.ROOT_LOGGER_NAME:
+                new_root_logger.name = _constants.ROOT_LOGGER_NAME
+
+            # Update logging.root to point to the new root logger
+            # This is necessary because logging.getLogger("") returns logging.root
+            # directly, and we want to ensure it points to our new logger instance.
+            if hasattr(logging, "root"):
+                logging.root = new_root_logger  # type: ignore[assignment]
+
+            # Also update logging.Logger.manager.root to point to new root logger
+            # The manager's root must stay in sync with logging.root, otherwise
+            # they reference different objects and child loggers may have incorrect
+            # parent references.
+            logging.Logger.manager.root = new_root_logger  # type: ignore[assignment]
+
+            # Port state from old root logger to new root logger
+            # (also reconnects child loggers internally)
+            #
+            # Smart port_level handling:
+            # - If root was instantiated: port its level (respect existing config)
+            # - If root is fresh (never accessed): use determineLogLevel() for defaults
+            # This allows users to register defaults and have them apply when the
+            # root logger hasn't been touched yet, while respecting user-configured
+            # root loggers accessed before extendLoggingModule() was called.
+            effective_port_level = port_level
+            if port_level is None and not root_was_instantiated:
+                # Root was never instantiated - use defaults, not port_level=True
+                # This makes determineLogLevel() apply via _setApatheticDefaults()
+                effective_port_level = False
+
+            _logging_utils.portLoggerState(
+                root_logger,
+                new_root_logger,
+                port_handlers=port_handlers,
+                port_level=effective_port_level,
+            )
+
+        # If already extended, skip returning early
+        if already_extended:
+            return False
+        cls._logging_module_extended = True
+
+        return True
+
+    @classmethod
+    def ensureRootLogger(
+        cls,
+        *,
+        logger_class: type[logging.Logger] | None = None,
+        always_replace: bool = False,
+        accept_subclass: bool = True,
+    ) -> None:
+        """Ensure the root logger is of the specified type.
+
+        This function allows applications to explicitly set what the root logger
+        should be. After calling this function, the root logger will not be
+        replaced by subsequent calls to extendLoggingModule().
+
+        Args:
+            logger_class: The desired logger class for the root logger. If None
+                (default), uses the current default logger class
+                (logging.getLoggerClass()). If specified, the root logger will be
+                created/replaced to be an instance of this class.
+            always_replace: If True, always replace the root logger even if it's
+                already the correct type or a subclass. If False (default), respects
+                existing root logger if it's already the desired type or a subclass
+                (when accept_subclass=True). This parameter is mainly for forcing
+                a fresh creation of the root logger.
+            accept_subclass: If True (default), considers a root logger that is a
+                subclass of `logger_class` as acceptable (no replacement needed).
+                If False, only exact type match is considered acceptable. This
+                affects the behavior when always_replace=False.
+
+        Example:
+            # Ensure root logger is the default apathetic logger
+            apathetic_logging.Logger.ensureRootLogger()
+
+            # Ensure root logger is a custom logger class
+            class MyLogger(apathetic_logging.Logger):
+                pass
+
+            apathetic_logging.Logger.ensureRootLogger(logger_class=MyLogger)
+
+        Note:
+            This function sets a module-level flag (_root_logger_user_configured)
+            indicating the user has **explicitly** configured the root logger. This
+            flag represents user **intent** and is distinct from whether the root
+            logger has been **instantiated** (see isRootLoggerInstantiated()).
+
+            The difference is critical:
+            - isRootLoggerInstantiated(): Queries current registry state. Returns
+              True if ANY code (user, library, stdlib) has accessed the root logger.
+            - _root_logger_user_configured flag: Tracks user intent. Only set if
+              the user explicitly called ensureRootLogger(). This flag persists
+              even if the root logger is later removed, ensuring user configuration
+              is always respected.
+
+            Subsequent calls to extendLoggingModule() check this flag to decide
+            whether to replace the root logger. If the flag is set,
+            extendLoggingModule() will not touch the root logger, respecting the
+            user's explicit choice.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        # If logger_class is None, use the current default logger class
+        if logger_class is None:
+            logger_class = logging.getLoggerClass()
+
+        # Get current root logger
+        root_logger = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+        # Determine if we should replace
+        should_replace = always_replace
+        if not should_replace:
+            # Smart mode: only replace if root is not the desired type
+            if accept_subclass:
+                # Accept exact match or subclass
+                should_replace = not isinstance(root_logger, logger_class)
+            else:
+                # Require exact match
+                should_replace = type(root_logger) is not logger_class
+
+        if should_replace:
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+            # Remove old root logger from registry
+            _logging_utils.removeLogger(_constants.ROOT_LOGGER_KEY)
+
+            # Clear logging.root
+            if hasattr(logging, "root"):
+                logging.root = None  # type: ignore[assignment]
+
+            # Set the logger class before getting the root logger
+            # This ensures the manager creates the root logger with the correct class
+            logging.setLoggerClass(logger_class)
+
+            # Create new root logger using the manager's getLogger method
+            # The logger class is already set above, so this will create a logger
+            # of type logger_class. We use the manager directly because it handles
+            # root logger creation properly even when logging.root is None.
+            new_root_logger = logging.Logger.manager.getLogger(
+                _constants.ROOT_LOGGER_KEY
+            )
+
+            # Ensure root logger has correct name
+            if new_root_logger.name != _constants.ROOT_LOGGER_NAME:
+                new_root_logger.name = _constants.ROOT_LOGGER_NAME
+
+            # Update logging.root
+            if hasattr(logging, "root"):
+                logging.root = new_root_logger  # type: ignore[assignment]
+
+            # Also update logging.Logger.manager.root to point to new root logger
+            # The manager's root must stay in sync with logging.root, otherwise
+            # they reference different objects and child loggers may have incorrect
+            # parent references.
+            logging.Logger.manager.root = new_root_logger  # type: ignore[assignment]
+
+            # Port state from old root logger to new one
+            _logging_utils.portLoggerState(
+                root_logger,
+                new_root_logger,
+                port_handlers=True,
+                port_level=True,
+            )
+
+        # Mark that user has explicitly configured the root logger
+        # This tells extendLoggingModule() not to touch the root logger
+        #
+        # IMPORTANT: This flag represents USER INTENT, not current state. It is
+        # distinct from isRootLoggerInstantiated() which queries the registry:
+        # - _root_logger_user_configured: "Did user call ensureRootLogger()?"
+        #   * Only set by ensureRootLogger()
+        #   * Sticky: persists even if root logger is removed
+        #   * Used to prevent extendLoggingModule() from touching the root logger
+        # - isRootLoggerInstantiated(): "Does a root logger currently exist?"
+        #   * Returns True if ANY code (user/library/stdlib) accessed root logger
+        #   * Dynamic: can change if root logger is removed
+        #   * Used to determine if we should port state or apply defaults
+        #
+        # Set on both the logger module (package mode) and apathetic_logging module
+        # (stitched mode). This ensures the flag is accessible in all runtime modes.
+        # Also set on the shim module (apathetic_logging.logger) if it exists, as
+        # serger creates separate module objects for submodule shims in stitched mode.
+        logger_module = sys.modules.get(__name__)
+        if logger_module is not None:
+            logger_module._root_logger_user_configured = True  # type: ignore[attr-defined]  # noqa: SLF001
+        namespace_module = sys.modules.get("apathetic_logging")
+        if namespace_module is not None:
+            namespace_module._root_logger_user_configured = True  # type: ignore[attr-defined]  # noqa: SLF001
+        # Also set on the shim module for stitched mode compatibility
+        logger_shim_module = sys.modules.get("apathetic_logging.logger")
+        if logger_shim_module is not None:
+            logger_shim_module._root_logger_user_configured = True  # type: ignore[attr-defined]  # noqa: SLF001
+
+    def determineLogLevel(
+        self,
+        *,
+        args: argparse.Namespace | None = None,
+        root_log_level: str | None = None,
+    ) -> str:
+        """Resolve log level from CLI → env → root config → default."""
+        _registry = ApatheticLogging_Internal_RegistryData
+        _constants = ApatheticLogging_Internal_Constants
+        args_level = getattr(args, "log_level", None)
+        if args_level is not None:
+            # cast_hint would cause circular dependency
+            return cast("str", args_level).upper()
+
+        # Check registered environment variables, or fall back to "LOG_LEVEL"
+        # Access registry via namespace class MRO to ensure correct resolution
+        # in both package and stitched builds
+        namespace_module = sys.modules.get("apathetic_logging")
+        if namespace_module is not None:
+            namespace_class = getattr(namespace_module, "apathetic_logging", None)
+            if namespace_class is not None:
+                # Use namespace class MRO to access registry
+                # (handles shadowed attributes correctly)
+                registered_env_vars = getattr(
+                    namespace_class,
+                    "registered_internal_log_level_env_vars",
+                    None,
+                )
+                registered_default = getattr(
+                    namespace_class,
+                    "registered_internal_default_log_level",
+                    None,
+                )
+            else:
+                # Fallback to direct registry access
+                registry_cls = _registry
+                registered_env_vars = (
+                    registry_cls.registered_internal_log_level_env_vars
+                )
+                registered_default = registry_cls.registered_internal_default_log_level
+        else:
+            # Fallback to direct registry access
+            registered_env_vars = _registry.registered_internal_log_level_env_vars
+            registered_default = _registry.registered_internal_default_log_level
+
+        env_vars_to_check = (
+            registered_env_vars or _constants.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
+        )
+        for env_var in env_vars_to_check:
+            env_log_level = os.getenv(env_var)
+            if env_log_level:
+                return env_log_level.upper()
+
+        if root_log_level:
+            return root_log_level.upper()
+
+        # Use registered default, or fall back to module default
+        default_level: str = (
+            registered_default or _constants.DEFAULT_APATHETIC_LOG_LEVEL
+        )
+        return default_level.upper()
+
+    @property
+    def levelName(self) -> str:
+        """Return the explicit level name set on this logger.
+
+        This property returns the name of the level explicitly set on this logger
+        (via self.level). For the effective level name (what's actually used,
+        considering inheritance), use effectiveLevelName instead.
+
+        See also: logging.getLevelName, effectiveLevelName
+        """
+        return self.getLevelName()
+
+    @property
+    def effectiveLevel(self) -> int:
+        """Return the effective level (what's actually used).
+
+        This property returns the effective logging level for this logger,
+        considering inheritance from parent loggers. This is the preferred
+        way to get the effective level. Also available via getEffectiveLevel()
+        for stdlib compatibility.
+
+        See also: logging.Logger.getEffectiveLevel, effectiveLevelName
+        """
+        return self.getEffectiveLevel()
+
+    @property
+    def effectiveLevelName(self) -> str:
+        """Return the effective level name (what's actually used).
+
+        This property returns the name of the effective logging level for this
+        logger, considering inheritance from parent loggers. This is the
+        preferred way to get the effective level name. Also available via
+        getEffectiveLevelName() for consistency.
+
+        See also: logging.getLevelName, effectiveLevel
+        """
+        return self.getEffectiveLevelName()
+
+    @property
+    def root(self) -> "ApatheticLogging_Internal_Logger.Logger" | logging.RootLogger:  # type: ignore[override, name-defined]  # noqa: UP037
+        """Return the root logger instance.
+
+        This property overrides the standard library's ``logging.Logger.root``
+        class attribute to provide better type hints. It returns the same root
+        logger instance as the standard library.
+
+        The root logger may be either:
+        - An ``apathetic_logging.Logger`` if it was created after
+          ``extendLoggingModule()`` was called (expected/common case)
+        - A standard ``logging.RootLogger`` if it was created before
+          ``extendLoggingModule()`` was called (fallback, see ROADMAP.md)
+
+        Returns:
+            The root logger instance (either ``apathetic_logging.Logger`` or
+            ``logging.RootLogger``).
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> # Access root logger with better type hints
+            >>> logger.root.setLevel("debug")
+            >>> logger.root.levelName
+            'DEBUG'
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        return logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+    def getLevel(self) -> int:
+        """Return the explicit level set on this logger.
+
+        This method returns the level explicitly set on this logger (via
+        self.level). For the effective level (what's actually used, considering
+        inheritance), use getEffectiveLevel() or the effectiveLevel property.
+
+        Returns:
+            The explicit level value (int) set on this logger.
+
+        See also: level property, getEffectiveLevel
+
+        """
+        return self.level
+
+    def getLevelName(self) -> str:
+        """Return the explicit level name set on this logger.
+
+        This method returns the name of the level explicitly set on this logger
+        (via self.level). For the effective level name (what's actually used,
+        considering inheritance), use getEffectiveLevelName() or the
+        effectiveLevelName property.
+
+        Returns:
+            The explicit level name (str) set on this logger.
+
+        See also: levelName property, getEffectiveLevelName
+
+        """
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(self.level)
+
+    def getEffectiveLevelName(self) -> str:
+        """Return the effective level name (what's actually used).
+
+        This method returns the name of the effective logging level for this
+        logger, considering inheritance from parent loggers. Prefer the
+        effectiveLevelName property for convenience, or use this method for
+        consistency with getEffectiveLevel().
+
+        Returns:
+            The effective level name (str) for this logger.
+
+        See also: effectiveLevelName property, getEffectiveLevel
+
+        """
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(
+            self.getEffectiveLevel(),
+        )
+
+    def errorIfNotDebug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Logs an exception with the real traceback starting from the caller.
+        Only shows full traceback if debug/trace is enabled.
+        """
+        exc_info = kwargs.pop("exc_info", True)
+        stacklevel = kwargs.pop("stacklevel", self.DEFAULT_STACKLEVEL)
+        if self.isEnabledFor(logging.DEBUG):
+            self.exception(
+                msg,
+                *args,
+                exc_info=exc_info,
+                stacklevel=stacklevel,
+                **kwargs,
+            )
+        else:
+            self.error(msg, *args, **kwargs)
+
+    def criticalIfNotDebug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Logs an exception with the real traceback starting from the caller.
+        Only shows full traceback if debug/trace is enabled.
+        """
+        exc_info = kwargs.pop("exc_info", True)
+        stacklevel = kwargs.pop("stacklevel", self.DEFAULT_STACKLEVEL)
+        if self.isEnabledFor(logging.DEBUG):
+            self.exception(
+                msg,
+                *args,
+                exc_info=exc_info,
+                stacklevel=stacklevel,
+                **kwargs,
+            )
+        else:
+            self.critical(msg, *args, **kwargs)
+
+    def colorize(
+        self,
+        text: str,
+        color: str,
+        *,
+        enable_color: bool | None = None,
+    ) -> str:
+        """Apply ANSI color codes to text.
+
+        Defaults to using the instance's enable_color setting.
+
+        Args:
+            text: Text to colorize
+            color: ANSI color code
+            enable_color: Override color setting, or None to use instance default
+
+        Returns:
+            Colorized text if enabled, otherwise original text
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        if enable_color is None:
+            enable_color = self.enable_color
+        return f"{color}{text}{_constants.ANSIColors.RESET}" if enable_color else text
+
+    def trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a trace-level message (more verbose than DEBUG)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.TRACE_LEVEL):
+            self._log(_constants.TRACE_LEVEL, msg, args, **kwargs)
+
+    def detail(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a detail-level message (more detailed than INFO)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.DETAIL_LEVEL):
+            self._log(
+                _constants.DETAIL_LEVEL,
+                msg,
+                args,
+                **kwargs,
+            )
+
+    def brief(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a brief-level message (less detailed than INFO)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.BRIEF_LEVEL):
+            self._log(
+                _constants.BRIEF_LEVEL,
+                msg,
+                args,
+                **kwargs,
+            )
+
+    def test(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a test-level message (most verbose, bypasses capture)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.TEST_LEVEL):
+            self._log(_constants.TEST_LEVEL, msg, args, **kwargs)
+
+    def logDynamic(self, level: str | int, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with a dynamically provided log level
+           (unlike .info(), .error(), etc.).
+
+        Useful when you have a log level (string or numeric) and don't want to resolve
+        either the string to int, or the int to a log method.
+
+        Args:
+            level: Log level as string name or integer
+            msg: Message format string
+            *args: Arguments for message formatting
+            **kwargs: Additional keyword arguments
+
+        """
+        # Resolve level
+        if isinstance(level, str):
+            try:
+                level_no = ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+            except ValueError:
+                self.error("Unknown log level: %r", level)
+                return
+        elif isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            level_no = level
+        else:
+            self.error("Invalid log level type: %r", type(level))
+            return
+
+        self._log(level_no, msg, args, **kwargs)
+
+    @contextmanager
+    def useLevel(
+        self,
+        level: str | int,
+        *,
+        minimum: bool = False,
+    ) -> Generator[None, None, None]:
+        """Use a context to temporarily log with a different log-level.
+
+        Args:
+            level: Log level to use (string name or numeric value)
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current effective level. This prevents
+                downgrading from a more verbose level (e.g., TRACE) to a less
+                verbose one (e.g., DEBUG). Compares against effective level
+                (considering parent inheritance), matching setLevel(minimum=True)
+                behavior. Defaults to False.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        """
+        # Save explicit level for restoration (not effective level)
+        prev_level = self.level
+
+        # Resolve level
+        if isinstance(level, str):
+            try:
+                level_no = ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+            except ValueError:
+                self.error("Unknown log level: %r", level)
+                # Yield control anyway so the 'with' block doesn't explode
+                yield
+                return
+        elif isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            level_no = level
+        else:
+            self.error("Invalid log level type: %r", type(level))
+            yield
+            return
+
+        # Apply new level (only if more verbose when minimum=True)
+        if minimum:
+            # Compare against effective level (not explicit level) to match
+            # setLevel(minimum=True) behavior. This ensures consistent behavior
+            # when logger inherits level from parent.
+            current_effective_level = self.getEffectiveLevel()
+            # Lower number = more verbose, so only set if new level is more verbose
+            if level_no < current_effective_level:
+                self.setLevel(level_no)
+            # Otherwise keep current level (don't downgrade)
+        else:
+            self.setLevel(level_no)
+
+        try:
+            yield
+        finally:
+            self.setLevel(prev_level)
+
+    @contextmanager
+    def useLevelMinimum(self, level: str | int) -> Generator[None, None, None]:
+        """Use a context to temporarily log with a different log-level.
+
+        Only applies if the level is more verbose than the current level.
+
+        This convenience context manager is equivalent to calling
+        ``useLevel(level, minimum=True)``. It temporarily sets the logger level
+        only if the requested level is more verbose (lower numeric value) than
+        the current effective level, preventing downgrades from more verbose
+        levels.
+
+        Args:
+            level: Log level to use (string name or numeric value). Only applied
+                if it's more verbose than the current effective level.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> logger.setLevel("TRACE")
+            >>> # This won't downgrade from TRACE to DEBUG
+            >>> with logger.useLevelMinimum("DEBUG"):
+            ...     assert logger.levelName == "TRACE"  # Still TRACE
+            >>> # This will upgrade from INFO to DEBUG
+            >>> logger.setLevel("INFO")
+            >>> with logger.useLevelMinimum("DEBUG"):
+            ...     assert logger.levelName == "DEBUG"  # Upgraded to DEBUG
+
+        """
+        with self.useLevel(level, minimum=True):
+            yield
+
+    @contextmanager
+    def usePropagate(
+        self,
+        propagate: bool,  # noqa: FBT001
+        *,
+        manage_handlers: bool | None = None,
+    ) -> Generator[None, None, None]:
+        """Use a context to temporarily change propagate setting.
+
+        Args:
+            propagate: If True, messages propagate to parent loggers. If False,
+                messages only go to this logger's handlers.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        """
+        # Save current propagate setting for restoration
+        prev_propagate = self.propagate
+
+        # Apply new propagate setting
+        self.setPropagate(propagate, manage_handlers=manage_handlers)
+
+        try:
+            yield
+        finally:
+            # Restore previous propagate setting
+            self.setPropagate(prev_propagate, manage_handlers=manage_handlers)
+
+    @contextmanager
+    def useLevelAndPropagate(
+        self,
+        level: str | int,
+        *,
+        minimum: bool = False,
+        manage_handlers: bool | None = None,
+    ) -> Generator[None, None, None]:
+        """Use a context to temporarily set level and propagate together.
+
+        This convenience context manager combines useLevel() and usePropagate()
+        with intelligent defaults:
+        - If level is INHERIT_LEVEL (NOTSET): sets propagate=True
+        - If level is a specific level: sets propagate=False
+        - On root logger: only sets level (propagate is unchanged)
+
+        Both settings are restored when the context exits.
+
+        Args:
+            level: Log level to use (string name or numeric value). Use
+                INHERIT_LEVEL (0) or "NOTSET" to inherit.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current effective level. This prevents
+                downgrading from a more verbose level (e.g., TRACE) to a less
+                verbose one (e.g., DEBUG). Compares against effective level
+                (considering parent inheritance), matching setLevel(minimum=True)
+                behavior. Defaults to False.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> # Temporarily inherit level and propagate
+            >>> with logger.useLevelAndPropagate(INHERIT_LEVEL):
+            ...     logger.info("This propagates to root")
+            >>> # Temporarily set explicit level with isolated logging
+            >>> with logger.useLevelAndPropagate("debug"):
+            ...     logger.debug("This only goes to logger's handlers")
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Save current settings for restoration
+        prev_level = self.level
+        prev_propagate = self.propagate
+
+        # Resolve level
+        if isinstance(level, str):
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+            try:
+                level_no = _logging_utils.getLevelNumber(level)
+            except ValueError:
+                self.error("Unknown log level: %r", level)
+                # Yield control anyway so the 'with' block doesn't explode
+                yield
+                return
+        elif isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            level_no = level
+        else:
+            self.error("Invalid log level type: %r", type(level))
+            yield
+            return
+
+        # Apply new level (only if more verbose when minimum=True)
+        if minimum:
+            # Compare against effective level (not explicit level) to match
+            # setLevel(minimum=True) behavior. This ensures consistent behavior
+            # when logger inherits level from parent.
+            current_effective_level = self.getEffectiveLevel()
+            # Lower number = more verbose, so only set if new level is more verbose
+            if level_no < current_effective_level:
+                self.setLevel(level_no)
+            # Otherwise keep current level (don't downgrade)
+        else:
+            self.setLevel(level_no)
+
+        # Set propagate based on level (only if not root logger)
+        # Root logger can have name "" (ROOT_LOGGER_KEY) or "root" (ROOT_LOGGER_NAME)
+        is_root = self.name in {
+            _constants.ROOT_LOGGER_KEY,
+            _constants.ROOT_LOGGER_NAME,
+        }
+        if not is_root:
+            if level_no == _constants.INHERIT_LEVEL:
+                # INHERIT_LEVEL -> propagate=True
+                self.setPropagate(True, manage_handlers=manage_handlers)
+            else:
+                # Specific level -> propagate=False
+                self.setPropagate(False, manage_handlers=manage_handlers)
+        # Root logger: propagate is unchanged (root always has handlers)
+
+        try:
+            yield
+        finally:
+            # Restore previous settings
+            self.setLevel(prev_level)
+            if not is_root:
+                self.setPropagate(prev_propagate, manage_handlers=manage_handlers)
+
+
+# === apathetic_logging.logger_namespace ===
+# src/apathetic_logging/logger_namespace.py
+"""Logger namespace mixin that provides the Logger nested class.
+
+See https://docs.python.org/3/library/logging.html#logging.Logger for the
+complete list of standard library Logger methods.
+
+Docstrings are adapted from the standard library logging.Logger documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_Logger:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the Logger nested class.
+
+    This class contains the Logger implementation as a nested class, using
+    the core Logger implementation.
+
+    When mixed into apathetic_logging, it provides apathetic_logging.Logger.
+    """
+
+    class Logger(
+        ApatheticLogging_Internal_LoggerCore,
+    ):
+        """Logger for all Apathetic tools.
+
+        This Logger class is composed from:
+        - Core Logger implementation
+          (ApatheticLogging_Internal_LoggerCore, which inherits from logging.Logger)
+        """
+
+
+# === apathetic_logging.get_logger ===
+# src/apathetic_logging/get_logger.py
+"""GetLogger functionality for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the getLogger static method.
+
+    This class contains the getLogger implementation as a static method.
+    When mixed into apathetic_logging, it provides apathetic_logging.getLogger.
+    """
+
+    _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
+
+    @staticmethod
+    def _setLoggerClassTemporarily(
+        klass: type[ApatheticLogging_Internal_GetLogger._LoggerType],
+        name: str,
+    ) -> ApatheticLogging_Internal_GetLogger._LoggerType:
+        """Temporarily set the logger class, get/create a logger, then restore.
+
+        This is an internal helper function used by getLoggerOfType to create
+        a logger of a specific type when one doesn't already exist. It temporarily
+        sets the logger class to the desired type, gets or creates the logger,
+        then restores the original logger class.
+
+        This function is mostly for internal use by the library. If you need
+        a logger of a specific type, use getLoggerOfType instead, which provides
+        all the conveniences (name inference, registry checking, etc.).
+
+        Args:
+            klass (logger class): The desired logger class type.
+            name: The name of the logger to get.
+
+        Returns:
+            A logger instance of the specified type.
+        """
+        # stdlib unwrapped
+        original_class = logging.getLoggerClass()
+        logging.setLoggerClass(klass)
+        # avoid circular dependency by using logging.getLogger directly
+        logger = logging.getLogger(name)
+        logging.setLoggerClass(original_class)
+        typed_logger = cast("ApatheticLogging_Internal_GetLogger._LoggerType", logger)
+        return typed_logger
+
+    @staticmethod
+    def _getOrCreateLoggerOfType(
+        register_name: str,
+        class_type: type[ApatheticLogging_Internal_GetLogger._LoggerType],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ApatheticLogging_Internal_GetLogger._LoggerType:
+        """Get or create a logger of the specified type.
+
+        Checks if a logger with the given name exists. If it exists but is not
+        of the correct type, removes it and creates a new one. If it doesn't
+        exist, creates a new logger of the specified type.
+
+        Args:
+            register_name: The name of the logger to get or create.
+            class_type: The logger class type to use.
+            *args: Additional positional arguments to pass to logging.getLogger.
+            **kwargs: Additional keyword arguments to pass to logging.getLogger.
+
+        Returns:
+            A logger instance of the specified type.
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        logger: logging.Logger | None = None
+        old_logger: logging.Logger | None = None
+        registered = _logging_utils.hasLogger(register_name)
+        if registered:
+            logger = logging.getLogger(register_name, *args, **kwargs)
+            if not isinstance(logger, class_type):
+                # Save reference to old logger before removing it
+                old_logger = logger
+                _logging_utils.removeLogger(register_name)
+                registered = False
+        if not registered:  # may have changed above
+            # Save the parent that Python's logging module assigned before creating
+            # logger. This is important because when we create a new logger, Python's
+            # logging module might assign it a parent (e.g., old root logger or
+            # intermediate logger)
+
+            _constants = ApatheticLogging_Internal_Constants
+
+            # Get the parent that would be assigned by Python's logging module
+            # We do this by temporarily creating the logger to see what parent it gets
+            # But we can't do that without side effects, so we'll check after creation
+            logger = ApatheticLogging_Internal_GetLogger._setLoggerClassTemporarily(
+                class_type, register_name
+            )
+
+            # Save the parent that was assigned
+            old_parent = logger.parent
+
+            # Port state from old logger if we replaced an existing logger
+            # (also reconnects child loggers internally)
+            if old_logger is not None:
+                # Port state from old logger, but user-provided kwargs take precedence
+                # Check if level is explicitly provided in kwargs - if so, don't port
+                # level (user's level will be applied later in getLoggerOfType)
+                user_provided_level = kwargs.get("level")
+                # Only port if user didn't provide level
+                port_level = user_provided_level is None
+                _logging_utils.portLoggerState(
+                    old_logger,
+                    logger,
+                    port_handlers=None,  # Use default (True) - port handlers
+                    port_level=port_level,  # Port level only if user didn't provide one
+                )
+
+            # Fix parent if it points to old root logger
+            # Only fix if this is not the root logger itself
+            if logger.name not in {
+                _constants.ROOT_LOGGER_KEY,
+                _constants.ROOT_LOGGER_NAME,
+            }:
+                # Check if old parent was the old root logger (has no parent itself)
+                # Root logger is the only logger that has no parent
+                if old_parent is not None:
+                    # Check if old_parent might be the old root logger
+                    # Root logger has no parent, and its name is "" or "root"
+                    old_parent_might_be_old_root = (
+                        old_parent.name
+                        in {
+                            _constants.ROOT_LOGGER_KEY,
+                            _constants.ROOT_LOGGER_NAME,
+                        }
+                        and old_parent.parent is None
+                    )
+
+                    if old_parent_might_be_old_root:
+                        # Get current root logger to check if it's different
+                        # Only call logging.getLogger() when we actually need to fix
+                        current_root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+                        if old_parent is not current_root:
+                            # Old parent was the old root logger - set to new root
+                            logger.parent = current_root
+                    # else: old parent was an intermediate logger - keep it
+                    # (preserve hierarchy)
+                else:
+                    # No old parent (shouldn't happen for non-root loggers, but be safe)
+                    # Get current root logger and set as parent
+                    current_root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+                    logger.parent = current_root
+
+        typed_logger = cast("ApatheticLogging_Internal_GetLogger._LoggerType", logger)
+        return typed_logger
+
+    @staticmethod
+    def _applyPropagateSetting(logger: logging.Logger) -> None:
+        """Apply propagate setting to a logger from registry or default.
+
+        This method implements the second phase of the two-phase propagate
+        initialization pattern. It is called automatically by getLoggerOfType()
+        after logger creation.
+
+        **Contract with Logger.__init__:** Only applies the registry/default
+        propagate value if the logger's _propagate_explicit flag is False,
+        indicating that the user did not explicitly provide a propagate value
+        in Logger.__init__(). This ensures that explicit user settings take
+        precedence over registry/default values.
+
+        If the logger does not have setPropagate() (e.g., standard logging.Logger),
+        the propagate attribute is set directly.
+
+        Args:
+            logger: The logger instance to apply the propagate setting to.
+        """
+        # Only set if not already explicitly set in __init__
+        if not getattr(logger, "_propagate_explicit", False):
+            # Use getDefaultPropagate() to resolve registry/default value
+            propagate_value = ApatheticLogging_Internal_Registry.getDefaultPropagate()
+
+            # Use setPropagate if available (apathetic logger), otherwise set directly
+            if hasattr(logger, "setPropagate"):
+                logger.setPropagate(propagate_value)  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+            else:
+                logger.propagate = propagate_value
+
+    @staticmethod
+    def getLogger(
+        name: str | None = None,
+        *args: Any,
+        level: str | int | None = None,
+        minimum: bool | None = None,
+        extend: bool | None = None,
+        replace_root: bool | None = None,
+        **kwargs: Any,
+    ) -> ApatheticLogging_Internal_Logger.Logger:
+        """Return a logger with the specified name, creating it if necessary.
+
+        Changes:
+        - When name is None, infers the name automatically from
+          the calling module's __package__ attribute by examining the call stack
+          (using skip_frames=2 to correctly identify the caller)
+          instead of returning the root logger.
+        - When name is an empty string (""), returns the root logger
+          as usual, matching standard library behavior.
+        - Returns an apathetic_logging.Logger instance instead of
+          the standard logging.Logger.
+
+        Args:
+            name: The name of the logger to get. If None, the logger name
+                will be auto-inferred from the calling module's __package__.
+                If an empty string (""), returns the root logger.
+            *args: Additional positional arguments (for future-proofing)
+            level: Log level to set on the logger. Accepts both string
+                names (case-insensitive) and numeric values. Level 0 or
+                INHERIT_LEVEL (i.e. NOTSET) allows inheritance from parent logger.
+                - If not provided: defaults to INHERIT_LEVEL (inherits from root)
+                - If None: auto-resolves via determineLogLevel()
+                - If provided (str/int): sets the logger's level to this value
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). If None, defaults to False. Only used when
+                `level` is provided.
+            extend: If True (default), extend the logging module.
+            replace_root: Whether to replace the root logger if it's not the correct
+                type. If None (default), uses registry setting or constant default.
+                Only used when extend=True.
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            A logger of type ApatheticLogging_Internal_Logger.Logger.
+
+        Wrapper for logging.getLogger.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogger
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        skip_frames = 2
+        result = _get_logger.getLoggerOfType(
+            name,
+            _logger.Logger,
+            skip_frames,
+            *args,
+            level=level,
+            minimum=minimum,
+            extend=extend,
+            replace_root=replace_root,
+            **kwargs,
+        )
+        return cast("ApatheticLogging_Internal_Logger.Logger", result)  # type: ignore[redundant-cast]
+
+    @staticmethod
+    def getLoggerOfType(
+        name: str | None,
+        class_type: type[ApatheticLogging_Internal_GetLogger._LoggerType],
+        skip_frames: int = 1,
+        *args: Any,
+        level: str | int | None = None,
+        minimum: bool | None = None,
+        extend: bool | None = True,
+        replace_root: bool | None = None,
+        **kwargs: Any,
+    ) -> ApatheticLogging_Internal_GetLogger._LoggerType:
+        """Get a logger of the specified type, creating it if necessary.
+
+        Changes:
+        - When name is None, infers the name automatically from
+          the calling module's __package__ attribute by examining the call stack
+          (using skip_frames to correctly identify the caller)
+          instead of returning the root logger.
+        - When name is an empty string (""), returns the root logger
+          as usual, matching standard library behavior.
+        - Returns a class_type instance instead of
+          the standard logging.Logger.
+
+        Args:
+            name: The name of the logger to get. If None, the logger name
+                will be auto-inferred from the calling module's __package__.
+                If an empty string (""), returns the root logger.
+            class_type: The logger class type to use.
+            skip_frames: Number of frames to skip when inferring logger name.
+                Prefer using as a keyword argument (e.g., skip_frames=2) for clarity.
+            *args: Additional positional arguments (for future-proofing)
+            level: Exact log level to set on the logger. Accepts both string
+                names (case-insensitive) and numeric values. Level 0 or
+                INHERIT_LEVEL (i.e. NOTSET) allows inheritance from parent
+                logger. If provided, sets the logger's level to this value.
+                Defaults to None.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). If None, defaults to False. Only used when
+                `level` is provided.
+            extend: If True (default), extend the logging module.
+            replace_root: Whether to replace the root logger if it's not the correct
+                type. If None (default), uses registry setting or constant default.
+                Only used when extend=True.
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            A logger instance of the specified type.
+
+        Wrapper for logging.getLogger.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogger
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Check compatibility mode for getLogger(None) behavior
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        compatibility_mode = (
+            _registry_data.registered_internal_compatibility_mode
+            if _registry_data.registered_internal_compatibility_mode is not None
+            else False
+        )
+
+        # In compatibility mode, getLogger(None) returns root logger (stdlib behavior)
+        if name is None and compatibility_mode:
+            register_name: str = ApatheticLogging_Internal_Constants.ROOT_LOGGER_KEY
+        else:
+            # Resolve logger name (with inference if needed)
+            # Note: Empty string ("") is a special case - getDefaultLoggerName
+            # returns it as-is (root logger, matching stdlib behavior). This is
+            # handled by the
+            # early return in getDefaultLoggerName when logger_name is not None.
+            # skip_frames+1 because: getLoggerOfType -> getDefaultLoggerName -> caller
+            # check_registry=True because getLogger() should use a previously registered
+            # name if available, which is the expected behavior for "get" operations.
+            # raise_on_error=True because getLogger() requires a logger name.
+            # infer=True and register=True - getLogger() infers and stores (matches old
+            # resolveLoggerName behavior where inferred names were automatically stored)
+            register_name_raw = _logging_utils.getDefaultLoggerName(
+                name,
+                check_registry=True,
+                skip_frames=skip_frames + 1,
+                raise_on_error=True,
+                infer=True,
+                register=True,
+            )
+            # With raise_on_error=True, register_name is guaranteed to be str, not None
+            register_name = register_name_raw  # type: ignore[assignment]
+
+        # extend logging module
+        if extend and hasattr(class_type, "extendLoggingModule"):
+            class_type.extendLoggingModule(replace_root=replace_root)  # type: ignore[attr-defined]
+
+        # Get or create logger of the correct type
+        logger = ApatheticLogging_Internal_GetLogger._getOrCreateLoggerOfType(
+            register_name, class_type, *args, **kwargs
+        )
+
+        # Apply log level settings
+        if level is not None:
+            logger.setLevel(
+                level,
+                minimum=minimum,  # type: ignore[call-arg]  # pyright: ignore[reportCallIssue]
+            )
+
+        # Apply propagate setting from registry or default
+        ApatheticLogging_Internal_GetLogger._applyPropagateSetting(logger)
+
+        return logger
+
+
+# === apathetic_logging.logging_levels ===
+# src/apathetic_logging/logging_levels.py
+"""Custom log level functions for Apathetic Logging.
+
+This module provides convenience functions for custom log levels (TEST, TRACE, DETAIL,
+BRIEF) that don't exist in the standard library. These functions log
+to the root logger and ensure the logging module is extended with custom levels.
+"""
+
+
+class ApatheticLogging_Internal_LoggingLevels:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides custom log level functions.
+
+    This class contains convenience functions for custom log levels that don't
+    exist in the standard library. These functions log to the root logger and
+    ensure the logging module is extended with custom levels.
+
+    When mixed into apathetic_logging, it provides functions for TEST, TRACE, DETAIL,
+    and BRIEF log levels.
+    """
+
+    @staticmethod
+    def trace(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'TRACE' on the root logger.
+
+        TRACE is more verbose than DEBUG. If the logger has no handlers,
+        call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its trace() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has trace method (it should if it's an apathetic logger)
+        if hasattr(logger, "trace"):
+            logger.trace(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        # This can happen if root logger was created before extendLoggingModule
+        elif logger.isEnabledFor(_constants.TRACE_LEVEL):
+            logger._log(_constants.TRACE_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    @staticmethod
+    def detail(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'DETAIL' on the root logger.
+
+        DETAIL is more detailed than INFO. If the logger has no handlers,
+        call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its detail() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has detail method (it should if it's an apathetic logger)
+        if hasattr(logger, "detail"):
+            logger.detail(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        elif logger.isEnabledFor(_constants.DETAIL_LEVEL):
+            logger._log(_constants.DETAIL_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    @staticmethod
+    def brief(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'BRIEF' on the root logger.
+
+        BRIEF is less detailed than INFO. If the logger has no handlers,
+        call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its brief() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has brief method (it should if it's an apathetic logger)
+        if hasattr(logger, "brief"):
+            logger.brief(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        elif logger.isEnabledFor(_constants.BRIEF_LEVEL):
+            logger._log(_constants.BRIEF_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    @staticmethod
+    def test(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'TEST' on the root logger.
+
+        TEST is the most verbose level and bypasses capture. If the logger has no
+        handlers, call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its test() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has test method (it should if it's an apathetic logger)
+        if hasattr(logger, "test"):
+            logger.test(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        # This can happen if root logger was created before extendLoggingModule
+        elif logger.isEnabledFor(_constants.TEST_LEVEL):
+            logger._log(_constants.TEST_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+# === apathetic_logging.namespace ===
+# src/apathetic_logging/namespace.py
+"""Shared Apathetic CLI logger implementation.
+
+See https://docs.python.org/3/library/logging.html for the complete list of
+standard library logging functions that are wrapped by this namespace.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+# --- Apathetic Logging Namespace -------------------------------------------
+
+
+class apathetic_logging(  # noqa: N801
+    ApatheticLogging_Internal_Constants,
+    ApatheticLogging_Internal_DualStreamHandler,
+    ApatheticLogging_Internal_GetLogger,
+    ApatheticLogging_Internal_Logger,
+    ApatheticLogging_Internal_LoggingLevels,
+    ApatheticLogging_Internal_LoggingRoot,
+    ApatheticLogging_Internal_LoggingUtils,
+    ApatheticLogging_Internal_Registry,
+    ApatheticLogging_Internal_RegistryData,
+    ApatheticLogging_Internal_SafeLogging,
+    ApatheticLogging_Internal_TagFormatter,
+    ApatheticLogging_Internal_StdCamelCase,  # keep last
+):
+    """Namespace for apathetic logging functionality.
+
+    All logger functionality is accessed via this namespace class to minimize
+    global namespace pollution when the library is embedded in a stitched script.
+
+    **Classes:**
+    - ``Logger`` → ``ApatheticLogging_Internal_Logger``
+    - ``TagFormatter`` → ``ApatheticLogging_Internal_TagFormatter``
+    - ``DualStreamHandler`` → ``ApatheticLogging_Internal_DualStreamHandler``
+
+    **Static Methods:**
+    - ``getLogger()`` → ``ApatheticLogging_Internal_GetLogger``
+    - ``registerDefaultLogLevel()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerLogLevelEnvVars()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerLogger()`` → ``ApatheticLogging_Internal_Registry``
+    - ``safeLog()`` → ``ApatheticLogging_Internal_SafeLogging``
+    - ``safeTrace()`` → ``ApatheticLogging_Internal_SafeLogging``
+    - ``makeSafeTrace()`` → ``ApatheticLogging_Internal_SafeLogging``
+
+    **Constants:**
+    - ``DEFAULT_APATHETIC_LOG_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS`` → ``ApatheticLogging_Internal_Constants``
+    - ``SAFE_TRACE_ENABLED`` → ``ApatheticLogging_Internal_SafeLogging``
+    - ``TEST_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``TRACE_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``BRIEF_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``DETAIL_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``SILENT_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``LEVEL_ORDER`` → ``ApatheticLogging_Internal_Constants``
+    - ``ANSIColors`` → ``ApatheticLogging_Internal_Constants``
+    - ``TAG_STYLES`` → ``ApatheticLogging_Internal_Constants``
+    """
+
+
+# Ensure logging module is extended with TEST, TRACE, DETAIL, BRIEF, and SILENT
+# levels
+# This must be called before any loggers are created
+# This runs when namespace.py is executed (both package and stitched modes)
+# The method is idempotent, so safe to call multiple times if needed
+apathetic_logging.Logger.extendLoggingModule()
+
+# Note: All exports are handled in __init__.py
+# - For library builds (package/stitched): __init__.py is included, exports happen
+# - For embedded builds: __init__.py is excluded, no exports (only class available)
+
+
+# === apathetic_logging.__init__ ===
+# src/apathetic_logging/__init__.py
+"""Apathetic Logging implementation."""
+
+
+# Get reference to the namespace class
+# In stitched mode: class is already defined in namespace.py (executed before this)
+# In package mode: import from namespace module
+_apathetic_logging_is_stitched = globals().get("__STITCHED__", False)
+
+if _apathetic_logging_is_stitched:
+    # Stitched mode: class already defined in namespace.py
+    # Get reference to the class (it's already in globals from namespace.py)
+    _apathetic_logging_raw = globals().get("apathetic_logging")
+    if _apathetic_logging_raw is None:
+        # Fallback: should not happen, but handle gracefully
+        msg = "apathetic_logging class not found in stitched mode"
+        raise RuntimeError(msg)
+    # Type cast to help mypy understand this is the apathetic_logging class
+    # The import gives us type[apathetic_logging], so cast to
+    # type[_apathetic_logging_class]
+    apathetic_logging = cast("type[_apathetic_logging_class]", _apathetic_logging_raw)
+else:
+    # Package mode: import from namespace module
+    # This block is only executed in package mode, not in stitched builds
+
+    # Ensure the else block is not empty (build script may remove import)
+    _ = apathetic_logging
+
+# Export all namespace items for convenience
+# These are aliases to apathetic_logging.*
+#
+# Note: In embedded builds, __init__.py is excluded from the stitch,
+# so this code never runs and no exports happen (only the class is available).
+# In stitched/package builds, __init__.py is included, so exports happen.
+DEFAULT_APATHETIC_LOG_LEVEL = apathetic_logging.DEFAULT_APATHETIC_LOG_LEVEL
+DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS = (
+    apathetic_logging.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
+)
+LEVEL_ORDER = apathetic_logging.LEVEL_ORDER
+SILENT_LEVEL = apathetic_logging.SILENT_LEVEL
+TAG_STYLES = apathetic_logging.TAG_STYLES
+TEST_LEVEL = apathetic_logging.TEST_LEVEL
+safeTrace = apathetic_logging.safeTrace
+SAFE_TRACE_ENABLED = apathetic_logging.SAFE_TRACE_ENABLED
+TRACE_LEVEL = apathetic_logging.TRACE_LEVEL
+BRIEF_LEVEL = apathetic_logging.BRIEF_LEVEL
+DETAIL_LEVEL = apathetic_logging.DETAIL_LEVEL
+INHERIT_LEVEL = apathetic_logging.INHERIT_LEVEL
+NOTSET_LEVEL = apathetic_logging.NOTSET_LEVEL
+ROOT_ALLOW_ALL_LEVEL = apathetic_logging.ROOT_ALLOW_ALL_LEVEL
+
+# Standard library logging levels
+DEBUG_LEVEL = apathetic_logging.DEBUG_LEVEL
+INFO_LEVEL = apathetic_logging.INFO_LEVEL
+WARNING_LEVEL = apathetic_logging.WARNING_LEVEL
+ERROR_LEVEL = apathetic_logging.ERROR_LEVEL
+CRITICAL_LEVEL = apathetic_logging.CRITICAL_LEVEL
+
+# ANSI Colors
+ANSIColors = apathetic_logging.ANSIColors
+
+# Classes
+DualStreamHandler = apathetic_logging.DualStreamHandler
+TagFormatter = apathetic_logging.TagFormatter
+# Logger is a nested class in ApatheticLogging_Internal_Logger that
+# inherits from logging.Logger.
+# Use TypeAlias to help mypy understand this is a class type.
+if TYPE_CHECKING:
+    Logger: TypeAlias = ApatheticLogging_Internal_Logger.Logger
+else:
+    Logger = apathetic_logging.Logger
+
+# Functions (camelCase - stdlib wrappers)
+addLevelName = apathetic_logging.addLevelName
+basicConfig = apathetic_logging.basicConfig
+captureWarnings = apathetic_logging.captureWarnings
+critical = apathetic_logging.critical
+currentframe = apathetic_logging.currentframe
+debug = apathetic_logging.debug
+detail = apathetic_logging.detail
+disable = apathetic_logging.disable
+error = apathetic_logging.error
+exception = apathetic_logging.exception
+fatal = apathetic_logging.fatal
+getHandlerByName = apathetic_logging.getHandlerByName
+getHandlerNames = apathetic_logging.getHandlerNames
+getLevelName = apathetic_logging.getLevelName
+getLevelNamesMapping = apathetic_logging.getLevelNamesMapping
+getLogRecordFactory = apathetic_logging.getLogRecordFactory
+getLogger = apathetic_logging.getLogger
+getLoggerClass = apathetic_logging.getLoggerClass
+info = apathetic_logging.info
+log = apathetic_logging.log
+makeLogRecord = apathetic_logging.makeLogRecord
+brief = apathetic_logging.brief
+setLogRecordFactory = apathetic_logging.setLogRecordFactory
+setLoggerClass = apathetic_logging.setLoggerClass
+setRootLevel = apathetic_logging.setRootLevel
+shutdown = apathetic_logging.shutdown
+test = apathetic_logging.test
+trace = apathetic_logging.trace
+warn = apathetic_logging.warn
+warning = apathetic_logging.warning
+
+# Functions (camelCase - library functions)
+getCompatibilityMode = apathetic_logging.getCompatibilityMode
+getDefaultLogLevel = apathetic_logging.getDefaultLogLevel
+getDefaultLoggerName = apathetic_logging.getDefaultLoggerName
+getDefaultPropagate = apathetic_logging.getDefaultPropagate
+getEffectiveRootLevel = apathetic_logging.getEffectiveRootLevel
+getEffectiveRootLevelName = apathetic_logging.getEffectiveRootLevelName
+getLevelName = apathetic_logging.getLevelName
+getLevelNameStr = apathetic_logging.getLevelNameStr
+getLevelNumber = apathetic_logging.getLevelNumber
+getLogLevelEnvVars = apathetic_logging.getLogLevelEnvVars
+getLoggerOfType = apathetic_logging.getLoggerOfType
+getRegisteredLoggerName = apathetic_logging.getRegisteredLoggerName
+getRootLevel = apathetic_logging.getRootLevel
+getRootLevelName = apathetic_logging.getRootLevelName
+getRootLogger = apathetic_logging.getRootLogger  # pyright: ignore[reportUnknownVariableType,reportUnknownMemberType]
+getTargetPythonVersion = apathetic_logging.getTargetPythonVersion
+hasLogger = apathetic_logging.hasLogger
+isRootLoggerInstantiated = apathetic_logging.isRootLoggerInstantiated
+makeSafeTrace = apathetic_logging.makeSafeTrace
+registerDefaultLogLevel = apathetic_logging.registerDefaultLogLevel
+registerLogLevelEnvVars = apathetic_logging.registerLogLevelEnvVars
+registerLogger = apathetic_logging.registerLogger
+registerCompatibilityMode = apathetic_logging.registerCompatibilityMode
+registerPortHandlers = apathetic_logging.registerPortHandlers
+registerPortLevel = apathetic_logging.registerPortLevel
+registerPropagate = apathetic_logging.registerPropagate
+registerReplaceRootLogger = apathetic_logging.registerReplaceRootLogger
+registerTargetPythonVersion = apathetic_logging.registerTargetPythonVersion
+removeLogger = apathetic_logging.removeLogger
+safeLog = apathetic_logging.safeLog
+setRootLevel = apathetic_logging.setRootLevel
+setRootLevelMinimum = apathetic_logging.setRootLevelMinimum
+useRootLevel = apathetic_logging.useRootLevel
+useRootLevelMinimum = apathetic_logging.useRootLevelMinimum
+isRootEnabledFor = apathetic_logging.isRootEnabledFor
+logRootDynamic = apathetic_logging.logRootDynamic
+
+
+__all__ = [
+    "BRIEF_LEVEL",
+    "CRITICAL_LEVEL",
+    "DEBUG_LEVEL",
+    "DEFAULT_APATHETIC_LOG_LEVEL",
+    "DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS",
+    "DETAIL_LEVEL",
+    "ERROR_LEVEL",
+    "INFO_LEVEL",
+    "INHERIT_LEVEL",
+    "LEVEL_ORDER",
+    "NOTSET_LEVEL",
+    "ROOT_ALLOW_ALL_LEVEL",
+    "SAFE_TRACE_ENABLED",
+    "SILENT_LEVEL",
+    "TAG_STYLES",
+    "TEST_LEVEL",
+    "TRACE_LEVEL",
+    "WARNING_LEVEL",
+    "ANSIColors",
+    "DualStreamHandler",
+    "Logger",
+    "TagFormatter",
+    "addLevelName",
+    "apathetic_logging",
+    "basicConfig",
+    "brief",
+    "captureWarnings",
+    "critical",
+    "currentframe",
+    "debug",
+    "detail",
+    "disable",
+    "error",
+    "exception",
+    "fatal",
+    "getCompatibilityMode",
+    "getDefaultLogLevel",
+    "getDefaultLoggerName",
+    "getDefaultPropagate",
+    "getEffectiveRootLevel",
+    "getEffectiveRootLevelName",
+    "getHandlerByName",
+    "getHandlerNames",
+    "getLevelName",
+    "getLevelNameStr",
+    "getLevelNamesMapping",
+    "getLevelNumber",
+    "getLogLevelEnvVars",
+    "getLogRecordFactory",
+    "getLogger",
+    "getLoggerClass",
+    "getLoggerOfType",
+    "getRegisteredLoggerName",
+    "getRootLevel",
+    "getRootLevelName",
+    "getRootLogger",
+    "getTargetPythonVersion",
+    "hasLogger",
+    "info",
+    "isRootEnabledFor",
+    "isRootLoggerInstantiated",
+    "log",
+    "logRootDynamic",
+    "makeLogRecord",
+    "makeSafeTrace",
+    "registerCompatibilityMode",
+    "registerDefaultLogLevel",
+    "registerLogLevelEnvVars",
+    "registerLogger",
+    "registerPortHandlers",
+    "registerPortLevel",
+    "registerPropagate",
+    "registerReplaceRootLogger",
+    "registerTargetPythonVersion",
+    "removeLogger",
+    "safeLog",
+    "safeTrace",
+    "setLogRecordFactory",
+    "setLoggerClass",
+    "setRootLevel",
+    "setRootLevelMinimum",
+    "shutdown",
+    "test",
+    "trace",
+    "useRootLevel",
+    "useRootLevelMinimum",
+    "warn",
+    "warning",
+]
+
+
+# === apathetic_utils.caching ===
+# src/apathetic_utils/caching.py
+"""Sized LRU cache shared by the library's internal caches."""
+
+
+ApatheticUtils_CacheKeyT = TypeVar("ApatheticUtils_CacheKeyT")
+ApatheticUtils_CacheValueT = TypeVar("ApatheticUtils_CacheValueT")
+
+
+class ApatheticUtils_Internal_Caching:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the building blocks of the library's caches.
+
+    Not part of the public namespace: the glob and parse caches subclass
+    SizedLRU and expose their own info / resize / clear functions.
+    """
+
+    class SizedLRU(Generic[ApatheticUtils_CacheKeyT, ApatheticUtils_CacheValueT]):
+        """Thread-safe LRU mapping with a resizable bound and statistics.
+
+        `entries` is ordered from least to most recently used. Subclasses that
+        validate entries themselves may read `entries` directly under `lock`
+        and count hits / misses as they see fit; lookup() and store() cover
+        the plain case. A maxsize of 0 disables caching (statistics are
+        still kept).
+        """
+
+        def __init__(self, maxsize: int) -> None:
+            self.maxsize = maxsize
+            self.entries: OrderedDict[
+                ApatheticUtils_CacheKeyT, ApatheticUtils_CacheValueT
+            ] = OrderedDict()
+            self.lock = threading.Lock()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+        @staticmethod
+        def size_from_env(env_var: str, default: int) -> int:
+            """Return the size set in `env_var`, or `default`.
+
+            Invalid or negative values fall back to the default size.
+            """
+            raw = os.environ.get(env_var, "").strip()
+            # isdecimal(), not isdigit(): int() rejects digits like '²'
+            if raw.isdecimal():
+                return int(raw)
+            return default
+
+        def lookup(
+            self, key: ApatheticUtils_CacheKeyT
+        ) -> ApatheticUtils_CacheValueT | None:
+            """Return the entry for `key`, counting a hit or a miss.
+
+            Hits do not take the lock (it costs more than the lookup): each
+            dict operation is atomic, and an entry evicted meanwhile is still
+            valid to return. Racing threads may undercount hits.
+            """
+            entries = self.entries
+            entry = entries.get(key)
+            if entry is None:
+                with self.lock:
+                    self.misses += 1
+                return None
+            try:  # noqa: SIM105  # suppress() is slower on this hot path
+                entries.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by another thread meanwhile
+            self.hits += 1
+            return entry
+
+        def store(
+            self, key: ApatheticUtils_CacheKeyT, entry: ApatheticUtils_CacheValueT
+        ) -> None:
+            """Add or replace the entry for `key` as most recently used."""
+            with self.lock:
+                self.entries[key] = entry
+                self.entries.move_to_end(key)
+                self.trim()
+
+        def resize(self, maxsize: int) -> None:
+            """Change maxsize, evicting least-recently-used entries above it."""
+            with self.lock:
+                self.maxsize = maxsize
+                self.trim()
+
+        def clear(self) -> None:
+            """Drop all entries and reset the statistics."""
+            with self.lock:
+                self.entries.clear()
+                self.reset_stats()
+
+        def reset_stats(self) -> None:
+            """Zero the statistics (lock held); subclasses add their own."""
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+        def trim(self) -> None:
+            """Evict least-recently-used entries above maxsize (lock held)."""
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+
+# === apathetic_utils.ci ===
+# src/apathetic_utils/ci.py
+"""CI environment detection utilities."""
+
+
+T = TypeVar("T")
+
+
+class ApatheticUtils_Internal_CI:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides CI environment detection functionality.
+
+    This class contains utilities for detecting CI environments.
+    When mixed into apathetic_utils, it provides CI detection methods.
+    """
+
+    # CI environment variable names that indicate CI environment
+    CI_ENV_VARS: ClassVar[tuple[str, ...]] = (
+        "CI",
+        "GITHUB_ACTIONS",
+        "GIT_TAG",
+        "GITHUB_REF",
+    )
+
+    @staticmethod
+    def is_ci() -> bool:
+        """Check if running in a CI environment.
+
+        Returns True if any of the following environment variables are set:
+        - CI: Generic CI indicator (set by most CI systems)
+        - GITHUB_ACTIONS: GitHub Actions specific
+        - GIT_TAG: Indicates a tagged build
+        - GITHUB_REF: GitHub Actions ref (branch/tag)
+
+        Returns:
+            True if running in CI, False otherwise
+        """
+        return bool(
+            any(os.getenv(var) for var in ApatheticUtils_Internal_CI.CI_ENV_VARS)
+        )
+
+    @staticmethod
+    def if_ci(ci_value: T, local_value: T) -> T:
+        r"""Return different values based on CI environment.
+
+        Useful for tests that need different behavior or expectations
+        in CI vs local development environments.
+
+        Args:
+            ci_value: Value to return when running in CI
+            local_value: Value to return when running locally
+
+        Returns:
+            ci_value if running in CI, otherwise local_value
+
+        Example:
+            # Different regex patterns for commit hashes
+            commit_pattern = if_ci(
+                r"[0-9a-f]{4,}",  # CI: expect actual commit hash
+                r"unknown \\(local build\\)"  # Local: expect placeholder
+            )
+        """
+        return ci_value if ApatheticUtils_Internal_CI.is_ci() else local_value
+
+
+# === apathetic_utils.constants ===
+# src/apathetic_utils/constants.py
+"""Constants for Apathetic Utils."""
+
+
+class ApatheticUtils_Internal_Constants:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Constants for apathetic utils functionality.
+
+    This class contains all constant values used by apathetic_utils.
+    It's kept separate for organizational purposes.
+    """
+
+    # Constants will be added here as utilities are implemented
+
+
+# === apathetic_utils.logs ===
+# src/apathetic_utils/logs.py
+"""Logger access helpers for hot paths."""
+
+
+class ApatheticUtils_Internal_Logs:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides cheap logger access for hot paths.
+
+    getLogger() resolves the logger through the call stack and the logger
+    registry, which costs more than most of the functions that log. These
+    helpers look the logger up once and reuse it for as long as it is still
+    the registered logger name and the logging module still maps that name to
+    the same instance (a test fixture swapping the logger invalidates it).
+    """
+
+    _cached_logger: Logger | None = None
+
+    @staticmethod
+    def get_logger() -> Logger:
+        """Return the library logger, calling getLogger() only when needed."""
+        cached = ApatheticUtils_Internal_Logs._cached_logger
+        if (
+            cached is not None
+            and getRegisteredLoggerName() == cached.name
+            and logging.Logger.manager.loggerDict.get(cached.name) is cached
+        ):
+            return cached
+        logger = getLogger()
+        ApatheticUtils_Internal_Logs._cached_logger = logger
+        return logger
+
+    @staticmethod
+    def is_trace_enabled() -> bool:
+        """Return True if TRACE messages from the library logger would be emitted.
+
+        Logger.isEnabledFor() memoizes its answer per level and the logging
+        module clears that memo on every setLevel(), so the result always
+        follows level changes. Hot loops call this once and skip building
+        trace messages entirely when it is False.
+        """
+        return ApatheticUtils_Internal_Logs.get_logger().isEnabledFor(TRACE_LEVEL)
+
+
+# === apathetic_utils.paths ===
+# src/apathetic_utils/paths.py
+"""Path manipulation utilities."""
+
+
+class ApatheticUtils_Internal_Paths:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides path manipulation functionality.
+
+    This class contains utilities for path normalization and glob handling.
+    When mixed into apathetic_utils, it provides path manipulation methods.
+    """
+
+    class ResolveCache:
+        """Memoized Path.resolve() results for one resolve_cache() scope.
+
+        Relative paths resolve against the current directory, so it is part of
+        their key. Entries are never refreshed: the scope assumes the paths it
+        resolves (and the symlinks along them) do not change while it is open.
+        """
+
+        def __init__(self) -> None:
+            self.entries: dict[tuple[str, Path], Path] = {}
+            self.hits = 0
+            self.misses = 0
+
+        def resolve(self, path: Path) -> Path:
+            """Return ``path.resolve()``, resolving each distinct path once."""
+            key = ("" if path.is_absolute() else os.getcwd(), path)  # noqa: PTH109
+            resolved = self.entries.get(key)
+            if resolved is not None:
+                self.hits += 1
+                return resolved
+            self.misses += 1
+            resolved = path.resolve()
+            self.entries[key] = resolved
+            return resolved
+
+    # Cache of the innermost resolve_cache() scope (per thread / async task)
+    _resolve_cache_var: ContextVar[
+        ApatheticUtils_Internal_Paths.ResolveCache | None
+    ] = ContextVar("apathetic_utils_resolve_cache", default=None)
+
+    @staticmethod
+    @contextmanager
+    def resolve_cache() -> Iterator[ApatheticUtils_Internal_Paths.ResolveCache]:
+        """Memoize resolve_path() for the duration of a `with` block.
+
+        Inside the block, resolve_path() (and everything built on it:
+        is_excluded_raw(), compile_excludes(), detect_packages_from_files(),
+        find_all_packages_under_path(), shorten_path(), iter_included_files())
+        resolves each distinct path once. The cache is dropped when the
+        outermost block exits; nested blocks share the outer cache.
+
+        The scope is bound to the current thread (or async task), so worker
+        threads and processes started inside it resolve uncached.
+
+        Example:
+            with resolve_cache() as cache:
+                packages, bases = detect_packages_from_files(files, "app")
+                kept = [f for f in files if not is_excluded_raw(f, excludes, root)]
+            print(cache.hits, cache.misses)
+
+        Yields:
+            The active ResolveCache (with ``hits`` / ``misses`` counters)
+        """
+        var = ApatheticUtils_Internal_Paths._resolve_cache_var
+        active = var.get()
+        if active is not None:
+            yield active
+            return
+
+        cache = ApatheticUtils_Internal_Paths.ResolveCache()
+        token = var.set(cache)
+        try:
+            yield cache
+        finally:
+            var.reset(token)
+            cache.entries.clear()
+
+    @staticmethod
+    def resolve_path(path: str | Path) -> Path:
+        """Return ``Path(path).resolve()``, memoized inside resolve_cache().
+
+        Outside a resolve_cache() block this is exactly Path.resolve().
+        """
+        cache = ApatheticUtils_Internal_Paths._resolve_cache_var.get()
+        if cache is None:
+            return Path(path).resolve()
+        return cache.resolve(Path(path))
+
+    @staticmethod
+    def normalize_path_string(raw: str) -> str:
+        r"""Normalize a user-supplied path string for cross-platform use.
+
+        Industry-standard (Git/Node/Python) rules:
+          - Treat both '/' and '\\' as valid separators and normalize all to '/'.
+          - Replace escaped spaces ('\\ ') with real spaces.
+          - Collapse redundant slashes (preserve protocol prefixes like 'file://').
+          - Never resolve '.' or '..' or touch the filesystem.
+          - Never raise for syntax; normalization is always possible.
+
+        This is the pragmatic cross-platform normalization strategy used by
+        Git, Node.js, and Python build tools.
+        This function is purely lexical — it normalizes syntax, not filesystem state.
+        """
+        if not raw:
+            return ""
+
+        path = raw.strip()
+
+        # Handle escaped spaces (common shell copy-paste)
+        if "\\ " in path:
+            fixed = path.replace("\\ ", " ")
+            ApatheticUtils_Internal_Logs.get_logger().warning(
+                "Normalizing escaped spaces in path: %r → %s", path, fixed
+            )
+            path = fixed
+
+        # Normalize all backslashes to forward slashes
+        path = path.replace("\\", "/")
+
+        # Collapse redundant slashes (keep protocol //)
+        if "//" not in path:
+            return path
+        collapsed_slashes = re.sub(r"(?<!:)//+", "/", path)
+        if collapsed_slashes != path:
+            ApatheticUtils_Internal_Logs.get_logger().trace(
+                "Collapsed redundant slashes: %r → %r", path, collapsed_slashes
+            )
+            path = collapsed_slashes
+
+        return path
+
+    @staticmethod
+    def has_glob_chars(s: str) -> bool:
+        return any(c in s for c in "*?[]")
+
+    @staticmethod
+    def get_glob_root(pattern: str) -> Path:
+        """Return the non-glob portion of a path like 'src/**/*.txt'.
+
+        Normalizes paths to cross-platform.
+        """
+        if not pattern:
+            return Path()
+
+        # Normalize backslashes to forward slashes
+        normalized = ApatheticUtils_Internal_Paths.normalize_path_string(pattern)
+
+        parts: list[str] = []
+        for part in Path(normalized).parts:
+            if re.search(r"[*?\[\]]", part):
+                break
+            parts.append(part)
+        return Path(*parts) if parts else Path()
+
+    @staticmethod
+    def shorten_path(
+        path: str | Path,
+        bases: str | Path | list[str | Path],
+    ) -> str:
+        """Return the shortest path relative to any base's common prefix.
+
+        Finds the longest shared prefix between `path` and each base path by
+        comparing their path parts, and returns the shortest remaining portion
+        of `path`. This works with any paths (files, directories, etc.) and does
+        not require one path to be under the other.
+
+        When the common prefix is only root ("/"), returns the absolute path
+        since a relative path from root is not useful.
+
+        Example:
+            shorten_path(
+                "/home/user/code/serger/src/logs.py",
+                ["/home/user/code/serger/tests/utils/patch.py",
+                 "/home/user/code/serger/src"]
+            )
+            → "logs.py" (shortest: common prefix with src/)
+
+            shorten_path(
+                "/home/user/code/serger/src/logs.py",
+                "/home/user/code/serger/tests/utils/patch.py"
+            )
+            → "src/logs.py"
+
+        Args:
+            path: Path to make relative
+            bases: Single base path or list of base paths to find common prefix with
+
+        Returns:
+            Shortest path relative to common prefix, or absolute path if common
+            prefix is only root
+        """
+        _resolve_path = ApatheticUtils_Internal_Paths.resolve_path
+        p = _resolve_path(path)
+
+        # Normalize bases to a list
+        if isinstance(bases, (str, Path)):
+            bases_list: list[str | Path] = [bases]
+        else:
+            bases_list = bases
+
+        candidates: list[str] = []
+
+        for base in bases_list:
+            b = _resolve_path(base)
+
+            # Split both into parts and find the longest shared prefix
+            common_len = 0
+            for a, c in zip_longest(p.parts, b.parts):
+                if a != c:
+                    break
+                common_len += 1
+
+            # Slice off the shared prefix
+            remaining = Path(*p.parts[common_len:])
+            result = str(remaining) or "."
+
+            # If common prefix is only root (common_len <= 1), return absolute path
+            if common_len <= 1:
+                # Common prefix is only root, return absolute path
+                candidates.append(str(p))
+            else:
+                candidates.append(result)
+
+        if candidates:
+            # Return shortest result
+            return min(candidates, key=len)
+
+        # No bases provided, return absolute path
+        return str(p)
+
+
+# === apathetic_utils.modules ===
+# src/apathetic_utils/modules.py
+"""Module detection utilities."""
+
+
+class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class providing module detection utilities.
+
+    These utilities help detect Python packages by scanning for __init__.py files.
+    """
+
+    @staticmethod
+    def _find_package_root_for_file(
+        file_path: Path,
+        *,
+        source_bases: list[str] | None = None,
+        _config_dir: Path | None = None,
+    ) -> Path | None:
+        """Find the package root for a file.
+
+        First checks for __init__.py files (definitive package marker).
+        If no __init__.py found and file is under a source_bases directory,
+        treats everything after the matching base prefix as a package structure.
+
+        Args:
+            file_path: Path to the Python file
+            source_bases: Optional list of module base directories (absolute paths)
+            _config_dir: Optional config directory (unused, kept for compatibility)
+
+        Returns:
+            Path to the package root directory, or None if not found
+        """
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        _resolve_path = ApatheticUtils_Internal_Paths.resolve_path
+        file_path_resolved = _resolve_path(file_path)
+        current_dir = file_path_resolved.parent
+        last_package_dir: Path | None = None
+
+        logger.trace(
+            "[PKG_ROOT] Finding package root for %s, starting from %s",
+            file_path.name,
+            current_dir,
+        )
+
+        # First, walk up looking for __init__.py (definitive package marker)
+        # __init__.py always takes precedence
+        while True:
+            # Check if current directory has __init__.py
+            init_file = current_dir / "__init__.py"
+            if init_file.exists():
+                # This directory is part of a package
+                last_package_dir = current_dir
+                logger.trace(
+                    "[PKG_ROOT] Found __init__.py at %s (package root so far: %s)",
+                    current_dir,
+                    last_package_dir,
+                )
+            # This directory doesn't have __init__.py
+            # If we found a package via __init__.py, return it
+            elif last_package_dir is not None:
+                logger.trace(
+                    "[PKG_ROOT] No __init__.py at %s, package root: %s",
+                    current_dir,
+                    last_package_dir,
+                )
+                return last_package_dir
+                # No __init__.py found yet, continue walking up
+                # (we'll check source_bases after this loop if needed)
+
+            # Move up one level
+            parent = current_dir.parent
+            if parent == current_dir:
+                # Reached filesystem root
+                if last_package_dir is not None:
+                    logger.trace(
+                        "[PKG_ROOT] Reached filesystem root, package root: %s",
+                        last_package_dir,
+                    )
+                    return last_package_dir
+                # No __init__.py found, break to check source_bases
+                break
+            current_dir = parent
+
+        # If no __init__.py found, check if file is under any source_bases directory
+        if source_bases and last_package_dir is None:
+            for base_str in source_bases:
+                # base_str is already an absolute path
+                base_path = _resolve_path(base_str)
+                try:
+                    # Check if file is under this base
+                    rel_path = file_path_resolved.relative_to(base_path)
+                    # If file is directly in base (e.g., src/mymodule.py), no package
+                    if len(rel_path.parts) == 1:
+                        # Single file in base - not a package
+                        continue
+                    # File is in a subdirectory of base (e.g., src/mypkg/submodule.py)
+                    # The first part after base is the package
+                    package_dir = base_path / rel_path.parts[0]
+                    if package_dir.exists() and package_dir.is_dir():
+                        logger.trace(
+                            "[PKG_ROOT] Found package via source_bases: %s (base: %s)",
+                            package_dir,
+                            base_path,
+                        )
+                        return package_dir
+                except ValueError:
+                    # File is not under this base, continue to next base
+                    continue
+
+        # Return None if no package found
+        return last_package_dir
+
+    @staticmethod
+    def detect_packages_from_files(
+        file_paths: list[Path],
+        package_name: str,
+        *,
+        source_bases: list[str] | None = None,
+        _config_dir: Path | None = None,
+    ) -> tuple[set[str], list[str]]:
+        """Detect packages from file paths.
+
+        If files are under source_bases directories, treats everything after the
+        matching base prefix as a package structure (regardless of __init__.py).
+        Otherwise, follows Python's import rules: only detects regular packages
+        (with __init__.py files). Falls back to configured package_name if none
+        detected.
+
+        Args:
+            file_paths: List of file paths to check
+            package_name: Configured package name (used as fallback)
+            source_bases: Optional list of module base directories (absolute paths)
+            _config_dir: Optional config directory (unused, kept for compatibility)
+
+        Returns:
+            Tuple of (set of detected package names, list of parent directories).
+            Package names always includes package_name. Parent directories are
+            returned as absolute paths, deduplicated.
+
+        Paths are resolved through resolve_path() inside a resolve_cache()
+        scope, so each file and source base is resolved once per call (or once
+        per enclosing resolve_cache() block).
+        """
+        with ApatheticUtils_Internal_Paths.resolve_cache():
+            return ApatheticUtils_Internal_Modules._detect_packages_from_files(
+                file_paths, package_name, source_bases=source_bases
+            )
+
+    @staticmethod
+    def _detect_packages_from_files(  # noqa: C901, PLR0912, PLR0915
+        file_paths: list[Path],
+        package_name: str,
+        *,
+        source_bases: list[str] | None = None,
+    ) -> tuple[set[str], list[str]]:
+        """Implement detect_packages_from_files() inside a resolve_cache()."""
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        _resolve_path = ApatheticUtils_Internal_Paths.resolve_path
+        _find_package_root_for_file = (
+            ApatheticUtils_Internal_Modules._find_package_root_for_file
+        )
+        detected: set[str] = set()
+        parent_dirs: list[Path] = []
+        seen_parents: set[Path] = set()
+        # Track which packages were detected via source_bases
+        # (for namespace package detection)
+        detected_via_source_bases: set[str] = set()
+        # Package root of each file, reused by the namespace package pass
+        pkg_roots: dict[Path, Path | None] = {}
+
+        # Detect packages from files
+        for file_path in file_paths:
+            file_path_resolved = _resolve_path(file_path)
+            pkg_root = _find_package_root_for_file(file_path, source_bases=source_bases)
+            pkg_roots[file_path] = pkg_root
+            if pkg_root:
+                # Check if this package was detected via source_bases
+                # (by checking if file is under any source_base and no __init__.py)
+                detected_via_sb = False
+                if source_bases:
+                    # Check if file is under a source_base
+                    for base_str in source_bases:
+                        base_path = _resolve_path(base_str)
+                        try:
+                            rel_path = file_path_resolved.relative_to(base_path)
+                            # If file is in a subdirectory of base, check __init__.py
+                            if (
+                                len(rel_path.parts) > 1
+                                and not (pkg_root / "__init__.py").exists()
+                            ):
+                                # No __init__.py, so detected via source_bases
+                                detected_via_sb = True
+                                break
+                        except ValueError:
+                            continue
+
+                # Extract package name from directory name
+                pkg_name = pkg_root.name
+                detected.add(pkg_name)
+                if detected_via_sb:
+                    detected_via_source_bases.add(pkg_name)
+
+                # For source_bases, also detect nested packages (all directory levels)
+                if detected_via_sb and source_bases:
+                    # Find which base this file is under
+                    for base_str in source_bases:
+                        base_path = _resolve_path(base_str)
+                        try:
+                            rel_path = file_path_resolved.relative_to(base_path)
+                            # Detect all directory levels between base and file
+                            # (excluding the file itself and the base)
+                            # More than base + first level + file
+                            min_nested_parts = 3
+                            if len(rel_path.parts) >= min_nested_parts:
+                                # Walk from base to file, detecting intermediate dirs
+                                current = base_path
+                                for part in rel_path.parts[:-1]:  # Exclude filename
+                                    current = current / part
+                                    if current.is_dir() and current != pkg_root:
+                                        nested_pkg_name = current.name
+                                        if (
+                                            nested_pkg_name
+                                            and nested_pkg_name != package_name
+                                        ):
+                                            detected.add(nested_pkg_name)
+                                            detected_via_source_bases.add(
+                                                nested_pkg_name
+                                            )
+                                            logger.trace(
+                                                "[PKG_DETECT] Detected nested package "
+                                                "%s from %s",
+                                                nested_pkg_name,
+                                                file_path,
+                                            )
+                        except ValueError:
+                            continue
+
+                # Extract parent directory (module base)
+                parent_dir = _resolve_path(pkg_root.parent)
+                # Check if parent is filesystem root (parent of root equals root)
+                is_root = parent_dir.parent == parent_dir
+                if not is_root and parent_dir not in seen_parents:
+                    seen_parents.add(parent_dir)
+                    parent_dirs.append(parent_dir)
+
+                logger.trace(
+                    "[PKG_DETECT] Detected package %s from %s "
+                    "(root: %s, parent: %s, via_sb=%s)",
+                    pkg_name,
+                    file_path,
+                    pkg_root,
+                    parent_dir,
+                    detected_via_sb,
+                )
+
+        # Also detect directories as namespace packages if they contain
+        # subdirectories that are packages (namespace packages)
+        # This must happen BEFORE adding package_name to detected, so we can check
+        # if base_name == package_name correctly
+        # Compute common root of all files to avoid detecting it as a package
+        common_root: Path | None = None
+        if file_paths:
+            common_root = file_paths[0].parent
+            for file_path in file_paths[1:]:
+                # Find common prefix of paths
+                common_parts = [
+                    p
+                    for p, q in zip(
+                        common_root.parts, file_path.parent.parts, strict=False
+                    )
+                    if p == q
+                ]
+                if common_parts:
+                    common_root = Path(*common_parts)
+                else:
+                    # No common root, use first file's parent
+                    common_root = file_paths[0].parent
+                    break
+
+        # Build set of source_bases paths for quick lookup
+        source_bases_paths: set[Path] = set()
+        if source_bases:
+            for base_str in source_bases:
+                base_path = _resolve_path(base_str)
+                if base_path.exists() and base_path.is_dir():
+                    source_bases_paths.add(base_path)
+
+        # Check all detected packages' parent directories to see if they should
+        # be detected as namespace packages
+        # Only detect namespace packages when using source_bases
+        if source_bases:
+            checked_parents: set[Path] = set()
+            for file_path in file_paths:
+                pkg_root = pkg_roots[file_path]
+                if pkg_root:
+                    pkg_name = pkg_root.name
+                    # Only check parents if this package was detected via source_bases
+                    if pkg_name not in detected_via_source_bases:
+                        continue
+
+                    pkg_parent = _resolve_path(pkg_root.parent)
+                    # Skip if we've already checked this parent
+                    if pkg_parent in checked_parents:
+                        continue
+                    checked_parents.add(pkg_parent)
+
+                    # Skip if parent is filesystem root
+                    if pkg_parent == pkg_parent.parent:
+                        continue
+
+                    parent_name = pkg_parent.name
+                    # Skip if empty name, already detected, is package_name,
+                    # is the common root, or is in source_bases
+                    if (
+                        not parent_name
+                        or parent_name in detected
+                        or parent_name == package_name
+                        or (common_root and pkg_parent == _resolve_path(common_root))
+                        or pkg_parent in source_bases_paths
+                    ):
+                        logger.trace(
+                            "[PKG_DETECT] Skipping parent %s: name=%s, in_detected=%s, "
+                            "is_package_name=%s, is_common_root=%s, in_source_bases=%s",
+                            pkg_parent,
+                            parent_name,
+                            parent_name in detected,
+                            parent_name == package_name,
+                            common_root and pkg_parent == _resolve_path(common_root),
+                            pkg_parent in source_bases_paths,
+                        )
+                        continue
+
+                    # This parent contains a detected package, so it's also a package
+                    detected.add(parent_name)
+                    detected_via_source_bases.add(parent_name)
+                    logger.trace(
+                        "[PKG_DETECT] Detected parent directory as namespace package: "
+                        "%s (contains package: %s)",
+                        parent_name,
+                        pkg_root.name,
+                    )
+
+        # Always include configured package (for fallback and multi-package scenarios)
+        detected.add(package_name)
+
+        # Return parent directories as absolute paths
+        normalized_parents: list[str] = []
+        seen_normalized: set[str] = set()
+
+        for parent_dir in parent_dirs:
+            base_str = str(parent_dir)
+            if base_str not in seen_normalized:
+                seen_normalized.add(base_str)
+                normalized_parents.append(base_str)
+
+        if len(detected) == 1 and package_name in detected:
+            logger.debug(
+                "Package detection: No packages found, using configured package '%s'",
+                package_name,
+            )
+        else:
+            logger.debug(
+                "Package detection: Found %d package(s): %s",
+                len(detected),
+                sorted(detected),
+            )
+
+        return detected, normalized_parents
+
+    @staticmethod
+    def find_all_packages_under_path(root_path: Path) -> set[str]:
+        """Find all package names under a directory by scanning for __init__.py files.
+
+        Args:
+            root_path: Path to the root directory to scan
+
+        Returns:
+            Set of package names found under the root directory
+        """
+        detected: set[str] = set()
+
+        root_path = ApatheticUtils_Internal_Paths.resolve_path(root_path)
+        if not root_path.exists():
+            return detected
+
+        # Find all __init__.py files under root_path
+        for init_file in root_path.rglob("__init__.py"):
+            # Find the package root by walking up
+            pkg_root = ApatheticUtils_Internal_Modules._find_package_root_for_file(
+                init_file
+            )
+            if pkg_root:
+                # Extract package name from root directory name
+                # Relative to root_path to get the top-level package name
+                try:
+                    rel_path = pkg_root.relative_to(root_path)
+                    # The first component is the top-level package name
+                    top_level_pkg = rel_path.parts[0]
+                    detected.add(top_level_pkg)
+                except ValueError:
+                    # If pkg_root is not under root_path, skip it
+                    pass
+
+        return detected
+
+
+# === apathetic_utils.shared ===
+# src/apathetic_utils/shared.py
+"""File and concurrency helpers shared by the other mixins."""
+
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+ApatheticUtils_ItemT = TypeVar("ApatheticUtils_ItemT")
+ApatheticUtils_ResultT = TypeVar("ApatheticUtils_ResultT")
+
+
+class ApatheticUtils_Internal_Shared:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class with helpers used by several other mixins.
+
+    Not part of the public namespace.
+    """
+
+    @staticmethod
+    def write_atomic(path: Path, *chunks: bytes, dir_mode: int = 0o777) -> None:
+        """Write `chunks` to `path` through a temporary file and os.replace().
+
+        Readers (in this or other processes) see either the old file or the
+        whole new one, never a partial write. The parent directory is created
+        (with `dir_mode`) if needed. Errors are raised as OSError after the
+        temporary file is removed; callers that only cache decide whether to
+        ignore them.
+        """
+        tmp_path: str | None = None
+        try:
+            path.parent.mkdir(mode=dir_mode, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            Path(tmp_path).replace(path)
+        except OSError:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    @contextmanager
+    def file_lock(lock_path: Path) -> Iterator[None]:
+        """Hold an exclusive cross-process lock on `lock_path`.
+
+        Uses flock on POSIX and msvcrt on Windows; the OS releases it if the
+        holder dies. The file (and its directory) is created if needed and
+        left in place.
+        """
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with lock_path.open("a+b") as f:
+            if sys.platform == "win32":
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after 10 attempts
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def map_chunks_in_processes(
+        func: Callable[[list[ApatheticUtils_ItemT]], list[ApatheticUtils_ResultT]],
+        items: Sequence[ApatheticUtils_ItemT],
+        workers: int,
+    ) -> list[ApatheticUtils_ResultT]:
+        """Run `func` on chunks of `items` in a process pool; return all results.
+
+        `func` takes a list of items and returns one result per item; it (and
+        anything bound to it) must be picklable. Results are in input order.
+        """
+        # Imported on use: it pulls in multiprocessing (and subprocess)
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        # A few chunks per worker keeps the pool busy without much overhead
+        chunk_size = -(-len(items) // (workers * 4))
+        chunks = [
+            list(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [
+                result
+                for chunk_results in pool.map(func, chunks)
+                for result in chunk_results
+            ]
+
+
+# === apathetic_utils.files ===
+# src/apathetic_utils/files.py
+"""File loading utilities."""
+
+
+class ApatheticUtils_Internal_Files:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides file loading functionality.
+
+    This class contains utilities for loading TOML and JSONC files.
+    When mixed into apathetic_utils, it provides file loading methods.
+    """
+
+    # Environment variable overriding the parse cache size at import time
+    PARSE_CACHE_SIZE_ENV_VAR = "APATHETIC_UTILS_PARSE_CACHE_SIZE"
+    DEFAULT_PARSE_CACHE_SIZE = 64
+    # Environment variable naming the on-disk parse cache directory
+    PARSE_CACHE_DIR_ENV_VAR = "APATHETIC_UTILS_PARSE_CACHE_DIR"
+    # Bytes read at a time by iter_jsonc_items()
+    DEFAULT_JSONC_CHUNK_SIZE = 1 << 20
+
+    @dataclass(frozen=True)
+    class ParseCacheInfo:
+        """Statistics for the load_jsonc() / load_toml() parse cache.
+
+        Returned by parse_cache_info(); mirrors GlobCacheInfo, plus the
+        on-disk cache directory and how many misses it served.
+        """
+
+        hits: int
+        misses: int
+        evictions: int
+        maxsize: int
+        currsize: int
+        disk_hits: int
+        directory: Path | None
+
+    @dataclass(frozen=True)
+    class LoadedFile:
+        """One file's outcome from load_many().
+
+        Exactly one of `data` / `error` is meaningful: `error` is the
+        exception loading raised (e.g. FileNotFoundError, ValueError for a
+        syntax error), or None when `data` holds the parsed content.
+        """
+
+        path: Path
+        data: Any = None
+        error: Exception | None = None
+
+        @property
+        def ok(self) -> bool:
+            """True if the file loaded without error."""
+            return self.error is None
+
+    @dataclass
+    class _ParseCacheEntry:
+        """A parsed file, pickled, with the stat() it was parsed at."""
+
+        mtime_ns: int
+        size: int
+        payload: bytes
+        # Content hash, kept only while the file's mtime is too recent to
+        # prove a same-size rewrite would have changed it
+        digest: bytes | None
+
+    class _ParseDiskCache:
+        """Parse results shared between processes through a cache directory.
+
+        One record per (loader, absolute path), named by a hash of both: the
+        source's mtime, size and SHA-256 at parse time, then the pickled
+        result. A record is only used if the source's current content hashes
+        the same, so neither stat() coincidences nor other processes rewriting
+        the source can serve a stale result. Records are written to a
+        temporary file and os.replace()d into place, so concurrent readers
+        see a whole old or a whole new record; unreadable records are misses
+        and write failures are ignored (the cache is only an accelerator).
+        """
+
+        # Bump when a loader's output for the same input changes
+        MAGIC = b"AUPC0001"
+        HEADER = struct.Struct("<8sqq32s")
+
+        def __init__(self, directory: Path) -> None:
+            self.directory = directory
+
+        def record_path(self, key: tuple[str, Path]) -> Path:
+            """Return the record file for a (loader, absolute path) key."""
+            kind, abs_path = key
+            ident = f"{kind}\0{abs_path}".encode("utf-8", "surrogateescape")
+            return self.directory / f"{hashlib.sha256(ident).hexdigest()}.pickle"
+
+        def get(
+            self, key: tuple[str, Path], st: os.stat_result
+        ) -> tuple[bytes, bytes] | None:
+            """Return ``(digest, payload)`` if the record matches `st`."""
+            try:
+                record = self.record_path(key).read_bytes()
+            except OSError:
+                return None
+            header_size = self.HEADER.size
+            if len(record) < header_size:
+                return None
+            magic, mtime_ns, size, digest = self.HEADER.unpack_from(record)
+            if (magic, mtime_ns, size) != (self.MAGIC, st.st_mtime_ns, st.st_size):
+                return None
+            return digest, record[header_size:]
+
+        def load(
+            self, key: tuple[str, Path], st: os.stat_result, digest: bytes
+        ) -> tuple[Any, bytes] | None:
+            """Return ``(data, payload)`` from a record still valid for `digest`."""
+            record = self.get(key, st)
+            if record is None or record[0] != digest:
+                return None
+            try:
+                return pickle.loads(record[1]), record[1]  # noqa: S301
+            except Exception:  # noqa: BLE001
+                # Corrupt record: the caller parses and rewrites it
+                return None
+
+        def put(
+            self,
+            key: tuple[str, Path],
+            st: os.stat_result,
+            digest: bytes,
+            payload: bytes,
+        ) -> None:
+            """Atomically write the record for `key`."""
+            header = self.HEADER.pack(self.MAGIC, st.st_mtime_ns, st.st_size, digest)
+            try:
+                ApatheticUtils_Internal_Shared.write_atomic(
+                    self.record_path(key), header, payload, dir_mode=0o700
+                )
+            except OSError as e:
+                ApatheticUtils_Internal_Logs.get_logger().debug(
+                    "Cannot write parse cache record in %s: %s", self.directory, e
+                )
+
+    class _ParseCache(
+        ApatheticUtils_Internal_Caching.SizedLRU[tuple[str, Path], "_ParseCacheEntry"]
+    ):
+        """Sized LRU of parsed files, keyed by loader and absolute path.
+
+        An entry is reused while the file's mtime and size are unchanged.
+        Filesystem timestamps are coarse, so a file whose mtime was within
+        RACY_WINDOW_NS of the time it was cached could be rewritten with the
+        same size and mtime; such entries also compare a content hash until
+        a later check shows the mtime has settled (the "racy clean" check git
+        uses for its index). Results are stored pickled and unpickled on every
+        hit, so callers always get their own copy to mutate.
+
+        With a `disk` cache, misses are looked up there before parsing, and
+        new results are written to it, so other processes can reuse them.
+        """
+
+        # Coarsest common timestamp granularity (FAT: 2 seconds)
+        RACY_WINDOW_NS = 2_000_000_000
+
+        def __init__(
+            self,
+            maxsize: int,
+            disk: ApatheticUtils_Internal_Files._ParseDiskCache | None = None,
+        ) -> None:
+            super().__init__(maxsize)
+            self.disk = disk
+            self.disk_hits = 0
+
+        def reset_stats(self) -> None:
+            """Zero the statistics, including disk hits (lock held)."""
+            super().reset_stats()
+            self.disk_hits = 0
+
+        def load(self, kind: str, path: Path, parse: Callable[[bytearray], Any]) -> Any:
+            """Return `parse` of the file at `path`, reusing a cached result.
+
+            `kind` names the loader, so different loaders never share entries
+            for the same file. Parse errors propagate and are not cached.
+            """
+            key = (kind, path.absolute())
+            now_ns = time.time_ns()
+            st = path.stat()
+            racy = now_ns - st.st_mtime_ns < self.RACY_WINDOW_NS
+
+            with self.lock:
+                entry = self.entries.get(key)
+            raw: bytearray | None = None
+            if (
+                entry is not None
+                and entry.mtime_ns == st.st_mtime_ns
+                and entry.size == st.st_size
+            ):
+                if entry.digest is not None:
+                    raw = ApatheticUtils_Internal_Files._read_file_buffer(path)
+                    if hashlib.sha256(raw).digest() != entry.digest:
+                        entry = None
+                if entry is not None:
+                    with self.lock:
+                        self.hits += 1
+                        if not racy:
+                            entry.digest = None
+                        if self.entries.get(key) is entry:
+                            self.entries.move_to_end(key)
+                    return pickle.loads(entry.payload)  # noqa: S301
+
+            with self.lock:
+                self.misses += 1
+                self.entries.pop(key, None)
+
+            # Read and parse outside the lock
+            if raw is None:
+                raw = ApatheticUtils_Internal_Files._read_file_buffer(path)
+            disk = self.disk
+            digest = hashlib.sha256(raw).digest() if racy or disk else None
+            stored = disk.load(key, st, digest) if disk is not None and digest else None
+            if stored is not None:
+                data, payload = stored
+                with self.lock:
+                    self.disk_hits += 1
+            else:
+                data = parse(raw)
+                payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+                if disk is not None and digest is not None:
+                    disk.put(key, st, digest, payload)
+            self.store(
+                key,
+                ApatheticUtils_Internal_Files._ParseCacheEntry(
+                    mtime_ns=st.st_mtime_ns,
+                    size=st.st_size,
+                    payload=payload,
+                    digest=digest if racy else None,
+                ),
+            )
+            return data
+
+    _parse_cache = _ParseCache(
+        _ParseCache.size_from_env(PARSE_CACHE_SIZE_ENV_VAR, DEFAULT_PARSE_CACHE_SIZE),
+        _ParseDiskCache(Path(os.environ[PARSE_CACHE_DIR_ENV_VAR]).expanduser())
+        if os.environ.get(PARSE_CACHE_DIR_ENV_VAR)
+        else None,
+    )
+
+    @staticmethod
+    def parse_cache_info() -> ApatheticUtils_Internal_Files.ParseCacheInfo:
+        """Return hit / miss / eviction statistics for the parse cache.
+
+        The cache is used by load_jsonc() and load_toml() when called with
+        cache=True.
+        """
+        cache = ApatheticUtils_Internal_Files._parse_cache
+        with cache.lock:
+            return ApatheticUtils_Internal_Files.ParseCacheInfo(
+                hits=cache.hits,
+                misses=cache.misses,
+                evictions=cache.evictions,
+                maxsize=cache.maxsize,
+                currsize=len(cache.entries),
+                disk_hits=cache.disk_hits,
+                directory=cache.disk.directory if cache.disk else None,
+            )
+
+    @staticmethod
+    def set_parse_cache_size(maxsize: int) -> None:
+        """Resize the parse cache, evicting least-recently-used entries.
+
+        The initial size is 64, or the value of the
+        APATHETIC_UTILS_PARSE_CACHE_SIZE environment variable at import time.
+
+        Args:
+            maxsize: Maximum number of parsed files to keep; 0 disables
+                caching
+
+        Raises:
+            ValueError: If `maxsize` is negative
+        """
+        if maxsize < 0:
+            xmsg = f"Parse cache size must be >= 0, got {maxsize}"
+            raise ValueError(xmsg)
+        ApatheticUtils_Internal_Files._parse_cache.resize(maxsize)
+
+    @staticmethod
+    def clear_parse_cache(path: Path | str | None = None) -> None:
+        """Drop cached parse results.
+
+        Args:
+            path: Only forget this file (for every loader), keeping the
+                statistics; None drops everything and resets the statistics
+        """
+        cache = ApatheticUtils_Internal_Files._parse_cache
+        with cache.lock:
+            if path is not None:
+                abs_path = Path(path).absolute()
+                for key in [k for k in cache.entries if k[1] == abs_path]:
+                    del cache.entries[key]
+                return
+            cache.entries.clear()
+            cache.reset_stats()
+
+    @staticmethod
+    def default_parse_cache_dir() -> Path:
+        """Return the per-user directory for the on-disk parse cache.
+
+        `%LOCALAPPDATA%` on Windows, `~/Library/Caches` on macOS, and
+        `$XDG_CACHE_HOME` (default `~/.cache`) elsewhere, each followed by
+        `apathetic_utils/parse`. Nothing is created until a record is written.
+        """
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or "~/AppData/Local"
+        elif sys.platform == "darwin":
+            base = "~/Library/Caches"
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+        return Path(base).expanduser() / "apathetic_utils" / "parse"
+
+    @staticmethod
+    def set_parse_cache_dir(directory: Path | str | None) -> None:
+        """Share parse results between processes through `directory`.
+
+        Once set, load_jsonc() / load_toml() calls with cache=True that miss
+        the in-memory cache look for a record of the same file there (valid
+        only if the file's content still hashes the same) before parsing, and
+        store what they parse. The initial directory is taken from the
+        APATHETIC_UTILS_PARSE_CACHE_DIR environment variable at import time.
+
+        Records are pickles: use a directory only you can write to, such as
+        default_parse_cache_dir(). It is created (mode 0o700) when needed and
+        may be deleted at any time.
+
+        Args:
+            directory: Cache directory, or None to stop using one
+        """
+        disk = (
+            None
+            if directory is None
+            else ApatheticUtils_Internal_Files._ParseDiskCache(
+                Path(directory).expanduser()
+            )
+        )
+        cache = ApatheticUtils_Internal_Files._parse_cache
+        with cache.lock:
+            cache.disk = disk
+
+    # JSONC regex fragments. Strings are matched whole so their contents are
+    # never mistaken for comments; unterminated strings run to the end. Loops
+    # are unrolled (a plain run, then one special item and another run) so
+    # the regex engine does one step per item rather than per alternative.
+    _JSONC_STRING = (
+        r"""["'][^"'\\]*(?:(?:\\\\["']?|\\[^\\]|\\\Z)[^"'\\]*)*(?:["']|\Z)"""
+    )
+    _JSONC_LINE_COMMENT = r"""(?:(?<!:)//|\#)[^\n]*"""
+    _JSONC_BLOCK_COMMENT_END = r"""[^*]*(?:\*(?!/)[^*]*)*\*/"""
+    # For UTF-8 bytes: an unterminated block comment swallows everything but
+    # the final character (kept whole, not just its last byte)
+    _JSONC_BLOCK_COMMENT = (
+        rf"""(?:/\*(?:{_JSONC_BLOCK_COMMENT_END}"""
+        r"""|(?:[\s\S]*(?=[\x00-\x7f\xc0-\xff][\x80-\xbf]*\Z))?))"""
+    )
+    _JSONC_COMMENT = rf"""(?:{_JSONC_LINE_COMMENT}|{_JSONC_BLOCK_COMMENT})"""
+
+    # _blank_jsonc() matches (bytes): a run of code, then one thing to blank:
+    # a trailing comma or a comment (`blank`), or the comments after a comma
+    # (`gap`, with `close` set if a bracket follows, making the comma
+    # trailing). Taking both in one match halves the number of matches; the
+    # \Z alternative ends the scan after the last run. Commas never look past
+    # comments they have not consumed, so each comment is scanned once.
+    _JSONC_BLANK_TOKEN = re.compile(
+        (
+            rf"""[^"'/\#,]*(?:(?:{_JSONC_STRING}|/(?![/*])|(?<=:)/(?=/)"""
+            r"""|,(?!\s*(?:[}\]]|//|\#|/\*)))[^"'/\#,]*)*"""
+            rf"""(?:(?P<blank>,(?=\s*[}}\]])|{_JSONC_COMMENT})"""
+            rf"""|,(?P<gap>\s*(?:{_JSONC_COMMENT}\s*)+)(?P<close>(?=[}}\]]))?"""
+            r"""|\Z)"""
+        ).encode("ascii")
+    )
+    # Maps every byte except newline to a space
+    _JSONC_BLANK_TABLE = bytes(b if b == ord("\n") else ord(" ") for b in range(256))
+    # Bytes iter_jsonc_items() stops at. Outside the root: anything but JSON
+    # whitespace. Inside it: what can start a string or comment, brackets
+    # and, at the root's top level, commas. In a string: its end, an escape
+    # or an apostrophe (see iter_jsonc_items()).
+    _JSONC_OUTSIDE_STOP = re.compile(rb"[^ \t\n\r]")
+    _JSONC_ITEMS_STOP = re.compile(rb"[\"'/#\[\]{},]")
+    _JSONC_NESTED_STOP = re.compile(rb"[\"'/#\[\]{}]")
+    _JSONC_STRING_STOP = re.compile(rb"[\"'\\]")
+
+    @staticmethod
+    def _blank_jsonc(data: bytearray) -> None:
+        """Replace JSONC comments and trailing commas with spaces, in place.
+
+        `data` is UTF-8 JSONC. Newlines inside comments are kept and every
+        blanked character becomes exactly one space, so the result is plain
+        JSON whose line / column positions match the original text.
+
+        Comments are //, # and /* */ outside strings. Quirks kept for
+        compatibility: either quote character toggles the string state, a
+        quote directly after an escaped backslash does not close a string,
+        '//' preceded by ':' is not a comment (URLs), and an unterminated
+        block comment swallows all but the final character. A comma is
+        trailing when only whitespace and comments separate it from a closing
+        '}' or ']' (commas inside strings are never touched).
+        """
+        # Blanked regions end before any later token's lookbehind, so blanking
+        # behind the scanner does not change what it matches next. Regions are
+        # copied from one pre-translated buffer instead of translated each.
+        blanked = data.translate(ApatheticUtils_Internal_Files._JSONC_BLANK_TABLE)
+        ascii_only = data.isascii()
+        resized: list[tuple[int, int, bytes]] = []
+        with memoryview(data) as view:
+            for match in ApatheticUtils_Internal_Files._JSONC_BLANK_TOKEN.finditer(
+                data
+            ):
+                kind = match.lastgroup
+                if kind is None:
+                    break  # Only code was left
+                if kind == "close":
+                    start, end = match.span("gap")
+                    start -= 1  # The comma before the comments is trailing
+                else:
+                    start, end = match.span(kind)
+                if not ascii_only and not data[start:end].isascii():
+                    # One space per character, not per UTF-8 byte (applied
+                    # below, as resizing is not possible while the scanner
+                    # holds data)
+                    text = data[start:end].decode("utf-8", "replace")
+                    resized.append((start, end, text.encode("ascii", "replace")))
+                view[start:end] = blanked[start:end]
+
+        # Back to front, so a resized chunk cannot shift the ones before it
+        table = ApatheticUtils_Internal_Files._JSONC_BLANK_TABLE
+        for start, end, ascii_chunk in reversed(resized):
+            data[start:end] = ascii_chunk.translate(table)
+
+    @staticmethod
+    def _read_file_buffer(path: Path) -> bytearray:
+        """Read a whole file into a single mutable buffer (no extra copy)."""
+        with path.open("rb") as f:
+            raw = bytearray(os.fstat(f.fileno()).st_size)
+            size = f.readinto(raw)
+            raw[size:] = f.read()  # In case the file changed size meanwhile
+        return raw
+
+    @staticmethod
+    def _load_file(
+        kind: str,
+        path: Path,
+        parse: Callable[[bytearray], Any],
+        *,
+        cache: bool,
+    ) -> Any:
+        """Read `path` and return `parse` of its bytes, via the parse cache."""
+        if cache:
+            return ApatheticUtils_Internal_Files._parse_cache.load(kind, path, parse)
+        return parse(ApatheticUtils_Internal_Files._read_file_buffer(path))
+
+    # TOML module used by load_toml(), resolved on first use (see toml_backend())
+    _toml_backend: ClassVar[ModuleType | None] = None
+    _toml_backend_resolved: ClassVar[bool] = False
+
+    @staticmethod
+    def _resolve_toml_backend() -> ModuleType | None:
+        """Import tomllib (Python 3.11+) or tomli, or return None if neither."""
+        # Try tomllib (Python 3.11+)
+        try:
+            import tomllib  # type: ignore[import-not-found] # noqa: PLC0415
+        except ImportError:
+            pass
+        else:
+            return tomllib  # type: ignore[no-any-return,unused-ignore]
+
+        # Try tomli (required for Python 3.10)
+        try:
+            import tomli  # type: ignore[import-not-found,unused-ignore] # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+        except ImportError:
+            return None
+        return tomli  # type: ignore[no-any-return,unused-ignore]  # pyright: ignore[reportUnknownVariableType]
+
+    @staticmethod
+    def _toml_module(*, required: bool) -> ModuleType | None:
+        """Return the TOML backend, resolving it once, see load_toml()."""
+        if not ApatheticUtils_Internal_Files._toml_backend_resolved:
+            # A failed import walks every sys.path finder; only pay for it once
+            backend = ApatheticUtils_Internal_Files._resolve_toml_backend()
+            ApatheticUtils_Internal_Files._toml_backend = backend
+            ApatheticUtils_Internal_Files._toml_backend_resolved = True
+        toml = ApatheticUtils_Internal_Files._toml_backend
+        if toml is None and required:
+            xmsg = (
+                "TOML parsing requires 'tomli' package on Python 3.10. "
+                "Install it with: pip install tomli, or disable "
+                "pyproject.toml support by setting "
+                "'use_pyproject_metadata: false' in your config."
+            )
+            raise RuntimeError(xmsg)
+        return toml
+
+    @staticmethod
+    def toml_backend() -> str | None:
+        """Return the name of the module load_toml() parses with.
+
+        The backend is looked up once, on first use: `tomllib` on Python
+        3.11+, else `tomli` if installed, else None (TOML unavailable).
+        set_toml_backend() overrides or resets it.
+        """
+        toml = ApatheticUtils_Internal_Files._toml_module(required=False)
+        return None if toml is None else toml.__name__
+
+    @staticmethod
+    def set_toml_backend(backend: ModuleType | str | None = None) -> None:
+        """Choose the module load_toml() parses with.
+
+        Args:
+            backend: A module with a tomllib-compatible loads(), or the name
+                of one to import (e.g. "tomli"); None forgets the current
+                backend, so the next use looks it up again
+
+        Raises:
+            ImportError: If `backend` names a module that cannot be imported
+            TypeError: If the module has no loads() function
+        """
+        if backend is None:
+            ApatheticUtils_Internal_Files._toml_backend = None
+            ApatheticUtils_Internal_Files._toml_backend_resolved = False
+            return
+        module = (
+            importlib.import_module(backend) if isinstance(backend, str) else backend
+        )
+        if not callable(getattr(module, "loads", None)):
+            xmsg = f"TOML backend {module.__name__!r} has no loads() function"
+            raise TypeError(xmsg)
+        ApatheticUtils_Internal_Files._toml_backend = module
+        ApatheticUtils_Internal_Files._toml_backend_resolved = True
+
+    @staticmethod
+    def load_toml(
+        path: Path, *, required: bool = False, cache: bool = False
+    ) -> dict[str, Any] | None:
+        """Load and parse a TOML file, supporting Python 3.10 and 3.11+.
+
+        Uses:
+        - `tomllib` (Python 3.11+ standard library)
+        - `tomli` (required for Python 3.10 - must be installed separately)
+
+        The backend is resolved once and reused (see toml_backend()); the file
+        is read once, in binary, and passed to its loads().
+
+        Args:
+            path: Path to TOML file
+            required: If True, raise RuntimeError when tomli is missing on
+                Python 3.10. If False, return None when unavailable (caller
+                handles gracefully).
+            cache: If True, reuse the parse cache (see parse_cache_info()):
+                an unchanged file is not re-read or re-parsed, and every call
+                returns a fresh copy
+
+        Returns:
+            Parsed TOML data as a dictionary, or None if unavailable and not required
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist (checked before the
+                backend, so also when TOML is unavailable)
+            RuntimeError: If required=True, the file exists, and neither
+                tomllib nor tomli is available
+            ValueError: If the file cannot be parsed
+        """
+        toml = ApatheticUtils_Internal_Files._toml_module(required=False)
+        if toml is None:
+            # Open the file first: a missing file is reported as such, before
+            # the missing backend (RuntimeError if required)
+            try:
+                path.open("rb").close()
+            except FileNotFoundError as e:
+                xmsg = f"TOML file not found: {path}"
+                raise FileNotFoundError(xmsg) from e
+            ApatheticUtils_Internal_Files._toml_module(required=required)
+            return None
+
+        def _parse(raw: bytearray) -> dict[str, Any]:
+            text = raw.decode("utf-8")
+            raw.clear()
+            return cast("dict[str, Any]", toml.loads(text))
+
+        # No exists() check first: opening the file is the check
+        try:
+            return cast(
+                "dict[str, Any]",
+                ApatheticUtils_Internal_Files._load_file(
+                    "toml", path, _parse, cache=cache
+                ),
+            )
+        except FileNotFoundError as e:
+            xmsg = f"TOML file not found: {path}"
+            raise FileNotFoundError(xmsg) from e
+
+    @staticmethod
+    def _parse_jsonc(raw: bytearray, path: Path) -> dict[str, Any] | list[Any] | None:
+        """Parse JSONC bytes read from `path` (consumes `raw`), see load_jsonc()."""
+        # Blank comments / trailing commas in the only copy of the document, so
+        # json error positions are the file's own line and column
+        ApatheticUtils_Internal_Files._blank_jsonc(raw)
+        text = raw.decode("utf-8")
+        raw.clear()
+
+        if not text or text.isspace():
+            # Empty or only comments → interpret as "no config"
+            return None
+
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            xmsg = (
+                f"Invalid JSONC syntax in {path}:"
+                f" {e.msg} (line {e.lineno}, column {e.colno})"
+            )
+            raise ValueError(xmsg) from e
+
+        # Guard against scalar roots (invalid config structure)
+        if not isinstance(data, (dict, list)):
+            xmsg = f"Invalid JSONC root type: {type(data).__name__}"
+            raise ValueError(xmsg)  # noqa: TRY004
+
+        # narrow type
+        return cast("dict[str, Any] | list[Any]", data)
+
+    @staticmethod
+    def load_jsonc(
+        path: Path, *, cache: bool = False
+    ) -> dict[str, Any] | list[Any] | None:
+        """Load JSONC (JSON with comments and trailing commas).
+
+        Comments and trailing commas are blanked out in place (see
+        _blank_jsonc()) before the standard json decoder runs, so the file is
+        held in memory once and the line / column numbers in error messages
+        refer to the original file.
+
+        With cache=True, an unchanged file is served from the parse cache (see
+        parse_cache_info()) without re-reading or re-parsing it; every call
+        still returns a fresh copy.
+        """
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        logger.trace("[load_jsonc] Loading from %s", path)
+
+        if not path.exists():
+            xmsg = f"JSONC file not found: {path}"
+            raise FileNotFoundError(xmsg)
+
+        if not path.is_file():
+            xmsg = f"Expected a file: {path}"
+            raise ValueError(xmsg)
+
+        result = cast(
+            "dict[str, Any] | list[Any] | None",
+            ApatheticUtils_Internal_Files._load_file(
+                "jsonc",
+                path,
+                lambda raw: ApatheticUtils_Internal_Files._parse_jsonc(raw, path),
+                cache=cache,
+            ),
+        )
+        if result is not None:
+            logger.trace(
+                "[load_jsonc] Loaded %s with %d items",
+                type(result).__name__,
+                len(result),
+            )
+        return result
+
+    @staticmethod
+    def _advance_position(line: int, column: int, text: str) -> tuple[int, int]:
+        """Return the line / column just after `text`, starting at line / column."""
+        newlines = text.count("\n")
+        if newlines:
+            return line + newlines, len(text) - text.rindex("\n")
+        return line, column + len(text)
+
+    @staticmethod
+    def _parse_jsonc_batch(
+        text: str, path: Path, line: int, column: int, *, members: bool
+    ) -> list[Any]:
+        """Parse a blanked, bracket-wrapped batch of iter_jsonc_items() items.
+
+        `line` / `column` are the file position the text would start at, for
+        error messages (the brackets are not in the file). With `members`, the text
+        is an object and its (key, value) pairs are returned, duplicate keys
+        included.
+        """
+        pairs: list[tuple[str, Any]] = []
+
+        def _pairs_hook(found: list[tuple[str, Any]]) -> dict[str, Any]:
+            # The root object is the last one the decoder completes
+            nonlocal pairs
+            pairs = found
+            return dict(found)
+
+        try:
+            if not members:
+                return cast("list[Any]", json.loads(text))
+            json.loads(text, object_pairs_hook=_pairs_hook)
+        except json.JSONDecodeError as e:
+            if e.lineno == 1:
+                column += e.colno - 1
+            else:
+                column = e.colno
+            xmsg = (
+                f"Invalid JSONC syntax in {path}:"
+                f" {e.msg} (line {line + e.lineno - 1}, column {column})"
+            )
+            raise ValueError(xmsg) from e
+        return pairs
+
+    @staticmethod
+    def iter_jsonc_items(  # noqa: C901, PLR0912, PLR0915
+        path: Path, *, chunk_size: int | None = None
+    ) -> Generator[Any, None, None]:
+        """Stream the top-level items of a JSONC array or object.
+
+        Yields each element of a root array, or a (key, value) pair for each
+        member of a root object (in file order, duplicate keys included),
+        without reading the whole file. It is read in binary chunks and a
+        small state machine (code, string, line or block comment) tracks the
+        bracket depth to find the root's top-level commas; each run of
+        complete items is blanked with _blank_jsonc() and decoded by the
+        standard json decoder in one go, so comments, trailing commas, results
+        and errors (at the file's own line and column) are the same as with
+        load_jsonc(). About one chunk of text and the items parsed from it are
+        held at a time, more only while a single item is larger than that.
+
+        A file that is empty or only comments yields nothing. Items are
+        checked as they are reached, so a syntax error late in the file
+        raises after the items before it have been yielded. Anything but
+        whitespace and comments around the root is reported by parsing the
+        whole file as load_jsonc() does. So is everything from the first
+        apostrophe inside the root, or escaped backslash followed by a quote
+        in a string, on: _blank_jsonc() reads strings differently from there
+        (see its quirks), so the rest is parsed whole to match.
+
+        Args:
+            path: Path to JSONC file
+            chunk_size: Bytes to read at a time (default
+                DEFAULT_JSONC_CHUNK_SIZE)
+
+        Yields:
+            Array elements, or (key, value) pairs of object members
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If `path` is not a file, `chunk_size` is less than 1,
+                the root is not an array or object, or the file is not valid
+                JSONC
+
+        Example:
+            for name, entry in iter_jsonc_items(Path("manifest.jsonc")):
+                ...
+        """
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        logger.trace("[iter_jsonc_items] Streaming from %s", path)
+
+        if chunk_size is None:
+            chunk_size = ApatheticUtils_Internal_Files.DEFAULT_JSONC_CHUNK_SIZE
+        if chunk_size < 1:
+            xmsg = f"chunk_size must be at least 1, got {chunk_size}"
+            raise ValueError(xmsg)
+
+        if not path.exists():
+            xmsg = f"JSONC file not found: {path}"
+            raise FileNotFoundError(xmsg)
+
+        if not path.is_file():
+            xmsg = f"Expected a file: {path}"
+            raise ValueError(xmsg)
+
+        advance = ApatheticUtils_Internal_Files._advance_position
+        # Indexed by min(depth, 2)
+        stops = (
+            ApatheticUtils_Internal_Files._JSONC_OUTSIDE_STOP,
+            ApatheticUtils_Internal_Files._JSONC_ITEMS_STOP,
+            ApatheticUtils_Internal_Files._JSONC_NESTED_STOP,
+        )
+        stop = stops[0]
+        string_stop = ApatheticUtils_Internal_Files._JSONC_STRING_STOP
+        quote, apostrophe, slash, hash_mark, comma, open_array = b"\"'/#,["
+        code, string, line_comment, block_comment = range(4)
+        state = code
+        buf = bytearray()
+        pos = 0  # Scan position in buf
+        start = 0  # Start of the items not yet parsed, in buf
+        line = column = 1  # File position of buf[start]
+        depth = 0
+        closer = b""  # The root's closing bracket, once it is open
+        after_comma = 0  # End of the last top-level comma, in buf
+        # End of the top-level comma before it: unlike the last one, it is
+        # known not to be trailing (only what follows the last can tell)
+        cut = 0
+        pending = False  # Whole items between start and cut
+        first = True  # No batch taken from the root yet
+        taken = 0  # Items returned by _take_batch() so far
+        eof = False
+
+        def _take_batch(end: int, *, last: bool, tail: bytes = b"") -> list[Any]:
+            # Parse buf[start:end] wrapped in sentinel items standing in for
+            # its neighbours, so blanking and the decoder see the same context
+            # as in the whole file: '[0,' + items + ',0]' ('{"":0,' ... for
+            # objects). A batch that is not the last ends with its comma; the
+            # last one ends with `tail`, the file's closing bracket (if any).
+            nonlocal start, line, column, first, pending, taken
+            members = closer == b"}"
+            sentinel = b'"":0' if members else b"0"
+            head = (b"{" if members else b"[") + (b"" if first else sentinel + b",")
+            if not last:
+                tail = sentinel + closer
+            batch = bytearray(head)
+            with memoryview(buf) as view:
+                batch += view[start:end]
+            batch += tail
+            ApatheticUtils_Internal_Files._blank_jsonc(batch)
+            text = batch.decode("utf-8")
+            del batch
+            body = text[len(head) : len(text) - len(tail)]
+            rest = body.rstrip()[:-1].rstrip()
+            if not last and (not rest or rest.endswith(",")):
+                # The batch ends with an empty item, which is only valid as
+                # a trailing comma ('[1, /* c */,]', '[,]'): wait for what
+                # follows, so the error (if any) is where load_jsonc() has it
+                return []
+            items = ApatheticUtils_Internal_Files._parse_jsonc_batch(
+                text, path, line, column - len(head), members=members
+            )
+            line, column = advance(line, column, body)
+            start = end
+            lo = 0 if first else 1
+            first = pending = False
+            items = items[lo:] if last else items[lo:-1]
+            taken += len(items)
+            return items
+
+        def _whole_file() -> Generator[Any, None, None]:
+            # Something this scanner does not follow (see the docstring):
+            # parse the whole file as load_jsonc() does, so it reports the
+            # same error (or scalar root), and yield the items not yet taken.
+            # Blanking runs front to back, so those taken read the same.
+            read = ApatheticUtils_Internal_Files._read_file_buffer
+            data = ApatheticUtils_Internal_Files._parse_jsonc(read(path), path)
+            if isinstance(data, dict):
+                # Again for the (key, value) pairs, duplicate keys included
+                raw = read(path)
+                ApatheticUtils_Internal_Files._blank_jsonc(raw)
+                yield from ApatheticUtils_Internal_Files._parse_jsonc_batch(
+                    raw.decode("utf-8"), path, 1, 1, members=True
+                )[taken:]
+            elif data is not None:
+                yield from data[taken:]
+
+        with path.open("rb") as f:
+            while True:
+                # Find the next byte that matters; `resume` is where to scan
+                # from once more data is read if there is none
+                found = -1
+                if state == code:
+                    match = stop.search(buf, pos)
+                    resume = len(buf) if match is None else match.start()
+                    if match is not None and not (
+                        # A '/' may start a comment: its next byte is needed
+                        buf[resume] == slash and resume + 1 == len(buf) and not eof
+                    ):
+                        found = resume
+                elif state == string:
+                    match = string_stop.search(buf, pos)
+                    resume = len(buf) if match is None else match.start()
+                    if match is not None and buf[resume] == quote:
+                        pos = resume + 1
+                        state = code
+                        continue
+                    if match is not None and buf[resume] == apostrophe:
+                        # _blank_jsonc() ends the string here
+                        yield from _whole_file()
+                        return
+                    escaped = bytes(buf[resume + 1 : resume + 3])
+                    if escaped[:1] == b"\\" and escaped[1:] in (b'"', b"'"):
+                        # _blank_jsonc() keeps the string open here
+                        yield from _whole_file()
+                        return
+                    if escaped and (escaped != b"\\" or eof):
+                        pos = resume + 2  # An escape and the byte it escapes
+                        continue
+                elif state == line_comment:
+                    found = buf.find(b"\n", pos)
+                    resume = len(buf)
+                    if found >= 0:
+                        pos = found  # The newline itself is whitespace
+                        state = code
+                        continue
+                else:
+                    found = buf.find(b"*/", pos)
+                    resume = max(pos, len(buf) - 1)  # '*' may end the data
+                    if found >= 0:
+                        pos = found + 2
+                        state = code
+                        continue
+
+                if found < 0:
+                    pos = resume
+                    if eof:
+                        break
+                    # Hand over the complete items first
+                    if pending:
+                        yield from _take_batch(cut, last=False)
+                    if not depth and state == code:
+                        line, column = advance(
+                            line, column, buf[start:pos].decode("utf-8", "replace")
+                        )
+                        start = pos
+                    del buf[:start]
+                    pos -= start
+                    after_comma -= start
+                    cut -= start
+                    start = 0
+                    data = f.read(max(chunk_size, len(buf)))
+                    eof = not data
+                    buf += data
+                    continue
+
+                char = buf[found]
+                pos = found + 1
+                if char == slash:
+                    follow = buf[pos : pos + 1]
+                    if follow == b"*":
+                        state = block_comment
+                        pos += 1
+                    elif follow == b"/" and buf[found - 1 : found] != b":":
+                        state = line_comment
+                        pos += 1
+                    elif not depth:
+                        yield from _whole_file()
+                        return
+                elif char == hash_mark:
+                    state = line_comment
+                elif not depth and (char not in b"[{" or closer):
+                    # Outside the root, only whitespace and comments are allowed
+                    yield from _whole_file()
+                    return
+                elif char == quote:
+                    state = string
+                elif char == apostrophe:
+                    # A string for _blank_jsonc(), invalid JSON
+                    yield from _whole_file()
+                    return
+                elif char == comma:
+                    if after_comma > start:
+                        cut = after_comma
+                        pending = True
+                    after_comma = pos
+                elif char in b"[{":
+                    if not depth:
+                        closer = b"]" if char == open_array else b"}"
+                        line, column = advance(
+                            line, column, buf[start:pos].decode("utf-8", "replace")
+                        )
+                        start = pos
+                    depth += 1
+                    stop = stops[min(depth, 2)]
+                else:
+                    depth -= 1
+                    stop = stops[min(depth, 2)]
+                    if not depth:
+                        yield from _take_batch(
+                            found, last=True, tail=bytes(buf[found:pos])
+                        )
+                        column += 1  # The closing bracket
+                        start = pos
+
+        if depth:
+            # Let the decoder describe what the truncated root is missing. An
+            # unterminated block comment keeps its final character, which
+            # may close the root (as in load_jsonc()).
+            yield from _take_batch(len(buf), last=True)
+            if state != block_comment:
+                xmsg = f"Invalid JSONC syntax in {path}: Unexpected end of file"
+                raise ValueError(xmsg)
+        if state == block_comment:
+            yield from _whole_file()
+
+    # Loader picked by load_many(loader="auto") for each file suffix
+    _LOADER_SUFFIXES: ClassVar[dict[str, str]] = {
+        ".json": "jsonc",
+        ".jsonc": "jsonc",
+        ".toml": "toml",
+    }
+
+    @staticmethod
+    def _load_one(
+        path: Path, *, loader: str, cache: bool
+    ) -> ApatheticUtils_Internal_Files.LoadedFile:
+        """Load one file for load_many(), capturing the error if it fails."""
+        _files = ApatheticUtils_Internal_Files
+        kind = loader
+        if kind == "auto":
+            kind = ApatheticUtils_Internal_Files._LOADER_SUFFIXES.get(
+                path.suffix.lower(), ""
+            )
+        try:
+            if kind == "jsonc":
+                data = _files.load_jsonc(path, cache=cache)
+            elif kind == "toml":
+                data = _files.load_toml(path, required=True, cache=cache)
+            else:
+                xmsg = f"No loader for {path.suffix or 'files without a suffix'}"
+                raise ValueError(xmsg)  # noqa: TRY301
+        except (OSError, ValueError, RuntimeError) as e:
+            return _files.LoadedFile(path, error=e)
+        return _files.LoadedFile(path, data)
+
+    @staticmethod
+    def _load_chunk(
+        paths: list[Path], *, loader: str, cache: bool
+    ) -> list[ApatheticUtils_Internal_Files.LoadedFile]:
+        """Load one chunk of files (process-pool worker for load_many)."""
+        load_one = ApatheticUtils_Internal_Files._load_one
+        return [load_one(path, loader=loader, cache=cache) for path in paths]
+
+    @staticmethod
+    def load_many(
+        paths: Iterable[Path | str],
+        *,
+        loader: str = "auto",
+        workers: int | None = None,
+        processes: bool = False,
+        cache: bool = False,
+    ) -> list[ApatheticUtils_Internal_Files.LoadedFile]:
+        """Load many JSONC / TOML files, optionally in parallel.
+
+        Each file is loaded with load_jsonc() or load_toml() (the latter with
+        required=True). A file that fails to load does not stop the others:
+        its LoadedFile carries the exception instead of data.
+
+        Threads overlap the file reads, but parsing holds the GIL (tomllib is
+        pure Python); with `processes`, chunks of files are loaded in a
+        process pool instead, which also parallelizes parsing but pays for
+        starting the workers and pickling the results back. Either way at most
+        `workers` files are being loaded at a time.
+
+        Args:
+            paths: Files to load
+            loader: "jsonc", "toml", or "auto" to pick by suffix (.json and
+                .jsonc → jsonc, .toml → toml; any other suffix is an error
+                for that file)
+            workers: If > 1, load in a pool of this many threads (or
+                processes); None or 1 loads sequentially
+            processes: Use a process pool instead of threads
+            cache: Passed to the loaders (see parse_cache_info()); process
+                workers only share the on-disk cache (set_parse_cache_dir())
+
+        Returns:
+            One LoadedFile per input path, in input order
+
+        Raises:
+            ValueError: If `loader` is unknown or `workers` is less than 1
+        """
+        _files = ApatheticUtils_Internal_Files
+        if loader not in ("auto", "jsonc", "toml"):
+            xmsg = f"Unknown loader {loader!r}, expected 'auto', 'jsonc' or 'toml'"
+            raise ValueError(xmsg)
+        if workers is not None and workers < 1:
+            xmsg = f"workers must be at least 1, got {workers}"
+            raise ValueError(xmsg)
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        path_list = [Path(path) for path in paths]
+        load_one = partial(
+            ApatheticUtils_Internal_Files._load_one, loader=loader, cache=cache
+        )
+
+        if workers is None or workers == 1 or len(path_list) < 2:  # noqa: PLR2004
+            results = [load_one(path) for path in path_list]
+        elif processes:
+            results = ApatheticUtils_Internal_Shared.map_chunks_in_processes(
+                partial(
+                    ApatheticUtils_Internal_Files._load_chunk,
+                    loader=loader,
+                    cache=cache,
+                ),
+                path_list,
+                workers,
+            )
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="load_many"
+            ) as pool:
+                results = list(pool.map(load_one, path_list))
+
+        logger.trace(
+            "[load_many] Loaded %d files, %d failed (workers=%s, processes=%s)",
+            len(results),
+            sum(not result.ok for result in results),
+            workers,
+            processes,
+        )
+        return results
+
+
+# === apathetic_utils.matching ===
+# src/apathetic_utils/matching.py
+"""Pattern matching utilities."""
+
+
+class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides pattern matching functionality.
+
+    This class contains utilities for glob pattern matching and exclusion checking.
+    When mixed into apathetic_utils, it provides pattern matching methods.
+    """
+
+    # Environment variable overriding the glob cache size at import time
+    GLOB_CACHE_SIZE_ENV_VAR = "APATHETIC_UTILS_GLOB_CACHE_SIZE"
+    DEFAULT_GLOB_CACHE_SIZE = 512
+
+    @dataclass(frozen=True)
+    class GlobCacheInfo:
+        """Statistics for the shared glob-compilation cache.
+
+        Returned by glob_cache_info(); mirrors functools' ``cache_info()`` with
+        an extra eviction count.
+        """
+
+        hits: int
+        misses: int
+        evictions: int
+        maxsize: int
+        currsize: int
+
+    class _GlobEntry:
+        """A glob cache entry: the pattern's fast-path form and its regex.
+
+        `kind` / `text` come from _classify_glob(); they describe
+        fnmatchcase_portable() semantics, so they are only read from entries
+        whose `recursive` flag is ``"**" in pattern``. The regex is compiled
+        on first use, so patterns answered by the fast path never compile one.
+        """
+
+        __slots__ = ("kind", "pattern", "recursive", "regex", "text")
+
+        def __init__(self, pattern: str, *, recursive: bool) -> None:
+            self.pattern = pattern
+            self.recursive = recursive
+            self.kind, self.text = ApatheticUtils_Internal_Matching._classify_glob(
+                pattern
+            )
+            self.regex: re.Pattern[str] | None = None
+
+        def compiled(self) -> re.Pattern[str]:
+            """Return the compiled regex, translating it on first use."""
+            if self.regex is None:
+                if self.recursive:
+                    source = ApatheticUtils_Internal_Matching._translate_glob_recursive(
+                        self.pattern
+                    )
+                else:
+                    source = translate(self.pattern)
+                # Two threads may both compile; either result is fine
+                self.regex = re.compile(source)
+            return self.regex
+
+    class _GlobCache(
+        ApatheticUtils_Internal_Caching.SizedLRU[tuple[bool, str], "_GlobEntry"]
+    ):
+        """Sized LRU of glob entries (see _GlobEntry), with statistics.
+
+        Keys are ``(recursive, pattern)``: recursive entries use the '**'
+        backport translator, the others fnmatch.translate(). Patterns
+        containing '**' always use the recursive translator, so
+        fnmatchcase_portable() and _compile_glob_recursive() share entries.
+        """
+
+        def get(
+            self, pattern: str, *, recursive: bool
+        ) -> ApatheticUtils_Internal_Matching._GlobEntry:
+            """Return the entry for `pattern`, classifying it on a miss."""
+            entry = self.lookup((recursive, pattern))
+            if entry is None:
+                entry = self.add(pattern, recursive=recursive)
+            return entry
+
+        def add(
+            self, pattern: str, *, recursive: bool
+        ) -> ApatheticUtils_Internal_Matching._GlobEntry:
+            """Classify `pattern` and store it (after a lookup() miss)."""
+            # Classify outside the lock
+            entry = ApatheticUtils_Internal_Matching._GlobEntry(
+                pattern, recursive=recursive
+            )
+            self.store((recursive, pattern), entry)
+            return entry
+
+    _glob_cache = _GlobCache(
+        _GlobCache.size_from_env(GLOB_CACHE_SIZE_ENV_VAR, DEFAULT_GLOB_CACHE_SIZE)
+    )
+
+    @staticmethod
+    def glob_cache_info() -> ApatheticUtils_Internal_Matching.GlobCacheInfo:
+        """Return hit / miss / eviction statistics for the glob cache.
+
+        The cache is shared by fnmatchcase_portable(), compile_glob_set(),
+        compile_excludes() and is_excluded_raw().
+        """
+        cache = ApatheticUtils_Internal_Matching._glob_cache
+        with cache.lock:
+            return ApatheticUtils_Internal_Matching.GlobCacheInfo(
+                hits=cache.hits,
+                misses=cache.misses,
+                evictions=cache.evictions,
+                maxsize=cache.maxsize,
+                currsize=len(cache.entries),
+            )
+
+    @staticmethod
+    def set_glob_cache_size(maxsize: int) -> None:
+        """Resize the glob cache, evicting least-recently-used entries.
+
+        The initial size is 512, or the value of the
+        APATHETIC_UTILS_GLOB_CACHE_SIZE environment variable at import time.
+
+        Args:
+            maxsize: Maximum number of patterns to keep; 0 disables
+                caching
+
+        Raises:
+            ValueError: If `maxsize` is negative
+        """
+        if maxsize < 0:
+            xmsg = f"Glob cache size must be >= 0, got {maxsize}"
+            raise ValueError(xmsg)
+        ApatheticUtils_Internal_Matching._glob_cache.resize(maxsize)
+
+    @staticmethod
+    def clear_glob_cache() -> None:
+        """Drop all cached patterns and reset the glob cache statistics."""
+        ApatheticUtils_Internal_Matching._glob_cache.clear()
+
+    @staticmethod
+    def _compile_glob_recursive(pattern: str) -> re.Pattern[str]:
+        """
+        Compile a glob pattern to regex, backporting recursive '**' on Python < 3.11.
+        See _translate_glob_recursive() for the translation rules.
+        Always case-sensitive. Cached in the shared glob cache.
+        """
+        return ApatheticUtils_Internal_Matching._glob_cache.get(
+            pattern, recursive=True
+        ).compiled()
+
+    @staticmethod
+    def _compile_glob(pattern: str) -> re.Pattern[str]:
+        """Compile a glob with fnmatchcase_portable() semantics (cached).
+
+        '**' patterns use the recursive backport translator; everything else
+        uses fnmatch.translate(), like fnmatchcase() would.
+        """
+        return ApatheticUtils_Internal_Matching._glob_cache.get(
+            pattern, recursive="**" in pattern
+        ).compiled()
+
+    @staticmethod
+    def _translate_glob_recursive(pattern: str) -> str:
+        """
+        Translate a glob pattern to regex source, backporting recursive '**'.
+        This translator handles literals, ?, *, **, and [] classes without relying on
+        slicing fnmatch.translate() output, avoiding unbalanced parentheses.
+        """
+
+        def _escape_lit(ch: str) -> str:
+            # Escape regex metacharacters
+            if ch in ".^$+{}[]|()\\":
+                return "\\" + ch
+            return ch
+
+        i = 0
+        n = len(pattern)
+        pieces: list[str] = []
+        while i < n:
+            ch = pattern[i]
+
+            # Character class: copy through closing ']'
+            if ch == "[":
+                j = i + 1
+                if j < n and pattern[j] in "!^":
+                    j += 1
+                # allow leading ']' inside class as a literal
+                if j < n and pattern[j] == "]":
+                    j += 1
+                while j < n and pattern[j] != "]":
+                    j += 1
+                if j < n and pattern[j] == "]":
+                    # whole class, keep as-is (regex already)
+                    pieces.append(pattern[i : j + 1])
+                    i = j + 1
+                else:
+                    # unmatched '[', treat literally
+                    pieces.append("\\[")
+                    i += 1
+                continue
+
+            # Recursive glob
+            if ch == "*" and i + 1 < n and pattern[i + 1] == "*":
+                # Collapse a run of consecutive '*' to detect '**'
+                k = i + 2
+                while k < n and pattern[k] == "*":
+                    k += 1
+                # Treat any run >= 2 as recursive
+                pieces.append(".*")
+                i = k
+                continue
+
+            # Single-segment glob
+            if ch == "*":
+                pieces.append("[^/]*")
+                i += 1
+                continue
+
+            # Single character
+            if ch == "?":
+                pieces.append("[^/]")
+                i += 1
+                continue
+
+            # Path separator or literal
+            pieces.append(_escape_lit(ch))
+            i += 1
+
+        inner = "".join(pieces)
+        return f"(?s:{inner})\\Z"
+
+    @staticmethod
+    def _classify_glob(pattern: str) -> tuple[str, str]:  # noqa: PLR0911
+        """
+        Classify a glob into a form that can be matched without a regex.
+
+        Returns (kind, text) where kind is one of:
+          "literal" - no glob chars: path == text
+          "suffix"  - '*x' / '**x': path.endswith(text)
+          "prefix"  - 'x*' / 'x**': path.startswith(text)
+          "any"     - only '*' characters: matches everything
+          "regex"   - anything else ('?', '[]', inner '*'); text is the pattern
+
+        The simple forms only arise where a star run translates to '.*' under
+        both fnmatch and the '**' backport, so results are identical to the
+        regex path. Results are kept in the glob cache entries (see
+        _GlobEntry).
+        """
+        if "?" in pattern or "[" in pattern:
+            return ("regex", pattern)
+        if "*" not in pattern:
+            return ("literal", pattern)
+        body = pattern.strip("*")
+        if not body:
+            return ("any", "")
+        # A star inside the body means a single '*' next to a '**' run, or a
+        # glob in the middle: both need the real translator.
+        if "*" in body or (pattern[0] == "*" and pattern[-1] == "*"):
+            return ("regex", pattern)
+        if pattern[-1] == "*":
+            return ("prefix", body)
+        return ("suffix", body)
+
+    @staticmethod
+    def fnmatchcase_portable(path: str, pattern: str) -> bool:
+        """
+        Case-sensitive glob pattern matching with Python 3.10 '**' backport.
+
+        Uses fnmatchcase semantics (case-sensitive) as the base, with backported
+        support for recursive '**' patterns on Python 3.10. Compiled patterns
+        live in the shared glob cache (see glob_cache_info()).
+
+        Args:
+            path: The path to match against the pattern
+            pattern: The glob pattern to match
+
+        Returns:
+            True if the path matches the pattern, False otherwise.
+        """
+        # '**' patterns use the backport translator since fnmatchcase doesn't
+        # support **
+        recursive = "**" in pattern
+        cache = ApatheticUtils_Internal_Matching._glob_cache
+        # lookup() / add() rather than get(): on this hot path a hit should
+        # cost a single call
+        entry = cache.lookup((recursive, pattern))
+        if entry is None:
+            entry = cache.add(pattern, recursive=recursive)
+        kind = entry.kind
+        if kind == "literal":
+            return path == entry.text
+        if kind == "suffix":
+            return path.endswith(entry.text)
+        if kind == "prefix":
+            return path.startswith(entry.text)
+        if kind == "any":
+            return True
+
+        # Everything else needs the regex
+        return entry.compiled().match(path) is not None
+
+    @dataclass(frozen=True)
+    class GlobSet:
+        """A set of glob patterns compiled for matching in a single pass.
+
+        Built by compile_glob_set(). Literal, pure-suffix ('*.ext', '**/name')
+        and pure-prefix ('dir/**') patterns are answered with dict lookups and
+        str.endswith / str.startswith on tuples. The remaining patterns are
+        joined into one alternation regex where each becomes a named group
+        (``p<index>``), so one ``re.match`` both tests them all and reports
+        which one matched. Per-pattern semantics are those of
+        fnmatchcase_portable().
+        """
+
+        patterns: tuple[str, ...]
+        labels: tuple[str, ...]
+        regex: re.Pattern[str] | None
+        literals: dict[str, int] = field(default_factory=dict, compare=False)
+        suffixes: tuple[str, ...] = ()
+        suffix_indices: tuple[int, ...] = ()
+        prefixes: tuple[str, ...] = ()
+        prefix_indices: tuple[int, ...] = ()
+        any_index: int | None = None
+        regex_first_index: int = 0
+
+        def match(self, path: str) -> str | None:
+            """Return the label of the first pattern matching `path`, or None."""
+            # Indices follow input order, so the smallest hit is the first match
+            best = self.literals.get(path, len(self.patterns))
+            if self.any_index is not None:
+                best = min(best, self.any_index)
+            if path.endswith(self.suffixes):
+                best = min(
+                    best,
+                    next(
+                        i
+                        for s, i in zip(self.suffixes, self.suffix_indices, strict=True)
+                        if path.endswith(s)
+                    ),
+                )
+            if path.startswith(self.prefixes):
+                best = min(
+                    best,
+                    next(
+                        i
+                        for s, i in zip(self.prefixes, self.prefix_indices, strict=True)
+                        if path.startswith(s)
+                    ),
+                )
+            if self.regex is not None and self.regex_first_index < best:
+                m = self.regex.match(path)
+                if m is not None and m.lastgroup is not None:
+                    best = min(best, int(m.lastgroup[1:]))
+            if best == len(self.patterns):
+                return None
+            return self.labels[best]
+
+        def is_match(self, path: str) -> bool:
+            """Return True if any pattern in the set matches `path`."""
+            return (
+                path in self.literals
+                or self.any_index is not None
+                or path.endswith(self.suffixes)
+                or path.startswith(self.prefixes)
+                or (self.regex is not None and self.regex.match(path) is not None)
+            )
+
+    @staticmethod
+    def compile_glob_set(
+        patterns: Iterable[str],
+        *,
+        labels: Iterable[str] | None = None,
+    ) -> ApatheticUtils_Internal_Matching.GlobSet:
+        """Compile glob patterns into one combined matcher.
+
+        Simple patterns (literals, '*.ext', 'dir/**') are matched with string
+        operations; the rest share one combined regex. Matching a path against
+        the returned set costs at most a single ``re.match`` instead of one
+        scan per pattern. Duplicate patterns are merged, keeping the first
+        occurrence.
+
+        Args:
+            patterns: Glob patterns, matched like fnmatchcase_portable()
+            labels: Optional values reported by GlobSet.match() instead of the
+                pattern itself (parallel to `patterns`)
+
+        Returns:
+            GlobSet whose `.match(path)` returns the first matching label
+
+        Example:
+            globs = compile_glob_set(["*.pyc", "src/**/*.py"])
+            globs.match("src/pkg/mod.py")  # "src/**/*.py"
+        """
+        pattern_list = list(patterns)
+        label_list = pattern_list if labels is None else list(labels)
+        if len(label_list) != len(pattern_list):
+            xmsg = (
+                f"labels length ({len(label_list)}) does not match"
+                f" patterns length ({len(pattern_list)})"
+            )
+            raise ValueError(xmsg)
+
+        kept_patterns: list[str] = []
+        kept_labels: list[str] = []
+        seen: set[str] = set()
+        for pattern, label in zip(pattern_list, label_list, strict=True):
+            if pattern in seen:
+                continue
+            seen.add(pattern)
+            kept_patterns.append(pattern)
+            kept_labels.append(label)
+
+        literals: dict[str, int] = {}
+        suffixes: list[tuple[str, int]] = []
+        prefixes: list[tuple[str, int]] = []
+        any_index: int | None = None
+        regex_parts: list[str] = []
+        regex_first_index = len(kept_patterns)
+        for i, pattern in enumerate(kept_patterns):
+            entry = ApatheticUtils_Internal_Matching._glob_cache.get(
+                pattern, recursive="**" in pattern
+            )
+            kind, text = entry.kind, entry.text
+            if kind == "literal":
+                literals.setdefault(text, i)
+            elif kind == "suffix":
+                suffixes.append((text, i))
+            elif kind == "prefix":
+                prefixes.append((text, i))
+            elif kind == "any":
+                if any_index is None:
+                    any_index = i
+            else:
+                regex_first_index = min(regex_first_index, i)
+                # Group names carry the pattern index for GlobSet.match()
+                # Reuse the cached translation instead of translating again
+                source = entry.compiled().pattern
+                regex_parts.append(f"(?P<p{i}>{source})")
+
+        # Each translated glob is already anchored with \Z inside its group,
+        # so the alternation as a whole needs no extra anchoring.
+        regex = re.compile("|".join(regex_parts)) if regex_parts else None
+
+        return ApatheticUtils_Internal_Matching.GlobSet(
+            patterns=tuple(kept_patterns),
+            labels=tuple(kept_labels),
+            regex=regex,
+            literals=literals,
+            suffixes=tuple(text for text, _ in suffixes),
+            suffix_indices=tuple(i for _, i in suffixes),
+            prefixes=tuple(text for text, _ in prefixes),
+            prefix_indices=tuple(i for _, i in prefixes),
+            any_index=any_index,
+            regex_first_index=regex_first_index,
+        )
+
+    @staticmethod
+    def _absolute_path(path: Path, *, lexical: bool) -> Path:
+        """Make `path` absolute and normalized.
+
+        By default this is resolve_path() (follows symlinks, touches the disk,
+        memoized inside resolve_cache()). With `lexical`, '.' / '..' and
+        redundant separators are collapsed purely as strings (os.path.abspath),
+        with no syscalls.
+        """
+        if lexical:
+            return Path(os.path.abspath(path))  # noqa: PTH100
+        return ApatheticUtils_Internal_Paths.resolve_path(path)
+
+    @staticmethod
+    def _resolve_parent_pattern(pat: str, root: Path, *, lexical: bool = False) -> str:
+        """Resolve a pattern containing '../' against the exclude root.
+
+        Glob patterns are split at the first glob character; only the literal
+        base is resolved so the glob part is preserved. The result uses '/'
+        separators and is meant to be matched against absolute paths.
+
+        With `lexical`, the base is normalized without touching the disk.
+
+        Raises:
+            ValueError, RuntimeError: If the base cannot be resolved
+        """
+        _absolute_path = ApatheticUtils_Internal_Matching._absolute_path
+
+        # If pattern contains glob chars, split and resolve carefully
+        if "*" in pat or "?" in pat or "[" in pat:
+            # Find the first glob character to split base from pattern
+            glob_chars = ["*", "?", "["]
+            first_glob_pos = min(
+                (pat.find(c) for c in glob_chars if c in pat),
+                default=len(pat),
+            )
+
+            # Split into base path (before glob) and pattern part
+            base_part = pat[:first_glob_pos].rstrip("/")
+            pattern_part = pat[first_glob_pos:]
+
+            # Resolve the base part relative to root
+            if base_part:
+                resolved_base = _absolute_path(root / base_part, lexical=lexical)
+                return str(resolved_base).replace("\\", "/") + "/" + pattern_part
+            # Pattern starts with glob, resolve root and prepend pattern
+            return str(root).replace("\\", "/") + "/" + pattern_part
+
+        # No glob chars, resolve normally
+        return str(_absolute_path(root / pat, lexical=lexical)).replace("\\", "/")
+
+    @staticmethod
+    def is_excluded_raw(  # noqa: PLR0911, PLR0912, PLR0915, C901
+        path: Path | str,
+        exclude_patterns: list[str],
+        root: Path | str,
+        *,
+        lexical: bool = False,
+    ) -> bool:
+        """Smart matcher for normalized inputs.
+
+        - Treats 'path' as relative to 'root' unless already absolute.
+        - If 'root' is a file, match directly.
+        - Handles absolute or relative glob patterns.
+
+        Special behavior for patterns with '../':
+        Unlike rsync/ruff (which don't support '../' in exclude patterns),
+        serger allows patterns with '../' to explicitly match files outside
+        the exclude root. This enables config files in subdirectories to
+        exclude files elsewhere in the project. Patterns containing '../'
+        are resolved relative to the exclude root, then matched against
+        the absolute file path.
+
+        Lexical mode (`lexical=True`):
+        Paths and the root are made absolute with os.path.abspath() instead of
+        Path.resolve(), so no per-path lstat/readlink syscalls are made (only
+        the root is checked for existence / being a file). Results are the
+        same on symlink-free trees; with symlinks, 'link/..' is collapsed
+        textually and links are not followed.
+
+        Note:
+            The function does not require `root` to exist; if it does not,
+            a debug message is logged and matching is purely path-based.
+        """
+        _matching = ApatheticUtils_Internal_Matching
+        _absolute_path = ApatheticUtils_Internal_Matching._absolute_path
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        trace = ApatheticUtils_Internal_Logs.is_trace_enabled()
+        root = _absolute_path(Path(root), lexical=lexical)
+        path = Path(path)
+
+        if trace:
+            logger.trace(
+                "[is_excluded_raw] Checking path=%s against %d patterns",
+                path,
+                len(exclude_patterns),
+            )
+
+        # the callee really should deal with this, otherwise we might spam
+        if not Path(root).exists():
+            logger.debug("Exclusion root does not exist: %s", root)
+
+        # If the root itself is a file, treat that as a direct exclusion target.
+        if root.is_file():
+            # If the given path resolves exactly to that file, exclude it.
+            full_path = path if path.is_absolute() else (root.parent / path)
+            return _absolute_path(full_path, lexical=lexical) == root
+
+        # If no exclude patterns, nothing else to exclude
+        if not exclude_patterns:
+            return False
+
+        # Otherwise, treat as directory root.
+        full_path = path if path.is_absolute() else (root / path)
+        full_path = _absolute_path(full_path, lexical=lexical)
+
+        # Try to get relative path for standard matching
+        try:
+            rel = str(full_path.relative_to(root)).replace("\\", "/")
+            path_outside_root = False
+        except ValueError:
+            # Path lies outside the root
+            path_outside_root = True
+            # For patterns starting with **/, we can still match against filename
+            # or absolute path. For other patterns, we need rel, so use empty string
+            # as fallback (won't match non-**/ patterns)
+            rel = ""
+
+        for pattern in exclude_patterns:
+            pat = pattern.replace("\\", "/")
+
+            # Handle patterns starting with **/ - these should match even for files
+            # outside the exclude root (matching rsync/ruff behavior)
+            if pat.startswith("**/"):
+                # For **/ patterns, match against:
+                # 1. The file's name (e.g., **/__init__.py matches any __init__.py)
+                # 2. The absolute path (for more complex patterns)
+                file_name = full_path.name
+                abs_path_str = str(full_path).replace("\\", "/")
+
+                # Remove **/ prefix and match against filename
+                pattern_suffix = pat[3:]  # Remove "**/" prefix
+                if _matching.fnmatchcase_portable(file_name, pattern_suffix):
+                    logger.trace(
+                        "[is_excluded_raw] MATCHED **/ pattern %r against filename %s",
+                        pattern,
+                        file_name,
+                    )
+                    return True
+
+                # Also try matching against absolute path, but only if the pattern
+                # suffix contains directory separators
+                # (for patterns like **/subdir/file.py)
+                # If the suffix has no directory separators, we've already checked
+                # the filename above, so skip absolute path matching to avoid false
+                # positives (e.g., **/test_*.py shouldn't match paths containing "test")
+                has_dir_sep = "/" in pattern_suffix or "\\" in pattern_suffix
+                if has_dir_sep and _matching.fnmatchcase_portable(abs_path_str, pat):
+                    logger.trace(
+                        "[is_excluded_raw] MATCHED **/ pattern %r against absolute"
+                        " path",
+                        pattern,
+                    )
+                    return True
+
+                # Continue to next pattern if we're outside root and **/ didn't match
+                if path_outside_root:
+                    continue
+
+            # Handle patterns with ../ - serger-specific behavior to allow
+            # patterns that explicitly navigate outside the exclude root
+            if "../" in pat or pat.startswith("../"):
+                try:
+                    abs_path_str = str(full_path).replace("\\", "/")
+                    resolved_pattern_str = (
+                        ApatheticUtils_Internal_Matching._resolve_parent_pattern(
+                            pat, root, lexical=lexical
+                        )
+                    )
+
+                    # Match the resolved pattern against the absolute file path
+                    if _matching.fnmatchcase_portable(
+                        abs_path_str, resolved_pattern_str
+                    ):
+                        logger.trace(
+                            "[is_excluded_raw] MATCHED ../ pattern %r (resolved to %s)",
+                            pattern,
+                            resolved_pattern_str,
+                        )
+                        return True
+                except (ValueError, RuntimeError):
+                    # Pattern resolves outside filesystem or invalid, skip
+                    logger.trace(
+                        "[is_excluded_raw] Could not resolve ../ pattern %r", pattern
+                    )
+
+            # If path is outside root and pattern doesn't start with **/ or
+            # contain ../, skip
+            if path_outside_root:
+                continue
+
+            if trace:
+                logger.trace(
+                    "[is_excluded_raw] Testing pattern %r against %s", pattern, rel
+                )
+
+            # If pattern is absolute and under root, adjust to relative form
+            if pat.startswith(str(root)):
+                try:
+                    pat_rel = str(Path(pat).relative_to(root)).replace("\\", "/")
+                except ValueError:
+                    pat_rel = pat  # not under root; treat as-is
+                if _matching.fnmatchcase_portable(rel, pat_rel):
+                    logger.trace("[is_excluded_raw] MATCHED pattern %r", pattern)
+                    return True
+
+            # Otherwise treat pattern as relative glob
+            if _matching.fnmatchcase_portable(rel, pat):
+                logger.trace("[is_excluded_raw] MATCHED pattern %r", pattern)
+                return True
+
+            # Optional directory-only semantics
+            if pat.endswith("/") and rel.startswith(pat.rstrip("/") + "/"):
+                logger.trace("[is_excluded_raw] MATCHED pattern %r", pattern)
+                return True
+
+        return False
+
+    @dataclass(frozen=True)
+    class CompiledExcludes:
+        """Exclude patterns pre-classified and bound to a resolved root.
+
+        Built by compile_excludes(). Matching has the same semantics as
+        is_excluded_raw(), but separator normalization, pattern classification
+        and all root / '../' resolution happen once at compile time.
+
+        Pattern groups (GlobSets are labelled with the original pattern):
+            name_globs: '**/x' suffixes, matched against the file name
+            abs_globs: matched against the absolute path, even outside root
+            inside_abs_globs: matched against the absolute path, inside root only
+            rel_globs: matched against the root-relative path
+            dir_prefixes: ``(original_pattern, 'foo/')`` directory-only prefixes
+
+        The ``dir_*`` GlobSets hold, per group, the patterns (and their parents,
+        for 'x/**' / 'x/*') whose match on a directory guarantees a match on
+        everything beneath it; is_dir_excluded() uses them to prune walks.
+        """
+
+        root: Path
+        root_is_file: bool
+        patterns: tuple[str, ...]
+        name_globs: ApatheticUtils_Internal_Matching.GlobSet
+        abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        inside_abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        rel_globs: ApatheticUtils_Internal_Matching.GlobSet
+        dir_prefixes: tuple[tuple[str, str], ...]
+        dir_abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        dir_inside_abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        dir_rel_globs: ApatheticUtils_Internal_Matching.GlobSet
+        lexical: bool = False
+
+        def _full_path(self, path: Path, base: Path) -> Path:
+            """Absolute, normalized form of `path` (relative paths join `base`)."""
+            full_path = path if path.is_absolute() else (base / path)
+            return ApatheticUtils_Internal_Matching._absolute_path(
+                full_path, lexical=self.lexical
+            )
+
+        def is_excluded(self, path: Path | str) -> bool:
+            """Return True if `path` matches any compiled exclude pattern."""
+            return self.match(path) is not None
+
+        def is_dir_excluded(self, path: Path | str) -> bool:  # noqa: PLR0911
+            """Return True if every path beneath directory `path` is excluded.
+
+            This is conservative: False means "might contain included paths",
+            so a walker must descend. The root itself is never reported.
+            """
+            if self.root_is_file or not self.patterns:
+                return False
+
+            full_path = self._full_path(Path(path), self.root)
+
+            abs_path_str = str(full_path).replace("\\", "/")
+            if self.dir_abs_globs.is_match(abs_path_str):
+                return True
+
+            try:
+                rel = str(full_path.relative_to(self.root)).replace("\\", "/")
+            except ValueError:
+                return False
+            if rel == ".":
+                return False
+
+            if self.dir_inside_abs_globs.is_match(
+                abs_path_str
+            ) or self.dir_rel_globs.is_match(rel):
+                return True
+
+            rel_dir = rel + "/"
+            return any(rel_dir.startswith(prefix) for _, prefix in self.dir_prefixes)
+
+        def match(self, path: Path | str) -> str | None:  # noqa: PLR0911
+            """Return the exclude pattern that matched `path`, or None.
+
+            When the root itself is a file, a match returns the root path string.
+            """
+            path = Path(path)
+
+            # If the root itself is a file, treat that as a direct exclusion target.
+            if self.root_is_file:
+                if self._full_path(path, self.root.parent) == self.root:
+                    return str(self.root)
+                return None
+
+            if not self.patterns:
+                return None
+
+            full_path = self._full_path(path, self.root)
+
+            abs_path_str = str(full_path).replace("\\", "/")
+            matched = self.name_globs.match(full_path.name)
+            if matched is None:
+                matched = self.abs_globs.match(abs_path_str)
+            if matched is not None:
+                return matched
+
+            try:
+                rel = str(full_path.relative_to(self.root)).replace("\\", "/")
+            except ValueError:
+                # Path lies outside the root; only the groups above apply
+                return None
+
+            matched = self.inside_abs_globs.match(abs_path_str)
+            if matched is None:
+                matched = self.rel_globs.match(rel)
+            if matched is not None:
+                return matched
+
+            for original, prefix in self.dir_prefixes:
+                if rel.startswith(prefix):
+                    return original
+
+            return None
+
+    @staticmethod
+    def _dir_exclude_forms(pattern: str) -> list[str]:
+        """Return globs that, matching a directory, match everything beneath it.
+
+        Only patterns ending in a '.*' star run qualify ('x**', 'x/**', or any
+        trailing '*' when fnmatch semantics apply): if such a pattern matches
+        a directory, the trailing '.*' also absorbs '/child'. For 'x/**' and
+        fnmatch 'x/*' the parent glob 'x' qualifies too.
+        """
+        tail = "**" if "**" in pattern else "*"
+        if not pattern.endswith(tail):
+            return []
+        forms = [pattern]
+        if pattern.endswith("/" + tail):
+            forms.append(pattern[: -len(tail) - 1])
+        return forms
+
+    @staticmethod
+    def compile_excludes(
+        exclude_patterns: Iterable[str],
+        root: Path | str,
+        *,
+        lexical: bool = False,
+    ) -> ApatheticUtils_Internal_Matching.CompiledExcludes:
+        """Compile exclude patterns into a reusable, immutable matcher.
+
+        Use this instead of calling is_excluded_raw() in a loop with the same
+        pattern list: the returned object's `.is_excluded(path)` has identical
+        semantics, but only pays the per-path cost.
+
+        The root is resolved, and checked for existence / being a file, once at
+        compile time rather than on every call.
+
+        Args:
+            exclude_patterns: Glob patterns to exclude (same forms as
+                is_excluded_raw(): relative, absolute, '**/' and '../')
+            root: Root directory (or file) the patterns are relative to
+            lexical: Normalize paths without touching the disk, like
+                is_excluded_raw(..., lexical=True)
+
+        Returns:
+            CompiledExcludes matcher bound to the resolved root
+
+        Example:
+            excludes = compile_excludes(["**/__pycache__/**", "dist/"], root)
+            files = [f for f in candidates if not excludes.is_excluded(f)]
+        """
+        _matching = ApatheticUtils_Internal_Matching
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        root = ApatheticUtils_Internal_Matching._absolute_path(
+            Path(root), lexical=lexical
+        )
+        patterns = tuple(exclude_patterns)
+
+        # the callee really should deal with this, otherwise we might spam
+        if not root.exists():
+            logger.debug("Exclusion root does not exist: %s", root)
+
+        root_str = str(root)
+        name_patterns: list[tuple[str, str]] = []
+        abs_patterns: list[tuple[str, str]] = []
+        inside_abs_patterns: list[tuple[str, str]] = []
+        rel_patterns: list[tuple[str, str]] = []
+        dir_prefixes: list[tuple[str, str]] = []
+
+        for pattern in patterns:
+            pat = pattern.replace("\\", "/")
+            double_star = pat.startswith("**/")
+
+            if double_star:
+                # Filename match, plus absolute-path match for suffixes with a
+                # directory separator (see is_excluded_raw for the rationale)
+                suffix = pat[3:]
+                name_patterns.append((pattern, suffix))
+                if "/" in suffix:
+                    abs_patterns.append((pattern, pat))
+
+            if "../" in pat:
+                try:
+                    resolved = ApatheticUtils_Internal_Matching._resolve_parent_pattern(
+                        pat, root, lexical=lexical
+                    )
+                except (ValueError, RuntimeError):
+                    logger.trace(
+                        "[compile_excludes] Could not resolve ../ pattern %r",
+                        pattern,
+                    )
+                else:
+                    # '**/' patterns skip '../' handling for paths outside root
+                    target = inside_abs_patterns if double_star else abs_patterns
+                    target.append((pattern, resolved))
+
+            # If pattern is absolute and under root, adjust to relative form
+            if pat.startswith(root_str):
+                try:
+                    pat_rel = str(Path(pat).relative_to(root)).replace("\\", "/")
+                except ValueError:
+                    pat_rel = pat  # not under root; treat as-is
+                rel_patterns.append((pattern, pat_rel))
+
+            # Otherwise treat pattern as relative glob
+            rel_patterns.append((pattern, pat))
+
+            # Optional directory-only semantics
+            if pat.endswith("/"):
+                dir_prefixes.append((pattern, pat.rstrip("/") + "/"))
+
+        logger.trace(
+            "[compile_excludes] Compiled %d patterns against root=%s",
+            len(patterns),
+            root,
+        )
+
+        def _globs(
+            pairs: list[tuple[str, str]],
+        ) -> ApatheticUtils_Internal_Matching.GlobSet:
+            return _matching.compile_glob_set(
+                [pat for _, pat in pairs], labels=[original for original, _ in pairs]
+            )
+
+        def _dir_globs(
+            pairs: list[tuple[str, str]],
+        ) -> ApatheticUtils_Internal_Matching.GlobSet:
+            return _globs(
+                [
+                    (original, form)
+                    for original, pat in pairs
+                    for form in ApatheticUtils_Internal_Matching._dir_exclude_forms(pat)
+                ]
+            )
+
+        return _matching.CompiledExcludes(
+            root=root,
+            root_is_file=root.is_file(),
+            patterns=patterns,
+            name_globs=_globs(name_patterns),
+            abs_globs=_globs(abs_patterns),
+            inside_abs_globs=_globs(inside_abs_patterns),
+            rel_globs=_globs(rel_patterns),
+            dir_prefixes=tuple(dir_prefixes),
+            dir_abs_globs=_dir_globs(abs_patterns),
+            dir_inside_abs_globs=_dir_globs(inside_abs_patterns),
+            dir_rel_globs=_dir_globs(rel_patterns),
+            lexical=lexical,
+        )
+
+    @staticmethod
+    def _excluded_chunk(
+        excludes: ApatheticUtils_Internal_Matching.CompiledExcludes,
+        paths: list[Path | str],
+    ) -> list[bool]:
+        """Check one chunk of paths (process-pool worker for is_excluded_many)."""
+        return [excludes.is_excluded(path) for path in paths]
+
+    @staticmethod
+    def is_excluded_many(
+        paths: Iterable[Path | str],
+        exclude_patterns: Iterable[str],
+        root: Path | str,
+        *,
+        workers: int | None = None,
+        lexical: bool = False,
+    ) -> list[bool]:
+        """Check many paths against the same exclude patterns in one call.
+
+        Same result as ``[is_excluded_raw(p, patterns, root) for p in paths]``,
+        but the root and patterns are resolved and compiled once (see
+        compile_excludes()), and per-path trace logging is only formatted
+        when TRACE is enabled.
+
+        Args:
+            paths: Paths to check (relative paths are relative to `root`)
+            exclude_patterns: Glob patterns to exclude
+            root: Root directory (or file) the patterns are relative to
+            workers: If > 1, split the paths into chunks checked in a process
+                pool of this size. Only worth it for very large inputs, since
+                the compiled matcher is pickled to every worker.
+            lexical: Normalize paths without touching the disk, like
+                is_excluded_raw(..., lexical=True)
+
+        Returns:
+            One bool per input path, in input order (True = excluded)
+
+        Raises:
+            ValueError: If `workers` is less than 1
+        """
+        if workers is not None and workers < 1:
+            xmsg = f"workers must be at least 1, got {workers}"
+            raise ValueError(xmsg)
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        excludes = ApatheticUtils_Internal_Matching.compile_excludes(
+            exclude_patterns, root, lexical=lexical
+        )
+        path_list = list(paths)
+
+        if workers is not None and workers > 1 and len(path_list) > 1:
+            results = ApatheticUtils_Internal_Shared.map_chunks_in_processes(
+                partial(ApatheticUtils_Internal_Matching._excluded_chunk, excludes),
+                path_list,
+                workers,
+            )
+            logger.trace(
+                "[is_excluded_many] %d of %d paths excluded (%d workers)",
+                sum(results),
+                len(results),
+                workers,
+            )
+            return results
+
+        if not ApatheticUtils_Internal_Logs.is_trace_enabled():
+            return [excludes.is_excluded(path) for path in path_list]
+
+        results = []
+        for path in path_list:
+            matched = excludes.match(path)
+            if matched is not None:
+                logger.trace("[is_excluded_many] %s excluded by %r", path, matched)
+            results.append(matched is not None)
+        return results
+
+
+# === apathetic_utils.subprocess_utils ===
+# src/apathetic_utils/subprocess_utils.py
+"""Subprocess utilities for testing."""
+
+
+class SubprocessResult:
+    """Result from run_with_output() that includes all output in error messages."""
+
+    def __init__(
+        self,
+        result: subprocess.CompletedProcess[str],
+    ) -> None:
+        self.result = result
+
+    @property
+    def stdout(self) -> str:
+        """Captured stdout (includes info messages)."""
+        return self.result.stdout
+
+    @property
+    def stderr(self) -> str:
+        """Captured stderr."""
+        return self.result.stderr
+
+    @property
+    def returncode(self) -> int:
+        """Return code from subprocess."""
+        return self.result.returncode
+
+    @property
+    def all_output(self) -> str:
+        """All output combined: stdout + stderr."""
+        parts: list[str] = []
+        if self.stdout:
+            parts.append(f"=== STDOUT ===\n{self.stdout}")
+        if self.stderr:
+            parts.append(f"=== STDERR ===\n{self.stderr}")
+        return "\n\n".join(parts) if parts else ""
+
+
+class SubprocessResultWithBypass:
+    """Result from run_with_separated_output() with separate bypass output."""
+
+    def __init__(
+        self,
+        result: subprocess.CompletedProcess[str],
+        bypass_output: str,
+    ) -> None:
+        self.result = result
+        self._bypass_output = bypass_output
+
+    @property
+    def stdout(self) -> str:
+        """Captured stdout (normal output, excluding bypass)."""
+        return self.result.stdout
+
+    @property
+    def stderr(self) -> str:
+        """Captured stderr."""
+        return self.result.stderr
+
+    @property
+    def bypass_output(self) -> str:
+        """Bypass output (written to sys.__stdout__)."""
+        return self._bypass_output
+
+    @property
+    def returncode(self) -> int:
+        """Return code from subprocess."""
+        return self.result.returncode
+
+    @property
+    def all_output(self) -> str:
+        """All output combined: stdout + stderr + bypass."""
+        parts: list[str] = []
+        if self.stdout:
+            parts.append(f"=== STDOUT ===\n{self.stdout}")
+        if self.stderr:
+            parts.append(f"=== STDERR ===\n{self.stderr}")
+        if self.bypass_output:
+            parts.append(f"=== BYPASS (__stdout__) ===\n{self.bypass_output}")
+        return "\n\n".join(parts) if parts else ""
+
+
+class ApatheticUtils_Internal_Subprocess:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class providing subprocess utilities for testing."""
+
+    # Environment variable naming the find_python_command() cache file
+    PYTHON_COMMAND_CACHE_ENV_VAR = "APATHETIC_UTILS_PYTHON_COMMAND_CACHE"
+    _PYTHON_COMMAND_CACHE_VERSION = 1
+
+    # find_python_command() results for this process, by _python_command_key()
+    _python_commands: ClassVar[dict[str, list[str]]] = {}
+    _python_command_cache_file: ClassVar[Path | None] = (
+        Path(os.environ[PYTHON_COMMAND_CACHE_ENV_VAR]).expanduser()
+        if os.environ.get(PYTHON_COMMAND_CACHE_ENV_VAR)
+        else None
+    )
+
+    @staticmethod
+    def _find_venv_paths() -> list[Path]:
+        """Find paths to common virtual environment providers.
+
+        Returns:
+            List of venv paths found (Poetry, pipenv, virtualenv/venv, conda)
+        """
+        venv_paths: list[Path] = []
+
+        # 1. Poetry
+        poetry_cmd = shutil.which("poetry")
+        if poetry_cmd:
+            try:
+                venv_path_result = subprocess.run(  # noqa: S603
+                    [poetry_cmd, "env", "info", "--path"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                venv_path = Path(venv_path_result.stdout.strip())
+                if venv_path.exists():
+                    venv_paths.append(venv_path)
+            except Exception:  # noqa: BLE001, S110
+                pass
+
+        # 2. pipenv
+        pipenv_cmd = shutil.which("pipenv")
+        if pipenv_cmd:
+            try:
+                venv_path_result = subprocess.run(  # noqa: S603
+                    [pipenv_cmd, "--venv"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                venv_path = Path(venv_path_result.stdout.strip())
+                if venv_path.exists():
+                    venv_paths.append(venv_path)
+            except Exception:  # noqa: BLE001, S110
+                pass
+
+        # 3. virtualenv/venv (via VIRTUAL_ENV)
+        virtual_env = os.getenv("VIRTUAL_ENV")
+        if virtual_env:
+            venv_path = Path(virtual_env)
+            if venv_path.exists():
+                venv_paths.append(venv_path)
+
+        # 4. conda (via CONDA_PREFIX)
+        conda_prefix = os.getenv("CONDA_PREFIX")
+        if conda_prefix:
+            venv_path = Path(conda_prefix)
+            if venv_path.exists():
+                venv_paths.append(venv_path)
+
+        return venv_paths
+
+    @staticmethod
+    def _python_command_key(command: str) -> str:
+        """Return what a find_python_command() result depends on, as a string.
+
+        The interpreter, PATH and VIRTUAL_ENV decide which command is found.
+        """
+        return json.dumps(
+            [
+                command,
+                sys.executable,
+                os.environ.get("PATH", ""),
+                os.environ.get("VIRTUAL_ENV", ""),
+            ]
+        )
+
+    @staticmethod
+    def _may_be_runnable_module(command: str) -> bool:
+        """Cheaply check whether `python -m <command>` could find a module to run.
+
+        Only a hint, answered without starting an interpreter: a top-level
+        name is looked up with importlib.util.find_spec() (packages also need
+        a __main__.py). Dotted names are not looked up, since that would
+        import their parent packages.
+        """
+        if "." in command:
+            return True
+        try:
+            spec = importlib.util.find_spec(command)
+        except (ImportError, ValueError):
+            return True  # Cannot tell; let _is_runnable_module() decide
+        if spec is None:
+            return False
+        if spec.submodule_search_locations is None:
+            return True
+        return any(
+            (Path(location) / "__main__.py").is_file()
+            for location in spec.submodule_search_locations
+        )
+
+    @staticmethod
+    def _is_runnable_module(command: str) -> bool:
+        """Check whether `python -m <command> --help` succeeds."""
+        try:
+            result = subprocess.run(  # noqa: S603
+                [sys.executable, "-m", command, "--help"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except Exception:  # noqa: BLE001
+            return False
+        return result.returncode == 0
+
+    @staticmethod
+    def _is_usable_python_command(cmd: list[str], *, confirmed: bool) -> bool:
+        """Check whether a remembered find_python_command() result still works.
+
+        The executable must exist. For `python -m <module>`, the module must
+        still look runnable (see _may_be_runnable_module()) and, unless this
+        process already ran it (`confirmed`), actually run.
+        """
+        if not Path(cmd[0]).exists():
+            return False
+        if len(cmd) == 3 and cmd[1] == "-m":  # noqa: PLR2004
+            # A module only a fresh interpreter found fails the hint; it is
+            # then searched for again, which finds it again
+            if not ApatheticUtils_Internal_Subprocess._may_be_runnable_module(cmd[2]):
+                return False
+            if not confirmed:
+                return ApatheticUtils_Internal_Subprocess._is_runnable_module(cmd[2])
+        return True
+
+    @staticmethod
+    def _read_python_command_cache(cache_file: Path) -> dict[str, list[str]]:
+        """Return the commands stored in `cache_file` (empty if unusable)."""
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version")
+            != ApatheticUtils_Internal_Subprocess._PYTHON_COMMAND_CACHE_VERSION
+            or not isinstance(data.get("commands"), dict)
+        ):
+            return {}
+        return {
+            key: cmd
+            for key, cmd in data["commands"].items()
+            if isinstance(cmd, list) and cmd and all(isinstance(a, str) for a in cmd)
+        }
+
+    @staticmethod
+    def _write_python_command_cache(
+        cache_file: Path, key: str, cmd: list[str] | None
+    ) -> None:
+        """Set `key` to `cmd` in `cache_file` (None drops it), best effort.
+
+        The file is re-read, updated and atomically replaced while holding
+        `<cache_file>.lock`, so concurrent writers keep each other's entries.
+        """
+        lock_path = cache_file.with_name(cache_file.name + ".lock")
+        # The cache only saves time; the next lookup just searches again
+        with suppress(OSError), ApatheticUtils_Internal_Shared.file_lock(lock_path):
+            commands = ApatheticUtils_Internal_Subprocess._read_python_command_cache(
+                cache_file
+            )
+            if cmd is not None:
+                commands[key] = cmd
+            elif commands.pop(key, None) is None:
+                return
+            data = {
+                "version": (
+                    ApatheticUtils_Internal_Subprocess._PYTHON_COMMAND_CACHE_VERSION
+                ),
+                "commands": commands,
+            }
+            text = json.dumps(data, indent=2, sort_keys=True) + "\n"
+            ApatheticUtils_Internal_Shared.write_atomic(
+                cache_file, text.encode("utf-8")
+            )
+
+    @staticmethod
+    def _search_python_command(command: str) -> list[str] | None:
+        """Search for `command` (see find_python_command()); None if not found."""
+        # Try python -m <command> first (most reliable). Always run it: a
+        # fresh interpreter can differ from this one (e.g. sys.path changed
+        # since startup), and a module that imports may still fail to run
+        if ApatheticUtils_Internal_Subprocess._is_runnable_module(command):
+            return [sys.executable, "-m", command]
+
+        # Fall back to command directly in PATH
+        cmd_path = shutil.which(command)
+        if cmd_path:
+            return [cmd_path]
+
+        # Try to find in common virtual environment providers
+        venv_paths = ApatheticUtils_Internal_Subprocess._find_venv_paths()
+
+        # Check each venv for the command
+        for venv_path in venv_paths:
+            # Try both bin/ and Scripts/ (Windows)
+            for bin_dir_name in ("bin", "Scripts"):
+                bin_dir = venv_path / bin_dir_name
+                cmd_in_venv = bin_dir / command
+                if cmd_in_venv.exists():
+                    return [str(cmd_in_venv)]
+        return None
+
+    @staticmethod
+    def find_python_command(
+        command: str,
+        *,
+        error_hint: str | None = None,
+    ) -> list[str]:
+        """Find a Python command (module or executable).
+
+        Returns a command list suitable for subprocess.run().
+        Tries `python -m <command>` first, then the command directly.
+
+        Also searches in common virtual environment providers:
+        - Poetry (via `poetry env info --path`)
+        - pipenv (via `pipenv --venv`)
+        - virtualenv/venv (via `VIRTUAL_ENV` environment variable)
+        - conda (via `CONDA_PREFIX` environment variable)
+
+        Results are remembered for the rest of the process, keyed by the
+        command, sys.executable, PATH and VIRTUAL_ENV, and also stored in the
+        cache file set by set_python_command_cache(), if any. A remembered
+        command is reused while its executable still exists and, for
+        `python -m`, its module still looks runnable; a `python -m` command
+        read from the cache file is also run once with --help. Otherwise it is
+        dropped and searched for again. Failed lookups are not remembered.
+
+        Args:
+            command: Name of the command to find (e.g., "zipbundler", "serger")
+            error_hint: Optional hint message to include in error if command not found.
+                If None, generates a default message.
+
+        Returns:
+            Command list (e.g., ["python", "-m", "zipbundler"] or ["zipbundler"])
+
+        Raises:
+            RuntimeError: If the command is not found
+
+        Example:
+            # Find zipbundler
+            zipbundler_cmd = find_python_command("zipbundler")
+            # Returns: ["python", "-m", "zipbundler"] or ["zipbundler"] or
+            # ["/path/to/venv/bin/zipbundler"]
+
+            # Find serger
+            serger_cmd = find_python_command("serger")
+            # Returns: ["python", "-m", "serger"] or ["serger"] or
+            # ["/path/to/venv/bin/serger"]
+        """
+        key = ApatheticUtils_Internal_Subprocess._python_command_key(command)
+        memo = ApatheticUtils_Internal_Subprocess._python_commands
+        cache_file = ApatheticUtils_Internal_Subprocess._python_command_cache_file
+
+        cmd = memo.get(key)
+        # Memo entries were found (and run) by this process
+        confirmed = cmd is not None
+        if cmd is None and cache_file is not None:
+            cmd = ApatheticUtils_Internal_Subprocess._read_python_command_cache(
+                cache_file
+            ).get(key)
+        stale = False
+        if cmd is not None:
+            if ApatheticUtils_Internal_Subprocess._is_usable_python_command(
+                cmd, confirmed=confirmed
+            ):
+                memo[key] = cmd
+                return list(cmd)  # Callers extend the list
+            # Uninstalled or moved: forget it
+            memo.pop(key, None)
+            stale = True
+
+        cmd = ApatheticUtils_Internal_Subprocess._search_python_command(command)
+        if cmd is None:
+            if stale and cache_file is not None:
+                ApatheticUtils_Internal_Subprocess._write_python_command_cache(
+                    cache_file, key, None
+                )
+            # Command not found
+            if error_hint is None:
+                error_hint = (
+                    f"{command} not found. "
+                    f"Ensure {command} is installed in your virtual environment."
+                )
+            raise RuntimeError(error_hint)
+
+        memo[key] = cmd
+        if cache_file is not None:
+            ApatheticUtils_Internal_Subprocess._write_python_command_cache(
+                cache_file, key, cmd
+            )
+        return list(cmd)
+
+    @staticmethod
+    def set_python_command_cache(path: Path | str | None) -> None:
+        """Share find_python_command() results between processes via `path`.
+
+        `path` is a JSON file mapping each lookup (command, interpreter, PATH,
+        VIRTUAL_ENV) to the command found. It is created when needed and may
+        be deleted at any time. Writers hold `<path>.lock` while updating it,
+        so processes sharing the file do not lose each other's entries. The
+        initial file is taken from the APATHETIC_UTILS_PYTHON_COMMAND_CACHE
+        environment variable at import time.
+
+        Args:
+            path: Cache file, or None to stop using one
+        """
+        ApatheticUtils_Internal_Subprocess._python_command_cache_file = (
+            None if path is None else Path(path).expanduser()
+        )
+
+    @staticmethod
+    def clear_python_command_cache() -> None:
+        """Forget the find_python_command() results of this process.
+
+        The cache file set by set_python_command_cache() is left alone.
+        """
+        ApatheticUtils_Internal_Subprocess._python_commands.clear()
+
+    @dataclass
+    class CapturedOutput:
+        """Captured stdout, stderr, and merged streams."""
+
+        stdout: StringIO
+        stderr: StringIO
+        merged: StringIO
+
+        def __str__(self) -> str:
+            """Human-friendly representation (merged output)."""
+            return self.merged.getvalue()
+
+        def as_dict(self) -> dict[str, str]:
+            """Return contents as plain strings for serialization."""
+            return {
+                "stdout": self.stdout.getvalue(),
+                "stderr": self.stderr.getvalue(),
+                "merged": self.merged.getvalue(),
+            }
+
+    @staticmethod
+    @contextmanager
+    def capture_output() -> Iterator[ApatheticUtils_Internal_Subprocess.CapturedOutput]:
+        """Temporarily capture stdout and stderr.
+
+        Any exception raised inside the block is re-raised with
+        the captured output attached as `exc.captured_output`.
+
+        Example:
+        from apathetic_utils import apathetic_utils
+        from serger.cli import main
+
+        with apathetic_utils.capture_output() as cap:
+            exit_code = main(["--config", "my.cfg", "--dry-run"])
+
+        result = {
+            "exit_code": exit_code,
+            "stdout": cap.stdout.getvalue(),
+            "stderr": cap.stderr.getvalue(),
+            "merged": cap.merged.getvalue(),
+        }
+
+        """
+        merged = StringIO()
+
+        class TeeStream(StringIO):
+            def write(self, s: str) -> int:
+                merged.write(s)
+                return super().write(s)
+
+        buf_out, buf_err = TeeStream(), TeeStream()
+        old_out, old_err = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = buf_out, buf_err
+
+        cap = ApatheticUtils_Internal_Subprocess.CapturedOutput(
+            stdout=buf_out, stderr=buf_err, merged=merged
+        )
+        try:
+            yield cap
+        except Exception as e:
+            # Attach captured output to the raised exception for API introspection
+            e.captured_output = cap  # type: ignore[attr-defined]
+            raise
+        finally:
+            sys.stdout, sys.stderr = old_out, old_err
+
+    @staticmethod
+    def run_with_output(
+        args: list[str],
+        *,
+        cwd: Path | str | None = None,
+        initial_env: dict[str, str] | None = None,
+        env: dict[str, str] | None = None,
+        forward_to: str | None = "normal",
+        check: bool = False,
+        **kwargs: Any,
+    ) -> SubprocessResult:
+        """Run subprocess and capture all output with optional forwarding.
+
+        This helper captures subprocess output and can optionally forward it to
+        different destinations. It ensures captured output is available for error
+        messages and can be displayed in real-time if desired.
+
+        Args:
+            args: Command and arguments to run
+            cwd: Working directory
+            initial_env: Initial environment state. If None, uses os.environ.copy().
+                If provided, starts with this environment (can be empty dict for
+                blank environment).
+            env: Additional environment variables to add/override
+            forward_to: Where to forward captured output. Options:
+                - "bypass": Forward to sys.__stdout__/sys.__stderr__
+                  (bypasses capsys) (default)
+                - "normal": Forward to sys.stdout/sys.stderr (normal streams)
+                - None: Don't forward
+            check: If True, raise CalledProcessError on non-zero exit
+            **kwargs: Additional arguments passed to subprocess.run()
+
+        Returns:
+            SubprocessResult with all captured output
+
+        Example:
+            # Use current environment with additional vars
+            result = run_with_output(
+                [sys.executable, "-m", "serger", "--config", "config.json"],
+                cwd=tmp_path,
+                env={"LOG_LEVEL": "test"},
+            )
+
+            # Forward output to bypass (visible in real-time, bypasses capsys)
+            result = run_with_output(
+                [sys.executable, "-m", "serger", "--config", "config.json"],
+                cwd=tmp_path,
+                env={"LOG_LEVEL": "test"},
+                forward_to="bypass",
+            )
+
+            # On test failure, output will be included
+            assert result.returncode == 0, f"Failed: {result.all_output}"
+        """
+        # Set up environment
+        proc_env = os.environ.copy() if initial_env is None else initial_env.copy()
+
+        if env:
+            proc_env.update(env)
+
+        # Run subprocess with normal capture
+        result = subprocess.run(  # noqa: S603
+            args,
+            cwd=cwd,
+            env=proc_env,
+            capture_output=True,
+            text=True,
+            check=check,
+            **kwargs,
+        )
+
+        # Forward captured output to specified destination
+        if forward_to == "bypass":
+            if result.stdout and sys.__stdout__ is not None:
+                print(result.stdout, file=sys.__stdout__, end="")
+                sys.__stdout__.flush()
+            if result.stderr and sys.__stderr__ is not None:
+                print(result.stderr, file=sys.__stderr__, end="")
+                sys.__stderr__.flush()
+        elif forward_to == "normal":
+            if result.stdout:
+                print(result.stdout, end="")  # noqa: T201
+                sys.stdout.flush()
+            if result.stderr:
+                print(result.stderr, file=sys.stderr, end="")  # noqa: T201
+                sys.stderr.flush()
+
+        return SubprocessResult(result=result)
+
+    @staticmethod
+    def run_with_separated_output(
+        args: list[str],
+        *,
+        cwd: Path | str | None = None,
+        initial_env: dict[str, str] | None = None,
+        env: dict[str, str] | None = None,
+        check: bool = False,
+        **kwargs: Any,
+    ) -> SubprocessResultWithBypass:
+        """Run subprocess with stdout and __stdout__ captured separately.
+
+        This uses a Python wrapper to modify sys.__stdout__ before the command runs,
+        allowing code to write to stdout and __stdout__ normally without any
+        changes. Normal output (stdout) is captured, while bypass output
+        (__stdout__) goes to the parent's stdout.
+
+        Args:
+            args: Command and arguments to run (must be a Python command)
+            cwd: Working directory
+            initial_env: Initial environment state. If None, uses os.environ.copy().
+                If provided, starts with this environment (can be empty dict for
+                blank environment).
+            env: Additional environment variables to add/override
+            check: If True, raise CalledProcessError on non-zero exit
+            **kwargs: Additional arguments passed to subprocess.run()
+
+        Returns:
+            SubprocessResultWithBypass with separate stdout and bypass_output
+
+        Example:
+            result = run_with_separated_output(
+                [sys.executable, "-m", "serger", "--config", "config.json"],
+                cwd=tmp_path,
+                env={"LOG_LEVEL": "test"},
+            )
+            # stdout contains normal output (captured)
+            # bypass_output contains output written to __stdout__
+            assert result.returncode == 0, f"Failed: {result.all_output}"
+        """
+        # Set up environment
+        proc_env = os.environ.copy() if initial_env is None else initial_env.copy()
+
+        if env:
+            proc_env.update(env)
+
+        # Create Python wrapper script that modifies sys.__stdout__ and runs command
+        # For Python commands, we exec the script code in this process
+        # Use __import__ to avoid namespace collisions in stitched mode
+        wrapper_script = """import sys
+import os
+import json
+
+# Modify __stdout__ to point to fd 3 (preserved original stdout)
+try:
+    original_stdout = os.fdopen(3, 'w')
+    sys.__stdout__ = original_stdout
+except (OSError, ValueError):
+    # FD 3 not available, __stdout__ remains unchanged
+    pass
+
+# Execute the actual command
+# Reconstruct the original command from environment (using JSON for safety)
+cmd_json = os.environ.get('_WRAPPED_CMD')
+if cmd_json:
+    cmd = json.loads(cmd_json)
+    if cmd and len(cmd) > 0:
+        # If it's a Python command with a script file, exec in this process
+        is_python = (
+            cmd[0] == sys.executable
+            or cmd[0].endswith('python')
+            or 'python' in cmd[0]
+        )
+        if is_python and len(cmd) > 1:
+            # Execute the script file in this process (after __stdout__ mod)
+            script_path = cmd[1]
+            with open(script_path, 'r') as f:
+                script_code = f.read()
+            # Execute in current namespace so __stdout__ modification applies
+            exec(
+                compile(script_code, script_path, 'exec'),
+                {'__name__': '__main__', '__file__': script_path},
+            )
+            sys.exit(0)
+        else:
+            # For other commands, exec directly
+            os.execvpe(cmd[0], cmd, os.environ)
+    else:
+        sys.exit(1)
+else:
+    sys.exit(1)
+"""
+
+        # Create temporary wrapper script
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(wrapper_script)
+            wrapper_path = f.name
+
+        # Initialize read_pipe before try block
+        read_pipe = None
+        try:
+            # Create pipes for stdout capture
+            read_pipe, write_pipe = os.pipe()
+
+            # Set up command in environment (use JSON for safety)
+            proc_env["_WRAPPED_CMD"] = json.dumps(args)
+
+            # Create shell command that:
+            # 1. Preserves original stdout to fd 3: exec 3>&1
+            # 2. Redirects stdout to pipe: exec 1>&{write_pipe}
+            # 3. Runs Python wrapper: exec python wrapper.py
+            shell_cmd = f"""
+exec 3>&1  # Preserve original stdout to fd 3
+exec 1>&{write_pipe}  # Redirect stdout to pipe
+exec {shutil.which("python3") or sys.executable} {wrapper_path}
+"""
+
+            # Run the shell command
+            # Note: We can't use capture_output=True because we need pass_fds
+            # which is incompatible with capture_output. We need manual PIPE setup.
+            result = subprocess.run(  # noqa: S603, UP022
+                ["/bin/bash", "-c", shell_cmd],
+                cwd=cwd,
+                env=proc_env,
+                stdout=subprocess.PIPE,  # This captures fd 3 output (bypass)
+                stderr=subprocess.PIPE,  # This captures stderr
+                text=True,
+                check=check,
+                pass_fds=(write_pipe,),
+                **kwargs,
+            )
+
+            # Close write end
+            os.close(write_pipe)
+
+            # Read captured stdout from pipe
+            captured_stdout = ""
+            try:
+                with os.fdopen(read_pipe, "r") as f:
+                    captured_stdout = f.read()
+            except (OSError, ValueError):
+                pass
+
+            # Result structure:
+            # - result.stdout contains bypass output (from fd 3)
+            # - captured_stdout contains normal output (from pipe)
+            # - result.stderr contains stderr
+
+            # Create a modified CompletedProcess with swapped stdout
+            modified_result = subprocess.CompletedProcess(
+                args=args,
+                returncode=result.returncode,
+                stdout=captured_stdout,  # Normal output from pipe
+                stderr=result.stderr,
+            )
+
+            return SubprocessResultWithBypass(
+                result=modified_result,
+                bypass_output=result.stdout,  # Bypass output from fd 3
+            )
+
+        finally:
+            # Clean up wrapper script
+            with suppress(OSError):
+                Path(wrapper_path).unlink()
+            if read_pipe is not None:
+                with suppress(OSError):
+                    os.close(read_pipe)
+
+
+# === apathetic_utils.runtime ===
+# src/apathetic_utils/runtime.py
+"""Build and runtime utilities for testing."""
+
+
+class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class providing build and runtime utilities for testing."""
+
+    @staticmethod
+    def detect_runtime_mode(package_name: str) -> str:  # noqa: PLR0911
+        """Detect the current runtime mode.
+
+        Args:
+            package_name: Name of the package to check for stitched mode
+
+        Returns:
+            - "frozen" if running as a frozen executable
+            - "zipapp" if running as a .pyz zipapp
+            - "stitched" if running as a stitched single-file script
+                (detects both __STITCHED__ and __STANDALONE__ markers)
+            - "package" if running from package
+        """
+        if getattr(sys, "frozen", False):
+            return "frozen"
+        # Check for zipapp mode by looking for an attribute on __main__
+        # named after this module's __file__ path that ends with .pyz
+        if "__main__" in sys.modules:
+            main_mod = sys.modules["__main__"]
+            # Get this module's __file__ path to use as attribute name
+            runtime_file = __file__
+            zipapp_path = getattr(main_mod, runtime_file, "")
+            if isinstance(zipapp_path, str) and zipapp_path.endswith(".pyz"):
+                return "zipapp"
+        # Check for stitched mode in multiple locations
+        # Supports both __STITCHED__ and __STANDALONE__ for backward compatibility
+        # 1. Current module's globals (for when called from within stitched script)
+        # This works when all files are stitched into a single namespace
+        if "__STITCHED__" in globals() or "__STANDALONE__" in globals():
+            return "stitched"
+        # 2. Check package module's globals (when loaded via importlib)
+        # The stitched script is loaded as the package
+        pkg_mod = sys.modules.get(package_name)
+        if pkg_mod is not None and (
+            hasattr(pkg_mod, "__STITCHED__") or hasattr(pkg_mod, "__STANDALONE__")
+        ):
+            return "stitched"
+        # 3. Check __main__ module's globals (for script execution)
+        if "__main__" in sys.modules:
+            main_mod = sys.modules["__main__"]
+            if hasattr(main_mod, "__STITCHED__") or hasattr(main_mod, "__STANDALONE__"):
+                return "stitched"
+        return "package"
+
+    # Build manifests: "<output>.manifest.json" next to each built artifact
+    _BUILD_MANIFEST_SUFFIX = ".manifest.json"
+    _BUILD_MANIFEST_VERSION = 1
+    # Coarsest common timestamp granularity (FAT: 2 seconds); inputs modified
+    # this close to being recorded are always hashed (git's "racy clean")
+    _RACY_WINDOW_NS = 2_000_000_000
+
+    @staticmethod
+    def _scan_sources(src_dir: Path) -> Iterator[tuple[str, os.DirEntry[str]]]:
+        """Yield (posix path relative to `src_dir`, entry) for each source file.
+
+        Walks with os.scandir() so file types come from the directory read,
+        and prunes `__pycache__` and hidden directories instead of descending
+        into them. Symlinked directories are not followed (no cycles, and
+        no files from outside the tree). Bytecode files are skipped. Order is
+        unspecified.
+        """
+        stack = [("", str(src_dir))]
+        while stack:
+            prefix, dir_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name != "__pycache__" and not name.startswith("."):
+                        stack.append((prefix + name + "/", entry.path))
+                elif not name.endswith(".pyc") and entry.is_file():
+                    yield prefix + name, entry
+
+    @staticmethod
+    def _bundled_dependency_dirs(config_path: Path, root: Path) -> list[Path]:
+        """Return the installed packages a serger config stitches in.
+
+        Include patterns that do not start with a path under `root` (e.g.
+        `apathetic_logging/**/*.py`) are found by serger on sys.path. Their
+        directories are build inputs too, so upgrading or editing a bundled
+        dependency triggers a rebuild. Patterns under `root` are assumed to
+        be covered by the package's own source directory.
+        """
+        try:
+            config = ApatheticUtils_Internal_Files.load_jsonc(config_path)
+        except (OSError, ValueError):
+            return []  # Missing or broken: the bundler reports it
+        includes = config.get("include") if isinstance(config, dict) else None
+        if not isinstance(includes, list):
+            return []
+
+        dirs: list[Path] = []
+        for pattern in includes:
+            if not isinstance(pattern, str):
+                continue
+            head = pattern.replace("\\", "/").split("/", 1)[0]
+            # Glob characters are not identifiers; paths under root are local
+            if not head.isidentifier() or (root / head).exists():
+                continue
+            # PathFinder, not importlib.util.find_spec(): look at sys.path, not
+            # at whatever sys.modules holds (e.g. a stitched copy)
+            spec = importlib.machinery.PathFinder.find_spec(head)
+            if spec is not None and spec.submodule_search_locations:
+                dirs.extend(Path(p) for p in spec.submodule_search_locations)
+        return dirs
+
+    @staticmethod
+    def _build_inputs(source_dirs: list[Path], extra_inputs: list[Path]) -> list[Path]:
+        """Return the files a build reads: `source_dirs` (minus bytecode), extras.
+
+        Extra inputs (config files, bundler scripts) are listed even if they
+        do not exist, so creating one later is seen as a change.
+        """
+        sources = [
+            Path(entry.path)
+            for src_dir in source_dirs
+            for _, entry in ApatheticUtils_Internal_Runtime._scan_sources(src_dir)
+        ]
+        return sorted(sources) + extra_inputs
+
+    @staticmethod
+    def _build_fingerprint(path: Path, now_ns: int) -> dict[str, Any] | None:
+        """Return size, mtime and content hash of `path`, or None if missing."""
+        try:
+            data = path.read_bytes()
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        racy = now_ns - st.st_mtime_ns < ApatheticUtils_Internal_Runtime._RACY_WINDOW_NS
+        return {
+            "size": st.st_size,
+            # None: the mtime cannot vouch for the content, always hash
+            "mtime_ns": None if racy else st.st_mtime_ns,
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+
+    @staticmethod
+    def _build_fingerprint_matches(
+        path: Path | os.DirEntry[str], recorded: dict[str, Any] | None, now_ns: int
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Check `path` against its recorded fingerprint.
+
+        Returns whether the content is unchanged, and a fresher fingerprint to
+        record when it is unchanged but had to be hashed (None otherwise).
+        """
+        try:
+            st = path.stat()  # cached by DirEntry
+        except FileNotFoundError:
+            return recorded is None, None
+        if recorded is None or st.st_size != recorded["size"]:
+            return False, None
+        if st.st_mtime_ns == recorded["mtime_ns"]:
+            return True, None
+        # Touched (checkout, touch) or racy: compare the content
+        current = ApatheticUtils_Internal_Runtime._build_fingerprint(Path(path), now_ns)
+        if current is None or current["sha256"] != recorded["sha256"]:
+            return False, None
+        return True, current
+
+    @staticmethod
+    def _manifest_key(path: Path, root: Path) -> str:
+        """Return how a build manifest names `path` (relative to `root`)."""
+        try:
+            return path.relative_to(root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    @staticmethod
+    def _read_build_manifest(output_path: Path) -> dict[str, Any] | None:
+        """Return the manifest recorded for `output_path`, or None if unusable."""
+        manifest_path = output_path.with_name(
+            output_path.name + ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_SUFFIX
+        )
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version")
+            != ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_VERSION
+        ):
+            return None
+        return cast("dict[str, Any]", manifest)
+
+    @staticmethod
+    def _write_build_manifest(output_path: Path, manifest: dict[str, Any]) -> None:
+        """Atomically write the manifest for `output_path` (best effort)."""
+        manifest_path = output_path.with_name(
+            output_path.name + ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_SUFFIX
+        )
+        text = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+        # Without a manifest the next check just rebuilds
+        with suppress(OSError):
+            ApatheticUtils_Internal_Shared.write_atomic(
+                manifest_path, text.encode("utf-8")
+            )
+
+    @staticmethod
+    def _fingerprint_inputs(root: Path, inputs: list[Path]) -> dict[str, Any]:
+        """Return the manifest's `inputs` entry: a fingerprint per input file.
+
+        Taken before the bundler runs, so an input edited during the build
+        no longer matches its recorded fingerprint and the next check rebuilds.
+        """
+        now_ns = time.time_ns()
+        fingerprint = ApatheticUtils_Internal_Runtime._build_fingerprint
+        manifest_key = ApatheticUtils_Internal_Runtime._manifest_key
+        return {manifest_key(path, root): fingerprint(path, now_ns) for path in inputs}
+
+    @staticmethod
+    def _record_build(
+        output_path: Path, inputs: dict[str, Any], command: list[str]
+    ) -> None:
+        """Record what `output_path` was just built from (see _check_needs_rebuild).
+
+        `inputs` comes from _fingerprint_inputs(), called before the build.
+        """
+        manifest = {
+            "version": ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_VERSION,
+            "command": command,
+            "output": ApatheticUtils_Internal_Runtime._build_fingerprint(
+                output_path, time.time_ns()
+            ),
+            "inputs": inputs,
+        }
+        ApatheticUtils_Internal_Runtime._write_build_manifest(output_path, manifest)
+
+    @staticmethod
+    def _check_needs_rebuild(
+        output_path: Path,
+        root: Path,
+        source_dirs: list[Path],
+        extra_inputs: list[Path],
+        command: list[str],
+        *,
+        refresh: bool = False,
+    ) -> bool:
+        """Check if output file needs to be rebuilt.
+
+        Compares the build manifest written next to the output with the
+        current inputs: a rebuild is needed if the output or manifest is
+        missing, the bundler command differs, an input was added, removed or
+        changed content, or the output itself was modified. Files whose mtime
+        moved but whose content did not (git checkout, touch) do not count;
+        with `refresh`, their new mtime is recorded so the next check skips
+        hashing them.
+
+        Without `refresh` the check is read-only, so it is safe without
+        _build_lock(); a due refresh then also returns True, so the caller
+        takes the lock and checks again with `refresh=True`.
+
+        Sources are checked while `source_dirs` are being scanned (see
+        _scan_sources()), and the check stops at the first change found.
+
+        Args:
+            output_path: Path to the output file
+            root: Project root directory (manifest paths are relative to it)
+            source_dirs: Package source directory, plus the directories of
+                bundled dependencies (see _build_inputs())
+            extra_inputs: Other files the build reads (see _build_inputs())
+            command: Bundler command line, as recorded by _record_build()
+            refresh: Write refreshed mtimes to the manifest (hold _build_lock())
+
+        Returns:
+            True if rebuild (or, without `refresh`, a manifest refresh) is
+            needed, False otherwise
+        """
+        manifest = ApatheticUtils_Internal_Runtime._read_build_manifest(output_path)
+        if manifest is None or manifest.get("command") != command:
+            return True
+
+        recorded_inputs: dict[str, Any] = manifest.get("inputs") or {}
+        manifest_key = ApatheticUtils_Internal_Runtime._manifest_key
+        scan_sources = ApatheticUtils_Internal_Runtime._scan_sources
+        # Lazy: the scan stops as soon as a check fails
+        checks: Iterator[tuple[dict[str, Any], str, Path | os.DirEntry[str]]] = (
+            itertools.chain(
+                [(manifest, "output", output_path)],
+                (
+                    (recorded_inputs, f"{manifest_key(src_dir, root)}/{rel}", e)
+                    for src_dir in source_dirs
+                    for rel, e in scan_sources(src_dir)
+                ),
+                ((recorded_inputs, manifest_key(p, root), p) for p in extra_inputs),
+            )
+        )
+
+        now_ns = time.time_ns()
+        refreshed = False
+        seen_inputs = 0
+        for table, key, path in checks:
+            if table is recorded_inputs:
+                if key not in recorded_inputs:
+                    return True  # added
+                seen_inputs += 1
+            unchanged, fresher = (
+                ApatheticUtils_Internal_Runtime._build_fingerprint_matches(
+                    path, table.get(key), now_ns
+                )
+            )
+            if not unchanged:
+                return True
+            if fresher is not None and fresher != table[key]:
+                table[key] = fresher
+                refreshed = True
+        if seen_inputs != len(recorded_inputs):
+            return True  # removed
+
+        if refreshed and refresh:
+            ApatheticUtils_Internal_Runtime._write_build_manifest(output_path, manifest)
+        # Up to date; a refresh still due needs the locked (writing) check
+        return refreshed and not refresh
+
+    @staticmethod
+    @contextmanager
+    def _build_lock(output_path: Path) -> Iterator[None]:
+        """Hold an exclusive cross-process lock for building `output_path`.
+
+        Uses `<output>.lock` next to the output (see file_lock()).
+        """
+        lock_path = output_path.with_name(output_path.name + ".lock")
+        with ApatheticUtils_Internal_Shared.file_lock(lock_path):
+            yield
+
+    @staticmethod
+    def _temp_build_path(output_path: Path) -> Path:
+        """Return where to build `output_path` before renaming it into place.
+
+        Only written while holding _build_lock(), so the name can be fixed.
+        """
+        return output_path.with_name(f".{output_path.stem}.tmp{output_path.suffix}")
+
+    @staticmethod
+    def _validate_build_output(output_path: Path, build_type: str) -> None:
+        """Validate that build output was created successfully.
+
+        Args:
+            output_path: Path to the output file
+            build_type: Type of build (e.g., "stitched script", "zipapp")
+
+        Raises:
+            RuntimeError: If output file doesn't exist after build
+        """
+        # Force mtime update in case contents identical
+        output_path.touch()
+        if not output_path.exists():
+            msg = f"❌ Failed to generate {build_type}."
+            raise RuntimeError(msg)
+
+    @staticmethod
+    def _print_build_status(message: str, output_prefix: str | None) -> None:
+        """Print a build status line, as `[<output_prefix>] <message>` if given."""
+        if output_prefix is not None:
+            message = f"[{output_prefix}] {message}"
+        print(message, flush=True)  # noqa: T201
+
+    @staticmethod
+    def _run_bundler(cmd: list[str], root: Path, output_prefix: str | None) -> None:
+        """Run a bundler command in `root`.
+
+        With `output_prefix`, stdout and stderr are merged and each line is
+        printed as `[<output_prefix>] <line>`, so concurrent builds stay
+        readable; otherwise the output goes straight to this process's streams.
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails
+        """
+        if output_prefix is None:
+            subprocess.run(cmd, check=True, cwd=root)  # noqa: S603
+            return
+        with subprocess.Popen(  # noqa: S603
+            cmd,
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        ) as proc:
+            for line in proc.stdout or ():
+                print(f"[{output_prefix}] {line}", end="", flush=True)  # noqa: T201
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    @staticmethod
+    def _run_bundler_script(
+        root: Path,
+        command_path: str | None,
+        output_path: Path,
+        build_type: str,
+        output_prefix: str | None = None,
+    ) -> bool:
+        """Run a custom bundler script if provided and exists.
+
+        The script writes `output_path` itself (it is not given a temporary
+        path), so unlike the serger / zipbundler builds this is not atomic.
+
+        Args:
+            root: Project root directory
+            command_path: Optional path to bundler script (relative to root)
+            output_path: Path to the expected output file
+            build_type: Type of build (e.g., "stitched script", "zipapp")
+            output_prefix: Optional prefix for each output line (see _run_bundler())
+
+        Returns:
+            True if bundler script was run successfully,
+            False if not provided or doesn't exist
+        """
+        if command_path is None:
+            return False
+
+        bundler_path = root / command_path
+        if not bundler_path.exists():
+            return False
+
+        ApatheticUtils_Internal_Runtime._print_build_status(
+            f"⚙️  Rebuilding {build_type} (python {command_path})...", output_prefix
+        )
+        ApatheticUtils_Internal_Runtime._run_bundler(
+            [sys.executable, str(bundler_path)], root, output_prefix
+        )
+        ApatheticUtils_Internal_Runtime._validate_build_output(output_path, build_type)
+        return True
+
+    @staticmethod
+    def ensure_stitched_script_up_to_date(
+        *,
+        root: Path,
+        script_name: str | None = None,
+        package_name: str,
+        command_path: str | None = None,
+        log_level: str | None = None,
+        output_prefix: str | None = None,
+    ) -> Path:
+        """Rebuild stitched script if missing or outdated.
+
+        Args:
+            root: Project root directory
+            script_name: Optional name of the stitched script (without .py extension).
+                If None, defaults to package_name.
+            package_name: Name of the package (e.g., "apathetic_utils")
+            command_path: Optional path to bundler script (relative to root).
+                If provided and exists, uses `python {command_path}`.
+                Otherwise, uses `python -m serger --config .serger.jsonc`.
+                The script writes the output itself, so such builds are
+                locked but not atomic: readers may see a partial file.
+            log_level: Optional log level to pass to serger.
+                If provided, adds `--log-level=<log_level>` to the serger command.
+            output_prefix: Optional prefix for the build's output lines
+                (status and bundler lines, printed as `[<output_prefix>] <line>`),
+                e.g. when several builds run at once.
+
+        Returns:
+            Path to the stitched script
+        """
+        # Use package_name as default if script_name not provided
+        actual_script_name = package_name if script_name is None else script_name
+        bin_path = root / "dist" / f"{actual_script_name}.py"
+        src_dir = root / "src" / package_name
+
+        config_path = root / ".serger.jsonc"
+        # The logical command (not the resolved executable) identifies the
+        # build, so checking never has to look the bundler up
+        if command_path is not None and (root / command_path).exists():
+            command = ["python", command_path]
+            source_dirs = [src_dir]
+            extra_inputs = [root / command_path]
+        else:
+            command = ["serger", "--config", config_path.name]
+            # Dependencies stitched in from site-packages are inputs too
+            source_dirs = [
+                src_dir,
+                *ApatheticUtils_Internal_Runtime._bundled_dependency_dirs(
+                    config_path, root
+                ),
+            ]
+            extra_inputs = [config_path, root / "pyproject.toml"]
+
+        # Check if rebuild is needed
+        if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+            bin_path, root, source_dirs, extra_inputs, command
+        ):
+            return bin_path
+
+        # One builder at a time (e.g. pytest-xdist workers); the others wait
+        # and then find it already rebuilt
+        with ApatheticUtils_Internal_Runtime._build_lock(bin_path):
+            if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+                bin_path, root, source_dirs, extra_inputs, command, refresh=True
+            ):
+                return bin_path
+
+            # Fingerprint the inputs before building (see _fingerprint_inputs)
+            inputs = ApatheticUtils_Internal_Runtime._fingerprint_inputs(
+                root,
+                ApatheticUtils_Internal_Runtime._build_inputs(
+                    source_dirs, extra_inputs
+                ),
+            )
+
+            # Check if command_path is provided and exists
+            if not ApatheticUtils_Internal_Runtime._run_bundler_script(
+                root, command_path, bin_path, "stitched script", output_prefix
+            ):
+                # Fall back to using serger (found via find_python_command)
+                if not config_path.exists():
+                    msg = (
+                        "❌ Failed to generate stitched script: "
+                        f"serger config not found at {config_path}."
+                    )
+                    raise RuntimeError(msg)
+
+                ApatheticUtils_Internal_Runtime._print_build_status(
+                    "⚙️  Rebuilding stitched bundle (serger)...", output_prefix
+                )
+                serger_cmd = ApatheticUtils_Internal_Subprocess.find_python_command(
+                    "serger",
+                    error_hint=(
+                        "serger not found. "
+                        "Ensure serger is installed in your virtual environment."
+                    ),
+                )
+                # Build beside the output and rename, so readers never see
+                # a half-written script
+                tmp_path = ApatheticUtils_Internal_Runtime._temp_build_path(bin_path)
+                serger_cmd.extend(["--config", str(config_path), "-o", str(tmp_path)])
+                if log_level is not None:
+                    serger_cmd.extend(["--log-level", log_level])
+                try:
+                    ApatheticUtils_Internal_Runtime._run_bundler(
+                        serger_cmd, root, output_prefix
+                    )
+                    tmp_path.replace(bin_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                ApatheticUtils_Internal_Runtime._validate_build_output(
+                    bin_path, "stitched script"
+                )
+            ApatheticUtils_Internal_Runtime._record_build(bin_path, inputs, command)
+
+        return bin_path
+
+    @staticmethod
+    def ensure_zipapp_up_to_date(
+        *,
+        root: Path,
+        script_name: str | None = None,
+        package_name: str,
+        command_path: str | None = None,
+        log_level: str | None = None,
+        output_prefix: str | None = None,
+    ) -> Path:
+        """Rebuild zipapp if missing or outdated.
+
+        Args:
+            root: Project root directory
+            script_name: Optional name of the zipapp (without .pyz extension).
+                If None, defaults to package_name.
+            package_name: Name of the package (e.g., "apathetic_utils")
+            command_path: Optional path to bundler script (relative to root).
+                If provided and exists, uses `python {command_path}`.
+                Otherwise, uses zipbundler.
+                The script writes the output itself, so such builds are
+                locked but not atomic: readers may see a partial file.
+            log_level: Optional log level to pass to zipbundler.
+                If provided, adds `--log-level=<log_level>` to the zipbundler command.
+            output_prefix: Optional prefix for the build's output lines
+                (see ensure_stitched_script_up_to_date()).
+
+        Returns:
+            Path to the zipapp
+        """
+        # Use package_name as default if script_name not provided
+        actual_script_name = package_name if script_name is None else script_name
+        zipapp_path = root / "dist" / f"{actual_script_name}.pyz"
+        src_dir = root / "src" / package_name
+
+        # The logical command (not the resolved executable) identifies the
+        # build, so checking never has to look the bundler up
+        if command_path is not None and (root / command_path).exists():
+            command = ["python", command_path]
+            extra_inputs = [root / command_path]
+        else:
+            output = ApatheticUtils_Internal_Runtime._manifest_key(zipapp_path, root)
+            command = ["zipbundler", "-m", package_name, "-o", output, "-q", "."]
+            extra_inputs = [root / "pyproject.toml"]
+
+        # zipbundler packs the package only, not its dependencies
+        source_dirs = [src_dir]
+
+        # Check if rebuild is needed
+        if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+            zipapp_path, root, source_dirs, extra_inputs, command
+        ):
+            return zipapp_path
+
+        # One builder at a time (see ensure_stitched_script_up_to_date)
+        with ApatheticUtils_Internal_Runtime._build_lock(zipapp_path):
+            if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+                zipapp_path, root, source_dirs, extra_inputs, command, refresh=True
+            ):
+                return zipapp_path
+
+            # Fingerprint the inputs before building (see _fingerprint_inputs)
+            inputs = ApatheticUtils_Internal_Runtime._fingerprint_inputs(
+                root,
+                ApatheticUtils_Internal_Runtime._build_inputs(
+                    source_dirs, extra_inputs
+                ),
+            )
+
+            # Check if command_path is provided and exists
+            if not ApatheticUtils_Internal_Runtime._run_bundler_script(
+                root, command_path, zipapp_path, "zipapp", output_prefix
+            ):
+                # Fall back to using zipbundler
+                zipbundler_cmd = ApatheticUtils_Internal_Subprocess.find_python_command(
+                    "zipbundler",
+                    error_hint=(
+                        "zipbundler not found. "
+                        "Ensure zipbundler is installed: poetry install --with dev"
+                    ),
+                )
+                ApatheticUtils_Internal_Runtime._print_build_status(
+                    "⚙️  Rebuilding zipapp (zipbundler)...", output_prefix
+                )
+                tmp_path = ApatheticUtils_Internal_Runtime._temp_build_path(zipapp_path)
+                cmd = [
+                    *zipbundler_cmd,
+                    "-m",
+                    package_name,
+                    "-o",
+                    str(tmp_path),
+                    "-q",
+                    ".",
+                ]
+                if log_level is not None:
+                    cmd.extend(["--log-level", log_level])
+                try:
+                    ApatheticUtils_Internal_Runtime._run_bundler(
+                        cmd, root, output_prefix
+                    )
+                    tmp_path.replace(zipapp_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                ApatheticUtils_Internal_Runtime._validate_build_output(
+                    zipapp_path, "zipapp"
+                )
+            ApatheticUtils_Internal_Runtime._record_build(zipapp_path, inputs, command)
+
+        return zipapp_path
+
+    @staticmethod
+    def ensure_artifacts_up_to_date(
+        *,
+        root: Path,
+        package_name: str,
+        modes: Sequence[str] = ("stitched", "zipapp"),
+        script_name: str | None = None,
+        stitch_command: str | None = None,
+        zipapp_command: str | None = None,
+        log_level: str | None = None,
+    ) -> dict[str, Path]:
+        """Bring the artifacts of several runtime modes up to date at once.
+
+        Runs ensure_stitched_script_up_to_date() and ensure_zipapp_up_to_date()
+        in parallel threads, so a cold build takes as long as the slower
+        bundler rather than both. Each bundler's output lines are prefixed
+        with its mode (e.g. `[zipapp] ...`).
+
+        Args:
+            root: Project root directory
+            package_name: Name of the package (e.g., "apathetic_utils")
+            modes: Runtime modes to prepare: "stitched", "zipapp" and/or
+                "package" (nothing to build; maps to src/{package_name})
+            script_name: Optional name of the distributed script (without
+                extension). If None, defaults to package_name.
+            stitch_command: Optional bundler script for stitched mode
+                (see runtime_swap())
+            zipapp_command: Optional bundler script for zipapp mode
+                (see runtime_swap())
+            log_level: Optional log level to pass to serger and zipbundler.
+
+        Returns:
+            Path of each requested mode's artifact, keyed by mode
+
+        Raises:
+            ValueError: If a mode is unknown
+            RuntimeError, subprocess.CalledProcessError: If a build fails
+                (raised after the other builds have finished)
+        """
+        common: dict[str, Any] = {
+            "root": root,
+            "script_name": script_name,
+            "package_name": package_name,
+            "log_level": log_level,
+        }
+        builders = {
+            "stitched": partial(
+                ApatheticUtils_Internal_Runtime.ensure_stitched_script_up_to_date,
+                command_path=stitch_command,
+                output_prefix="stitched",
+                **common,
+            ),
+            "zipapp": partial(
+                ApatheticUtils_Internal_Runtime.ensure_zipapp_up_to_date,
+                command_path=zipapp_command,
+                output_prefix="zipapp",
+                **common,
+            ),
+        }
+        wanted = list(dict.fromkeys(modes))
+        unknown = [mode for mode in wanted if mode not in (*builders, "package")]
+        if unknown:
+            xmsg = (
+                f"Unknown runtime mode(s) {unknown!r}; "
+                "expected 'package', 'stitched' or 'zipapp'"
+            )
+            raise ValueError(xmsg)
+
+        to_build = [mode for mode in wanted if mode in builders]
+        with ThreadPoolExecutor(
+            max_workers=max(len(to_build), 1), thread_name_prefix="ensure_artifacts"
+        ) as executor:
+            futures = {mode: executor.submit(builders[mode]) for mode in to_build}
+        return {
+            mode: futures[mode].result()
+            if mode in futures
+            else root / "src" / package_name
+            for mode in wanted
+        }
+
+    @staticmethod
+    def runtime_swap(
+        *,
+        root: Path,
+        package_name: str,
+        script_name: str | None = None,
+        stitch_command: str | None = None,
+        zipapp_command: str | None = None,
+        mode: str | None = None,
+        log_level: str | None = None,
+        bytecode_dir: Path | str | None = None,
+    ) -> bool:
+        """Pre-import hook — runs before any tests or plugins are imported.
+
+        Swaps in the appropriate runtime module based on RUNTIME_MODE:
+        - package (default): uses src/{package_name} (no swap needed)
+        - stitched: uses dist/{script_name}.py (serger-built single file)
+        - zipapp: uses dist/{script_name}.pyz (zipbundler-built zipapp)
+
+        This ensures all test imports work transparently regardless of runtime mode.
+
+        Args:
+            root: Project root directory
+            package_name: Name of the package (e.g., "apathetic_utils")
+            script_name: Optional name of the distributed script (without extension).
+                If None, defaults to package_name.
+            stitch_command: Optional path to bundler script for stitched mode
+                (relative to root). If provided and exists, uses
+                `python {stitch_command}`. Otherwise, uses
+                `python -m serger --config .serger.jsonc`.
+            zipapp_command: Optional path to bundler script for zipapp mode
+                (relative to root). If provided and exists, uses
+                `python {zipapp_command}`. Otherwise, uses zipbundler.
+            mode: Runtime mode override. If None, reads from RUNTIME_MODE env var.
+            log_level: Optional log level to pass to serger and zipbundler.
+                If provided, adds `--log-level=<log_level>` to their commands.
+            bytecode_dir: Directory for the stitched script's bytecode cache
+                (e.g. when dist/ is read-only); written even if
+                sys.dont_write_bytecode is set. If None, uses __pycache__ next
+                to the script, or sys.pycache_prefix when that is set.
+
+        Returns:
+            True if swap was performed, False if in package mode
+
+        Raises:
+            pytest.UsageError: If mode is invalid or build fails
+        """
+        # Imported here, not at module level, so that importing apathetic_utils
+        # outside of tests does not import pytest
+        import pytest  # noqa: PLC0415
+
+        safe_trace = makeSafeTrace("🧬")
+
+        if mode is None:
+            mode = os.getenv("RUNTIME_MODE", "package")
+
+        if mode == "package":
+            return False  # Normal package mode; nothing to do.
+
+        # Nuke any already-imported modules from src/ to avoid stale refs.
+        # Dynamically detect all modules under src/ instead of hardcoding names.
+        src_dir = root / "src"
+        modules_to_nuke = ApatheticUtils_Internal_Modules.find_all_packages_under_path(
+            src_dir
+        )
+
+        for name in list(sys.modules):
+            # Check if module name matches any detected module or is a submodule
+            for mod_name in modules_to_nuke:
+                if name == mod_name or name.startswith(f"{mod_name}."):
+                    del sys.modules[name]
+                    break
+
+        if mode == "stitched":
+            return ApatheticUtils_Internal_Runtime._load_stitched_mode(
+                root,
+                package_name,
+                script_name,
+                stitch_command,
+                safe_trace,
+                log_level,
+                None if bytecode_dir is None else Path(bytecode_dir),
+            )
+        if mode == "zipapp":
+            return ApatheticUtils_Internal_Runtime._load_zipapp_mode(
+                root, package_name, script_name, zipapp_command, safe_trace, log_level
+            )
+
+        # Unknown mode
+        xmsg = f"Unknown RUNTIME_MODE={mode!r}. Valid modes: package, stitched, zipapp"
+        raise pytest.UsageError(xmsg)
+
+    # PEP 552 pyc flags: hash-based, checked against the source on load
+    _PYC_CHECKED_HASH_FLAGS = (0b11).to_bytes(4, "little")
+
+    @staticmethod
+    def _stitched_bytecode_path(
+        bin_path: Path, bytecode_dir: Path | None
+    ) -> Path | None:
+        """Return where to cache `bin_path`'s bytecode, or None to not cache it."""
+        cache_tag = sys.implementation.cache_tag
+        if cache_tag is None:
+            return None  # This interpreter does not cache bytecode
+        if bytecode_dir is not None:
+            return bytecode_dir / f"{bin_path.stem}.{cache_tag}.pyc"
+        # __pycache__ next to the script, or under sys.pycache_prefix
+        return Path(importlib.util.cache_from_source(str(bin_path)))
+
+    @staticmethod
+    def _stitched_code(
+        bin_path: Path, bytecode_dir: Path | None, safe_trace: Any
+    ) -> CodeType:
+        """Return the compiled code of a stitched script, via a bytecode cache.
+
+        The cache is a standard hash-based .pyc (PEP 552): it is valid while
+        the script's source hash matches, whatever the timestamps, and the
+        import system accepts it too. A cache that cannot be read or written
+        (e.g. a read-only dist/) only costs the compile. The default location
+        is not written when sys.dont_write_bytecode is set.
+        """
+        source = bin_path.read_bytes()
+        header = (
+            importlib.util.MAGIC_NUMBER
+            + ApatheticUtils_Internal_Runtime._PYC_CHECKED_HASH_FLAGS
+            + importlib.util.source_hash(source)
+        )
+        pyc_path = ApatheticUtils_Internal_Runtime._stitched_bytecode_path(
+            bin_path, bytecode_dir
+        )
+
+        if pyc_path is not None:
+            try:
+                data = pyc_path.read_bytes()
+            except OSError:
+                data = b""
+            if data[: len(header)] == header:
+                try:
+                    # Same trust as the script itself: written next to it
+                    # (or where the caller chose) by this function
+                    code = marshal.loads(memoryview(data)[len(header) :])  # noqa: S302
+                except (EOFError, ValueError, TypeError):
+                    pass  # Corrupt: recompile and rewrite it
+                else:
+                    safe_trace(f"Loaded stitched bytecode from {pyc_path}")
+                    return cast("CodeType", code)
+
+        code = compile(source, str(bin_path), "exec", dont_inherit=True)
+        # An explicit bytecode_dir asks for a cache even without write_bytecode
+        if pyc_path is None or (sys.dont_write_bytecode and bytecode_dir is None):
+            return code
+
+        try:
+            ApatheticUtils_Internal_Shared.write_atomic(
+                pyc_path, header, marshal.dumps(code)
+            )
+            safe_trace(f"Wrote stitched bytecode to {pyc_path}")
+        except OSError as e:
+            safe_trace(f"Cannot write stitched bytecode to {pyc_path}: {e}")
+        return code
+
+    @staticmethod
+    def _load_stitched_mode(
+        root: Path,
+        package_name: str,
+        script_name: str | None,
+        command_path: str | None,
+        safe_trace: Any,
+        log_level: str | None = None,
+        bytecode_dir: Path | None = None,
+    ) -> bool:
+        """Load stitched single-file script mode."""
+        import pytest  # noqa: PLC0415
+
+        bin_path = ApatheticUtils_Internal_Runtime.ensure_stitched_script_up_to_date(
+            root=root,
+            script_name=script_name,
+            package_name=package_name,
+            command_path=command_path,
+            log_level=log_level,
+        )
+
+        if not bin_path.exists():
+            if command_path is None:
+                hint_msg = (
+                    "Hint: run the bundler (e.g. `poetry run poe build:stitched`)."
+                )
+            else:
+                hint_msg = (
+                    f"Hint: run the bundler (e.g. `python {command_path}` "
+                    f"or `poetry run poe build:stitched`)."
+                )
+            xmsg = (
+                f"RUNTIME_MODE=stitched but stitched script not found "
+                f"at {bin_path}.\n{hint_msg}"
+            )
+            raise pytest.UsageError(xmsg)
+
+        # Load stitched script as the package.
+        spec = importlib.util.spec_from_file_location(package_name, bin_path)
+        if not spec or not spec.loader:
+            xmsg = f"Could not create import spec for {bin_path}"
+            raise pytest.UsageError(xmsg)
+
+        try:
+            mod: ModuleType = importlib.util.module_from_spec(spec)
+            sys.modules[package_name] = mod
+            code = ApatheticUtils_Internal_Runtime._stitched_code(
+                bin_path, bytecode_dir, safe_trace
+            )
+            exec(code, mod.__dict__)  # noqa: S102
+            safe_trace(f"Loaded stitched module from {bin_path}")
+        except Exception as e:
+            # Fail fast with context; this is a config/runtime problem.
+            error_name = type(e).__name__
+            xmsg = (
+                f"Failed to import stitched module from {bin_path}.\n"
+                f"Original error: {error_name}: {e}\n"
+                f"Tip: rebuild the bundle and re-run."
+            )
+            raise pytest.UsageError(xmsg) from e
+
+        safe_trace(f"✅ Loaded stitched runtime early from {bin_path}")
+        return True
+
+    @staticmethod
+    def _load_zipapp_mode(
+        root: Path,
+        package_name: str,
+        script_name: str | None,
+        command_path: str | None,
+        safe_trace: Any,
+        log_level: str | None = None,
+    ) -> bool:
+        """Load zipapp mode.
+
+        Handles zipbundler zipapps which store packages directly in the zip root.
+        Python's standard zipimporter can handle this structure directly.
+        """
+        import pytest  # noqa: PLC0415
+
+        zipapp_path = ApatheticUtils_Internal_Runtime.ensure_zipapp_up_to_date(
+            root=root,
+            script_name=script_name,
+            package_name=package_name,
+            command_path=command_path,
+            log_level=log_level,
+        )
+
+        if not zipapp_path.exists():
+            xmsg = (
+                f"RUNTIME_MODE=zipapp but zipapp not found at {zipapp_path}.\n"
+                f"Hint: run `poetry run poe build:zipapp`."
+            )
+            raise pytest.UsageError(xmsg)
+
+        # For zipbundler zipapps, use normal import
+        zipapp_str = str(zipapp_path)
+        if zipapp_str not in sys.path:
+            sys.path.insert(0, zipapp_str)
+
+        try:
+            importlib.import_module(package_name)
+            safe_trace(f"Loaded zipapp module from {zipapp_path}")
+        except Exception as e:
+            error_name = type(e).__name__
+            xmsg = (
+                f"Failed to import zipapp module from {zipapp_path}.\n"
+                f"Original error: {error_name}: {e}\n"
+                f"Tip: rebuild the zipapp and re-run."
+            )
+            raise pytest.UsageError(xmsg) from e
+
+        safe_trace(f"✅ Loaded zipapp runtime early from {zipapp_path}")
+        return True
+
+
+# === apathetic_utils.testing ===
+# src/apathetic_utils/testing.py
+"""Test utilities mixin for reusable test helpers."""
+
+
+class ApatheticUtils_Internal_Testing:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class providing reusable test utilities.
+
+    Inherit from this mixin in your test classes to access shared test utilities
+    that can be used across multiple projects.
+    """
+
+    @staticmethod
+    def _short_path(path: str | None) -> str:
+        """Return a shortened version of a path for logging."""
+        if not path:
+            return "n/a"
+        # Use a simple approach: show last MAX_PATH_COMPONENTS or full path if shorter
+        max_path_components = 3
+        path_obj = Path(path)
+        parts = path_obj.parts
+        if len(parts) > max_path_components:
+            return str(Path(*parts[-max_path_components:]))
+        return path
+
+    @staticmethod
+    def is_running_under_pytest() -> bool:
+        """Detect if code is running under pytest.
+
+        Checks multiple indicators:
+        - Environment variables set by pytest
+        - Command-line arguments containing 'pytest'
+
+        Returns:
+            True if running under pytest, False otherwise
+        """
+        return (
+            "pytest" in os.environ.get("_", "")
+            or "PYTEST_CURRENT_TEST" in os.environ
+            or any(
+                "pytest" in arg
+                for arg in sys.argv
+                if isinstance(arg, str)  # pyright: ignore[reportUnnecessaryIsInstance]
+            )
+        )
+
+    @staticmethod
+    def create_mock_superclass_test(
+        mixin_class: type,
+        parent_class: type,
+        method_name: str,
+        camel_case_method_name: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a mixin's snake_case method calls parent's camelCase via super().
+
+        Creates a test class with controlled MRO:
+        - TestClass inherits from mixin_class, then MockBaseClass
+        - MockBaseClass provides the camelCase method that super() resolves to
+        - Mocks the camelCase method and verifies it's called
+
+        Args:
+            mixin_class: The mixin class containing the snake_case method
+            parent_class: The parent class with the camelCase method
+                (e.g., logging.Logger)
+            method_name: Name of the snake_case method to test (e.g., "add_filter")
+            camel_case_method_name: Name of the camelCase method to mock
+                (e.g., "addFilter")
+            args: Arguments to pass to the snake_case method
+            kwargs: Keyword arguments to pass to the snake_case method
+            monkeypatch: pytest.MonkeyPatch fixture for patching
+
+        Raises:
+            AssertionError: If the camelCase method was not called as expected
+        """
+        # Imported here, not at module level, so that importing apathetic_utils
+        # outside of tests does not import pytest or unittest.mock
+        from unittest.mock import MagicMock  # noqa: PLC0415
+
+        import pytest  # noqa: PLC0415
+
+        # Get the real camelCase method from parent class to use as the base
+        # implementation. Check if the method exists first.
+        if not hasattr(parent_class, camel_case_method_name):
+            py_version = f"{sys.version_info[0]}.{sys.version_info[1]}"
+            pytest.skip(
+                f"{camel_case_method_name} does not exist on {parent_class.__name__} "
+                f"(Python {py_version})"
+            )
+        camel_method_unbound = getattr(parent_class, camel_case_method_name)
+
+        # Create a base class with the camelCase method (what super() resolves to)
+        # We define it dynamically so we can use any method name
+        # The method needs to exist on the class for patching to work
+        def create_method(camel_method: Any) -> Any:
+            """Create a method that wraps the parent class method."""
+
+            def method(self: Any, *a: Any, **kw: Any) -> Any:
+                return camel_method(self, *a, **kw)
+
+            return method
+
+        mock_base_class = type(
+            "MockBaseClass",
+            (),
+            {camel_case_method_name: create_method(camel_method_unbound)},
+        )
+
+        # Create test class: mixin first, then base class
+        # MRO: TestLogger -> Mixin -> MockBaseClass -> object
+        # When super() is called from Mixin, it resolves to MockBaseClass
+        class TestClass(mixin_class, mock_base_class):  # type: ignore[misc, valid-type]
+            """Test class with controlled MRO for super() resolution."""
+
+            def __init__(self) -> None:
+                mock_base_class.__init__(self)  # type: ignore[misc]
+
+        # Create an instance of our test class
+        test_instance = TestClass()
+
+        # Get the snake_case method from the test instance
+        snake_method = getattr(test_instance, method_name)
+        if snake_method is None:
+            msg = f"Method {method_name} not found on {mixin_class.__name__}"
+            raise AttributeError(msg)
+
+        # Mock the base class method (what super() resolves to)
+        mock_method = MagicMock(wraps=camel_method_unbound)
+        monkeypatch.setattr(mock_base_class, camel_case_method_name, mock_method)
+        # Call the snake_case method on our test instance
+        # Some methods may raise (e.g., invalid arguments)
+        # That's okay - we just want to verify the mock was called
+        with suppress(Exception):
+            snake_method(*args, **kwargs)
+
+        # Verify the underlying method was called
+        # For super() calls, this verifies the parent method was invoked
+        # When called via super(), the method is bound, so self is implicit
+        # The mock receives just the args (self is already bound)
+        # This is a "happy path" test - we just verify the method was called
+        # (exact argument matching is less important than verifying the call happened)
+        if not mock_method.called:
+            msg = f"{camel_case_method_name} was not called by {method_name}"
+            raise AssertionError(msg)
+        # If we have simple args/kwargs, try to verify them more precisely
+        # But don't fail if the method has defaults that fill in extra args
+        if args and not kwargs:
+            # For positional-only calls, check the first few args match
+            call_args = mock_method.call_args
+            if call_args:
+                call_args_pos, _ = call_args
+                # Verify at least the first arg matches (if we have args)
+                if (
+                    call_args_pos
+                    and len(call_args_pos) >= len(args)
+                    and call_args_pos[: len(args)] != args
+                ):
+                    msg = (
+                        f"Args don't match: expected {args}, "
+                        f"got {call_args_pos[: len(args)]}"
+                    )
+                    raise AssertionError(msg)
+
+    @staticmethod
+    def detect_module_runtime_mode(
+        mod: ModuleType,
+        *,
+        stitch_hints: set[str] | None = None,
+    ) -> str:
+        """Detect the runtime mode of a specific module.
+
+        Determines whether a module was built as part of a stitched single-file
+        script, zipapp archive, or standard package by checking for markers and
+        file path attributes.
+
+        This check prioritizes marker-based detection (most reliable) but falls
+        back to path heuristics for edge cases. It works correctly in:
+        - Stitched mode: Modules loaded from a .py stitched script
+        - Zipapp mode: Modules loaded from a .pyz zipapp archive
+        - Package mode: Regular package modules
+        - Mixed scenarios: When testing a stitched module while running in package mode
+
+        Args:
+            mod: Module to check
+            stitch_hints: Optional set of path hints to identify stitched modules.
+                Defaults to {"/dist/", "stitched"}. Used as fallback when markers
+                are not present.
+
+        Returns:
+            - "stitched" if module has __STITCHED__ or __STANDALONE__ marker,
+              or __file__ path matches stitch_hints
+            - "zipapp" if module __file__ indicates zipapp (contains .pyz)
+            - "package" for regular package modules
+
+        Raises:
+            TypeError: If mod is not a ModuleType
+        """
+        if stitch_hints is None:
+            stitch_hints = {"/dist/", "stitched"}
+
+        if not isinstance(mod, ModuleType):  # pyright: ignore[reportUnnecessaryIsInstance]
+            msg = f"Expected ModuleType, got {type(mod).__name__}"
+            raise TypeError(msg)
+
+        # Check for stitched markers first (most reliable)
+        if hasattr(mod, "__STITCHED__") or hasattr(mod, "__STANDALONE__"):
+            return "stitched"
+
+        # Check for zipapp and stitched by looking at __file__ path
+        file_path = getattr(mod, "__file__", "") or ""
+        if ".pyz/" in file_path or file_path.endswith(".pyz"):
+            return "zipapp"
+        if any(h in file_path for h in stitch_hints):
+            return "stitched"
+
+        # Default to package mode
+        return "package"
+
+    @staticmethod
+    def patch_everywhere(  # noqa: C901, PLR0912, PLR0915
+        mp: pytest.MonkeyPatch,
+        mod_env: ModuleType | Any,
+        func_name: str,
+        replacement_func: Callable[..., object],
+        *,
+        package_prefix: str | Sequence[str],
+        stitch_hints: set[str] | None = None,
+        create_if_missing: bool = False,
+        caller_func_name: str | None = None,
+    ) -> None:
+        """Replace a function everywhere it was imported.
+
+        Works in both package and stitched single-file runtimes.
+        Walks sys.modules once and handles:
+          • the defining module
+          • any other module that imported the same function object
+          • any freshly reloaded stitched modules (heuristic: path matches hints)
+
+        Args:
+            mp: pytest.MonkeyPatch instance to use for patching
+            mod_env: Module or object containing the function to patch
+            func_name: Name of the function to patch
+            replacement_func: Function to replace the original with
+            package_prefix: Package name prefix(es) to filter modules.
+                Can be a single string (e.g., "apathetic_utils") or a sequence
+                of strings (e.g., ["apathetic_utils", "my_package"]) to patch
+                across multiple packages.
+            stitch_hints: Set of path hints to identify stitched modules.
+                Defaults to {"/dist/", "stitched"}. When providing custom
+                hints, you must be certain of the path attributes of your
+                stitched file, as this uses substring matching on the module's
+                __file__ path. This is a heuristic fallback when identity
+                checks fail (e.g., when modules are reloaded).
+            create_if_missing: If True, create the attribute if it doesn't exist.
+                If False (default), raise TypeError if the function doesn't exist.
+            caller_func_name: If provided, only patch __globals__ for this specific
+                function. If None (default), patch __globals__ for all functions in
+                the module that reference the original function.
+        """
+        if stitch_hints is None:
+            stitch_hints = {"/dist/", "stitched"}
+
+        # --- Sanity checks ---
+        func = getattr(mod_env, func_name, None)
+        func_existed = func is not None
+
+        if func is None:
+            if create_if_missing:
+                # Will create the function below, but don't set func to replacement_func
+                # since we need to track that it didn't exist for search logic
+                pass
+            else:
+                xmsg = f"Could not find {func_name!r} on {mod_env!r}"
+                raise TypeError(xmsg)
+
+        mod_name = getattr(mod_env, "__name__", type(mod_env).__name__)
+
+        # Patch in the defining module
+        # For modules, if the attribute doesn't exist and create_if_missing=True,
+        # we need to create it manually first, then use monkeypatch to track it
+        if not func_existed and isinstance(mod_env, ModuleType):
+            # Manually create the attribute on the module's __dict__
+            # This is necessary because monkeypatch.setattr may fail if the attribute
+            # doesn't exist on a module
+            mod_env.__dict__[func_name] = replacement_func
+            # Now register with monkeypatch for cleanup on undo
+            # Since the attribute now exists, setattr should work
+            mp.setattr(mod_env, func_name, replacement_func)
+            safeTrace(f"Patched {mod_name}.{func_name}")
+        else:
+            try:
+                mp.setattr(mod_env, func_name, replacement_func)
+            except AttributeError:
+                # If setattr fails because attribute doesn't exist on a module,
+                # create it manually and try again
+                if isinstance(mod_env, ModuleType) and create_if_missing:
+                    mod_env.__dict__[func_name] = replacement_func
+                    mp.setattr(mod_env, func_name, replacement_func)
+                    safeTrace(f"Created and patched {mod_name}.{func_name}")
+                else:
+                    raise
+            if func_existed:
+                safeTrace(f"Patched {mod_name}.{func_name}")
+            else:
+                safeTrace(f"Created and patched {mod_name}.{func_name}")
+
+        # Patch direct function calls via __globals__
+        # In package mode, module-level functions reference their module's __dict__
+        # as __globals__. We patch __globals__ to intercept direct calls (e.g.,
+        # func()) which resolve through __globals__, not module attributes.
+        #
+        # In stitched mode (e.g., serger's stub architecture), the situation is more
+        # complex: stub modules have a separate __dict__ from the stitched file's
+        # __globals__. When serger creates stub modules via types.ModuleType, it
+        # copies values from stitched __globals__ to the stub's __dict__. Functions
+        # defined in the stitched file use the stitched file's __globals__ for
+        # direct calls, NOT the stub's __dict__. Therefore, patching BOTH the stub
+        # module (via setattr) AND __globals__ is necessary to intercept all call
+        # patterns. MonkeyPatch's undo stack properly restores patched values,
+        # ensuring test isolation is preserved even with shared __globals__.
+        is_stitched_or_zipapp = False
+        if isinstance(mod_env, ModuleType):
+            # Check if module is stitched or zipapp
+            mode = ApatheticUtils_Internal_Testing.detect_module_runtime_mode(
+                mod_env,
+                stitch_hints=stitch_hints,
+            )
+            is_stitched_or_zipapp = mode in ("stitched", "zipapp")
+
+        if func_existed and isinstance(mod_env, ModuleType) and func is not None:
+            _apathetic_testing_priv_patch_globals_for_direct_calls(
+                mp=mp,
+                mod=mod_env,
+                func_name=func_name,
+                original_func=func,
+                replacement_func=replacement_func,
+                safeTrace=safeTrace,
+                caller_func_name=caller_func_name,
+            )
+
+        patched_ids: set[int] = set()
+
+        for m in list(sys.modules.values()):
+            if (
+                m is mod_env
+                or not isinstance(m, ModuleType)  # pyright: ignore[reportUnnecessaryIsInstance]
+                or not hasattr(m, "__dict__")
+            ):
+                continue
+
+            # skip irrelevant stdlib or third-party modules for performance
+            name = getattr(m, "__name__", "")
+            if isinstance(package_prefix, str):
+                prefixes: Sequence[str] = (package_prefix,)
+            else:
+                prefixes = package_prefix
+            if not any(name.startswith(prefix) for prefix in prefixes):
+                continue
+
+            did_patch = False
+
+            # 1) Normal case: module imported the same object
+            # Only search if the function actually existed (not created)
+            if func_existed:
+                for k, v in list(m.__dict__.items()):
+                    if v is func:
+                        mp.setattr(m, k, replacement_func)
+                        did_patch = True
+
+            # 2) Single-file/zipapp case: reloaded stitched modules or zipapp modules
+            #    Check for __STITCHED__ marker first (most reliable), then fallback
+            #    to path heuristics
+            mode = ApatheticUtils_Internal_Testing.detect_module_runtime_mode(
+                m,
+                stitch_hints=stitch_hints,
+            )
+            is_stitched_or_zipapp = mode in ("stitched", "zipapp")
+            if is_stitched_or_zipapp and hasattr(m, func_name):
+                mp.setattr(m, func_name, replacement_func)
+
+                # CRITICAL: Also patch __globals__ for stitched modules.
+                # This handles the case where a stitched file (e.g., serger) creates
+                # stub modules and calls functions with direct calls (e.g., func()).
+                # The stub module's __dict__ is a separate dictionary from the
+                # stitched file's __globals__. Direct calls resolve through __globals__,
+                # not the stub's __dict__. Therefore, patching only via setattr is
+                # insufficient - we must also patch __globals__ to intercept direct
+                # calls within the stitched functions. MonkeyPatch's undo stack ensures
+                # proper restoration and test isolation even for shared __globals__.
+                if func_existed and func is not None:
+                    _apathetic_testing_priv_patch_globals_for_direct_calls(
+                        mp=mp,
+                        mod=m,
+                        func_name=func_name,
+                        original_func=func,
+                        replacement_func=replacement_func,
+                        safeTrace=safeTrace,
+                        caller_func_name=caller_func_name,
+                    )
+                did_patch = True
+
+            if did_patch and id(m) not in patched_ids:
+                patched_ids.add(id(m))
+                safeTrace(f"  also patched {name}")
+
+
+def _apathetic_testing_priv_patch_globals_for_direct_calls(
+    *,
+    mp: pytest.MonkeyPatch,
+    mod: ModuleType,
+    func_name: str,
+    original_func: Callable[..., object],
+    replacement_func: Callable[..., object],
+    safeTrace: Callable[..., None],  # noqa: N803
+    caller_func_name: str | None = None,
+) -> None:
+    """Replace a function everywhere it was imported.
+
+    Works in both package and stitched single-file runtimes.
+    Walks sys.modules once and handles:
+      • the defining module
+      • any other module that imported the same function object
+      • any freshly reloaded stitched modules (heuristic: path matches hints)
+
+    Args:
+        mp: pytest.MonkeyPatch instance to use for patching
+        mod: Module containing the function to patch
+        func_name: Name of the function to patch
+        original_func: The original function object to replace
+        replacement_func: Function to replace the original with
+        safeTrace: Callable for safe tracing/logging operations
+        caller_func_name: If provided, only patch __globals__ for this specific
+            function. If None (default), patch __globals__ for all functions in
+            the module that reference the original function.
+    """
+    patched_count = 0
+    for name, obj in mod.__dict__.items():
+        if not callable(obj):
+            continue
+        if caller_func_name and name != caller_func_name:
+            continue
+        if not hasattr(obj, "__globals__"):
+            continue
+        # Get __globals__ and check if it's actually a dict
+        try:
+            globals_dict = obj.__globals__
+        except (TypeError, AttributeError):
+            # __globals__ might be a descriptor or not accessible
+            continue
+        if not isinstance(globals_dict, dict):  # pyright: ignore[reportUnnecessaryIsInstance]
+            # __globals__ is not a dict (could be a descriptor)
+            continue
+        # Check if this function's __globals__ references the original function
+        if func_name in globals_dict:
+            current_ref = globals_dict[func_name]
+            if current_ref is original_func:
+                # Use mp.setitem() to ensure proper restoration when test completes
+                # This is critical for test isolation - without it, __globals__
+                # modifications persist and affect subsequent tests
+                mp.setitem(globals_dict, func_name, replacement_func)
+                patched_count += 1
+                safeTrace(
+                    f"  patched __globals__ for {name}()",
+                    f"original_id={id(original_func)}",
+                    f"replacement_id={id(replacement_func)}",
+                )
+            else:
+                safeTrace(
+                    f"  ⏭️  skipped __globals__ for {name}()",
+                    "reference mismatch",
+                )
+    if patched_count > 0:
+        safeTrace(
+            f"  patched __globals__ for {patched_count} function(s) in {mod.__name__}"
+        )
+
+
+# === apathetic_utils.text ===
+# src/apathetic_utils/text.py
+"""Text manipulation utilities."""
+
+
+class ApatheticUtils_Internal_Text:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides text manipulation functionality.
+
+    This class contains utilities for text processing and formatting.
+    When mixed into apathetic_utils, it provides text manipulation methods.
+    """
+
+    @staticmethod
+    def plural(obj: Any) -> str:
+        """Return 's' if obj represents a plural count.
+
+        Accepts ints, floats, and any object implementing __len__().
+        Returns '' for singular or zero.
+        """
+        count: int | float
+        try:
+            count = len(obj)
+        except TypeError:
+            # fallback for numbers or uncountable types
+            count = obj if isinstance(obj, (int, float)) else 0
+        return "s" if count != 1 else ""
+
+    @staticmethod
+    def remove_path_in_error_message(inner_msg: str, path: Path) -> str:
+        """Remove redundant file path mentions (and nearby filler)
+        from error messages.
+
+        Useful when wrapping a lower-level exception that already
+        embeds its own file reference, so the higher-level message
+        can use its own path without duplication.
+
+        Example:
+            "Invalid JSONC syntax in /abs/path/config.jsonc: Expecting value"
+            → "Invalid JSONC syntax: Expecting value"
+
+        """
+        # Normalize both path and name for flexible matching
+        full_path = str(path)
+        filename = path.name
+
+        # Common redundant phrases we might need to remove
+        candidates = [
+            f"in {full_path}",
+            f"in '{full_path}'",
+            f'in "{full_path}"',
+            f"in {filename}",
+            f"in '{filename}'",
+            f'in "{filename}"',
+            full_path,
+            filename,
+        ]
+
+        clean_msg = inner_msg
+        for pattern in candidates:
+            clean_msg = clean_msg.replace(pattern, "").strip(": ").strip()
+
+        # Normalize leftover spaces and colons
+        clean_msg = re.sub(r"\s{2,}", " ", clean_msg)
+        clean_msg = re.sub(r"\s*:\s*", ": ", clean_msg)
+
+        return clean_msg
+
+
+# === apathetic_utils.types ===
+# src/apathetic_utils/types.py
+"""Type utilities."""
+
+
+ApatheticUtils_T = TypeVar("ApatheticUtils_T")
+
+
+class ApatheticUtils_Internal_Types:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides type utility functionality.
+
+    This class contains utilities for type checking and manipulation.
+    When mixed into apathetic_utils, it provides type utility methods.
+    """
+
+    @staticmethod
+    def cast_hint(
+        typ: type[ApatheticUtils_T],  # noqa: ARG004
+        value: Any,
+    ) -> ApatheticUtils_T:
+        """Explicit cast that documents intent but is purely for type hinting.
+
+        A drop-in replacement for `typing.cast`, meant for places where:
+          - You want to silence mypy's redundant-cast warnings.
+          - You want to signal "this narrowing is intentional."
+          - You need IDEs (like Pylance) to retain strong inference on a value.
+
+        Does not handle Union, Optional, or nested generics: stick to cast(),
+          because unions almost always represent a meaningful type narrowing.
+
+        This function performs *no runtime checks*.
+        """
+        return cast("ApatheticUtils_T", value)
+
+    @staticmethod
+    def schema_from_typeddict(td: type[Any]) -> dict[str, Any]:
+        """Extract field names and their annotated types from a TypedDict."""
+        return get_type_hints(td, include_extras=True)
+
+    @staticmethod
+    def literal_to_set(literal_type: Any) -> set[Any]:
+        """Extract values from a Literal type as a set.
+
+        Example:
+            StitchMode = Literal["raw", "package"]
+            valid_modes = literal_to_set(StitchMode)  # Returns set with literal values
+
+        Args:
+            literal_type: A Literal type (e.g., Literal["a", "b"])
+
+        Returns:
+            A set containing all values from the Literal type.
+            Returns set[Any] to allow flexible operations without requiring
+            casts. The actual values are constrained by the Literal type at
+            runtime validation.
+
+        Type Safety Tradeoffs:
+            This function returns set[Any] after considering three approaches:
+
+            1. set[Any] (current): Allows flexible operations (e.g., sorted(),
+               membership checks) without requiring casts. Less type-safe but
+               more ergonomic for common use cases.
+
+            2. set[str | int | float | bool | None]: More type-safe, but requires
+               casts for operations like sorted() that expect specific types,
+               creating noise and potential for errors.
+
+            3. TypeVar (like cast_hint): Would provide perfect type inference,
+               but Python's type system cannot extract the union of literal
+               values from a Literal type at the type level.
+
+            The current approach prioritizes ergonomics while still providing
+            runtime validation that the input is a Literal type.
+
+        Raises:
+            TypeError: If the input is not a Literal type
+        """
+        origin = get_origin(literal_type)
+        if origin is not Literal:
+            msg = f"Expected Literal type, got {literal_type}"
+            raise TypeError(msg)
+        return set(get_args(literal_type))
+
+    @staticmethod
+    def _isinstance_generics(  # noqa: PLR0911
+        value: Any,
+        origin: Any,
+        args: tuple[Any, ...],
+    ) -> bool:
+        # Outer container check
+        if not isinstance(value, origin):
+            return False
+
+        # Recursively check elements for known homogeneous containers
+        if not args:
+            return True
+
+        # list[str]
+        if origin is list and isinstance(value, list):
+            subtype = args[0]
+            items = ApatheticUtils_Internal_Types.cast_hint(list[Any], value)
+            return all(
+                ApatheticUtils_Internal_Types.safe_isinstance(v, subtype) for v in items
+            )
+
+        # dict[str, int]
+        if origin is dict and isinstance(value, dict):
+            key_t, val_t = args if len(args) == 2 else (Any, Any)  # noqa: PLR2004
+            dct = ApatheticUtils_Internal_Types.cast_hint(dict[Any, Any], value)
+            return all(
+                ApatheticUtils_Internal_Types.safe_isinstance(k, key_t)
+                and ApatheticUtils_Internal_Types.safe_isinstance(v, val_t)
+                for k, v in dct.items()
+            )
+
+        # Tuple[str, int] etc.
+        if origin is tuple and isinstance(value, tuple):
+            subtypes = args
+            tup = ApatheticUtils_Internal_Types.cast_hint(tuple[Any, ...], value)
+            # Check for Ellipsis first (tuple[str, ...])
+            if len(subtypes) == 2 and subtypes[1] is Ellipsis:  # noqa: PLR2004
+                return all(
+                    ApatheticUtils_Internal_Types.safe_isinstance(v, subtypes[0])
+                    for v in tup
+                )
+            # Fixed-length tuples (tuple[str, int])
+            if len(subtypes) == len(tup):
+                return all(
+                    ApatheticUtils_Internal_Types.safe_isinstance(v, t)
+                    for v, t in zip(tup, subtypes, strict=False)
+                )
+            return False
+
+        return True  # e.g., other typing origins like set[], Iterable[]
+
+    @staticmethod
+    def safe_isinstance(value: Any, expected_type: Any) -> bool:  # noqa: PLR0911
+        """Like isinstance(), but safe for TypedDicts and typing generics.
+
+        Handles:
+          - typing.Union, Optional, Any
+          - typing.NotRequired
+          - TypedDict subclasses
+          - list[...] with inner types
+          - Defensive fallback for exotic typing constructs
+        """
+        # --- Always allow Any ---
+        if expected_type is Any:
+            return True
+
+        origin = get_origin(expected_type)
+        args = get_args(expected_type)
+
+        # --- Handle NotRequired (extract inner type) ---
+        if origin is NotRequired:
+            # NotRequired[str] → validate as str
+            if args:
+                return ApatheticUtils_Internal_Types.safe_isinstance(value, args[0])
+            return True
+
+        # --- Handle Literals explicitly ---
+        if origin is Literal:
+            # Literal["x", "y"] → True if value equals any of the allowed literals
+            return value in args
+
+        # --- Handle Unions (includes Optional) ---
+        if origin in {Union, UnionType}:
+            # e.g. Union[str, int]
+            return any(
+                ApatheticUtils_Internal_Types.safe_isinstance(value, t) for t in args
+            )
+
+        # --- Handle special case: TypedDicts ---
+        try:
+            if (
+                isinstance(expected_type, type)
+                and hasattr(expected_type, "__annotations__")
+                and hasattr(expected_type, "__total__")
+            ):
+                # Treat TypedDict-like as dict
+                return isinstance(value, dict)
+        except TypeError:
+            # Not a class — skip
+            pass
+
+        # --- Handle generics like list[str], dict[str, int] ---
+        if origin:
+            return ApatheticUtils_Internal_Types._isinstance_generics(
+                value, origin, args
+            )
+
+        # --- Fallback for simple types ---
+        try:
+            return isinstance(value, expected_type)
+        except TypeError:
+            # Non-type or strange typing construct
+            return False
+
+
+# === apathetic_utils.version ===
+# src/apathetic_utils/version.py
+"""Version utilities."""
+
+
+class ApatheticUtils_Internal_Version:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides version utility functionality.
+
+    This class contains utilities for version detection and manipulation.
+    When mixed into apathetic_utils, it provides version utility methods.
+    """
+
+    @staticmethod
+    def get_sys_version_info() -> tuple[int, int, int] | tuple[int, int, int, str, int]:
+        return sys.version_info
+
+    @staticmethod
+    def create_version_info(major: int, minor: int, micro: int = 0) -> Any:
+        """Create a mock sys.version_info object with major and minor attributes.
+
+        This properly mocks sys.version_info so it can be used with attribute access
+        (.major, .minor) and tuple comparison, matching the behavior of the real
+        sys.version_info object (which is a named tuple).
+
+        Useful for testing or when you need to simulate different Python versions.
+
+        Args:
+            major: Major version number (e.g., 3)
+            minor: Minor version number (e.g., 11)
+            micro: Micro version number (default: 0)
+
+        Returns:
+            A mock version_info object with .major, .minor, .micro attributes
+            and tuple-like comparison support.
+
+        Example:
+            version = create_version_info(3, 11)
+            assert version.major == 3
+            assert version.minor == 11
+            assert version >= (3, 10)
+        """
+
+        # Create a named tuple that matches sys.version_info structure
+        class _VersionInfo(NamedTuple):
+            """Mock sys.version_info named tuple."""
+
+            major: int
+            minor: int
+            micro: int
+            releaselevel: str
+            serial: int
+
+        return _VersionInfo(
+            major=major, minor=minor, micro=micro, releaselevel="final", serial=0
+        )
+
+
+# === apathetic_utils.walk ===
+# src/apathetic_utils/walk.py
+"""Filesystem walking utilities."""
+
+
+class ApatheticUtils_Internal_Walk:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides filesystem walking functionality.
+
+    This class contains utilities for finding files by include / exclude
+    patterns. When mixed into apathetic_utils, it provides walking methods.
+    """
+
+    @staticmethod
+    def _include_rules(
+        include_patterns: Iterable[str],
+        root: Path,
+    ) -> dict[Path, ApatheticUtils_Internal_Matching.GlobSet | None]:
+        """Split include patterns into walk starts and globs below each start.
+
+        Each pattern's non-glob prefix (see get_glob_root()) is resolved against
+        `root` to give the directory (or file) the walk starts from. The glob
+        remainder is matched against paths relative to that start. A pattern
+        without glob characters maps to None: everything under the start.
+        """
+        _paths = ApatheticUtils_Internal_Paths
+
+        tails: dict[Path, list[str] | None] = {}
+        for pattern in include_patterns:
+            normalized = _paths.normalize_path_string(pattern)
+            base = _paths.get_glob_root(normalized)
+            start = _paths.resolve_path(root / base)
+            tail = "/".join(Path(normalized).parts[len(base.parts) :])
+
+            if not tail:
+                tails[start] = None
+                continue
+            existing = tails.setdefault(start, [])
+            if existing is not None:
+                existing.append(tail)
+
+        return {
+            start: None
+            if globs is None
+            else ApatheticUtils_Internal_Matching.compile_glob_set(globs)
+            for start, globs in tails.items()
+        }
+
+    @staticmethod
+    def _scan_dir(path: str) -> list[tuple[os.DirEntry[str], bool]]:
+        """List a directory with os.scandir(), sorted by entry name.
+
+        Returns ``(entry, is_dir)`` pairs for subdirectories (symlinks are not
+        followed) and files; anything else is dropped. The type checks run here
+        so that, in parallel walks, any stat calls they need run in the worker.
+        Unreadable directories are logged and treated as empty.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            ApatheticUtils_Internal_Logs.get_logger().debug(
+                "Cannot scan directory %s: %s", path, e
+            )
+            return []
+
+        listing: list[tuple[os.DirEntry[str], bool]] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                listing.append((entry, True))
+            elif entry.is_file():
+                listing.append((entry, False))
+        return listing
+
+    @staticmethod
+    def _rule_matches(
+        rules: list[tuple[str, ApatheticUtils_Internal_Matching.GlobSet | None]],
+        file_path: str,
+    ) -> bool:
+        """Return True if `file_path` is selected by any (start, globs) rule."""
+        for start_str, globs in rules:
+            if file_path == start_str:
+                return True
+            # A filesystem root ("/", "C:\\") already ends with a separator
+            prefix = start_str if start_str.endswith(os.sep) else start_str + os.sep
+            if not file_path.startswith(prefix):
+                continue
+            if globs is None:
+                return True
+            if globs.is_match(file_path[len(prefix) :].replace(os.sep, "/")):
+                return True
+        return False
+
+    class _DirScan:
+        """A subdirectory the walk will enter, with its scan once submitted."""
+
+        __slots__ = ("future", "path", "taken")
+
+        def __init__(self, path: str) -> None:
+            self.path = path
+            self.future: Future[list[tuple[os.DirEntry[str], bool]]] | None = None
+            # Entered by the walk before a pool thread picked it up
+            self.taken = False
+
+    @staticmethod
+    def _walk_tree(
+        top: str,
+        excludes: ApatheticUtils_Internal_Matching.CompiledExcludes,
+        executor: ThreadPoolExecutor | None = None,
+        prefetch: int = 0,
+    ) -> Iterator[os.DirEntry[str]]:
+        """Yield file entries under `top` depth-first, pruning excluded dirs.
+
+        With an executor, up to `prefetch` subdirectory scans run in the pool
+        ahead of the walk, chosen in the order the depth-first walk will enter
+        them; more are submitted as their results are consumed. Results are
+        consumed in the same sorted depth-first order as a sequential walk.
+        """
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        scan = ApatheticUtils_Internal_Walk._scan_dir
+        dir_scan = ApatheticUtils_Internal_Walk._DirScan
+
+        # Dirs not submitted yet; the last one is the next the walk enters
+        unsubmitted: list[ApatheticUtils_Internal_Walk._DirScan] = []
+        in_flight = 0
+
+        def _submit_more() -> None:
+            nonlocal in_flight
+            while executor is not None and in_flight < prefetch and unsubmitted:
+                pending = unsubmitted.pop()
+                if not pending.taken:
+                    pending.future = executor.submit(scan, pending.path)
+                    in_flight += 1
+
+        def _expand(
+            listing: list[tuple[os.DirEntry[str], bool]],
+        ) -> Iterator[
+            tuple[os.DirEntry[str], ApatheticUtils_Internal_Walk._DirScan | None]
+        ]:
+            # Keep files and unpruned dirs
+            items: list[
+                tuple[os.DirEntry[str], ApatheticUtils_Internal_Walk._DirScan | None]
+            ] = []
+            for entry, is_dir in listing:
+                if not is_dir:
+                    items.append((entry, None))
+                elif excludes.is_dir_excluded(entry.path):
+                    logger.trace("[iter_included_files] Pruned %s", entry.path)
+                else:
+                    items.append((entry, dir_scan(entry.path)))
+            if executor is not None:
+                unsubmitted.extend(
+                    pending for _, pending in reversed(items) if pending is not None
+                )
+                _submit_more()
+            return iter(items)
+
+        stack = [_expand(scan(top))]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                continue
+            entry, pending = item
+            if pending is None:
+                yield entry
+            elif pending.future is None:
+                pending.taken = True
+                stack.append(_expand(scan(entry.path)))
+            else:
+                listing = pending.future.result()
+                in_flight -= 1
+                stack.append(_expand(listing))
+
+    @staticmethod
+    def iter_included_files(
+        root: Path | str,
+        include_patterns: Iterable[str],
+        exclude_patterns: Iterable[str],
+        *,
+        workers: int | None = None,
+    ) -> Generator[Path, None, None]:
+        """Yield files under `root` matching an include and no exclude pattern.
+
+        Walks with os.scandir() starting only from each include pattern's glob
+        root (see get_glob_root()), and prunes whole directories when every
+        path beneath them is excluded (e.g. 'node_modules/', '.git/**',
+        '**/__pycache__/**'), so excluded subtrees are never listed.
+
+        Pattern semantics match the rest of the library: includes use
+        fnmatchcase_portable() on the path relative to their glob root, and
+        excludes use compile_excludes() / is_excluded_raw() semantics
+        ('**/', '../', trailing '/') relative to `root`. An include without
+        glob characters selects that file, or everything under that directory.
+
+        Symlinked directories are not descended into (avoids cycles); symlinked
+        files are yielded.
+
+        With `workers` > 1, directory scans are fanned out to a thread pool
+        (os.scandir releases the GIL during the syscall), which mostly helps on
+        network filesystems and cold caches. At most 2 * `workers` scans run
+        ahead of the walk, so memory does not grow with the tree. Output order
+        is unchanged.
+
+        Args:
+            root: Directory the include and exclude patterns are relative to
+            include_patterns: Glob patterns selecting files
+            exclude_patterns: Glob patterns removing files
+            workers: Number of scanning threads; None or 1 walks sequentially
+
+        Yields:
+            Absolute paths, in a deterministic order (directories walked
+            depth-first, entries sorted by name), whatever `workers` is
+
+        Raises:
+            ValueError: If `workers` is less than 1
+
+        Example:
+            for path in iter_included_files(root, ["src/**/*.py"], ["**/tests/"]):
+                ...
+        """
+        if workers is not None and workers < 1:
+            xmsg = f"workers must be at least 1, got {workers}"
+            raise ValueError(xmsg)
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        root_path = ApatheticUtils_Internal_Paths.resolve_path(root)
+        excludes = ApatheticUtils_Internal_Matching.compile_excludes(
+            exclude_patterns, root_path
+        )
+        rules = ApatheticUtils_Internal_Walk._include_rules(include_patterns, root_path)
+        rule_items = [(str(start), globs) for start, globs in rules.items()]
+
+        # Walk each start once: starts nested inside another are covered by it
+        tops: list[Path] = []
+        for start in sorted(rules, key=lambda p: p.parts):
+            if not any(start.is_relative_to(top) for top in tops):
+                tops.append(start)
+
+        # Scans allowed ahead of the walk: enough to keep every thread busy,
+        # without holding listings for the whole tree
+        prefetch = 2 * workers if workers is not None else 0
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="iter_included_files"
+            )
+            if workers is not None and workers > 1
+            else None
+        )
+        try:
+            for top in tops:
+                if top.is_file():
+                    if ApatheticUtils_Internal_Walk._rule_matches(
+                        rule_items, str(top)
+                    ) and not excludes.is_excluded(top):
+                        yield top
+                elif not top.is_dir():
+                    logger.trace("[iter_included_files] No such start: %s", top)
+                elif not excludes.is_dir_excluded(top):
+                    for entry in ApatheticUtils_Internal_Walk._walk_tree(
+                        str(top), excludes, executor, prefetch
+                    ):
+                        if ApatheticUtils_Internal_Walk._rule_matches(
+                            rule_items, entry.path
+                        ) and not excludes.is_excluded(entry.path):
+                            yield Path(entry.path)
+        finally:
+            # Stop scans nobody will read if the caller stops iterating early
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+
+# === apathetic_utils.namespace ===
+# src/apathetic_utils/namespace.py
+"""Shared Apathetic Utils namespace implementation.
+
+This namespace class provides a structure to minimize global namespace pollution
+when the library is embedded in a stitched script.
+"""
+
+
+# --- Apathetic Utils Namespace -------------------------------------------
+
+
+class apathetic_utils(  # noqa: N801
+    ApatheticUtils_Internal_Constants,
+    ApatheticUtils_Internal_CI,
+    ApatheticUtils_Internal_Files,
+    ApatheticUtils_Internal_Logs,
+    ApatheticUtils_Internal_Matching,
+    ApatheticUtils_Internal_Modules,
+    ApatheticUtils_Internal_Paths,
+    ApatheticUtils_Internal_Runtime,
+    ApatheticUtils_Internal_Subprocess,
+    ApatheticUtils_Internal_Testing,
+    ApatheticUtils_Internal_Text,
+    ApatheticUtils_Internal_Types,
+    ApatheticUtils_Internal_Version,
+    ApatheticUtils_Internal_Walk,
+):
+    """Namespace for apathetic utils functionality.
+
+    All utility functionality is accessed via this namespace class to minimize
+    global namespace pollution when the library is embedded in a stitched script.
+    """
+
+
+# Note: All exports are handled in __init__.py
+# - For library builds (package/stitched): __init__.py is included, exports happen
+# - For embedded builds: __init__.py is excluded, no exports (only class available)
+
+
+# === apathetic_utils.__init__ ===
+# src/apathetic_utils/__init__.py
+"""Apathetic utilities package."""
+
+
+# Get reference to the namespace class
+# In stitched mode: class is already defined in namespace.py (executed before this)
+# In package mode: import from namespace module
+_apathetic_utils_is_standalone = globals().get("__STITCHED__", False)
+
+if _apathetic_utils_is_standalone:
+    # Stitched mode: class already defined in namespace.py
+    # Get reference to the class (it's already in globals from namespace.py)
+    _apathetic_utils_raw = globals().get("apathetic_utils")
+    if _apathetic_utils_raw is None:
+        # Fallback: should not happen, but handle gracefully
+        msg = "apathetic_utils class not found in stitched mode"
+        raise RuntimeError(msg)
+    # Type cast to help mypy understand this is the apathetic_utils class
+    # The import gives us type[apathetic_utils], so cast to
+    # type[_apathetic_utils_class]
+    apathetic_utils = cast("type[_apathetic_utils_class]", _apathetic_utils_raw)
+else:
+    # Package mode: import from namespace module
+    # This block is only executed in package mode, not in stitched builds
+
+    # Ensure the else block is not empty (build script may remove import)
+    _ = apathetic_utils
+
+# Export all namespace items for convenience
+# These are aliases to apathetic_utils.*
+
+# Note: In embedded builds, __init__.py is excluded from the stitch,
+# so this code never runs and no exports happen (only the class is available).
+# In stitched/package builds, __init__.py is included, so exports happen.
+
+# CI
+CI_ENV_VARS = apathetic_utils.CI_ENV_VARS
+if_ci = apathetic_utils.if_ci
+is_ci = apathetic_utils.is_ci
+
+# Files
+# LoadedFile and ParseCacheInfo are nested classes in
+# ApatheticUtils_Internal_Files that are accessed via the namespace class.
+if TYPE_CHECKING:
+    LoadedFile: TypeAlias = ApatheticUtils_Internal_Files.LoadedFile
+    ParseCacheInfo: TypeAlias = ApatheticUtils_Internal_Files.ParseCacheInfo
+else:
+    LoadedFile = apathetic_utils.LoadedFile
+    ParseCacheInfo = apathetic_utils.ParseCacheInfo
+
+clear_parse_cache = apathetic_utils.clear_parse_cache
+default_parse_cache_dir = apathetic_utils.default_parse_cache_dir
+iter_jsonc_items = apathetic_utils.iter_jsonc_items
+load_jsonc = apathetic_utils.load_jsonc
+load_many = apathetic_utils.load_many
+load_toml = apathetic_utils.load_toml
+parse_cache_info = apathetic_utils.parse_cache_info
+set_parse_cache_dir = apathetic_utils.set_parse_cache_dir
+set_parse_cache_size = apathetic_utils.set_parse_cache_size
+set_toml_backend = apathetic_utils.set_toml_backend
+toml_backend = apathetic_utils.toml_backend
+
+# Logs
+get_logger = apathetic_utils.get_logger
+is_trace_enabled = apathetic_utils.is_trace_enabled
+
+# Matching
+# CompiledExcludes and GlobSet are nested classes in
+# ApatheticUtils_Internal_Matching that are accessed via the namespace class.
+if TYPE_CHECKING:
+    CompiledExcludes: TypeAlias = ApatheticUtils_Internal_Matching.CompiledExcludes
+    GlobCacheInfo: TypeAlias = ApatheticUtils_Internal_Matching.GlobCacheInfo
+    GlobSet: TypeAlias = ApatheticUtils_Internal_Matching.GlobSet
+else:
+    CompiledExcludes = apathetic_utils.CompiledExcludes
+    GlobCacheInfo = apathetic_utils.GlobCacheInfo
+    GlobSet = apathetic_utils.GlobSet
+
+clear_glob_cache = apathetic_utils.clear_glob_cache
+compile_excludes = apathetic_utils.compile_excludes
+compile_glob_set = apathetic_utils.compile_glob_set
+fnmatchcase_portable = apathetic_utils.fnmatchcase_portable
+glob_cache_info = apathetic_utils.glob_cache_info
+is_excluded_many = apathetic_utils.is_excluded_many
+is_excluded_raw = apathetic_utils.is_excluded_raw
+set_glob_cache_size = apathetic_utils.set_glob_cache_size
+
+# Modules
+detect_packages_from_files = apathetic_utils.detect_packages_from_files
+find_all_packages_under_path = apathetic_utils.find_all_packages_under_path
+
+# Paths
+# ResolveCache is a nested class in ApatheticUtils_Internal_Paths that is
+# accessed via the namespace class.
+if TYPE_CHECKING:
+    ResolveCache: TypeAlias = ApatheticUtils_Internal_Paths.ResolveCache
+else:
+    ResolveCache = apathetic_utils.ResolveCache
+
+get_glob_root = apathetic_utils.get_glob_root
+has_glob_chars = apathetic_utils.has_glob_chars
+normalize_path_string = apathetic_utils.normalize_path_string
+resolve_cache = apathetic_utils.resolve_cache
+resolve_path = apathetic_utils.resolve_path
+shorten_path = apathetic_utils.shorten_path
+
+# System
+# CapturedOutput is a nested class in ApatheticUtils_Internal_Subprocess that
+# is accessed via the namespace class.
+# Use TypeAlias to help mypy understand this is a class type.
+if TYPE_CHECKING:
+    CapturedOutput: TypeAlias = ApatheticUtils_Internal_Subprocess.CapturedOutput
+else:
+    CapturedOutput = apathetic_utils.CapturedOutput
+
+capture_output = apathetic_utils.capture_output
+clear_python_command_cache = apathetic_utils.clear_python_command_cache
+create_version_info = apathetic_utils.create_version_info
+detect_runtime_mode = apathetic_utils.detect_runtime_mode
+ensure_artifacts_up_to_date = apathetic_utils.ensure_artifacts_up_to_date
+ensure_stitched_script_up_to_date = apathetic_utils.ensure_stitched_script_up_to_date
+ensure_zipapp_up_to_date = apathetic_utils.ensure_zipapp_up_to_date
+find_python_command = apathetic_utils.find_python_command
+get_sys_version_info = apathetic_utils.get_sys_version_info
+is_running_under_pytest = apathetic_utils.is_running_under_pytest
+run_with_output = apathetic_utils.run_with_output
+run_with_separated_output = apathetic_utils.run_with_separated_output
+runtime_swap = apathetic_utils.runtime_swap
+set_python_command_cache = apathetic_utils.set_python_command_cache
+
+# Testing
+create_mock_superclass_test = apathetic_utils.create_mock_superclass_test
+detect_module_runtime_mode = apathetic_utils.detect_module_runtime_mode
+patch_everywhere = apathetic_utils.patch_everywhere
+
+# Text
+plural = apathetic_utils.plural
+remove_path_in_error_message = apathetic_utils.remove_path_in_error_message
+
+# Types
+cast_hint = apathetic_utils.cast_hint
+literal_to_set = apathetic_utils.literal_to_set
+safe_isinstance = apathetic_utils.safe_isinstance
+schema_from_typeddict = apathetic_utils.schema_from_typeddict
+
+# Walk
+iter_included_files = apathetic_utils.iter_included_files
+
+
+__all__ = [  # noqa: RUF022
+    # ci
+    "CI_ENV_VARS",
+    "if_ci",
+    "is_ci",
+    # files
+    "LoadedFile",
+    "ParseCacheInfo",
+    "clear_parse_cache",
+    "default_parse_cache_dir",
+    "iter_jsonc_items",
+    "load_jsonc",
+    "load_many",
+    "load_toml",
+    "parse_cache_info",
+    "set_parse_cache_dir",
+    "set_parse_cache_size",
+    "set_toml_backend",
+    "toml_backend",
+    # logs
+    "get_logger",
+    "is_trace_enabled",
+    # matching
+    "CompiledExcludes",
+    "GlobCacheInfo",
+    "GlobSet",
+    "clear_glob_cache",
+    "compile_excludes",
+    "compile_glob_set",
+    "fnmatchcase_portable",
+    "glob_cache_info",
+    "is_excluded_many",
+    "is_excluded_raw",
+    "set_glob_cache_size",
+    # modules
+    "detect_packages_from_files",
+    "find_all_packages_under_path",
+    # paths
+    "ResolveCache",
+    "get_glob_root",
+    "has_glob_chars",
+    "normalize_path_string",
+    "resolve_cache",
+    "resolve_path",
+    "shorten_path",
+    # system
+    "CapturedOutput",
+    "capture_output",
+    "clear_python_command_cache",
+    "create_version_info",
+    "detect_runtime_mode",
+    "ensure_artifacts_up_to_date",
+    "ensure_stitched_script_up_to_date",
+    "ensure_zipapp_up_to_date",
+    "find_python_command",
+    "get_sys_version_info",
+    "is_running_under_pytest",
+    "run_with_output",
+    "run_with_separated_output",
+    "runtime_swap",
+    "set_python_command_cache",
+    # testing
+    "create_mock_superclass_test",
+    "detect_module_runtime_mode",
+    "patch_everywhere",
+    # text
+    "plural",
+    "remove_path_in_error_message",
+    # types
+    "cast_hint",
+    "literal_to_set",
+    "safe_isinstance",
+    "schema_from_typeddict",
+    # walk
+    "iter_included_files",
+]
+
+
+# --- import shims for stitched runtime ---
+def _create_pkg_module(pkg_name: str) -> types.ModuleType:
+    """Create a package module and set up parent relationships."""
+    # Always create a new module object for packages
+    # Don't reuse existing modules - they might be the
+    # stitched module itself or have wrong attributes
+    _mod = types.ModuleType(pkg_name)
+    _mod.__package__ = pkg_name
+    sys.modules[pkg_name] = _mod
+    # Set up parent-child relationships for nested packages
+    if "." in pkg_name:
+        _parent_pkg = ".".join(pkg_name.split(".")[:-1])
+        _child_name = pkg_name.split(".")[-1]
+        _parent = sys.modules.get(_parent_pkg)
+        if _parent:
+            setattr(_parent, _child_name, _mod)
+    return _mod
+
+
+def _setup_pkg_modules(  # noqa: C901, PLR0912
+    pkg_name: str, module_names: list[str], name_mapping: dict[str, str] | None = None
+) -> None:
+    """Set up package module attributes and register submodules."""
+    _mod = sys.modules.get(pkg_name)
+    if not _mod:
+        return
+    # Copy attributes from all modules under this package
+    _globals = globals()
+    # Debug: log what's in globals for this package
+    # Note: This copies all globals to the package module
+    for _key, _value in _globals.items():
+        setattr(_mod, _key, _value)
+    # Set up package attributes for nested packages BEFORE registering
+    # modules (so packages are available when modules are registered)
+    _seen_packages: set[str] = set()
+    for _name in module_names:
+        if _name != pkg_name and _name.startswith(pkg_name + "."):
+            # Extract parent package (e.g., mypkg.public from
+            # mypkg.public.utils)
+            _name_parts = _name.split(".")
+            if len(_name_parts) > 2:  # noqa: PLR2004
+                # Has at least one intermediate package
+                _parent_pkg = ".".join(_name_parts[:-1])
+                if (
+                    _parent_pkg.startswith(pkg_name + ".")
+                    and _parent_pkg not in _seen_packages
+                ):
+                    _seen_packages.add(_parent_pkg)
+                    _pkg_obj = sys.modules.get(_parent_pkg)
+                    if _pkg_obj and _pkg_obj != _mod:
+                        # Set parent package as attribute
+                        _pkg_attr_name = _name_parts[1]
+                        if not hasattr(_mod, _pkg_attr_name):
+                            setattr(_mod, _pkg_attr_name, _pkg_obj)
+    # Register all modules under this package
+    for _name in module_names:
+        # Try to find module by transformed name first
+        _module_obj = sys.modules.get(_name)
+        if not _module_obj and name_mapping:
+            # If not found, try to find by original name
+            _original_name = name_mapping.get(_name)
+            if _original_name:
+                _module_obj = sys.modules.get(_original_name)
+                if _module_obj:
+                    # Register with transformed name
+                    sys.modules[_name] = _module_obj
+        # If still not found, use package module
+        if not _module_obj:
+            sys.modules[_name] = _mod
+    # Set submodules as attributes on parent package
+    for _name in module_names:
+        if _name != pkg_name and _name.startswith(pkg_name + "."):
+            _submodule_name = _name.split(".")[-1]
+            # Try to get actual module object
+            _module_obj = sys.modules.get(_name)
+            if not _module_obj and name_mapping:
+                _original_name = name_mapping.get(_name)
+                if _original_name:
+                    _module_obj = sys.modules.get(_original_name)
+            # Use actual module object if found, otherwise package
+            _target = _module_obj if _module_obj else _mod
+            if not hasattr(_mod, _submodule_name) or isinstance(
+                getattr(_mod, _submodule_name, None), types.ModuleType
+            ):
+                setattr(_mod, _submodule_name, _target)
+
+
+_create_pkg_module("apathetic_logging")
+_create_pkg_module("apathetic_utils")
+
+_setup_pkg_modules(
+    "apathetic_logging",
+    [
+        "apathetic_logging.__init__",
+        "apathetic_logging.constants",
+        "apathetic_logging.dual_stream_handler",
+        "apathetic_logging.get_logger",
+        "apathetic_logging.logger",
+        "apathetic_logging.logger_namespace",
+        "apathetic_logging.logging_levels",
+        "apathetic_logging.logging_root",
+        "apathetic_logging.logging_std_camel",
+        "apathetic_logging.logging_utils",
+        "apathetic_logging.namespace",
+        "apathetic_logging.registry",
+        "apathetic_logging.registry_data",
+        "apathetic_logging.safe_logging",
+        "apathetic_logging.tag_formatter",
+    ],
+    None,
+)
+_setup_pkg_modules(
+    "apathetic_utils",
+    [
+        "apathetic_utils.__init__",
+        "apathetic_utils.caching",
+        "apathetic_utils.ci",
+        "apathetic_utils.constants",
+        "apathetic_utils.files",
+        "apathetic_utils.logs",
+        "apathetic_utils.matching",
+        "apathetic_utils.modules",
+        "apathetic_utils.namespace",
+        "apathetic_utils.paths",
+        "apathetic_utils.runtime",
+        "apathetic_utils.shared",
+        "apathetic_utils.subprocess_utils",
+        "apathetic_utils.testing",
+        "apathetic_utils.text",
+        "apathetic_utils.types",
+        "apathetic_utils.version",
+        "apathetic_utils.walk",
+    ],
+    None,
+)
@@ -45,21 +45,75 @@ if_ci = apathetic_utils.if_ci
 is_ci = apathetic_utils.is_ci
 
 # Files
+# LoadedFile and ParseCacheInfo are nested classes in
+# ApatheticUtils_Internal_Files that are accessed via the namespace class.
+if TYPE_CHECKING:
+    from .files import ApatheticUtils_Internal_Files
+
+    LoadedFile: TypeAlias = ApatheticUtils_Internal_Files.LoadedFile
+    ParseCacheInfo: TypeAlias = ApatheticUtils_Internal_Files.ParseCacheInfo
+else:
+    LoadedFile = apathetic_utils.LoadedFile
+    ParseCacheInfo = apathetic_utils.ParseCacheInfo
+
+clear_parse_cache = apathetic_utils.clear_parse_cache
+default_parse_cache_dir = apathetic_utils.default_parse_cache_dir
+iter_jsonc_items = apathetic_utils.iter_jsonc_items
 load_jsonc = apathetic_utils.load_jsonc
+load_many = apathetic_utils.load_many
 load_toml = apathetic_utils.load_toml
+parse_cache_info = apathetic_utils.parse_cache_info
+set_parse_cache_dir = apathetic_utils.set_parse_cache_dir
+set_parse_cache_size = apathetic_utils.set_parse_cache_size
+set_toml_backend = apathetic_utils.set_toml_backend
+toml_backend = apathetic_utils.toml_backend
+
+# Logs
+get_logger = apathetic_utils.get_logger
+is_trace_enabled = apathetic_utils.is_trace_enabled
 
 # Matching
+# CompiledExcludes and GlobSet are nested classes in
+# ApatheticUtils_Internal_Matching that are accessed via the namespace class.
+if TYPE_CHECKING:
+    from .matching import ApatheticUtils_Internal_Matching
+
+    CompiledExcludes: TypeAlias = ApatheticUtils_Internal_Matching.CompiledExcludes
+    GlobCacheInfo: TypeAlias = ApatheticUtils_Internal_Matching.GlobCacheInfo
+    GlobSet: TypeAlias = ApatheticUtils_Internal_Matching.GlobSet
+else:
+    CompiledExcludes = apathetic_utils.CompiledExcludes
+    GlobCacheInfo = apathetic_utils.GlobCacheInfo
+    GlobSet = apathetic_utils.GlobSet
+
+clear_glob_cache = apathetic_utils.clear_glob_cache
+compile_excludes = apathetic_utils.compile_excludes
+compile_glob_set = apathetic_utils.compile_glob_set
 fnmatchcase_portable = apathetic_utils.fnmatchcase_portable
+glob_cache_info = apathetic_utils.glob_cache_info
+is_excluded_many = apathetic_utils.is_excluded_many
 is_excluded_raw = apathetic_utils.is_excluded_raw
+set_glob_cache_size = apathetic_utils.set_glob_cache_size
 
 # Modules
 detect_packages_from_files = apathetic_utils.detect_packages_from_files
 find_all_packages_under_path = apathetic_utils.find_all_packages_under_path
 
 # Paths
+# ResolveCache is a nested class in ApatheticUtils_Internal_Paths that is
+# accessed via the namespace class.
+if TYPE_CHECKING:
+    from .paths import ApatheticUtils_Internal_Paths
+
+    ResolveCache: TypeAlias = ApatheticUtils_Internal_Paths.ResolveCache
+else:
+    ResolveCache = apathetic_utils.ResolveCache
+
 get_glob_root = apathetic_utils.get_glob_root
 has_glob_chars = apathetic_utils.has_glob_chars
 normalize_path_string = apathetic_utils.normalize_path_string
+resolve_cache = apathetic_utils.resolve_cache
+resolve_path = apathetic_utils.resolve_path
 shorten_path = apathetic_utils.shorten_path
 
 # System
@@ -74,8 +128,10 @@ else:
     CapturedOutput = apathetic_utils.CapturedOutput
 
 capture_output = apathetic_utils.capture_output
+clear_python_command_cache = apathetic_utils.clear_python_command_cache
 create_version_info = apathetic_utils.create_version_info
 detect_runtime_mode = apathetic_utils.detect_runtime_mode
+ensure_artifacts_up_to_date = apathetic_utils.ensure_artifacts_up_to_date
 ensure_stitched_script_up_to_date = apathetic_utils.ensure_stitched_script_up_to_date
 ensure_zipapp_up_to_date = apathetic_utils.ensure_zipapp_up_to_date
 find_python_command = apathetic_utils.find_python_command
@@ -84,6 +140,7 @@ is_running_under_pytest = apathetic_utils.is_running_under_pytest
 run_with_output = apathetic_utils.run_with_output
 run_with_separated_output = apathetic_utils.run_with_separated_output
 runtime_swap = apathetic_utils.runtime_swap
+set_python_command_cache = apathetic_utils.set_python_command_cache
 
 # Testing
 create_mock_superclass_test = apathetic_utils.create_mock_superclass_test
@@ -100,6 +157,9 @@ literal_to_set = apathetic_utils.literal_to_set
 safe_isinstance = apathetic_utils.safe_isinstance
 schema_from_typeddict = apathetic_utils.schema_from_typeddict
 
+# Walk
+iter_included_files = apathetic_utils.iter_included_files
+
 
 __all__ = [  # noqa: RUF022
     # ci
@@ -107,24 +167,52 @@ __all__ = [  # noqa: RUF022
     "if_ci",
     "is_ci",
     # files
+    "LoadedFile",
+    "ParseCacheInfo",
+    "clear_parse_cache",
+    "default_parse_cache_dir",
+    "iter_jsonc_items",
     "load_jsonc",
+    "load_many",
     "load_toml",
+    "parse_cache_info",
+    "set_parse_cache_dir",
+    "set_parse_cache_size",
+    "set_toml_backend",
+    "toml_backend",
+    # logs
+    "get_logger",
+    "is_trace_enabled",
     # matching
+    "CompiledExcludes",
+    "GlobCacheInfo",
+    "GlobSet",
+    "clear_glob_cache",
+    "compile_excludes",
+    "compile_glob_set",
     "fnmatchcase_portable",
+    "glob_cache_info",
+    "is_excluded_many",
     "is_excluded_raw",
+    "set_glob_cache_size",
     # modules
     "detect_packages_from_files",
     "find_all_packages_under_path",
     # paths
+    "ResolveCache",
     "get_glob_root",
     "has_glob_chars",
     "normalize_path_string",
+    "resolve_cache",
+    "resolve_path",
     "shorten_path",
     # system
     "CapturedOutput",
     "capture_output",
+    "clear_python_command_cache",
     "create_version_info",
     "detect_runtime_mode",
+    "ensure_artifacts_up_to_date",
     "ensure_stitched_script_up_to_date",
     "ensure_zipapp_up_to_date",
     "find_python_command",
@@ -133,6 +221,7 @@ __all__ = [  # noqa: RUF022
     "run_with_output",
     "run_with_separated_output",
     "runtime_swap",
+    "set_python_command_cache",
     # testing
     "create_mock_superclass_test",
     "detect_module_runtime_mode",
@@ -145,4 +234,6 @@ __all__ = [  # noqa: RUF022
     "literal_to_set",
     "safe_isinstance",
     "schema_from_typeddict",
+    # walk
+    "iter_included_files",
 ]
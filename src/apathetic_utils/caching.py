@@ -0,0 +1,108 @@
+# src/apathetic_utils/caching.py
+"""Sized LRU cache shared by the library's internal caches."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+
+ApatheticUtils_CacheKeyT = TypeVar("ApatheticUtils_CacheKeyT")
+ApatheticUtils_CacheValueT = TypeVar("ApatheticUtils_CacheValueT")
+
+
+class ApatheticUtils_Internal_Caching:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the building blocks of the library's caches.
+
+    Not part of the public namespace: the glob and parse caches subclass
+    SizedLRU and expose their own info / resize / clear functions.
+    """
+
+    class SizedLRU(Generic[ApatheticUtils_CacheKeyT, ApatheticUtils_CacheValueT]):
+        """Thread-safe LRU mapping with a resizable bound and statistics.
+
+        `entries` is ordered from least to most recently used. Subclasses that
+        validate entries themselves may read `entries` directly under `lock`
+        and count hits / misses as they see fit; lookup() and store() cover
+        the plain case. A maxsize of 0 disables caching (statistics are
+        still kept).
+        """
+
+        def __init__(self, maxsize: int) -> None:
+            self.maxsize = maxsize
+            self.entries: OrderedDict[
+                ApatheticUtils_CacheKeyT, ApatheticUtils_CacheValueT
+            ] = OrderedDict()
+            self.lock = threading.Lock()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+        @staticmethod
+        def size_from_env(env_var: str, default: int) -> int:
+            """Return the size set in `env_var`, or `default`.
+
+            Invalid or negative values fall back to the default size.
+            """
+            raw = os.environ.get(env_var, "").strip()
+            # isdecimal(), not isdigit(): int() rejects digits like '²'
+            if raw.isdecimal():
+                return int(raw)
+            return default
+
+        def lookup(
+            self, key: ApatheticUtils_CacheKeyT
+        ) -> ApatheticUtils_CacheValueT | None:
+            """Return the entry for `key`, counting a hit or a miss.
+
+            Hits do not take the lock (it costs more than the lookup): each
+            dict operation is atomic, and an entry evicted meanwhile is still
+            valid to return. Racing threads may undercount hits.
+            """
+            entries = self.entries
+            entry = entries.get(key)
+            if entry is None:
+                with self.lock:
+                    self.misses += 1
+                return None
+            try:  # noqa: SIM105  # suppress() is slower on this hot path
+                entries.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by another thread meanwhile
+            self.hits += 1
+            return entry
+
+        def store(
+            self, key: ApatheticUtils_CacheKeyT, entry: ApatheticUtils_CacheValueT
+        ) -> None:
+            """Add or replace the entry for `key` as most recently used."""
+            with self.lock:
+                self.entries[key] = entry
+                self.entries.move_to_end(key)
+                self.trim()
+
+        def resize(self, maxsize: int) -> None:
+            """Change maxsize, evicting least-recently-used entries above it."""
+            with self.lock:
+                self.maxsize = maxsize
+                self.trim()
+
+        def clear(self) -> None:
+            """Drop all entries and reset the statistics."""
+            with self.lock:
+                self.entries.clear()
+                self.reset_stats()
+
+        def reset_stats(self) -> None:
+            """Zero the statistics (lock held); subclasses add their own."""
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+        def trim(self) -> None:
+            """Evict least-recently-used entries above maxsize (lock held)."""
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
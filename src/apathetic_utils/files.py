@@ -3,12 +3,26 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib
 import json
+import os
+import pickle
 import re
+import struct
+import sys
+import time
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, cast
+from types import ModuleType
+from typing import Any, ClassVar, cast
 
-from apathetic_logging import getLogger
+from .caching import ApatheticUtils_Internal_Caching
+from .logs import ApatheticUtils_Internal_Logs
+from .shared import ApatheticUtils_Internal_Shared
 
 
 class ApatheticUtils_Internal_Files:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -18,145 +32,633 @@ class ApatheticUtils_Internal_Files:  # noqa: N801  # pyright: ignore[reportUnus
     When mixed into apathetic_utils, it provides file loading methods.
     """
 
-    @staticmethod
-    def _strip_jsonc_comments(text: str) -> str:  # noqa: PLR0912
-        """Strip comments from JSONC while preserving string contents.
-
-        Handles //, #, and /* */ comments without modifying content inside strings.
-        """
-        result: list[str] = []
-        in_string = False
-        in_escape = False
-        i = 0
-        while i < len(text):
-            ch = text[i]
-
-            # Handle escape sequences in strings
-            if in_escape:
-                result.append(ch)
-                in_escape = False
-                i += 1
-                continue
-
-            if ch == "\\" and in_string:
-                result.append(ch)
-                in_escape = True
-                i += 1
-                continue
-
-            # Toggle string state
-            if ch in ('"', "'") and (not in_string or text[i - 1 : i] != "\\"):
-                in_string = not in_string
-                result.append(ch)
-                i += 1
-                continue
-
-            # If in a string, keep everything
-            if in_string:
-                result.append(ch)
-                i += 1
-                continue
-
-            # Outside strings: handle comments
-            # Check for // comment (but skip URLs like http://)
+    # Environment variable overriding the parse cache size at import time
+    PARSE_CACHE_SIZE_ENV_VAR = "APATHETIC_UTILS_PARSE_CACHE_SIZE"
+    DEFAULT_PARSE_CACHE_SIZE = 64
+    # Environment variable naming the on-disk parse cache directory
+    PARSE_CACHE_DIR_ENV_VAR = "APATHETIC_UTILS_PARSE_CACHE_DIR"
+    # Bytes read at a time by iter_jsonc_items()
+    DEFAULT_JSONC_CHUNK_SIZE = 1 << 20
+
+    @dataclass(frozen=True)
+    class ParseCacheInfo:
+        """Statistics for the load_jsonc() / load_toml() parse cache.
+
+        Returned by parse_cache_info(); mirrors GlobCacheInfo, plus the
+        on-disk cache directory and how many misses it served.
+        """
+
+        hits: int
+        misses: int
+        evictions: int
+        maxsize: int
+        currsize: int
+        disk_hits: int
+        directory: Path | None
+
+    @dataclass(frozen=True)
+    class LoadedFile:
+        """One file's outcome from load_many().
+
+        Exactly one of `data` / `error` is meaningful: `error` is the
+        exception loading raised (e.g. FileNotFoundError, ValueError for a
+        syntax error), or None when `data` holds the parsed content.
+        """
+
+        path: Path
+        data: Any = None
+        error: Exception | None = None
+
+        @property
+        def ok(self) -> bool:
+            """True if the file loaded without error."""
+            return self.error is None
+
+    @dataclass
+    class _ParseCacheEntry:
+        """A parsed file, pickled, with the stat() it was parsed at."""
+
+        mtime_ns: int
+        size: int
+        payload: bytes
+        # Content hash, kept only while the file's mtime is too recent to
+        # prove a same-size rewrite would have changed it
+        digest: bytes | None
+
+    class _ParseDiskCache:
+        """Parse results shared between processes through a cache directory.
+
+        One record per (loader, absolute path), named by a hash of both: the
+        source's mtime, size and SHA-256 at parse time, then the pickled
+        result. A record is only used if the source's current content hashes
+        the same, so neither stat() coincidences nor other processes rewriting
+        the source can serve a stale result. Records are written to a
+        temporary file and os.replace()d into place, so concurrent readers
+        see a whole old or a whole new record; unreadable records are misses
+        and write failures are ignored (the cache is only an accelerator).
+        """
+
+        # Bump when a loader's output for the same input changes
+        MAGIC = b"AUPC0001"
+        HEADER = struct.Struct("<8sqq32s")
+
+        def __init__(self, directory: Path) -> None:
+            self.directory = directory
+
+        def record_path(self, key: tuple[str, Path]) -> Path:
+            """Return the record file for a (loader, absolute path) key."""
+            kind, abs_path = key
+            ident = f"{kind}\0{abs_path}".encode("utf-8", "surrogateescape")
+            return self.directory / f"{hashlib.sha256(ident).hexdigest()}.pickle"
+
+        def get(
+            self, key: tuple[str, Path], st: os.stat_result
+        ) -> tuple[bytes, bytes] | None:
+            """Return ``(digest, payload)`` if the record matches `st`."""
+            try:
+                record = self.record_path(key).read_bytes()
+            except OSError:
+                return None
+            header_size = self.HEADER.size
+            if len(record) < header_size:
+                return None
+            magic, mtime_ns, size, digest = self.HEADER.unpack_from(record)
+            if (magic, mtime_ns, size) != (self.MAGIC, st.st_mtime_ns, st.st_size):
+                return None
+            return digest, record[header_size:]
+
+        def load(
+            self, key: tuple[str, Path], st: os.stat_result, digest: bytes
+        ) -> tuple[Any, bytes] | None:
+            """Return ``(data, payload)`` from a record still valid for `digest`."""
+            record = self.get(key, st)
+            if record is None or record[0] != digest:
+                return None
+            try:
+                return pickle.loads(record[1]), record[1]  # noqa: S301
+            except Exception:  # noqa: BLE001
+                # Corrupt record: the caller parses and rewrites it
+                return None
+
+        def put(
+            self,
+            key: tuple[str, Path],
+            st: os.stat_result,
+            digest: bytes,
+            payload: bytes,
+        ) -> None:
+            """Atomically write the record for `key`."""
+            header = self.HEADER.pack(self.MAGIC, st.st_mtime_ns, st.st_size, digest)
+            try:
+                ApatheticUtils_Internal_Shared.write_atomic(
+                    self.record_path(key), header, payload, dir_mode=0o700
+                )
+            except OSError as e:
+                ApatheticUtils_Internal_Logs.get_logger().debug(
+                    "Cannot write parse cache record in %s: %s", self.directory, e
+                )
+
+    class _ParseCache(
+        ApatheticUtils_Internal_Caching.SizedLRU[tuple[str, Path], "_ParseCacheEntry"]
+    ):
+        """Sized LRU of parsed files, keyed by loader and absolute path.
+
+        An entry is reused while the file's mtime and size are unchanged.
+        Filesystem timestamps are coarse, so a file whose mtime was within
+        RACY_WINDOW_NS of the time it was cached could be rewritten with the
+        same size and mtime; such entries also compare a content hash until
+        a later check shows the mtime has settled (the "racy clean" check git
+        uses for its index). Results are stored pickled and unpickled on every
+        hit, so callers always get their own copy to mutate.
+
+        With a `disk` cache, misses are looked up there before parsing, and
+        new results are written to it, so other processes can reuse them.
+        """
+
+        # Coarsest common timestamp granularity (FAT: 2 seconds)
+        RACY_WINDOW_NS = 2_000_000_000
+
+        def __init__(
+            self,
+            maxsize: int,
+            disk: ApatheticUtils_Internal_Files._ParseDiskCache | None = None,
+        ) -> None:
+            super().__init__(maxsize)
+            self.disk = disk
+            self.disk_hits = 0
+
+        def reset_stats(self) -> None:
+            """Zero the statistics, including disk hits (lock held)."""
+            super().reset_stats()
+            self.disk_hits = 0
+
+        def load(self, kind: str, path: Path, parse: Callable[[bytearray], Any]) -> Any:
+            """Return `parse` of the file at `path`, reusing a cached result.
+
+            `kind` names the loader, so different loaders never share entries
+            for the same file. Parse errors propagate and are not cached.
+            """
+            key = (kind, path.absolute())
+            now_ns = time.time_ns()
+            st = path.stat()
+            racy = now_ns - st.st_mtime_ns < self.RACY_WINDOW_NS
+
+            with self.lock:
+                entry = self.entries.get(key)
+            raw: bytearray | None = None
             if (
-                ch == "/"
-                and i + 1 < len(text)
-                and text[i + 1] == "/"
-                and not (i > 0 and text[i - 1] == ":")
+                entry is not None
+                and entry.mtime_ns == st.st_mtime_ns
+                and entry.size == st.st_size
             ):
-                # Skip to end of line
-                while i < len(text) and text[i] != "\n":
-                    i += 1
-                if i < len(text):
-                    result.append("\n")
-                    i += 1
-                continue
-
-            # Check for # comment
-            if ch == "#":
-                # Skip to end of line
-                while i < len(text) and text[i] != "\n":
-                    i += 1
-                if i < len(text):
-                    result.append("\n")
-                    i += 1
-                continue
-
-            # Check for block comments /* ... */
-            if ch == "/" and i + 1 < len(text) and text[i + 1] == "*":
-                # Skip to end of block comment
-                i += 2
-                while i + 1 < len(text):
-                    if text[i] == "*" and text[i + 1] == "/":
-                        i += 2
-                        break
-                    i += 1
-                continue
+                if entry.digest is not None:
+                    raw = ApatheticUtils_Internal_Files._read_file_buffer(path)
+                    if hashlib.sha256(raw).digest() != entry.digest:
+                        entry = None
+                if entry is not None:
+                    with self.lock:
+                        self.hits += 1
+                        if not racy:
+                            entry.digest = None
+                        if self.entries.get(key) is entry:
+                            self.entries.move_to_end(key)
+                    return pickle.loads(entry.payload)  # noqa: S301
+
+            with self.lock:
+                self.misses += 1
+                self.entries.pop(key, None)
+
+            # Read and parse outside the lock
+            if raw is None:
+                raw = ApatheticUtils_Internal_Files._read_file_buffer(path)
+            disk = self.disk
+            digest = hashlib.sha256(raw).digest() if racy or disk else None
+            stored = disk.load(key, st, digest) if disk is not None and digest else None
+            if stored is not None:
+                data, payload = stored
+                with self.lock:
+                    self.disk_hits += 1
+            else:
+                data = parse(raw)
+                payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+                if disk is not None and digest is not None:
+                    disk.put(key, st, digest, payload)
+            self.store(
+                key,
+                ApatheticUtils_Internal_Files._ParseCacheEntry(
+                    mtime_ns=st.st_mtime_ns,
+                    size=st.st_size,
+                    payload=payload,
+                    digest=digest if racy else None,
+                ),
+            )
+            return data
+
+    _parse_cache = _ParseCache(
+        _ParseCache.size_from_env(PARSE_CACHE_SIZE_ENV_VAR, DEFAULT_PARSE_CACHE_SIZE),
+        _ParseDiskCache(Path(os.environ[PARSE_CACHE_DIR_ENV_VAR]).expanduser())
+        if os.environ.get(PARSE_CACHE_DIR_ENV_VAR)
+        else None,
+    )
+
+    @staticmethod
+    def parse_cache_info() -> ApatheticUtils_Internal_Files.ParseCacheInfo:
+        """Return hit / miss / eviction statistics for the parse cache.
+
+        The cache is used by load_jsonc() and load_toml() when called with
+        cache=True.
+        """
+        cache = ApatheticUtils_Internal_Files._parse_cache
+        with cache.lock:
+            return ApatheticUtils_Internal_Files.ParseCacheInfo(
+                hits=cache.hits,
+                misses=cache.misses,
+                evictions=cache.evictions,
+                maxsize=cache.maxsize,
+                currsize=len(cache.entries),
+                disk_hits=cache.disk_hits,
+                directory=cache.disk.directory if cache.disk else None,
+            )
+
+    @staticmethod
+    def set_parse_cache_size(maxsize: int) -> None:
+        """Resize the parse cache, evicting least-recently-used entries.
+
+        The initial size is 64, or the value of the
+        APATHETIC_UTILS_PARSE_CACHE_SIZE environment variable at import time.
+
+        Args:
+            maxsize: Maximum number of parsed files to keep; 0 disables
+                caching
+
+        Raises:
+            ValueError: If `maxsize` is negative
+        """
+        if maxsize < 0:
+            xmsg = f"Parse cache size must be >= 0, got {maxsize}"
+            raise ValueError(xmsg)
+        ApatheticUtils_Internal_Files._parse_cache.resize(maxsize)
 
-            # Regular character
-            result.append(ch)
-            i += 1
+    @staticmethod
+    def clear_parse_cache(path: Path | str | None = None) -> None:
+        """Drop cached parse results.
+
+        Args:
+            path: Only forget this file (for every loader), keeping the
+                statistics; None drops everything and resets the statistics
+        """
+        cache = ApatheticUtils_Internal_Files._parse_cache
+        with cache.lock:
+            if path is not None:
+                abs_path = Path(path).absolute()
+                for key in [k for k in cache.entries if k[1] == abs_path]:
+                    del cache.entries[key]
+                return
+            cache.entries.clear()
+            cache.reset_stats()
 
-        return "".join(result)
+    @staticmethod
+    def default_parse_cache_dir() -> Path:
+        """Return the per-user directory for the on-disk parse cache.
+
+        `%LOCALAPPDATA%` on Windows, `~/Library/Caches` on macOS, and
+        `$XDG_CACHE_HOME` (default `~/.cache`) elsewhere, each followed by
+        `apathetic_utils/parse`. Nothing is created until a record is written.
+        """
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or "~/AppData/Local"
+        elif sys.platform == "darwin":
+            base = "~/Library/Caches"
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+        return Path(base).expanduser() / "apathetic_utils" / "parse"
+
+    @staticmethod
+    def set_parse_cache_dir(directory: Path | str | None) -> None:
+        """Share parse results between processes through `directory`.
+
+        Once set, load_jsonc() / load_toml() calls with cache=True that miss
+        the in-memory cache look for a record of the same file there (valid
+        only if the file's content still hashes the same) before parsing, and
+        store what they parse. The initial directory is taken from the
+        APATHETIC_UTILS_PARSE_CACHE_DIR environment variable at import time.
+
+        Records are pickles: use a directory only you can write to, such as
+        default_parse_cache_dir(). It is created (mode 0o700) when needed and
+        may be deleted at any time.
+
+        Args:
+            directory: Cache directory, or None to stop using one
+        """
+        disk = (
+            None
+            if directory is None
+            else ApatheticUtils_Internal_Files._ParseDiskCache(
+                Path(directory).expanduser()
+            )
+        )
+        cache = ApatheticUtils_Internal_Files._parse_cache
+        with cache.lock:
+            cache.disk = disk
+
+    # JSONC regex fragments. Strings are matched whole so their contents are
+    # never mistaken for comments; unterminated strings run to the end. Loops
+    # are unrolled (a plain run, then one special item and another run) so
+    # the regex engine does one step per item rather than per alternative.
+    _JSONC_STRING = (
+        r"""["'][^"'\\]*(?:(?:\\\\["']?|\\[^\\]|\\\Z)[^"'\\]*)*(?:["']|\Z)"""
+    )
+    _JSONC_LINE_COMMENT = r"""(?:(?<!:)//|\#)[^\n]*"""
+    _JSONC_BLOCK_COMMENT_END = r"""[^*]*(?:\*(?!/)[^*]*)*\*/"""
+    # For UTF-8 bytes: an unterminated block comment swallows everything but
+    # the final character (kept whole, not just its last byte)
+    _JSONC_BLOCK_COMMENT = (
+        rf"""(?:/\*(?:{_JSONC_BLOCK_COMMENT_END}"""
+        r"""|(?:[\s\S]*(?=[\x00-\x7f\xc0-\xff][\x80-\xbf]*\Z))?))"""
+    )
+    _JSONC_COMMENT = rf"""(?:{_JSONC_LINE_COMMENT}|{_JSONC_BLOCK_COMMENT})"""
+
+    # _blank_jsonc() matches (bytes): a run of code, then one thing to blank:
+    # a trailing comma or a comment (`blank`), or the comments after a comma
+    # (`gap`, with `close` set if a bracket follows, making the comma
+    # trailing). Taking both in one match halves the number of matches; the
+    # \Z alternative ends the scan after the last run. Commas never look past
+    # comments they have not consumed, so each comment is scanned once.
+    _JSONC_BLANK_TOKEN = re.compile(
+        (
+            rf"""[^"'/\#,]*(?:(?:{_JSONC_STRING}|/(?![/*])|(?<=:)/(?=/)"""
+            r"""|,(?!\s*(?:[}\]]|//|\#|/\*)))[^"'/\#,]*)*"""
+            rf"""(?:(?P<blank>,(?=\s*[}}\]])|{_JSONC_COMMENT})"""
+            rf"""|,(?P<gap>\s*(?:{_JSONC_COMMENT}\s*)+)(?P<close>(?=[}}\]]))?"""
+            r"""|\Z)"""
+        ).encode("ascii")
+    )
+    # Maps every byte except newline to a space
+    _JSONC_BLANK_TABLE = bytes(b if b == ord("\n") else ord(" ") for b in range(256))
+    # Bytes iter_jsonc_items() stops at. Outside the root: anything but JSON
+    # whitespace. Inside it: what can start a string or comment, brackets
+    # and, at the root's top level, commas. In a string: its end, an escape
+    # or an apostrophe (see iter_jsonc_items()).
+    _JSONC_OUTSIDE_STOP = re.compile(rb"[^ \t\n\r]")
+    _JSONC_ITEMS_STOP = re.compile(rb"[\"'/#\[\]{},]")
+    _JSONC_NESTED_STOP = re.compile(rb"[\"'/#\[\]{}]")
+    _JSONC_STRING_STOP = re.compile(rb"[\"'\\]")
+
+    @staticmethod
+    def _blank_jsonc(data: bytearray) -> None:
+        """Replace JSONC comments and trailing commas with spaces, in place.
+
+        `data` is UTF-8 JSONC. Newlines inside comments are kept and every
+        blanked character becomes exactly one space, so the result is plain
+        JSON whose line / column positions match the original text.
+
+        Comments are //, # and /* */ outside strings. Quirks kept for
+        compatibility: either quote character toggles the string state, a
+        quote directly after an escaped backslash does not close a string,
+        '//' preceded by ':' is not a comment (URLs), and an unterminated
+        block comment swallows all but the final character. A comma is
+        trailing when only whitespace and comments separate it from a closing
+        '}' or ']' (commas inside strings are never touched).
+        """
+        # Blanked regions end before any later token's lookbehind, so blanking
+        # behind the scanner does not change what it matches next. Regions are
+        # copied from one pre-translated buffer instead of translated each.
+        blanked = data.translate(ApatheticUtils_Internal_Files._JSONC_BLANK_TABLE)
+        ascii_only = data.isascii()
+        resized: list[tuple[int, int, bytes]] = []
+        with memoryview(data) as view:
+            for match in ApatheticUtils_Internal_Files._JSONC_BLANK_TOKEN.finditer(
+                data
+            ):
+                kind = match.lastgroup
+                if kind is None:
+                    break  # Only code was left
+                if kind == "close":
+                    start, end = match.span("gap")
+                    start -= 1  # The comma before the comments is trailing
+                else:
+                    start, end = match.span(kind)
+                if not ascii_only and not data[start:end].isascii():
+                    # One space per character, not per UTF-8 byte (applied
+                    # below, as resizing is not possible while the scanner
+                    # holds data)
+                    text = data[start:end].decode("utf-8", "replace")
+                    resized.append((start, end, text.encode("ascii", "replace")))
+                view[start:end] = blanked[start:end]
+
+        # Back to front, so a resized chunk cannot shift the ones before it
+        table = ApatheticUtils_Internal_Files._JSONC_BLANK_TABLE
+        for start, end, ascii_chunk in reversed(resized):
+            data[start:end] = ascii_chunk.translate(table)
+
+    @staticmethod
+    def _read_file_buffer(path: Path) -> bytearray:
+        """Read a whole file into a single mutable buffer (no extra copy)."""
+        with path.open("rb") as f:
+            raw = bytearray(os.fstat(f.fileno()).st_size)
+            size = f.readinto(raw)
+            raw[size:] = f.read()  # In case the file changed size meanwhile
+        return raw
+
+    @staticmethod
+    def _load_file(
+        kind: str,
+        path: Path,
+        parse: Callable[[bytearray], Any],
+        *,
+        cache: bool,
+    ) -> Any:
+        """Read `path` and return `parse` of its bytes, via the parse cache."""
+        if cache:
+            return ApatheticUtils_Internal_Files._parse_cache.load(kind, path, parse)
+        return parse(ApatheticUtils_Internal_Files._read_file_buffer(path))
+
+    # TOML module used by load_toml(), resolved on first use (see toml_backend())
+    _toml_backend: ClassVar[ModuleType | None] = None
+    _toml_backend_resolved: ClassVar[bool] = False
+
+    @staticmethod
+    def _resolve_toml_backend() -> ModuleType | None:
+        """Import tomllib (Python 3.11+) or tomli, or return None if neither."""
+        # Try tomllib (Python 3.11+)
+        try:
+            import tomllib  # type: ignore[import-not-found] # noqa: PLC0415
+        except ImportError:
+            pass
+        else:
+            return tomllib  # type: ignore[no-any-return,unused-ignore]
+
+        # Try tomli (required for Python 3.10)
+        try:
+            import tomli  # type: ignore[import-not-found,unused-ignore] # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+        except ImportError:
+            return None
+        return tomli  # type: ignore[no-any-return,unused-ignore]  # pyright: ignore[reportUnknownVariableType]
+
+    @staticmethod
+    def _toml_module(*, required: bool) -> ModuleType | None:
+        """Return the TOML backend, resolving it once, see load_toml()."""
+        if not ApatheticUtils_Internal_Files._toml_backend_resolved:
+            # A failed import walks every sys.path finder; only pay for it once
+            backend = ApatheticUtils_Internal_Files._resolve_toml_backend()
+            ApatheticUtils_Internal_Files._toml_backend = backend
+            ApatheticUtils_Internal_Files._toml_backend_resolved = True
+        toml = ApatheticUtils_Internal_Files._toml_backend
+        if toml is None and required:
+            xmsg = (
+                "TOML parsing requires 'tomli' package on Python 3.10. "
+                "Install it with: pip install tomli, or disable "
+                "pyproject.toml support by setting "
+                "'use_pyproject_metadata: false' in your config."
+            )
+            raise RuntimeError(xmsg)
+        return toml
+
+    @staticmethod
+    def toml_backend() -> str | None:
+        """Return the name of the module load_toml() parses with.
+
+        The backend is looked up once, on first use: `tomllib` on Python
+        3.11+, else `tomli` if installed, else None (TOML unavailable).
+        set_toml_backend() overrides or resets it.
+        """
+        toml = ApatheticUtils_Internal_Files._toml_module(required=False)
+        return None if toml is None else toml.__name__
+
+    @staticmethod
+    def set_toml_backend(backend: ModuleType | str | None = None) -> None:
+        """Choose the module load_toml() parses with.
+
+        Args:
+            backend: A module with a tomllib-compatible loads(), or the name
+                of one to import (e.g. "tomli"); None forgets the current
+                backend, so the next use looks it up again
+
+        Raises:
+            ImportError: If `backend` names a module that cannot be imported
+            TypeError: If the module has no loads() function
+        """
+        if backend is None:
+            ApatheticUtils_Internal_Files._toml_backend = None
+            ApatheticUtils_Internal_Files._toml_backend_resolved = False
+            return
+        module = (
+            importlib.import_module(backend) if isinstance(backend, str) else backend
+        )
+        if not callable(getattr(module, "loads", None)):
+            xmsg = f"TOML backend {module.__name__!r} has no loads() function"
+            raise TypeError(xmsg)
+        ApatheticUtils_Internal_Files._toml_backend = module
+        ApatheticUtils_Internal_Files._toml_backend_resolved = True
 
     @staticmethod
-    def load_toml(path: Path, *, required: bool = False) -> dict[str, Any] | None:
+    def load_toml(
+        path: Path, *, required: bool = False, cache: bool = False
+    ) -> dict[str, Any] | None:
         """Load and parse a TOML file, supporting Python 3.10 and 3.11+.
 
         Uses:
         - `tomllib` (Python 3.11+ standard library)
         - `tomli` (required for Python 3.10 - must be installed separately)
 
+        The backend is resolved once and reused (see toml_backend()); the file
+        is read once, in binary, and passed to its loads().
+
         Args:
             path: Path to TOML file
             required: If True, raise RuntimeError when tomli is missing on
                 Python 3.10. If False, return None when unavailable (caller
                 handles gracefully).
+            cache: If True, reuse the parse cache (see parse_cache_info()):
+                an unchanged file is not re-read or re-parsed, and every call
+                returns a fresh copy
 
         Returns:
             Parsed TOML data as a dictionary, or None if unavailable and not required
 
         Raises:
-            FileNotFoundError: If the file doesn't exist
-            RuntimeError: If required=True and neither tomllib nor tomli is available
+            FileNotFoundError: If the file doesn't exist (checked before the
+                backend, so also when TOML is unavailable)
+            RuntimeError: If required=True, the file exists, and neither
+                tomllib nor tomli is available
             ValueError: If the file cannot be parsed
         """
-        if not path.exists():
-            xmsg = f"TOML file not found: {path}"
-            raise FileNotFoundError(xmsg)
+        toml = ApatheticUtils_Internal_Files._toml_module(required=False)
+        if toml is None:
+            # Open the file first: a missing file is reported as such, before
+            # the missing backend (RuntimeError if required)
+            try:
+                path.open("rb").close()
+            except FileNotFoundError as e:
+                xmsg = f"TOML file not found: {path}"
+                raise FileNotFoundError(xmsg) from e
+            ApatheticUtils_Internal_Files._toml_module(required=required)
+            return None
 
-        # Try tomllib (Python 3.11+)
+        def _parse(raw: bytearray) -> dict[str, Any]:
+            text = raw.decode("utf-8")
+            raw.clear()
+            return cast("dict[str, Any]", toml.loads(text))
+
+        # No exists() check first: opening the file is the check
         try:
-            import tomllib  # type: ignore[import-not-found] # noqa: PLC0415
+            return cast(
+                "dict[str, Any]",
+                ApatheticUtils_Internal_Files._load_file(
+                    "toml", path, _parse, cache=cache
+                ),
+            )
+        except FileNotFoundError as e:
+            xmsg = f"TOML file not found: {path}"
+            raise FileNotFoundError(xmsg) from e
 
-            with path.open("rb") as f:
-                return tomllib.load(f)  # type: ignore[no-any-return]
-        except ImportError:
-            pass
+    @staticmethod
+    def _parse_jsonc(raw: bytearray, path: Path) -> dict[str, Any] | list[Any] | None:
+        """Parse JSONC bytes read from `path` (consumes `raw`), see load_jsonc()."""
+        # Blank comments / trailing commas in the only copy of the document, so
+        # json error positions are the file's own line and column
+        ApatheticUtils_Internal_Files._blank_jsonc(raw)
+        text = raw.decode("utf-8")
+        raw.clear()
+
+        if not text or text.isspace():
+            # Empty or only comments → interpret as "no config"
+            return None
 
-        # Try tomli (required for Python 3.10)
         try:
-            import tomli  # type: ignore[import-not-found,unused-ignore] # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            xmsg = (
+                f"Invalid JSONC syntax in {path}:"
+                f" {e.msg} (line {e.lineno}, column {e.colno})"
+            )
+            raise ValueError(xmsg) from e
 
-            with path.open("rb") as f:
-                return tomli.load(f)  # type: ignore[no-any-return,unused-ignore]  # pyright: ignore[reportUnknownReturnType]
-        except ImportError:
-            if required:
-                xmsg = (
-                    "TOML parsing requires 'tomli' package on Python 3.10. "
-                    "Install it with: pip install tomli, or disable "
-                    "pyproject.toml support by setting "
-                    "'use_pyproject_metadata: false' in your config."
-                )
-                raise RuntimeError(xmsg) from None
-            return None
+        # Guard against scalar roots (invalid config structure)
+        if not isinstance(data, (dict, list)):
+            xmsg = f"Invalid JSONC root type: {type(data).__name__}"
+            raise ValueError(xmsg)  # noqa: TRY004
+
+        # narrow type
+        return cast("dict[str, Any] | list[Any]", data)
 
     @staticmethod
-    def load_jsonc(path: Path) -> dict[str, Any] | list[Any] | None:
-        """Load JSONC (JSON with comments and trailing commas)."""
-        logger = getLogger()
-        logger.trace(f"[load_jsonc] Loading from {path}")
+    def load_jsonc(
+        path: Path, *, cache: bool = False
+    ) -> dict[str, Any] | list[Any] | None:
+        """Load JSONC (JSON with comments and trailing commas).
+
+        Comments and trailing commas are blanked out in place (see
+        _blank_jsonc()) before the standard json decoder runs, so the file is
+        held in memory once and the line / column numbers in error messages
+        refer to the original file.
+
+        With cache=True, an unchanged file is served from the parse cache (see
+        parse_cache_info()) without re-reading or re-parsing it; every call
+        still returns a fresh copy.
+        """
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        logger.trace("[load_jsonc] Loading from %s", path)
 
         if not path.exists():
             xmsg = f"JSONC file not found: {path}"
@@ -166,37 +668,450 @@ class ApatheticUtils_Internal_Files:  # noqa: N801  # pyright: ignore[reportUnus
             xmsg = f"Expected a file: {path}"
             raise ValueError(xmsg)
 
-        text = path.read_text(encoding="utf-8")
-        text = ApatheticUtils_Internal_Files._strip_jsonc_comments(text)
+        result = cast(
+            "dict[str, Any] | list[Any] | None",
+            ApatheticUtils_Internal_Files._load_file(
+                "jsonc",
+                path,
+                lambda raw: ApatheticUtils_Internal_Files._parse_jsonc(raw, path),
+                cache=cache,
+            ),
+        )
+        if result is not None:
+            logger.trace(
+                "[load_jsonc] Loaded %s with %d items",
+                type(result).__name__,
+                len(result),
+            )
+        return result
 
-        # Remove trailing commas before } or ]
-        text = re.sub(r",(?=\s*[}\]])", "", text)
+    @staticmethod
+    def _advance_position(line: int, column: int, text: str) -> tuple[int, int]:
+        """Return the line / column just after `text`, starting at line / column."""
+        newlines = text.count("\n")
+        if newlines:
+            return line + newlines, len(text) - text.rindex("\n")
+        return line, column + len(text)
 
-        # Trim whitespace
-        text = text.strip()
+    @staticmethod
+    def _parse_jsonc_batch(
+        text: str, path: Path, line: int, column: int, *, members: bool
+    ) -> list[Any]:
+        """Parse a blanked, bracket-wrapped batch of iter_jsonc_items() items.
 
-        if not text:
-            # Empty or only comments → interpret as "no config"
-            return None
+        `line` / `column` are the file position the text would start at, for
+        error messages (the brackets are not in the file). With `members`, the text
+        is an object and its (key, value) pairs are returned, duplicate keys
+        included.
+        """
+        pairs: list[tuple[str, Any]] = []
+
+        def _pairs_hook(found: list[tuple[str, Any]]) -> dict[str, Any]:
+            # The root object is the last one the decoder completes
+            nonlocal pairs
+            pairs = found
+            return dict(found)
 
         try:
-            data = json.loads(text)
+            if not members:
+                return cast("list[Any]", json.loads(text))
+            json.loads(text, object_pairs_hook=_pairs_hook)
         except json.JSONDecodeError as e:
+            if e.lineno == 1:
+                column += e.colno - 1
+            else:
+                column = e.colno
             xmsg = (
                 f"Invalid JSONC syntax in {path}:"
-                f" {e.msg} (line {e.lineno}, column {e.colno})"
+                f" {e.msg} (line {line + e.lineno - 1}, column {column})"
             )
             raise ValueError(xmsg) from e
+        return pairs
 
-        # Guard against scalar roots (invalid config structure)
-        if not isinstance(data, (dict, list)):
-            xmsg = f"Invalid JSONC root type: {type(data).__name__}"
-            raise ValueError(xmsg)  # noqa: TRY004
+    @staticmethod
+    def iter_jsonc_items(  # noqa: C901, PLR0912, PLR0915
+        path: Path, *, chunk_size: int | None = None
+    ) -> Generator[Any, None, None]:
+        """Stream the top-level items of a JSONC array or object.
+
+        Yields each element of a root array, or a (key, value) pair for each
+        member of a root object (in file order, duplicate keys included),
+        without reading the whole file. It is read in binary chunks and a
+        small state machine (code, string, line or block comment) tracks the
+        bracket depth to find the root's top-level commas; each run of
+        complete items is blanked with _blank_jsonc() and decoded by the
+        standard json decoder in one go, so comments, trailing commas, results
+        and errors (at the file's own line and column) are the same as with
+        load_jsonc(). About one chunk of text and the items parsed from it are
+        held at a time, more only while a single item is larger than that.
+
+        A file that is empty or only comments yields nothing. Items are
+        checked as they are reached, so a syntax error late in the file
+        raises after the items before it have been yielded. Anything but
+        whitespace and comments around the root is reported by parsing the
+        whole file as load_jsonc() does. So is everything from the first
+        apostrophe inside the root, or escaped backslash followed by a quote
+        in a string, on: _blank_jsonc() reads strings differently from there
+        (see its quirks), so the rest is parsed whole to match.
+
+        Args:
+            path: Path to JSONC file
+            chunk_size: Bytes to read at a time (default
+                DEFAULT_JSONC_CHUNK_SIZE)
+
+        Yields:
+            Array elements, or (key, value) pairs of object members
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If `path` is not a file, `chunk_size` is less than 1,
+                the root is not an array or object, or the file is not valid
+                JSONC
+
+        Example:
+            for name, entry in iter_jsonc_items(Path("manifest.jsonc")):
+                ...
+        """
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        logger.trace("[iter_jsonc_items] Streaming from %s", path)
+
+        if chunk_size is None:
+            chunk_size = ApatheticUtils_Internal_Files.DEFAULT_JSONC_CHUNK_SIZE
+        if chunk_size < 1:
+            xmsg = f"chunk_size must be at least 1, got {chunk_size}"
+            raise ValueError(xmsg)
+
+        if not path.exists():
+            xmsg = f"JSONC file not found: {path}"
+            raise FileNotFoundError(xmsg)
+
+        if not path.is_file():
+            xmsg = f"Expected a file: {path}"
+            raise ValueError(xmsg)
+
+        advance = ApatheticUtils_Internal_Files._advance_position
+        # Indexed by min(depth, 2)
+        stops = (
+            ApatheticUtils_Internal_Files._JSONC_OUTSIDE_STOP,
+            ApatheticUtils_Internal_Files._JSONC_ITEMS_STOP,
+            ApatheticUtils_Internal_Files._JSONC_NESTED_STOP,
+        )
+        stop = stops[0]
+        string_stop = ApatheticUtils_Internal_Files._JSONC_STRING_STOP
+        quote, apostrophe, slash, hash_mark, comma, open_array = b"\"'/#,["
+        code, string, line_comment, block_comment = range(4)
+        state = code
+        buf = bytearray()
+        pos = 0  # Scan position in buf
+        start = 0  # Start of the items not yet parsed, in buf
+        line = column = 1  # File position of buf[start]
+        depth = 0
+        closer = b""  # The root's closing bracket, once it is open
+        after_comma = 0  # End of the last top-level comma, in buf
+        # End of the top-level comma before it: unlike the last one, it is
+        # known not to be trailing (only what follows the last can tell)
+        cut = 0
+        pending = False  # Whole items between start and cut
+        first = True  # No batch taken from the root yet
+        taken = 0  # Items returned by _take_batch() so far
+        eof = False
+
+        def _take_batch(end: int, *, last: bool, tail: bytes = b"") -> list[Any]:
+            # Parse buf[start:end] wrapped in sentinel items standing in for
+            # its neighbours, so blanking and the decoder see the same context
+            # as in the whole file: '[0,' + items + ',0]' ('{"":0,' ... for
+            # objects). A batch that is not the last ends with its comma; the
+            # last one ends with `tail`, the file's closing bracket (if any).
+            nonlocal start, line, column, first, pending, taken
+            members = closer == b"}"
+            sentinel = b'"":0' if members else b"0"
+            head = (b"{" if members else b"[") + (b"" if first else sentinel + b",")
+            if not last:
+                tail = sentinel + closer
+            batch = bytearray(head)
+            with memoryview(buf) as view:
+                batch += view[start:end]
+            batch += tail
+            ApatheticUtils_Internal_Files._blank_jsonc(batch)
+            text = batch.decode("utf-8")
+            del batch
+            body = text[len(head) : len(text) - len(tail)]
+            rest = body.rstrip()[:-1].rstrip()
+            if not last and (not rest or rest.endswith(",")):
+                # The batch ends with an empty item, which is only valid as
+                # a trailing comma ('[1, /* c */,]', '[,]'): wait for what
+                # follows, so the error (if any) is where load_jsonc() has it
+                return []
+            items = ApatheticUtils_Internal_Files._parse_jsonc_batch(
+                text, path, line, column - len(head), members=members
+            )
+            line, column = advance(line, column, body)
+            start = end
+            lo = 0 if first else 1
+            first = pending = False
+            items = items[lo:] if last else items[lo:-1]
+            taken += len(items)
+            return items
+
+        def _whole_file() -> Generator[Any, None, None]:
+            # Something this scanner does not follow (see the docstring):
+            # parse the whole file as load_jsonc() does, so it reports the
+            # same error (or scalar root), and yield the items not yet taken.
+            # Blanking runs front to back, so those taken read the same.
+            read = ApatheticUtils_Internal_Files._read_file_buffer
+            data = ApatheticUtils_Internal_Files._parse_jsonc(read(path), path)
+            if isinstance(data, dict):
+                # Again for the (key, value) pairs, duplicate keys included
+                raw = read(path)
+                ApatheticUtils_Internal_Files._blank_jsonc(raw)
+                yield from ApatheticUtils_Internal_Files._parse_jsonc_batch(
+                    raw.decode("utf-8"), path, 1, 1, members=True
+                )[taken:]
+            elif data is not None:
+                yield from data[taken:]
+
+        with path.open("rb") as f:
+            while True:
+                # Find the next byte that matters; `resume` is where to scan
+                # from once more data is read if there is none
+                found = -1
+                if state == code:
+                    match = stop.search(buf, pos)
+                    resume = len(buf) if match is None else match.start()
+                    if match is not None and not (
+                        # A '/' may start a comment: its next byte is needed
+                        buf[resume] == slash and resume + 1 == len(buf) and not eof
+                    ):
+                        found = resume
+                elif state == string:
+                    match = string_stop.search(buf, pos)
+                    resume = len(buf) if match is None else match.start()
+                    if match is not None and buf[resume] == quote:
+                        pos = resume + 1
+                        state = code
+                        continue
+                    if match is not None and buf[resume] == apostrophe:
+                        # _blank_jsonc() ends the string here
+                        yield from _whole_file()
+                        return
+                    escaped = bytes(buf[resume + 1 : resume + 3])
+                    if escaped[:1] == b"\\" and escaped[1:] in (b'"', b"'"):
+                        # _blank_jsonc() keeps the string open here
+                        yield from _whole_file()
+                        return
+                    if escaped and (escaped != b"\\" or eof):
+                        pos = resume + 2  # An escape and the byte it escapes
+                        continue
+                elif state == line_comment:
+                    found = buf.find(b"\n", pos)
+                    resume = len(buf)
+                    if found >= 0:
+                        pos = found  # The newline itself is whitespace
+                        state = code
+                        continue
+                else:
+                    found = buf.find(b"*/", pos)
+                    resume = max(pos, len(buf) - 1)  # '*' may end the data
+                    if found >= 0:
+                        pos = found + 2
+                        state = code
+                        continue
+
+                if found < 0:
+                    pos = resume
+                    if eof:
+                        break
+                    # Hand over the complete items first
+                    if pending:
+                        yield from _take_batch(cut, last=False)
+                    if not depth and state == code:
+                        line, column = advance(
+                            line, column, buf[start:pos].decode("utf-8", "replace")
+                        )
+                        start = pos
+                    del buf[:start]
+                    pos -= start
+                    after_comma -= start
+                    cut -= start
+                    start = 0
+                    data = f.read(max(chunk_size, len(buf)))
+                    eof = not data
+                    buf += data
+                    continue
+
+                char = buf[found]
+                pos = found + 1
+                if char == slash:
+                    follow = buf[pos : pos + 1]
+                    if follow == b"*":
+                        state = block_comment
+                        pos += 1
+                    elif follow == b"/" and buf[found - 1 : found] != b":":
+                        state = line_comment
+                        pos += 1
+                    elif not depth:
+                        yield from _whole_file()
+                        return
+                elif char == hash_mark:
+                    state = line_comment
+                elif not depth and (char not in b"[{" or closer):
+                    # Outside the root, only whitespace and comments are allowed
+                    yield from _whole_file()
+                    return
+                elif char == quote:
+                    state = string
+                elif char == apostrophe:
+                    # A string for _blank_jsonc(), invalid JSON
+                    yield from _whole_file()
+                    return
+                elif char == comma:
+                    if after_comma > start:
+                        cut = after_comma
+                        pending = True
+                    after_comma = pos
+                elif char in b"[{":
+                    if not depth:
+                        closer = b"]" if char == open_array else b"}"
+                        line, column = advance(
+                            line, column, buf[start:pos].decode("utf-8", "replace")
+                        )
+                        start = pos
+                    depth += 1
+                    stop = stops[min(depth, 2)]
+                else:
+                    depth -= 1
+                    stop = stops[min(depth, 2)]
+                    if not depth:
+                        yield from _take_batch(
+                            found, last=True, tail=bytes(buf[found:pos])
+                        )
+                        column += 1  # The closing bracket
+                        start = pos
+
+        if depth:
+            # Let the decoder describe what the truncated root is missing. An
+            # unterminated block comment keeps its final character, which
+            # may close the root (as in load_jsonc()).
+            yield from _take_batch(len(buf), last=True)
+            if state != block_comment:
+                xmsg = f"Invalid JSONC syntax in {path}: Unexpected end of file"
+                raise ValueError(xmsg)
+        if state == block_comment:
+            yield from _whole_file()
+
+    # Loader picked by load_many(loader="auto") for each file suffix
+    _LOADER_SUFFIXES: ClassVar[dict[str, str]] = {
+        ".json": "jsonc",
+        ".jsonc": "jsonc",
+        ".toml": "toml",
+    }
+
+    @staticmethod
+    def _load_one(
+        path: Path, *, loader: str, cache: bool
+    ) -> ApatheticUtils_Internal_Files.LoadedFile:
+        """Load one file for load_many(), capturing the error if it fails."""
+        _files = ApatheticUtils_Internal_Files
+        kind = loader
+        if kind == "auto":
+            kind = ApatheticUtils_Internal_Files._LOADER_SUFFIXES.get(
+                path.suffix.lower(), ""
+            )
+        try:
+            if kind == "jsonc":
+                data = _files.load_jsonc(path, cache=cache)
+            elif kind == "toml":
+                data = _files.load_toml(path, required=True, cache=cache)
+            else:
+                xmsg = f"No loader for {path.suffix or 'files without a suffix'}"
+                raise ValueError(xmsg)  # noqa: TRY301
+        except (OSError, ValueError, RuntimeError) as e:
+            return _files.LoadedFile(path, error=e)
+        return _files.LoadedFile(path, data)
+
+    @staticmethod
+    def _load_chunk(
+        paths: list[Path], *, loader: str, cache: bool
+    ) -> list[ApatheticUtils_Internal_Files.LoadedFile]:
+        """Load one chunk of files (process-pool worker for load_many)."""
+        load_one = ApatheticUtils_Internal_Files._load_one
+        return [load_one(path, loader=loader, cache=cache) for path in paths]
+
+    @staticmethod
+    def load_many(
+        paths: Iterable[Path | str],
+        *,
+        loader: str = "auto",
+        workers: int | None = None,
+        processes: bool = False,
+        cache: bool = False,
+    ) -> list[ApatheticUtils_Internal_Files.LoadedFile]:
+        """Load many JSONC / TOML files, optionally in parallel.
+
+        Each file is loaded with load_jsonc() or load_toml() (the latter with
+        required=True). A file that fails to load does not stop the others:
+        its LoadedFile carries the exception instead of data.
+
+        Threads overlap the file reads, but parsing holds the GIL (tomllib is
+        pure Python); with `processes`, chunks of files are loaded in a
+        process pool instead, which also parallelizes parsing but pays for
+        starting the workers and pickling the results back. Either way at most
+        `workers` files are being loaded at a time.
+
+        Args:
+            paths: Files to load
+            loader: "jsonc", "toml", or "auto" to pick by suffix (.json and
+                .jsonc → jsonc, .toml → toml; any other suffix is an error
+                for that file)
+            workers: If > 1, load in a pool of this many threads (or
+                processes); None or 1 loads sequentially
+            processes: Use a process pool instead of threads
+            cache: Passed to the loaders (see parse_cache_info()); process
+                workers only share the on-disk cache (set_parse_cache_dir())
+
+        Returns:
+            One LoadedFile per input path, in input order
+
+        Raises:
+            ValueError: If `loader` is unknown or `workers` is less than 1
+        """
+        _files = ApatheticUtils_Internal_Files
+        if loader not in ("auto", "jsonc", "toml"):
+            xmsg = f"Unknown loader {loader!r}, expected 'auto', 'jsonc' or 'toml'"
+            raise ValueError(xmsg)
+        if workers is not None and workers < 1:
+            xmsg = f"workers must be at least 1, got {workers}"
+            raise ValueError(xmsg)
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        path_list = [Path(path) for path in paths]
+        load_one = partial(
+            ApatheticUtils_Internal_Files._load_one, loader=loader, cache=cache
+        )
+
+        if workers is None or workers == 1 or len(path_list) < 2:  # noqa: PLR2004
+            results = [load_one(path) for path in path_list]
+        elif processes:
+            results = ApatheticUtils_Internal_Shared.map_chunks_in_processes(
+                partial(
+                    ApatheticUtils_Internal_Files._load_chunk,
+                    loader=loader,
+                    cache=cache,
+                ),
+                path_list,
+                workers,
+            )
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="load_many"
+            ) as pool:
+                results = list(pool.map(load_one, path_list))
 
-        # narrow type
-        result = cast("dict[str, Any] | list[Any]", data)
         logger.trace(
-            f"[load_jsonc] Loaded {type(result).__name__} with"
-            f" {len(result) if hasattr(result, '__len__') else 'N/A'} items"
+            "[load_many] Loaded %d files, %d failed (workers=%s, processes=%s)",
+            len(results),
+            sum(not result.ok for result in results),
+            workers,
+            processes,
         )
-        return result
+        return results
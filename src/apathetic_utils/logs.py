@@ -0,0 +1,51 @@
+# src/apathetic_utils/logs.py
+"""Logger access helpers for hot paths."""
+
+from __future__ import annotations
+
+import logging
+
+from apathetic_logging import (
+    TRACE_LEVEL,
+    Logger,
+    getLogger,
+    getRegisteredLoggerName,
+)
+
+
+class ApatheticUtils_Internal_Logs:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides cheap logger access for hot paths.
+
+    getLogger() resolves the logger through the call stack and the logger
+    registry, which costs more than most of the functions that log. These
+    helpers look the logger up once and reuse it for as long as it is still
+    the registered logger name and the logging module still maps that name to
+    the same instance (a test fixture swapping the logger invalidates it).
+    """
+
+    _cached_logger: Logger | None = None
+
+    @staticmethod
+    def get_logger() -> Logger:
+        """Return the library logger, calling getLogger() only when needed."""
+        cached = ApatheticUtils_Internal_Logs._cached_logger
+        if (
+            cached is not None
+            and getRegisteredLoggerName() == cached.name
+            and logging.Logger.manager.loggerDict.get(cached.name) is cached
+        ):
+            return cached
+        logger = getLogger()
+        ApatheticUtils_Internal_Logs._cached_logger = logger
+        return logger
+
+    @staticmethod
+    def is_trace_enabled() -> bool:
+        """Return True if TRACE messages from the library logger would be emitted.
+
+        Logger.isEnabledFor() memoizes its answer per level and the logging
+        module clears that memo on every setLevel(), so the result always
+        follows level changes. Hot loops call this once and skip building
+        trace messages entirely when it is False.
+        """
+        return ApatheticUtils_Internal_Logs.get_logger().isEnabledFor(TRACE_LEVEL)
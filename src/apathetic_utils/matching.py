@@ -3,12 +3,18 @@
 
 from __future__ import annotations
 
+import os
 import re
-from fnmatch import fnmatchcase
-from functools import lru_cache
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from fnmatch import translate
+from functools import partial
 from pathlib import Path
 
-from apathetic_logging import getLogger
+from .caching import ApatheticUtils_Internal_Caching
+from .logs import ApatheticUtils_Internal_Logs
+from .paths import ApatheticUtils_Internal_Paths
+from .shared import ApatheticUtils_Internal_Shared
 
 
 class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -18,14 +24,160 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
     When mixed into apathetic_utils, it provides pattern matching methods.
     """
 
+    # Environment variable overriding the glob cache size at import time
+    GLOB_CACHE_SIZE_ENV_VAR = "APATHETIC_UTILS_GLOB_CACHE_SIZE"
+    DEFAULT_GLOB_CACHE_SIZE = 512
+
+    @dataclass(frozen=True)
+    class GlobCacheInfo:
+        """Statistics for the shared glob-compilation cache.
+
+        Returned by glob_cache_info(); mirrors functools' ``cache_info()`` with
+        an extra eviction count.
+        """
+
+        hits: int
+        misses: int
+        evictions: int
+        maxsize: int
+        currsize: int
+
+    class _GlobEntry:
+        """A glob cache entry: the pattern's fast-path form and its regex.
+
+        `kind` / `text` come from _classify_glob(); they describe
+        fnmatchcase_portable() semantics, so they are only read from entries
+        whose `recursive` flag is ``"**" in pattern``. The regex is compiled
+        on first use, so patterns answered by the fast path never compile one.
+        """
+
+        __slots__ = ("kind", "pattern", "recursive", "regex", "text")
+
+        def __init__(self, pattern: str, *, recursive: bool) -> None:
+            self.pattern = pattern
+            self.recursive = recursive
+            self.kind, self.text = ApatheticUtils_Internal_Matching._classify_glob(
+                pattern
+            )
+            self.regex: re.Pattern[str] | None = None
+
+        def compiled(self) -> re.Pattern[str]:
+            """Return the compiled regex, translating it on first use."""
+            if self.regex is None:
+                if self.recursive:
+                    source = ApatheticUtils_Internal_Matching._translate_glob_recursive(
+                        self.pattern
+                    )
+                else:
+                    source = translate(self.pattern)
+                # Two threads may both compile; either result is fine
+                self.regex = re.compile(source)
+            return self.regex
+
+    class _GlobCache(
+        ApatheticUtils_Internal_Caching.SizedLRU[tuple[bool, str], "_GlobEntry"]
+    ):
+        """Sized LRU of glob entries (see _GlobEntry), with statistics.
+
+        Keys are ``(recursive, pattern)``: recursive entries use the '**'
+        backport translator, the others fnmatch.translate(). Patterns
+        containing '**' always use the recursive translator, so
+        fnmatchcase_portable() and _compile_glob_recursive() share entries.
+        """
+
+        def get(
+            self, pattern: str, *, recursive: bool
+        ) -> ApatheticUtils_Internal_Matching._GlobEntry:
+            """Return the entry for `pattern`, classifying it on a miss."""
+            entry = self.lookup((recursive, pattern))
+            if entry is None:
+                entry = self.add(pattern, recursive=recursive)
+            return entry
+
+        def add(
+            self, pattern: str, *, recursive: bool
+        ) -> ApatheticUtils_Internal_Matching._GlobEntry:
+            """Classify `pattern` and store it (after a lookup() miss)."""
+            # Classify outside the lock
+            entry = ApatheticUtils_Internal_Matching._GlobEntry(
+                pattern, recursive=recursive
+            )
+            self.store((recursive, pattern), entry)
+            return entry
+
+    _glob_cache = _GlobCache(
+        _GlobCache.size_from_env(GLOB_CACHE_SIZE_ENV_VAR, DEFAULT_GLOB_CACHE_SIZE)
+    )
+
+    @staticmethod
+    def glob_cache_info() -> ApatheticUtils_Internal_Matching.GlobCacheInfo:
+        """Return hit / miss / eviction statistics for the glob cache.
+
+        The cache is shared by fnmatchcase_portable(), compile_glob_set(),
+        compile_excludes() and is_excluded_raw().
+        """
+        cache = ApatheticUtils_Internal_Matching._glob_cache
+        with cache.lock:
+            return ApatheticUtils_Internal_Matching.GlobCacheInfo(
+                hits=cache.hits,
+                misses=cache.misses,
+                evictions=cache.evictions,
+                maxsize=cache.maxsize,
+                currsize=len(cache.entries),
+            )
+
+    @staticmethod
+    def set_glob_cache_size(maxsize: int) -> None:
+        """Resize the glob cache, evicting least-recently-used entries.
+
+        The initial size is 512, or the value of the
+        APATHETIC_UTILS_GLOB_CACHE_SIZE environment variable at import time.
+
+        Args:
+            maxsize: Maximum number of patterns to keep; 0 disables
+                caching
+
+        Raises:
+            ValueError: If `maxsize` is negative
+        """
+        if maxsize < 0:
+            xmsg = f"Glob cache size must be >= 0, got {maxsize}"
+            raise ValueError(xmsg)
+        ApatheticUtils_Internal_Matching._glob_cache.resize(maxsize)
+
+    @staticmethod
+    def clear_glob_cache() -> None:
+        """Drop all cached patterns and reset the glob cache statistics."""
+        ApatheticUtils_Internal_Matching._glob_cache.clear()
+
     @staticmethod
-    @lru_cache(maxsize=512)
     def _compile_glob_recursive(pattern: str) -> re.Pattern[str]:
         """
         Compile a glob pattern to regex, backporting recursive '**' on Python < 3.11.
+        See _translate_glob_recursive() for the translation rules.
+        Always case-sensitive. Cached in the shared glob cache.
+        """
+        return ApatheticUtils_Internal_Matching._glob_cache.get(
+            pattern, recursive=True
+        ).compiled()
+
+    @staticmethod
+    def _compile_glob(pattern: str) -> re.Pattern[str]:
+        """Compile a glob with fnmatchcase_portable() semantics (cached).
+
+        '**' patterns use the recursive backport translator; everything else
+        uses fnmatch.translate(), like fnmatchcase() would.
+        """
+        return ApatheticUtils_Internal_Matching._glob_cache.get(
+            pattern, recursive="**" in pattern
+        ).compiled()
+
+    @staticmethod
+    def _translate_glob_recursive(pattern: str) -> str:
+        """
+        Translate a glob pattern to regex source, backporting recursive '**'.
         This translator handles literals, ?, *, **, and [] classes without relying on
         slicing fnmatch.translate() output, avoiding unbalanced parentheses.
-        Always case-sensitive.
         """
 
         def _escape_lit(ch: str) -> str:
@@ -88,15 +240,48 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
             i += 1
 
         inner = "".join(pieces)
-        return re.compile(f"(?s:{inner})\\Z")
+        return f"(?s:{inner})\\Z"
+
+    @staticmethod
+    def _classify_glob(pattern: str) -> tuple[str, str]:  # noqa: PLR0911
+        """
+        Classify a glob into a form that can be matched without a regex.
+
+        Returns (kind, text) where kind is one of:
+          "literal" - no glob chars: path == text
+          "suffix"  - '*x' / '**x': path.endswith(text)
+          "prefix"  - 'x*' / 'x**': path.startswith(text)
+          "any"     - only '*' characters: matches everything
+          "regex"   - anything else ('?', '[]', inner '*'); text is the pattern
+
+        The simple forms only arise where a star run translates to '.*' under
+        both fnmatch and the '**' backport, so results are identical to the
+        regex path. Results are kept in the glob cache entries (see
+        _GlobEntry).
+        """
+        if "?" in pattern or "[" in pattern:
+            return ("regex", pattern)
+        if "*" not in pattern:
+            return ("literal", pattern)
+        body = pattern.strip("*")
+        if not body:
+            return ("any", "")
+        # A star inside the body means a single '*' next to a '**' run, or a
+        # glob in the middle: both need the real translator.
+        if "*" in body or (pattern[0] == "*" and pattern[-1] == "*"):
+            return ("regex", pattern)
+        if pattern[-1] == "*":
+            return ("prefix", body)
+        return ("suffix", body)
 
     @staticmethod
     def fnmatchcase_portable(path: str, pattern: str) -> bool:
         """
         Case-sensitive glob pattern matching with Python 3.10 '**' backport.
 
-        Uses fnmatchcase (case-sensitive) as the base, with backported support
-        for recursive '**' patterns on Python 3.10.
+        Uses fnmatchcase semantics (case-sensitive) as the base, with backported
+        support for recursive '**' patterns on Python 3.10. Compiled patterns
+        live in the shared glob cache (see glob_cache_info()).
 
         Args:
             path: The path to match against the pattern
@@ -105,20 +290,241 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
         Returns:
             True if the path matches the pattern, False otherwise.
         """
-        # Always use backport for ** patterns since fnmatchcase doesn't support **
-        if "**" in pattern:
-            return bool(
-                ApatheticUtils_Internal_Matching._compile_glob_recursive(pattern).match(
-                    path
+        # '**' patterns use the backport translator since fnmatchcase doesn't
+        # support **
+        recursive = "**" in pattern
+        cache = ApatheticUtils_Internal_Matching._glob_cache
+        # lookup() / add() rather than get(): on this hot path a hit should
+        # cost a single call
+        entry = cache.lookup((recursive, pattern))
+        if entry is None:
+            entry = cache.add(pattern, recursive=recursive)
+        kind = entry.kind
+        if kind == "literal":
+            return path == entry.text
+        if kind == "suffix":
+            return path.endswith(entry.text)
+        if kind == "prefix":
+            return path.startswith(entry.text)
+        if kind == "any":
+            return True
+
+        # Everything else needs the regex
+        return entry.compiled().match(path) is not None
+
+    @dataclass(frozen=True)
+    class GlobSet:
+        """A set of glob patterns compiled for matching in a single pass.
+
+        Built by compile_glob_set(). Literal, pure-suffix ('*.ext', '**/name')
+        and pure-prefix ('dir/**') patterns are answered with dict lookups and
+        str.endswith / str.startswith on tuples. The remaining patterns are
+        joined into one alternation regex where each becomes a named group
+        (``p<index>``), so one ``re.match`` both tests them all and reports
+        which one matched. Per-pattern semantics are those of
+        fnmatchcase_portable().
+        """
+
+        patterns: tuple[str, ...]
+        labels: tuple[str, ...]
+        regex: re.Pattern[str] | None
+        literals: dict[str, int] = field(default_factory=dict, compare=False)
+        suffixes: tuple[str, ...] = ()
+        suffix_indices: tuple[int, ...] = ()
+        prefixes: tuple[str, ...] = ()
+        prefix_indices: tuple[int, ...] = ()
+        any_index: int | None = None
+        regex_first_index: int = 0
+
+        def match(self, path: str) -> str | None:
+            """Return the label of the first pattern matching `path`, or None."""
+            # Indices follow input order, so the smallest hit is the first match
+            best = self.literals.get(path, len(self.patterns))
+            if self.any_index is not None:
+                best = min(best, self.any_index)
+            if path.endswith(self.suffixes):
+                best = min(
+                    best,
+                    next(
+                        i
+                        for s, i in zip(self.suffixes, self.suffix_indices, strict=True)
+                        if path.endswith(s)
+                    ),
+                )
+            if path.startswith(self.prefixes):
+                best = min(
+                    best,
+                    next(
+                        i
+                        for s, i in zip(self.prefixes, self.prefix_indices, strict=True)
+                        if path.startswith(s)
+                    ),
                 )
+            if self.regex is not None and self.regex_first_index < best:
+                m = self.regex.match(path)
+                if m is not None and m.lastgroup is not None:
+                    best = min(best, int(m.lastgroup[1:]))
+            if best == len(self.patterns):
+                return None
+            return self.labels[best]
+
+        def is_match(self, path: str) -> bool:
+            """Return True if any pattern in the set matches `path`."""
+            return (
+                path in self.literals
+                or self.any_index is not None
+                or path.endswith(self.suffixes)
+                or path.startswith(self.prefixes)
+                or (self.regex is not None and self.regex.match(path) is not None)
             )
-        return fnmatchcase(path, pattern)
+
+    @staticmethod
+    def compile_glob_set(
+        patterns: Iterable[str],
+        *,
+        labels: Iterable[str] | None = None,
+    ) -> ApatheticUtils_Internal_Matching.GlobSet:
+        """Compile glob patterns into one combined matcher.
+
+        Simple patterns (literals, '*.ext', 'dir/**') are matched with string
+        operations; the rest share one combined regex. Matching a path against
+        the returned set costs at most a single ``re.match`` instead of one
+        scan per pattern. Duplicate patterns are merged, keeping the first
+        occurrence.
+
+        Args:
+            patterns: Glob patterns, matched like fnmatchcase_portable()
+            labels: Optional values reported by GlobSet.match() instead of the
+                pattern itself (parallel to `patterns`)
+
+        Returns:
+            GlobSet whose `.match(path)` returns the first matching label
+
+        Example:
+            globs = compile_glob_set(["*.pyc", "src/**/*.py"])
+            globs.match("src/pkg/mod.py")  # "src/**/*.py"
+        """
+        pattern_list = list(patterns)
+        label_list = pattern_list if labels is None else list(labels)
+        if len(label_list) != len(pattern_list):
+            xmsg = (
+                f"labels length ({len(label_list)}) does not match"
+                f" patterns length ({len(pattern_list)})"
+            )
+            raise ValueError(xmsg)
+
+        kept_patterns: list[str] = []
+        kept_labels: list[str] = []
+        seen: set[str] = set()
+        for pattern, label in zip(pattern_list, label_list, strict=True):
+            if pattern in seen:
+                continue
+            seen.add(pattern)
+            kept_patterns.append(pattern)
+            kept_labels.append(label)
+
+        literals: dict[str, int] = {}
+        suffixes: list[tuple[str, int]] = []
+        prefixes: list[tuple[str, int]] = []
+        any_index: int | None = None
+        regex_parts: list[str] = []
+        regex_first_index = len(kept_patterns)
+        for i, pattern in enumerate(kept_patterns):
+            entry = ApatheticUtils_Internal_Matching._glob_cache.get(
+                pattern, recursive="**" in pattern
+            )
+            kind, text = entry.kind, entry.text
+            if kind == "literal":
+                literals.setdefault(text, i)
+            elif kind == "suffix":
+                suffixes.append((text, i))
+            elif kind == "prefix":
+                prefixes.append((text, i))
+            elif kind == "any":
+                if any_index is None:
+                    any_index = i
+            else:
+                regex_first_index = min(regex_first_index, i)
+                # Group names carry the pattern index for GlobSet.match()
+                # Reuse the cached translation instead of translating again
+                source = entry.compiled().pattern
+                regex_parts.append(f"(?P<p{i}>{source})")
+
+        # Each translated glob is already anchored with \Z inside its group,
+        # so the alternation as a whole needs no extra anchoring.
+        regex = re.compile("|".join(regex_parts)) if regex_parts else None
+
+        return ApatheticUtils_Internal_Matching.GlobSet(
+            patterns=tuple(kept_patterns),
+            labels=tuple(kept_labels),
+            regex=regex,
+            literals=literals,
+            suffixes=tuple(text for text, _ in suffixes),
+            suffix_indices=tuple(i for _, i in suffixes),
+            prefixes=tuple(text for text, _ in prefixes),
+            prefix_indices=tuple(i for _, i in prefixes),
+            any_index=any_index,
+            regex_first_index=regex_first_index,
+        )
+
+    @staticmethod
+    def _absolute_path(path: Path, *, lexical: bool) -> Path:
+        """Make `path` absolute and normalized.
+
+        By default this is resolve_path() (follows symlinks, touches the disk,
+        memoized inside resolve_cache()). With `lexical`, '.' / '..' and
+        redundant separators are collapsed purely as strings (os.path.abspath),
+        with no syscalls.
+        """
+        if lexical:
+            return Path(os.path.abspath(path))  # noqa: PTH100
+        return ApatheticUtils_Internal_Paths.resolve_path(path)
+
+    @staticmethod
+    def _resolve_parent_pattern(pat: str, root: Path, *, lexical: bool = False) -> str:
+        """Resolve a pattern containing '../' against the exclude root.
+
+        Glob patterns are split at the first glob character; only the literal
+        base is resolved so the glob part is preserved. The result uses '/'
+        separators and is meant to be matched against absolute paths.
+
+        With `lexical`, the base is normalized without touching the disk.
+
+        Raises:
+            ValueError, RuntimeError: If the base cannot be resolved
+        """
+        _absolute_path = ApatheticUtils_Internal_Matching._absolute_path
+
+        # If pattern contains glob chars, split and resolve carefully
+        if "*" in pat or "?" in pat or "[" in pat:
+            # Find the first glob character to split base from pattern
+            glob_chars = ["*", "?", "["]
+            first_glob_pos = min(
+                (pat.find(c) for c in glob_chars if c in pat),
+                default=len(pat),
+            )
+
+            # Split into base path (before glob) and pattern part
+            base_part = pat[:first_glob_pos].rstrip("/")
+            pattern_part = pat[first_glob_pos:]
+
+            # Resolve the base part relative to root
+            if base_part:
+                resolved_base = _absolute_path(root / base_part, lexical=lexical)
+                return str(resolved_base).replace("\\", "/") + "/" + pattern_part
+            # Pattern starts with glob, resolve root and prepend pattern
+            return str(root).replace("\\", "/") + "/" + pattern_part
+
+        # No glob chars, resolve normally
+        return str(_absolute_path(root / pat, lexical=lexical)).replace("\\", "/")
 
     @staticmethod
     def is_excluded_raw(  # noqa: PLR0911, PLR0912, PLR0915, C901
         path: Path | str,
         exclude_patterns: list[str],
         root: Path | str,
+        *,
+        lexical: bool = False,
     ) -> bool:
         """Smart matcher for normalized inputs.
 
@@ -134,20 +540,31 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
         are resolved relative to the exclude root, then matched against
         the absolute file path.
 
+        Lexical mode (`lexical=True`):
+        Paths and the root are made absolute with os.path.abspath() instead of
+        Path.resolve(), so no per-path lstat/readlink syscalls are made (only
+        the root is checked for existence / being a file). Results are the
+        same on symlink-free trees; with symlinks, 'link/..' is collapsed
+        textually and links are not followed.
+
         Note:
             The function does not require `root` to exist; if it does not,
             a debug message is logged and matching is purely path-based.
         """
         _matching = ApatheticUtils_Internal_Matching
+        _absolute_path = ApatheticUtils_Internal_Matching._absolute_path
 
-        logger = getLogger()
-        root = Path(root).resolve()
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        trace = ApatheticUtils_Internal_Logs.is_trace_enabled()
+        root = _absolute_path(Path(root), lexical=lexical)
         path = Path(path)
 
-        logger.trace(
-            f"[is_excluded_raw] Checking path={path} against"
-            f" {len(exclude_patterns)} patterns"
-        )
+        if trace:
+            logger.trace(
+                "[is_excluded_raw] Checking path=%s against %d patterns",
+                path,
+                len(exclude_patterns),
+            )
 
         # the callee really should deal with this, otherwise we might spam
         if not Path(root).exists():
@@ -157,7 +574,7 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
         if root.is_file():
             # If the given path resolves exactly to that file, exclude it.
             full_path = path if path.is_absolute() else (root.parent / path)
-            return full_path.resolve() == root.resolve()
+            return _absolute_path(full_path, lexical=lexical) == root
 
         # If no exclude patterns, nothing else to exclude
         if not exclude_patterns:
@@ -165,7 +582,7 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
 
         # Otherwise, treat as directory root.
         full_path = path if path.is_absolute() else (root / path)
-        full_path = full_path.resolve()
+        full_path = _absolute_path(full_path, lexical=lexical)
 
         # Try to get relative path for standard matching
         try:
@@ -195,8 +612,9 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
                 pattern_suffix = pat[3:]  # Remove "**/" prefix
                 if _matching.fnmatchcase_portable(file_name, pattern_suffix):
                     logger.trace(
-                        f"[is_excluded_raw] MATCHED **/ pattern {pattern!r} "
-                        f"against filename {file_name}"
+                        "[is_excluded_raw] MATCHED **/ pattern %r against filename %s",
+                        pattern,
+                        file_name,
                     )
                     return True
 
@@ -209,8 +627,9 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
                 has_dir_sep = "/" in pattern_suffix or "\\" in pattern_suffix
                 if has_dir_sep and _matching.fnmatchcase_portable(abs_path_str, pat):
                     logger.trace(
-                        f"[is_excluded_raw] MATCHED **/ pattern {pattern!r} "
-                        f"against absolute path"
+                        "[is_excluded_raw] MATCHED **/ pattern %r against absolute"
+                        " path",
+                        pattern,
                     )
                     return True
 
@@ -221,56 +640,28 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
             # Handle patterns with ../ - serger-specific behavior to allow
             # patterns that explicitly navigate outside the exclude root
             if "../" in pat or pat.startswith("../"):
-                # Resolve the pattern relative to the exclude root
-                # We need to handle glob patterns (with **) by resolving the base
-                # path and preserving the glob part
                 try:
                     abs_path_str = str(full_path).replace("\\", "/")
-
-                    # If pattern contains glob chars, split and resolve carefully
-                    if "*" in pat or "?" in pat or "[" in pat:
-                        # Find the first glob character to split base from pattern
-                        glob_chars = ["*", "?", "["]
-                        first_glob_pos = min(
-                            (pat.find(c) for c in glob_chars if c in pat),
-                            default=len(pat),
+                    resolved_pattern_str = (
+                        ApatheticUtils_Internal_Matching._resolve_parent_pattern(
+                            pat, root, lexical=lexical
                         )
-
-                        # Split into base path (before glob) and pattern part
-                        base_part = pat[:first_glob_pos].rstrip("/")
-                        pattern_part = pat[first_glob_pos:]
-
-                        # Resolve the base part relative to root
-                        if base_part:
-                            resolved_base = (root / base_part).resolve()
-                            resolved_pattern_str = (
-                                str(resolved_base).replace("\\", "/")
-                                + "/"
-                                + pattern_part
-                            )
-                        else:
-                            # Pattern starts with glob, resolve root and prepend pattern
-                            resolved_pattern_str = (
-                                str(root).replace("\\", "/") + "/" + pattern_part
-                            )
-                    else:
-                        # No glob chars, resolve normally
-                        resolved_pattern = (root / pat).resolve()
-                        resolved_pattern_str = str(resolved_pattern).replace("\\", "/")
+                    )
 
                     # Match the resolved pattern against the absolute file path
                     if _matching.fnmatchcase_portable(
                         abs_path_str, resolved_pattern_str
                     ):
                         logger.trace(
-                            f"[is_excluded_raw] MATCHED ../ pattern {pattern!r} "
-                            f"(resolved to {resolved_pattern_str})"
+                            "[is_excluded_raw] MATCHED ../ pattern %r (resolved to %s)",
+                            pattern,
+                            resolved_pattern_str,
                         )
                         return True
                 except (ValueError, RuntimeError):
                     # Pattern resolves outside filesystem or invalid, skip
                     logger.trace(
-                        f"[is_excluded_raw] Could not resolve ../ pattern {pattern!r}"
+                        "[is_excluded_raw] Could not resolve ../ pattern %r", pattern
                     )
 
             # If path is outside root and pattern doesn't start with **/ or
@@ -278,7 +669,10 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
             if path_outside_root:
                 continue
 
-            logger.trace(f"[is_excluded_raw] Testing pattern {pattern!r} against {rel}")
+            if trace:
+                logger.trace(
+                    "[is_excluded_raw] Testing pattern %r against %s", pattern, rel
+                )
 
             # If pattern is absolute and under root, adjust to relative form
             if pat.startswith(str(root)):
@@ -287,17 +681,356 @@ class ApatheticUtils_Internal_Matching:  # noqa: N801  # pyright: ignore[reportU
                 except ValueError:
                     pat_rel = pat  # not under root; treat as-is
                 if _matching.fnmatchcase_portable(rel, pat_rel):
-                    logger.trace(f"[is_excluded_raw] MATCHED pattern {pattern!r}")
+                    logger.trace("[is_excluded_raw] MATCHED pattern %r", pattern)
                     return True
 
             # Otherwise treat pattern as relative glob
             if _matching.fnmatchcase_portable(rel, pat):
-                logger.trace(f"[is_excluded_raw] MATCHED pattern {pattern!r}")
+                logger.trace("[is_excluded_raw] MATCHED pattern %r", pattern)
                 return True
 
             # Optional directory-only semantics
             if pat.endswith("/") and rel.startswith(pat.rstrip("/") + "/"):
-                logger.trace(f"[is_excluded_raw] MATCHED pattern {pattern!r}")
+                logger.trace("[is_excluded_raw] MATCHED pattern %r", pattern)
                 return True
 
         return False
+
+    @dataclass(frozen=True)
+    class CompiledExcludes:
+        """Exclude patterns pre-classified and bound to a resolved root.
+
+        Built by compile_excludes(). Matching has the same semantics as
+        is_excluded_raw(), but separator normalization, pattern classification
+        and all root / '../' resolution happen once at compile time.
+
+        Pattern groups (GlobSets are labelled with the original pattern):
+            name_globs: '**/x' suffixes, matched against the file name
+            abs_globs: matched against the absolute path, even outside root
+            inside_abs_globs: matched against the absolute path, inside root only
+            rel_globs: matched against the root-relative path
+            dir_prefixes: ``(original_pattern, 'foo/')`` directory-only prefixes
+
+        The ``dir_*`` GlobSets hold, per group, the patterns (and their parents,
+        for 'x/**' / 'x/*') whose match on a directory guarantees a match on
+        everything beneath it; is_dir_excluded() uses them to prune walks.
+        """
+
+        root: Path
+        root_is_file: bool
+        patterns: tuple[str, ...]
+        name_globs: ApatheticUtils_Internal_Matching.GlobSet
+        abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        inside_abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        rel_globs: ApatheticUtils_Internal_Matching.GlobSet
+        dir_prefixes: tuple[tuple[str, str], ...]
+        dir_abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        dir_inside_abs_globs: ApatheticUtils_Internal_Matching.GlobSet
+        dir_rel_globs: ApatheticUtils_Internal_Matching.GlobSet
+        lexical: bool = False
+
+        def _full_path(self, path: Path, base: Path) -> Path:
+            """Absolute, normalized form of `path` (relative paths join `base`)."""
+            full_path = path if path.is_absolute() else (base / path)
+            return ApatheticUtils_Internal_Matching._absolute_path(
+                full_path, lexical=self.lexical
+            )
+
+        def is_excluded(self, path: Path | str) -> bool:
+            """Return True if `path` matches any compiled exclude pattern."""
+            return self.match(path) is not None
+
+        def is_dir_excluded(self, path: Path | str) -> bool:  # noqa: PLR0911
+            """Return True if every path beneath directory `path` is excluded.
+
+            This is conservative: False means "might contain included paths",
+            so a walker must descend. The root itself is never reported.
+            """
+            if self.root_is_file or not self.patterns:
+                return False
+
+            full_path = self._full_path(Path(path), self.root)
+
+            abs_path_str = str(full_path).replace("\\", "/")
+            if self.dir_abs_globs.is_match(abs_path_str):
+                return True
+
+            try:
+                rel = str(full_path.relative_to(self.root)).replace("\\", "/")
+            except ValueError:
+                return False
+            if rel == ".":
+                return False
+
+            if self.dir_inside_abs_globs.is_match(
+                abs_path_str
+            ) or self.dir_rel_globs.is_match(rel):
+                return True
+
+            rel_dir = rel + "/"
+            return any(rel_dir.startswith(prefix) for _, prefix in self.dir_prefixes)
+
+        def match(self, path: Path | str) -> str | None:  # noqa: PLR0911
+            """Return the exclude pattern that matched `path`, or None.
+
+            When the root itself is a file, a match returns the root path string.
+            """
+            path = Path(path)
+
+            # If the root itself is a file, treat that as a direct exclusion target.
+            if self.root_is_file:
+                if self._full_path(path, self.root.parent) == self.root:
+                    return str(self.root)
+                return None
+
+            if not self.patterns:
+                return None
+
+            full_path = self._full_path(path, self.root)
+
+            abs_path_str = str(full_path).replace("\\", "/")
+            matched = self.name_globs.match(full_path.name)
+            if matched is None:
+                matched = self.abs_globs.match(abs_path_str)
+            if matched is not None:
+                return matched
+
+            try:
+                rel = str(full_path.relative_to(self.root)).replace("\\", "/")
+            except ValueError:
+                # Path lies outside the root; only the groups above apply
+                return None
+
+            matched = self.inside_abs_globs.match(abs_path_str)
+            if matched is None:
+                matched = self.rel_globs.match(rel)
+            if matched is not None:
+                return matched
+
+            for original, prefix in self.dir_prefixes:
+                if rel.startswith(prefix):
+                    return original
+
+            return None
+
+    @staticmethod
+    def _dir_exclude_forms(pattern: str) -> list[str]:
+        """Return globs that, matching a directory, match everything beneath it.
+
+        Only patterns ending in a '.*' star run qualify ('x**', 'x/**', or any
+        trailing '*' when fnmatch semantics apply): if such a pattern matches
+        a directory, the trailing '.*' also absorbs '/child'. For 'x/**' and
+        fnmatch 'x/*' the parent glob 'x' qualifies too.
+        """
+        tail = "**" if "**" in pattern else "*"
+        if not pattern.endswith(tail):
+            return []
+        forms = [pattern]
+        if pattern.endswith("/" + tail):
+            forms.append(pattern[: -len(tail) - 1])
+        return forms
+
+    @staticmethod
+    def compile_excludes(
+        exclude_patterns: Iterable[str],
+        root: Path | str,
+        *,
+        lexical: bool = False,
+    ) -> ApatheticUtils_Internal_Matching.CompiledExcludes:
+        """Compile exclude patterns into a reusable, immutable matcher.
+
+        Use this instead of calling is_excluded_raw() in a loop with the same
+        pattern list: the returned object's `.is_excluded(path)` has identical
+        semantics, but only pays the per-path cost.
+
+        The root is resolved, and checked for existence / being a file, once at
+        compile time rather than on every call.
+
+        Args:
+            exclude_patterns: Glob patterns to exclude (same forms as
+                is_excluded_raw(): relative, absolute, '**/' and '../')
+            root: Root directory (or file) the patterns are relative to
+            lexical: Normalize paths without touching the disk, like
+                is_excluded_raw(..., lexical=True)
+
+        Returns:
+            CompiledExcludes matcher bound to the resolved root
+
+        Example:
+            excludes = compile_excludes(["**/__pycache__/**", "dist/"], root)
+            files = [f for f in candidates if not excludes.is_excluded(f)]
+        """
+        _matching = ApatheticUtils_Internal_Matching
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        root = ApatheticUtils_Internal_Matching._absolute_path(
+            Path(root), lexical=lexical
+        )
+        patterns = tuple(exclude_patterns)
+
+        # the callee really should deal with this, otherwise we might spam
+        if not root.exists():
+            logger.debug("Exclusion root does not exist: %s", root)
+
+        root_str = str(root)
+        name_patterns: list[tuple[str, str]] = []
+        abs_patterns: list[tuple[str, str]] = []
+        inside_abs_patterns: list[tuple[str, str]] = []
+        rel_patterns: list[tuple[str, str]] = []
+        dir_prefixes: list[tuple[str, str]] = []
+
+        for pattern in patterns:
+            pat = pattern.replace("\\", "/")
+            double_star = pat.startswith("**/")
+
+            if double_star:
+                # Filename match, plus absolute-path match for suffixes with a
+                # directory separator (see is_excluded_raw for the rationale)
+                suffix = pat[3:]
+                name_patterns.append((pattern, suffix))
+                if "/" in suffix:
+                    abs_patterns.append((pattern, pat))
+
+            if "../" in pat:
+                try:
+                    resolved = ApatheticUtils_Internal_Matching._resolve_parent_pattern(
+                        pat, root, lexical=lexical
+                    )
+                except (ValueError, RuntimeError):
+                    logger.trace(
+                        "[compile_excludes] Could not resolve ../ pattern %r",
+                        pattern,
+                    )
+                else:
+                    # '**/' patterns skip '../' handling for paths outside root
+                    target = inside_abs_patterns if double_star else abs_patterns
+                    target.append((pattern, resolved))
+
+            # If pattern is absolute and under root, adjust to relative form
+            if pat.startswith(root_str):
+                try:
+                    pat_rel = str(Path(pat).relative_to(root)).replace("\\", "/")
+                except ValueError:
+                    pat_rel = pat  # not under root; treat as-is
+                rel_patterns.append((pattern, pat_rel))
+
+            # Otherwise treat pattern as relative glob
+            rel_patterns.append((pattern, pat))
+
+            # Optional directory-only semantics
+            if pat.endswith("/"):
+                dir_prefixes.append((pattern, pat.rstrip("/") + "/"))
+
+        logger.trace(
+            "[compile_excludes] Compiled %d patterns against root=%s",
+            len(patterns),
+            root,
+        )
+
+        def _globs(
+            pairs: list[tuple[str, str]],
+        ) -> ApatheticUtils_Internal_Matching.GlobSet:
+            return _matching.compile_glob_set(
+                [pat for _, pat in pairs], labels=[original for original, _ in pairs]
+            )
+
+        def _dir_globs(
+            pairs: list[tuple[str, str]],
+        ) -> ApatheticUtils_Internal_Matching.GlobSet:
+            return _globs(
+                [
+                    (original, form)
+                    for original, pat in pairs
+                    for form in ApatheticUtils_Internal_Matching._dir_exclude_forms(pat)
+                ]
+            )
+
+        return _matching.CompiledExcludes(
+            root=root,
+            root_is_file=root.is_file(),
+            patterns=patterns,
+            name_globs=_globs(name_patterns),
+            abs_globs=_globs(abs_patterns),
+            inside_abs_globs=_globs(inside_abs_patterns),
+            rel_globs=_globs(rel_patterns),
+            dir_prefixes=tuple(dir_prefixes),
+            dir_abs_globs=_dir_globs(abs_patterns),
+            dir_inside_abs_globs=_dir_globs(inside_abs_patterns),
+            dir_rel_globs=_dir_globs(rel_patterns),
+            lexical=lexical,
+        )
+
+    @staticmethod
+    def _excluded_chunk(
+        excludes: ApatheticUtils_Internal_Matching.CompiledExcludes,
+        paths: list[Path | str],
+    ) -> list[bool]:
+        """Check one chunk of paths (process-pool worker for is_excluded_many)."""
+        return [excludes.is_excluded(path) for path in paths]
+
+    @staticmethod
+    def is_excluded_many(
+        paths: Iterable[Path | str],
+        exclude_patterns: Iterable[str],
+        root: Path | str,
+        *,
+        workers: int | None = None,
+        lexical: bool = False,
+    ) -> list[bool]:
+        """Check many paths against the same exclude patterns in one call.
+
+        Same result as ``[is_excluded_raw(p, patterns, root) for p in paths]``,
+        but the root and patterns are resolved and compiled once (see
+        compile_excludes()), and per-path trace logging is only formatted
+        when TRACE is enabled.
+
+        Args:
+            paths: Paths to check (relative paths are relative to `root`)
+            exclude_patterns: Glob patterns to exclude
+            root: Root directory (or file) the patterns are relative to
+            workers: If > 1, split the paths into chunks checked in a process
+                pool of this size. Only worth it for very large inputs, since
+                the compiled matcher is pickled to every worker.
+            lexical: Normalize paths without touching the disk, like
+                is_excluded_raw(..., lexical=True)
+
+        Returns:
+            One bool per input path, in input order (True = excluded)
+
+        Raises:
+            ValueError: If `workers` is less than 1
+        """
+        if workers is not None and workers < 1:
+            xmsg = f"workers must be at least 1, got {workers}"
+            raise ValueError(xmsg)
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        excludes = ApatheticUtils_Internal_Matching.compile_excludes(
+            exclude_patterns, root, lexical=lexical
+        )
+        path_list = list(paths)
+
+        if workers is not None and workers > 1 and len(path_list) > 1:
+            results = ApatheticUtils_Internal_Shared.map_chunks_in_processes(
+                partial(ApatheticUtils_Internal_Matching._excluded_chunk, excludes),
+                path_list,
+                workers,
+            )
+            logger.trace(
+                "[is_excluded_many] %d of %d paths excluded (%d workers)",
+                sum(results),
+                len(results),
+                workers,
+            )
+            return results
+
+        if not ApatheticUtils_Internal_Logs.is_trace_enabled():
+            return [excludes.is_excluded(path) for path in path_list]
+
+        results = []
+        for path in path_list:
+            matched = excludes.match(path)
+            if matched is not None:
+                logger.trace("[is_excluded_many] %s excluded by %r", path, matched)
+            results.append(matched is not None)
+        return results
@@ -5,7 +5,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from apathetic_logging import getLogger
+from .logs import ApatheticUtils_Internal_Logs
+from .paths import ApatheticUtils_Internal_Paths
 
 
 class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -35,8 +36,9 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
         Returns:
             Path to the package root directory, or None if not found
         """
-        logger = getLogger()
-        file_path_resolved = file_path.resolve()
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        _resolve_path = ApatheticUtils_Internal_Paths.resolve_path
+        file_path_resolved = _resolve_path(file_path)
         current_dir = file_path_resolved.parent
         last_package_dir: Path | None = None
 
@@ -89,7 +91,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
         if source_bases and last_package_dir is None:
             for base_str in source_bases:
                 # base_str is already an absolute path
-                base_path = Path(base_str).resolve()
+                base_path = _resolve_path(base_str)
                 try:
                     # Check if file is under this base
                     rel_path = file_path_resolved.relative_to(base_path)
@@ -115,7 +117,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
         return last_package_dir
 
     @staticmethod
-    def detect_packages_from_files(  # noqa: C901, PLR0912, PLR0915
+    def detect_packages_from_files(
         file_paths: list[Path],
         package_name: str,
         *,
@@ -140,21 +142,43 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
             Tuple of (set of detected package names, list of parent directories).
             Package names always includes package_name. Parent directories are
             returned as absolute paths, deduplicated.
+
+        Paths are resolved through resolve_path() inside a resolve_cache()
+        scope, so each file and source base is resolved once per call (or once
+        per enclosing resolve_cache() block).
         """
-        logger = getLogger()
+        with ApatheticUtils_Internal_Paths.resolve_cache():
+            return ApatheticUtils_Internal_Modules._detect_packages_from_files(
+                file_paths, package_name, source_bases=source_bases
+            )
+
+    @staticmethod
+    def _detect_packages_from_files(  # noqa: C901, PLR0912, PLR0915
+        file_paths: list[Path],
+        package_name: str,
+        *,
+        source_bases: list[str] | None = None,
+    ) -> tuple[set[str], list[str]]:
+        """Implement detect_packages_from_files() inside a resolve_cache()."""
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        _resolve_path = ApatheticUtils_Internal_Paths.resolve_path
+        _find_package_root_for_file = (
+            ApatheticUtils_Internal_Modules._find_package_root_for_file
+        )
         detected: set[str] = set()
         parent_dirs: list[Path] = []
         seen_parents: set[Path] = set()
         # Track which packages were detected via source_bases
         # (for namespace package detection)
         detected_via_source_bases: set[str] = set()
+        # Package root of each file, reused by the namespace package pass
+        pkg_roots: dict[Path, Path | None] = {}
 
         # Detect packages from files
         for file_path in file_paths:
-            file_path_resolved = file_path.resolve()
-            pkg_root = ApatheticUtils_Internal_Modules._find_package_root_for_file(
-                file_path, source_bases=source_bases
-            )
+            file_path_resolved = _resolve_path(file_path)
+            pkg_root = _find_package_root_for_file(file_path, source_bases=source_bases)
+            pkg_roots[file_path] = pkg_root
             if pkg_root:
                 # Check if this package was detected via source_bases
                 # (by checking if file is under any source_base and no __init__.py)
@@ -162,7 +186,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
                 if source_bases:
                     # Check if file is under a source_base
                     for base_str in source_bases:
-                        base_path = Path(base_str).resolve()
+                        base_path = _resolve_path(base_str)
                         try:
                             rel_path = file_path_resolved.relative_to(base_path)
                             # If file is in a subdirectory of base, check __init__.py
@@ -186,7 +210,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
                 if detected_via_sb and source_bases:
                     # Find which base this file is under
                     for base_str in source_bases:
-                        base_path = Path(base_str).resolve()
+                        base_path = _resolve_path(base_str)
                         try:
                             rel_path = file_path_resolved.relative_to(base_path)
                             # Detect all directory levels between base and file
@@ -218,7 +242,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
                             continue
 
                 # Extract parent directory (module base)
-                parent_dir = pkg_root.parent.resolve()
+                parent_dir = _resolve_path(pkg_root.parent)
                 # Check if parent is filesystem root (parent of root equals root)
                 is_root = parent_dir.parent == parent_dir
                 if not is_root and parent_dir not in seen_parents:
@@ -263,7 +287,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
         source_bases_paths: set[Path] = set()
         if source_bases:
             for base_str in source_bases:
-                base_path = Path(base_str).resolve()
+                base_path = _resolve_path(base_str)
                 if base_path.exists() and base_path.is_dir():
                     source_bases_paths.add(base_path)
 
@@ -273,17 +297,14 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
         if source_bases:
             checked_parents: set[Path] = set()
             for file_path in file_paths:
-                file_path_resolved = file_path.resolve()
-                pkg_root = ApatheticUtils_Internal_Modules._find_package_root_for_file(
-                    file_path, source_bases=source_bases
-                )
+                pkg_root = pkg_roots[file_path]
                 if pkg_root:
                     pkg_name = pkg_root.name
                     # Only check parents if this package was detected via source_bases
                     if pkg_name not in detected_via_source_bases:
                         continue
 
-                    pkg_parent = pkg_root.parent.resolve()
+                    pkg_parent = _resolve_path(pkg_root.parent)
                     # Skip if we've already checked this parent
                     if pkg_parent in checked_parents:
                         continue
@@ -300,7 +321,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
                         not parent_name
                         or parent_name in detected
                         or parent_name == package_name
-                        or (common_root and pkg_parent == common_root.resolve())
+                        or (common_root and pkg_parent == _resolve_path(common_root))
                         or pkg_parent in source_bases_paths
                     ):
                         logger.trace(
@@ -310,7 +331,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
                             parent_name,
                             parent_name in detected,
                             parent_name == package_name,
-                            common_root and pkg_parent == common_root.resolve(),
+                            common_root and pkg_parent == _resolve_path(common_root),
                             pkg_parent in source_bases_paths,
                         )
                         continue
@@ -364,7 +385,7 @@ class ApatheticUtils_Internal_Modules:  # noqa: N801  # pyright: ignore[reportUn
         """
         detected: set[str] = set()
 
-        root_path = root_path.resolve()
+        root_path = ApatheticUtils_Internal_Paths.resolve_path(root_path)
         if not root_path.exists():
             return detected
 
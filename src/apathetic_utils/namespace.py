@@ -16,6 +16,9 @@ from .constants import (
 from .files import (
     ApatheticUtils_Internal_Files,
 )
+from .logs import (
+    ApatheticUtils_Internal_Logs,
+)
 from .matching import (
     ApatheticUtils_Internal_Matching,
 )
@@ -43,6 +46,9 @@ from .types import (
 from .version import (
     ApatheticUtils_Internal_Version,
 )
+from .walk import (
+    ApatheticUtils_Internal_Walk,
+)
 
 
 # --- Apathetic Utils Namespace -------------------------------------------
@@ -52,6 +58,7 @@ class apathetic_utils(  # noqa: N801
     ApatheticUtils_Internal_Constants,
     ApatheticUtils_Internal_CI,
     ApatheticUtils_Internal_Files,
+    ApatheticUtils_Internal_Logs,
     ApatheticUtils_Internal_Matching,
     ApatheticUtils_Internal_Modules,
     ApatheticUtils_Internal_Paths,
@@ -61,6 +68,7 @@ class apathetic_utils(  # noqa: N801
     ApatheticUtils_Internal_Text,
     ApatheticUtils_Internal_Types,
     ApatheticUtils_Internal_Version,
+    ApatheticUtils_Internal_Walk,
 ):
     """Namespace for apathetic utils functionality.
 
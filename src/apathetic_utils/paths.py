@@ -3,11 +3,15 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from itertools import zip_longest
 from pathlib import Path
 
-from apathetic_logging import getLogger
+from .logs import ApatheticUtils_Internal_Logs
 
 
 class ApatheticUtils_Internal_Paths:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -17,6 +21,84 @@ class ApatheticUtils_Internal_Paths:  # noqa: N801  # pyright: ignore[reportUnus
     When mixed into apathetic_utils, it provides path manipulation methods.
     """
 
+    class ResolveCache:
+        """Memoized Path.resolve() results for one resolve_cache() scope.
+
+        Relative paths resolve against the current directory, so it is part of
+        their key. Entries are never refreshed: the scope assumes the paths it
+        resolves (and the symlinks along them) do not change while it is open.
+        """
+
+        def __init__(self) -> None:
+            self.entries: dict[tuple[str, Path], Path] = {}
+            self.hits = 0
+            self.misses = 0
+
+        def resolve(self, path: Path) -> Path:
+            """Return ``path.resolve()``, resolving each distinct path once."""
+            key = ("" if path.is_absolute() else os.getcwd(), path)  # noqa: PTH109
+            resolved = self.entries.get(key)
+            if resolved is not None:
+                self.hits += 1
+                return resolved
+            self.misses += 1
+            resolved = path.resolve()
+            self.entries[key] = resolved
+            return resolved
+
+    # Cache of the innermost resolve_cache() scope (per thread / async task)
+    _resolve_cache_var: ContextVar[
+        ApatheticUtils_Internal_Paths.ResolveCache | None
+    ] = ContextVar("apathetic_utils_resolve_cache", default=None)
+
+    @staticmethod
+    @contextmanager
+    def resolve_cache() -> Iterator[ApatheticUtils_Internal_Paths.ResolveCache]:
+        """Memoize resolve_path() for the duration of a `with` block.
+
+        Inside the block, resolve_path() (and everything built on it:
+        is_excluded_raw(), compile_excludes(), detect_packages_from_files(),
+        find_all_packages_under_path(), shorten_path(), iter_included_files())
+        resolves each distinct path once. The cache is dropped when the
+        outermost block exits; nested blocks share the outer cache.
+
+        The scope is bound to the current thread (or async task), so worker
+        threads and processes started inside it resolve uncached.
+
+        Example:
+            with resolve_cache() as cache:
+                packages, bases = detect_packages_from_files(files, "app")
+                kept = [f for f in files if not is_excluded_raw(f, excludes, root)]
+            print(cache.hits, cache.misses)
+
+        Yields:
+            The active ResolveCache (with ``hits`` / ``misses`` counters)
+        """
+        var = ApatheticUtils_Internal_Paths._resolve_cache_var
+        active = var.get()
+        if active is not None:
+            yield active
+            return
+
+        cache = ApatheticUtils_Internal_Paths.ResolveCache()
+        token = var.set(cache)
+        try:
+            yield cache
+        finally:
+            var.reset(token)
+            cache.entries.clear()
+
+    @staticmethod
+    def resolve_path(path: str | Path) -> Path:
+        """Return ``Path(path).resolve()``, memoized inside resolve_cache().
+
+        Outside a resolve_cache() block this is exactly Path.resolve().
+        """
+        cache = ApatheticUtils_Internal_Paths._resolve_cache_var.get()
+        if cache is None:
+            return Path(path).resolve()
+        return cache.resolve(Path(path))
+
     @staticmethod
     def normalize_path_string(raw: str) -> str:
         r"""Normalize a user-supplied path string for cross-platform use.
@@ -32,7 +114,6 @@ class ApatheticUtils_Internal_Paths:  # noqa: N801  # pyright: ignore[reportUnus
         Git, Node.js, and Python build tools.
         This function is purely lexical — it normalizes syntax, not filesystem state.
         """
-        logger = getLogger()
         if not raw:
             return ""
 
@@ -41,16 +122,20 @@ class ApatheticUtils_Internal_Paths:  # noqa: N801  # pyright: ignore[reportUnus
         # Handle escaped spaces (common shell copy-paste)
         if "\\ " in path:
             fixed = path.replace("\\ ", " ")
-            logger.warning("Normalizing escaped spaces in path: %r → %s", path, fixed)
+            ApatheticUtils_Internal_Logs.get_logger().warning(
+                "Normalizing escaped spaces in path: %r → %s", path, fixed
+            )
             path = fixed
 
         # Normalize all backslashes to forward slashes
         path = path.replace("\\", "/")
 
         # Collapse redundant slashes (keep protocol //)
+        if "//" not in path:
+            return path
         collapsed_slashes = re.sub(r"(?<!:)//+", "/", path)
         if collapsed_slashes != path:
-            logger.trace(
+            ApatheticUtils_Internal_Logs.get_logger().trace(
                 "Collapsed redundant slashes: %r → %r", path, collapsed_slashes
             )
             path = collapsed_slashes
@@ -117,7 +202,8 @@ class ApatheticUtils_Internal_Paths:  # noqa: N801  # pyright: ignore[reportUnus
             Shortest path relative to common prefix, or absolute path if common
             prefix is only root
         """
-        p = Path(path).resolve()
+        _resolve_path = ApatheticUtils_Internal_Paths.resolve_path
+        p = _resolve_path(path)
 
         # Normalize bases to a list
         if isinstance(bases, (str, Path)):
@@ -128,7 +214,7 @@ class ApatheticUtils_Internal_Paths:  # noqa: N801  # pyright: ignore[reportUnus
         candidates: list[str] = []
 
         for base in bases_list:
-            b = Path(base).resolve()
+            b = _resolve_path(base)
 
             # Split both into parts and find the longest shared prefix
             common_len = 0
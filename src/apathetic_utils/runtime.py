@@ -3,23 +3,34 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
+import importlib.machinery
 import importlib.util
+import itertools
+import json
+import marshal
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
-import pytest
 from apathetic_logging import makeSafeTrace
 
+from .files import ApatheticUtils_Internal_Files
 from .modules import ApatheticUtils_Internal_Modules
+from .shared import ApatheticUtils_Internal_Shared
 from .subprocess_utils import ApatheticUtils_Internal_Subprocess
 
 
 if TYPE_CHECKING:
-    from types import ModuleType
+    from collections.abc import Iterator, Sequence
+    from types import CodeType, ModuleType
 
 
 class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -70,24 +81,298 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
                 return "stitched"
         return "package"
 
+    # Build manifests: "<output>.manifest.json" next to each built artifact
+    _BUILD_MANIFEST_SUFFIX = ".manifest.json"
+    _BUILD_MANIFEST_VERSION = 1
+    # Coarsest common timestamp granularity (FAT: 2 seconds); inputs modified
+    # this close to being recorded are always hashed (git's "racy clean")
+    _RACY_WINDOW_NS = 2_000_000_000
+
+    @staticmethod
+    def _scan_sources(src_dir: Path) -> Iterator[tuple[str, os.DirEntry[str]]]:
+        """Yield (posix path relative to `src_dir`, entry) for each source file.
+
+        Walks with os.scandir() so file types come from the directory read,
+        and prunes `__pycache__` and hidden directories instead of descending
+        into them. Symlinked directories are not followed (no cycles, and
+        no files from outside the tree). Bytecode files are skipped. Order is
+        unspecified.
+        """
+        stack = [("", str(src_dir))]
+        while stack:
+            prefix, dir_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name != "__pycache__" and not name.startswith("."):
+                        stack.append((prefix + name + "/", entry.path))
+                elif not name.endswith(".pyc") and entry.is_file():
+                    yield prefix + name, entry
+
+    @staticmethod
+    def _bundled_dependency_dirs(config_path: Path, root: Path) -> list[Path]:
+        """Return the installed packages a serger config stitches in.
+
+        Include patterns that do not start with a path under `root` (e.g.
+        `apathetic_logging/**/*.py`) are found by serger on sys.path. Their
+        directories are build inputs too, so upgrading or editing a bundled
+        dependency triggers a rebuild. Patterns under `root` are assumed to
+        be covered by the package's own source directory.
+        """
+        try:
+            config = ApatheticUtils_Internal_Files.load_jsonc(config_path)
+        except (OSError, ValueError):
+            return []  # Missing or broken: the bundler reports it
+        includes = config.get("include") if isinstance(config, dict) else None
+        if not isinstance(includes, list):
+            return []
+
+        dirs: list[Path] = []
+        for pattern in includes:
+            if not isinstance(pattern, str):
+                continue
+            head = pattern.replace("\\", "/").split("/", 1)[0]
+            # Glob characters are not identifiers; paths under root are local
+            if not head.isidentifier() or (root / head).exists():
+                continue
+            # PathFinder, not importlib.util.find_spec(): look at sys.path, not
+            # at whatever sys.modules holds (e.g. a stitched copy)
+            spec = importlib.machinery.PathFinder.find_spec(head)
+            if spec is not None and spec.submodule_search_locations:
+                dirs.extend(Path(p) for p in spec.submodule_search_locations)
+        return dirs
+
+    @staticmethod
+    def _build_inputs(source_dirs: list[Path], extra_inputs: list[Path]) -> list[Path]:
+        """Return the files a build reads: `source_dirs` (minus bytecode), extras.
+
+        Extra inputs (config files, bundler scripts) are listed even if they
+        do not exist, so creating one later is seen as a change.
+        """
+        sources = [
+            Path(entry.path)
+            for src_dir in source_dirs
+            for _, entry in ApatheticUtils_Internal_Runtime._scan_sources(src_dir)
+        ]
+        return sorted(sources) + extra_inputs
+
+    @staticmethod
+    def _build_fingerprint(path: Path, now_ns: int) -> dict[str, Any] | None:
+        """Return size, mtime and content hash of `path`, or None if missing."""
+        try:
+            data = path.read_bytes()
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        racy = now_ns - st.st_mtime_ns < ApatheticUtils_Internal_Runtime._RACY_WINDOW_NS
+        return {
+            "size": st.st_size,
+            # None: the mtime cannot vouch for the content, always hash
+            "mtime_ns": None if racy else st.st_mtime_ns,
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+
+    @staticmethod
+    def _build_fingerprint_matches(
+        path: Path | os.DirEntry[str], recorded: dict[str, Any] | None, now_ns: int
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Check `path` against its recorded fingerprint.
+
+        Returns whether the content is unchanged, and a fresher fingerprint to
+        record when it is unchanged but had to be hashed (None otherwise).
+        """
+        try:
+            st = path.stat()  # cached by DirEntry
+        except FileNotFoundError:
+            return recorded is None, None
+        if recorded is None or st.st_size != recorded["size"]:
+            return False, None
+        if st.st_mtime_ns == recorded["mtime_ns"]:
+            return True, None
+        # Touched (checkout, touch) or racy: compare the content
+        current = ApatheticUtils_Internal_Runtime._build_fingerprint(Path(path), now_ns)
+        if current is None or current["sha256"] != recorded["sha256"]:
+            return False, None
+        return True, current
+
+    @staticmethod
+    def _manifest_key(path: Path, root: Path) -> str:
+        """Return how a build manifest names `path` (relative to `root`)."""
+        try:
+            return path.relative_to(root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    @staticmethod
+    def _read_build_manifest(output_path: Path) -> dict[str, Any] | None:
+        """Return the manifest recorded for `output_path`, or None if unusable."""
+        manifest_path = output_path.with_name(
+            output_path.name + ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_SUFFIX
+        )
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version")
+            != ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_VERSION
+        ):
+            return None
+        return cast("dict[str, Any]", manifest)
+
+    @staticmethod
+    def _write_build_manifest(output_path: Path, manifest: dict[str, Any]) -> None:
+        """Atomically write the manifest for `output_path` (best effort)."""
+        manifest_path = output_path.with_name(
+            output_path.name + ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_SUFFIX
+        )
+        text = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+        # Without a manifest the next check just rebuilds
+        with suppress(OSError):
+            ApatheticUtils_Internal_Shared.write_atomic(
+                manifest_path, text.encode("utf-8")
+            )
+
+    @staticmethod
+    def _fingerprint_inputs(root: Path, inputs: list[Path]) -> dict[str, Any]:
+        """Return the manifest's `inputs` entry: a fingerprint per input file.
+
+        Taken before the bundler runs, so an input edited during the build
+        no longer matches its recorded fingerprint and the next check rebuilds.
+        """
+        now_ns = time.time_ns()
+        fingerprint = ApatheticUtils_Internal_Runtime._build_fingerprint
+        manifest_key = ApatheticUtils_Internal_Runtime._manifest_key
+        return {manifest_key(path, root): fingerprint(path, now_ns) for path in inputs}
+
+    @staticmethod
+    def _record_build(
+        output_path: Path, inputs: dict[str, Any], command: list[str]
+    ) -> None:
+        """Record what `output_path` was just built from (see _check_needs_rebuild).
+
+        `inputs` comes from _fingerprint_inputs(), called before the build.
+        """
+        manifest = {
+            "version": ApatheticUtils_Internal_Runtime._BUILD_MANIFEST_VERSION,
+            "command": command,
+            "output": ApatheticUtils_Internal_Runtime._build_fingerprint(
+                output_path, time.time_ns()
+            ),
+            "inputs": inputs,
+        }
+        ApatheticUtils_Internal_Runtime._write_build_manifest(output_path, manifest)
+
     @staticmethod
-    def _check_needs_rebuild(output_path: Path, src_dir: Path) -> bool:
+    def _check_needs_rebuild(
+        output_path: Path,
+        root: Path,
+        source_dirs: list[Path],
+        extra_inputs: list[Path],
+        command: list[str],
+        *,
+        refresh: bool = False,
+    ) -> bool:
         """Check if output file needs to be rebuilt.
 
+        Compares the build manifest written next to the output with the
+        current inputs: a rebuild is needed if the output or manifest is
+        missing, the bundler command differs, an input was added, removed or
+        changed content, or the output itself was modified. Files whose mtime
+        moved but whose content did not (git checkout, touch) do not count;
+        with `refresh`, their new mtime is recorded so the next check skips
+        hashing them.
+
+        Without `refresh` the check is read-only, so it is safe without
+        _build_lock(); a due refresh then also returns True, so the caller
+        takes the lock and checks again with `refresh=True`.
+
+        Sources are checked while `source_dirs` are being scanned (see
+        _scan_sources()), and the check stops at the first change found.
+
         Args:
             output_path: Path to the output file
-            src_dir: Directory containing source files to check
+            root: Project root directory (manifest paths are relative to it)
+            source_dirs: Package source directory, plus the directories of
+                bundled dependencies (see _build_inputs())
+            extra_inputs: Other files the build reads (see _build_inputs())
+            command: Bundler command line, as recorded by _record_build()
+            refresh: Write refreshed mtimes to the manifest (hold _build_lock())
 
         Returns:
-            True if rebuild is needed, False otherwise
+            True if rebuild (or, without `refresh`, a manifest refresh) is
+            needed, False otherwise
         """
-        if not output_path.exists():
+        manifest = ApatheticUtils_Internal_Runtime._read_build_manifest(output_path)
+        if manifest is None or manifest.get("command") != command:
             return True
-        output_mtime_ns = output_path.stat().st_mtime_ns
-        for src_file in src_dir.rglob("*.py"):
-            if src_file.stat().st_mtime_ns > output_mtime_ns:
+
+        recorded_inputs: dict[str, Any] = manifest.get("inputs") or {}
+        manifest_key = ApatheticUtils_Internal_Runtime._manifest_key
+        scan_sources = ApatheticUtils_Internal_Runtime._scan_sources
+        # Lazy: the scan stops as soon as a check fails
+        checks: Iterator[tuple[dict[str, Any], str, Path | os.DirEntry[str]]] = (
+            itertools.chain(
+                [(manifest, "output", output_path)],
+                (
+                    (recorded_inputs, f"{manifest_key(src_dir, root)}/{rel}", e)
+                    for src_dir in source_dirs
+                    for rel, e in scan_sources(src_dir)
+                ),
+                ((recorded_inputs, manifest_key(p, root), p) for p in extra_inputs),
+            )
+        )
+
+        now_ns = time.time_ns()
+        refreshed = False
+        seen_inputs = 0
+        for table, key, path in checks:
+            if table is recorded_inputs:
+                if key not in recorded_inputs:
+                    return True  # added
+                seen_inputs += 1
+            unchanged, fresher = (
+                ApatheticUtils_Internal_Runtime._build_fingerprint_matches(
+                    path, table.get(key), now_ns
+                )
+            )
+            if not unchanged:
                 return True
-        return False
+            if fresher is not None and fresher != table[key]:
+                table[key] = fresher
+                refreshed = True
+        if seen_inputs != len(recorded_inputs):
+            return True  # removed
+
+        if refreshed and refresh:
+            ApatheticUtils_Internal_Runtime._write_build_manifest(output_path, manifest)
+        # Up to date; a refresh still due needs the locked (writing) check
+        return refreshed and not refresh
+
+    @staticmethod
+    @contextmanager
+    def _build_lock(output_path: Path) -> Iterator[None]:
+        """Hold an exclusive cross-process lock for building `output_path`.
+
+        Uses `<output>.lock` next to the output (see file_lock()).
+        """
+        lock_path = output_path.with_name(output_path.name + ".lock")
+        with ApatheticUtils_Internal_Shared.file_lock(lock_path):
+            yield
+
+    @staticmethod
+    def _temp_build_path(output_path: Path) -> Path:
+        """Return where to build `output_path` before renaming it into place.
+
+        Only written while holding _build_lock(), so the name can be fixed.
+        """
+        return output_path.with_name(f".{output_path.stem}.tmp{output_path.suffix}")
 
     @staticmethod
     def _validate_build_output(output_path: Path, build_type: str) -> None:
@@ -106,20 +391,59 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
             msg = f"❌ Failed to generate {build_type}."
             raise RuntimeError(msg)
 
+    @staticmethod
+    def _print_build_status(message: str, output_prefix: str | None) -> None:
+        """Print a build status line, as `[<output_prefix>] <message>` if given."""
+        if output_prefix is not None:
+            message = f"[{output_prefix}] {message}"
+        print(message, flush=True)  # noqa: T201
+
+    @staticmethod
+    def _run_bundler(cmd: list[str], root: Path, output_prefix: str | None) -> None:
+        """Run a bundler command in `root`.
+
+        With `output_prefix`, stdout and stderr are merged and each line is
+        printed as `[<output_prefix>] <line>`, so concurrent builds stay
+        readable; otherwise the output goes straight to this process's streams.
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails
+        """
+        if output_prefix is None:
+            subprocess.run(cmd, check=True, cwd=root)  # noqa: S603
+            return
+        with subprocess.Popen(  # noqa: S603
+            cmd,
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        ) as proc:
+            for line in proc.stdout or ():
+                print(f"[{output_prefix}] {line}", end="", flush=True)  # noqa: T201
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
     @staticmethod
     def _run_bundler_script(
         root: Path,
         command_path: str | None,
         output_path: Path,
         build_type: str,
+        output_prefix: str | None = None,
     ) -> bool:
         """Run a custom bundler script if provided and exists.
 
+        The script writes `output_path` itself (it is not given a temporary
+        path), so unlike the serger / zipbundler builds this is not atomic.
+
         Args:
             root: Project root directory
             command_path: Optional path to bundler script (relative to root)
             output_path: Path to the expected output file
             build_type: Type of build (e.g., "stitched script", "zipapp")
+            output_prefix: Optional prefix for each output line (see _run_bundler())
 
         Returns:
             True if bundler script was run successfully,
@@ -132,13 +456,11 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         if not bundler_path.exists():
             return False
 
-        print(  # noqa: T201
-            f"⚙️  Rebuilding {build_type} (python {command_path})..."
+        ApatheticUtils_Internal_Runtime._print_build_status(
+            f"⚙️  Rebuilding {build_type} (python {command_path})...", output_prefix
         )
-        subprocess.run(  # noqa: S603
-            [sys.executable, str(bundler_path)],
-            check=True,
-            cwd=root,
+        ApatheticUtils_Internal_Runtime._run_bundler(
+            [sys.executable, str(bundler_path)], root, output_prefix
         )
         ApatheticUtils_Internal_Runtime._validate_build_output(output_path, build_type)
         return True
@@ -151,6 +473,7 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         package_name: str,
         command_path: str | None = None,
         log_level: str | None = None,
+        output_prefix: str | None = None,
     ) -> Path:
         """Rebuild stitched script if missing or outdated.
 
@@ -162,8 +485,13 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
             command_path: Optional path to bundler script (relative to root).
                 If provided and exists, uses `python {command_path}`.
                 Otherwise, uses `python -m serger --config .serger.jsonc`.
+                The script writes the output itself, so such builds are
+                locked but not atomic: readers may see a partial file.
             log_level: Optional log level to pass to serger.
                 If provided, adds `--log-level=<log_level>` to the serger command.
+            output_prefix: Optional prefix for the build's output lines
+                (status and bundler lines, printed as `[<output_prefix>] <line>`),
+                e.g. when several builds run at once.
 
         Returns:
             Path to the stitched script
@@ -173,46 +501,85 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         bin_path = root / "dist" / f"{actual_script_name}.py"
         src_dir = root / "src" / package_name
 
+        config_path = root / ".serger.jsonc"
+        # The logical command (not the resolved executable) identifies the
+        # build, so checking never has to look the bundler up
+        if command_path is not None and (root / command_path).exists():
+            command = ["python", command_path]
+            source_dirs = [src_dir]
+            extra_inputs = [root / command_path]
+        else:
+            command = ["serger", "--config", config_path.name]
+            # Dependencies stitched in from site-packages are inputs too
+            source_dirs = [
+                src_dir,
+                *ApatheticUtils_Internal_Runtime._bundled_dependency_dirs(
+                    config_path, root
+                ),
+            ]
+            extra_inputs = [config_path, root / "pyproject.toml"]
+
         # Check if rebuild is needed
-        needs_rebuild = ApatheticUtils_Internal_Runtime._check_needs_rebuild(
-            bin_path, src_dir
-        )
+        if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+            bin_path, root, source_dirs, extra_inputs, command
+        ):
+            return bin_path
 
-        if needs_rebuild:
-            # Check if command_path is provided and exists
-            if ApatheticUtils_Internal_Runtime._run_bundler_script(
-                root, command_path, bin_path, "stitched script"
+        # One builder at a time (e.g. pytest-xdist workers); the others wait
+        # and then find it already rebuilt
+        with ApatheticUtils_Internal_Runtime._build_lock(bin_path):
+            if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+                bin_path, root, source_dirs, extra_inputs, command, refresh=True
             ):
                 return bin_path
 
-            # Fall back to using serger (found via find_python_command)
-            config_path = root / ".serger.jsonc"
-            if not config_path.exists():
-                msg = (
-                    "❌ Failed to generate stitched script: "
-                    f"serger config not found at {config_path}."
-                )
-                raise RuntimeError(msg)
-
-            print("⚙️  Rebuilding stitched bundle (serger)...")  # noqa: T201
-            serger_cmd = ApatheticUtils_Internal_Subprocess.find_python_command(
-                "serger",
-                error_hint=(
-                    "serger not found. "
-                    "Ensure serger is installed in your virtual environment."
+            # Fingerprint the inputs before building (see _fingerprint_inputs)
+            inputs = ApatheticUtils_Internal_Runtime._fingerprint_inputs(
+                root,
+                ApatheticUtils_Internal_Runtime._build_inputs(
+                    source_dirs, extra_inputs
                 ),
             )
-            serger_cmd.extend(["--config", str(config_path)])
-            if log_level is not None:
-                serger_cmd.extend(["--log-level", log_level])
-            subprocess.run(  # noqa: S603
-                serger_cmd,
-                check=True,
-                cwd=root,
-            )
-            ApatheticUtils_Internal_Runtime._validate_build_output(
-                bin_path, "stitched script"
-            )
+
+            # Check if command_path is provided and exists
+            if not ApatheticUtils_Internal_Runtime._run_bundler_script(
+                root, command_path, bin_path, "stitched script", output_prefix
+            ):
+                # Fall back to using serger (found via find_python_command)
+                if not config_path.exists():
+                    msg = (
+                        "❌ Failed to generate stitched script: "
+                        f"serger config not found at {config_path}."
+                    )
+                    raise RuntimeError(msg)
+
+                ApatheticUtils_Internal_Runtime._print_build_status(
+                    "⚙️  Rebuilding stitched bundle (serger)...", output_prefix
+                )
+                serger_cmd = ApatheticUtils_Internal_Subprocess.find_python_command(
+                    "serger",
+                    error_hint=(
+                        "serger not found. "
+                        "Ensure serger is installed in your virtual environment."
+                    ),
+                )
+                # Build beside the output and rename, so readers never see
+                # a half-written script
+                tmp_path = ApatheticUtils_Internal_Runtime._temp_build_path(bin_path)
+                serger_cmd.extend(["--config", str(config_path), "-o", str(tmp_path)])
+                if log_level is not None:
+                    serger_cmd.extend(["--log-level", log_level])
+                try:
+                    ApatheticUtils_Internal_Runtime._run_bundler(
+                        serger_cmd, root, output_prefix
+                    )
+                    tmp_path.replace(bin_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                ApatheticUtils_Internal_Runtime._validate_build_output(
+                    bin_path, "stitched script"
+                )
+            ApatheticUtils_Internal_Runtime._record_build(bin_path, inputs, command)
 
         return bin_path
 
@@ -224,6 +591,7 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         package_name: str,
         command_path: str | None = None,
         log_level: str | None = None,
+        output_prefix: str | None = None,
     ) -> Path:
         """Rebuild zipapp if missing or outdated.
 
@@ -235,8 +603,12 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
             command_path: Optional path to bundler script (relative to root).
                 If provided and exists, uses `python {command_path}`.
                 Otherwise, uses zipbundler.
+                The script writes the output itself, so such builds are
+                locked but not atomic: readers may see a partial file.
             log_level: Optional log level to pass to zipbundler.
                 If provided, adds `--log-level=<log_level>` to the zipbundler command.
+            output_prefix: Optional prefix for the build's output lines
+                (see ensure_stitched_script_up_to_date()).
 
         Returns:
             Path to the zipapp
@@ -246,49 +618,161 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         zipapp_path = root / "dist" / f"{actual_script_name}.pyz"
         src_dir = root / "src" / package_name
 
+        # The logical command (not the resolved executable) identifies the
+        # build, so checking never has to look the bundler up
+        if command_path is not None and (root / command_path).exists():
+            command = ["python", command_path]
+            extra_inputs = [root / command_path]
+        else:
+            output = ApatheticUtils_Internal_Runtime._manifest_key(zipapp_path, root)
+            command = ["zipbundler", "-m", package_name, "-o", output, "-q", "."]
+            extra_inputs = [root / "pyproject.toml"]
+
+        # zipbundler packs the package only, not its dependencies
+        source_dirs = [src_dir]
+
         # Check if rebuild is needed
-        needs_rebuild = ApatheticUtils_Internal_Runtime._check_needs_rebuild(
-            zipapp_path, src_dir
-        )
+        if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+            zipapp_path, root, source_dirs, extra_inputs, command
+        ):
+            return zipapp_path
 
-        if needs_rebuild:
-            # Check if command_path is provided and exists
-            if ApatheticUtils_Internal_Runtime._run_bundler_script(
-                root, command_path, zipapp_path, "zipapp"
+        # One builder at a time (see ensure_stitched_script_up_to_date)
+        with ApatheticUtils_Internal_Runtime._build_lock(zipapp_path):
+            if not ApatheticUtils_Internal_Runtime._check_needs_rebuild(
+                zipapp_path, root, source_dirs, extra_inputs, command, refresh=True
             ):
                 return zipapp_path
 
-            # Fall back to using zipbundler
-            zipbundler_cmd = ApatheticUtils_Internal_Subprocess.find_python_command(
-                "zipbundler",
-                error_hint=(
-                    "zipbundler not found. "
-                    "Ensure zipbundler is installed: poetry install --with dev"
+            # Fingerprint the inputs before building (see _fingerprint_inputs)
+            inputs = ApatheticUtils_Internal_Runtime._fingerprint_inputs(
+                root,
+                ApatheticUtils_Internal_Runtime._build_inputs(
+                    source_dirs, extra_inputs
                 ),
             )
-            print("⚙️  Rebuilding zipapp (zipbundler)...")  # noqa: T201
-            cmd = [
-                *zipbundler_cmd,
-                "-m",
-                package_name,
-                "-o",
-                str(zipapp_path),
-                "-q",
-                ".",
-            ]
-            if log_level is not None:
-                cmd.extend(["--log-level", log_level])
-            subprocess.run(  # noqa: S603
-                cmd,
-                cwd=root,
-                check=True,
-            )
-            ApatheticUtils_Internal_Runtime._validate_build_output(
-                zipapp_path, "zipapp"
-            )
+
+            # Check if command_path is provided and exists
+            if not ApatheticUtils_Internal_Runtime._run_bundler_script(
+                root, command_path, zipapp_path, "zipapp", output_prefix
+            ):
+                # Fall back to using zipbundler
+                zipbundler_cmd = ApatheticUtils_Internal_Subprocess.find_python_command(
+                    "zipbundler",
+                    error_hint=(
+                        "zipbundler not found. "
+                        "Ensure zipbundler is installed: poetry install --with dev"
+                    ),
+                )
+                ApatheticUtils_Internal_Runtime._print_build_status(
+                    "⚙️  Rebuilding zipapp (zipbundler)...", output_prefix
+                )
+                tmp_path = ApatheticUtils_Internal_Runtime._temp_build_path(zipapp_path)
+                cmd = [
+                    *zipbundler_cmd,
+                    "-m",
+                    package_name,
+                    "-o",
+                    str(tmp_path),
+                    "-q",
+                    ".",
+                ]
+                if log_level is not None:
+                    cmd.extend(["--log-level", log_level])
+                try:
+                    ApatheticUtils_Internal_Runtime._run_bundler(
+                        cmd, root, output_prefix
+                    )
+                    tmp_path.replace(zipapp_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                ApatheticUtils_Internal_Runtime._validate_build_output(
+                    zipapp_path, "zipapp"
+                )
+            ApatheticUtils_Internal_Runtime._record_build(zipapp_path, inputs, command)
 
         return zipapp_path
 
+    @staticmethod
+    def ensure_artifacts_up_to_date(
+        *,
+        root: Path,
+        package_name: str,
+        modes: Sequence[str] = ("stitched", "zipapp"),
+        script_name: str | None = None,
+        stitch_command: str | None = None,
+        zipapp_command: str | None = None,
+        log_level: str | None = None,
+    ) -> dict[str, Path]:
+        """Bring the artifacts of several runtime modes up to date at once.
+
+        Runs ensure_stitched_script_up_to_date() and ensure_zipapp_up_to_date()
+        in parallel threads, so a cold build takes as long as the slower
+        bundler rather than both. Each bundler's output lines are prefixed
+        with its mode (e.g. `[zipapp] ...`).
+
+        Args:
+            root: Project root directory
+            package_name: Name of the package (e.g., "apathetic_utils")
+            modes: Runtime modes to prepare: "stitched", "zipapp" and/or
+                "package" (nothing to build; maps to src/{package_name})
+            script_name: Optional name of the distributed script (without
+                extension). If None, defaults to package_name.
+            stitch_command: Optional bundler script for stitched mode
+                (see runtime_swap())
+            zipapp_command: Optional bundler script for zipapp mode
+                (see runtime_swap())
+            log_level: Optional log level to pass to serger and zipbundler.
+
+        Returns:
+            Path of each requested mode's artifact, keyed by mode
+
+        Raises:
+            ValueError: If a mode is unknown
+            RuntimeError, subprocess.CalledProcessError: If a build fails
+                (raised after the other builds have finished)
+        """
+        common: dict[str, Any] = {
+            "root": root,
+            "script_name": script_name,
+            "package_name": package_name,
+            "log_level": log_level,
+        }
+        builders = {
+            "stitched": partial(
+                ApatheticUtils_Internal_Runtime.ensure_stitched_script_up_to_date,
+                command_path=stitch_command,
+                output_prefix="stitched",
+                **common,
+            ),
+            "zipapp": partial(
+                ApatheticUtils_Internal_Runtime.ensure_zipapp_up_to_date,
+                command_path=zipapp_command,
+                output_prefix="zipapp",
+                **common,
+            ),
+        }
+        wanted = list(dict.fromkeys(modes))
+        unknown = [mode for mode in wanted if mode not in (*builders, "package")]
+        if unknown:
+            xmsg = (
+                f"Unknown runtime mode(s) {unknown!r}; "
+                "expected 'package', 'stitched' or 'zipapp'"
+            )
+            raise ValueError(xmsg)
+
+        to_build = [mode for mode in wanted if mode in builders]
+        with ThreadPoolExecutor(
+            max_workers=max(len(to_build), 1), thread_name_prefix="ensure_artifacts"
+        ) as executor:
+            futures = {mode: executor.submit(builders[mode]) for mode in to_build}
+        return {
+            mode: futures[mode].result()
+            if mode in futures
+            else root / "src" / package_name
+            for mode in wanted
+        }
+
     @staticmethod
     def runtime_swap(
         *,
@@ -299,6 +783,7 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         zipapp_command: str | None = None,
         mode: str | None = None,
         log_level: str | None = None,
+        bytecode_dir: Path | str | None = None,
     ) -> bool:
         """Pre-import hook — runs before any tests or plugins are imported.
 
@@ -324,6 +809,10 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
             mode: Runtime mode override. If None, reads from RUNTIME_MODE env var.
             log_level: Optional log level to pass to serger and zipbundler.
                 If provided, adds `--log-level=<log_level>` to their commands.
+            bytecode_dir: Directory for the stitched script's bytecode cache
+                (e.g. when dist/ is read-only); written even if
+                sys.dont_write_bytecode is set. If None, uses __pycache__ next
+                to the script, or sys.pycache_prefix when that is set.
 
         Returns:
             True if swap was performed, False if in package mode
@@ -331,6 +820,10 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         Raises:
             pytest.UsageError: If mode is invalid or build fails
         """
+        # Imported here, not at module level, so that importing apathetic_utils
+        # outside of tests does not import pytest
+        import pytest  # noqa: PLC0415
+
         safe_trace = makeSafeTrace("🧬")
 
         if mode is None:
@@ -355,7 +848,13 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
 
         if mode == "stitched":
             return ApatheticUtils_Internal_Runtime._load_stitched_mode(
-                root, package_name, script_name, stitch_command, safe_trace, log_level
+                root,
+                package_name,
+                script_name,
+                stitch_command,
+                safe_trace,
+                log_level,
+                None if bytecode_dir is None else Path(bytecode_dir),
             )
         if mode == "zipapp":
             return ApatheticUtils_Internal_Runtime._load_zipapp_mode(
@@ -366,6 +865,74 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         xmsg = f"Unknown RUNTIME_MODE={mode!r}. Valid modes: package, stitched, zipapp"
         raise pytest.UsageError(xmsg)
 
+    # PEP 552 pyc flags: hash-based, checked against the source on load
+    _PYC_CHECKED_HASH_FLAGS = (0b11).to_bytes(4, "little")
+
+    @staticmethod
+    def _stitched_bytecode_path(
+        bin_path: Path, bytecode_dir: Path | None
+    ) -> Path | None:
+        """Return where to cache `bin_path`'s bytecode, or None to not cache it."""
+        cache_tag = sys.implementation.cache_tag
+        if cache_tag is None:
+            return None  # This interpreter does not cache bytecode
+        if bytecode_dir is not None:
+            return bytecode_dir / f"{bin_path.stem}.{cache_tag}.pyc"
+        # __pycache__ next to the script, or under sys.pycache_prefix
+        return Path(importlib.util.cache_from_source(str(bin_path)))
+
+    @staticmethod
+    def _stitched_code(
+        bin_path: Path, bytecode_dir: Path | None, safe_trace: Any
+    ) -> CodeType:
+        """Return the compiled code of a stitched script, via a bytecode cache.
+
+        The cache is a standard hash-based .pyc (PEP 552): it is valid while
+        the script's source hash matches, whatever the timestamps, and the
+        import system accepts it too. A cache that cannot be read or written
+        (e.g. a read-only dist/) only costs the compile. The default location
+        is not written when sys.dont_write_bytecode is set.
+        """
+        source = bin_path.read_bytes()
+        header = (
+            importlib.util.MAGIC_NUMBER
+            + ApatheticUtils_Internal_Runtime._PYC_CHECKED_HASH_FLAGS
+            + importlib.util.source_hash(source)
+        )
+        pyc_path = ApatheticUtils_Internal_Runtime._stitched_bytecode_path(
+            bin_path, bytecode_dir
+        )
+
+        if pyc_path is not None:
+            try:
+                data = pyc_path.read_bytes()
+            except OSError:
+                data = b""
+            if data[: len(header)] == header:
+                try:
+                    # Same trust as the script itself: written next to it
+                    # (or where the caller chose) by this function
+                    code = marshal.loads(memoryview(data)[len(header) :])  # noqa: S302
+                except (EOFError, ValueError, TypeError):
+                    pass  # Corrupt: recompile and rewrite it
+                else:
+                    safe_trace(f"Loaded stitched bytecode from {pyc_path}")
+                    return cast("CodeType", code)
+
+        code = compile(source, str(bin_path), "exec", dont_inherit=True)
+        # An explicit bytecode_dir asks for a cache even without write_bytecode
+        if pyc_path is None or (sys.dont_write_bytecode and bytecode_dir is None):
+            return code
+
+        try:
+            ApatheticUtils_Internal_Shared.write_atomic(
+                pyc_path, header, marshal.dumps(code)
+            )
+            safe_trace(f"Wrote stitched bytecode to {pyc_path}")
+        except OSError as e:
+            safe_trace(f"Cannot write stitched bytecode to {pyc_path}: {e}")
+        return code
+
     @staticmethod
     def _load_stitched_mode(
         root: Path,
@@ -374,8 +941,11 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         command_path: str | None,
         safe_trace: Any,
         log_level: str | None = None,
+        bytecode_dir: Path | None = None,
     ) -> bool:
         """Load stitched single-file script mode."""
+        import pytest  # noqa: PLC0415
+
         bin_path = ApatheticUtils_Internal_Runtime.ensure_stitched_script_up_to_date(
             root=root,
             script_name=script_name,
@@ -409,7 +979,10 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         try:
             mod: ModuleType = importlib.util.module_from_spec(spec)
             sys.modules[package_name] = mod
-            spec.loader.exec_module(mod)
+            code = ApatheticUtils_Internal_Runtime._stitched_code(
+                bin_path, bytecode_dir, safe_trace
+            )
+            exec(code, mod.__dict__)  # noqa: S102
             safe_trace(f"Loaded stitched module from {bin_path}")
         except Exception as e:
             # Fail fast with context; this is a config/runtime problem.
@@ -438,6 +1011,8 @@ class ApatheticUtils_Internal_Runtime:  # noqa: N801  # pyright: ignore[reportUn
         Handles zipbundler zipapps which store packages directly in the zip root.
         Python's standard zipimporter can handle this structure directly.
         """
+        import pytest  # noqa: PLC0415
+
         zipapp_path = ApatheticUtils_Internal_Runtime.ensure_zipapp_up_to_date(
             root=root,
             script_name=script_name,
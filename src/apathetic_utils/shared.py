@@ -0,0 +1,110 @@
+# src/apathetic_utils/shared.py
+"""File and concurrency helpers shared by the other mixins."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+ApatheticUtils_ItemT = TypeVar("ApatheticUtils_ItemT")
+ApatheticUtils_ResultT = TypeVar("ApatheticUtils_ResultT")
+
+
+class ApatheticUtils_Internal_Shared:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class with helpers used by several other mixins.
+
+    Not part of the public namespace.
+    """
+
+    @staticmethod
+    def write_atomic(path: Path, *chunks: bytes, dir_mode: int = 0o777) -> None:
+        """Write `chunks` to `path` through a temporary file and os.replace().
+
+        Readers (in this or other processes) see either the old file or the
+        whole new one, never a partial write. The parent directory is created
+        (with `dir_mode`) if needed. Errors are raised as OSError after the
+        temporary file is removed; callers that only cache decide whether to
+        ignore them.
+        """
+        tmp_path: str | None = None
+        try:
+            path.parent.mkdir(mode=dir_mode, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            Path(tmp_path).replace(path)
+        except OSError:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    @contextmanager
+    def file_lock(lock_path: Path) -> Iterator[None]:
+        """Hold an exclusive cross-process lock on `lock_path`.
+
+        Uses flock on POSIX and msvcrt on Windows; the OS releases it if the
+        holder dies. The file (and its directory) is created if needed and
+        left in place.
+        """
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with lock_path.open("a+b") as f:
+            if sys.platform == "win32":
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after 10 attempts
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def map_chunks_in_processes(
+        func: Callable[[list[ApatheticUtils_ItemT]], list[ApatheticUtils_ResultT]],
+        items: Sequence[ApatheticUtils_ItemT],
+        workers: int,
+    ) -> list[ApatheticUtils_ResultT]:
+        """Run `func` on chunks of `items` in a process pool; return all results.
+
+        `func` takes a list of items and returns one result per item; it (and
+        anything bound to it) must be picklable. Results are in input order.
+        """
+        # Imported on use: it pulls in multiprocessing (and subprocess)
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        # A few chunks per worker keeps the pool busy without much overhead
+        chunk_size = -(-len(items) // (workers * 4))
+        chunks = [
+            list(items[i : i + chunk_size]) for i in range(0, len(items), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [
+                result
+                for chunk_results in pool.map(func, chunks)
+                for result in chunk_results
+            ]
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import shutil
@@ -14,7 +15,9 @@ from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+from .shared import ApatheticUtils_Internal_Shared
 
 
 class SubprocessResult:
@@ -99,6 +102,18 @@ class SubprocessResultWithBypass:
 class ApatheticUtils_Internal_Subprocess:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Mixin class providing subprocess utilities for testing."""
 
+    # Environment variable naming the find_python_command() cache file
+    PYTHON_COMMAND_CACHE_ENV_VAR = "APATHETIC_UTILS_PYTHON_COMMAND_CACHE"
+    _PYTHON_COMMAND_CACHE_VERSION = 1
+
+    # find_python_command() results for this process, by _python_command_key()
+    _python_commands: ClassVar[dict[str, list[str]]] = {}
+    _python_command_cache_file: ClassVar[Path | None] = (
+        Path(os.environ[PYTHON_COMMAND_CACHE_ENV_VAR]).expanduser()
+        if os.environ.get(PYTHON_COMMAND_CACHE_ENV_VAR)
+        else None
+    )
+
     @staticmethod
     def _find_venv_paths() -> list[Path]:
         """Find paths to common virtual environment providers.
@@ -156,6 +171,155 @@ class ApatheticUtils_Internal_Subprocess:  # noqa: N801  # pyright: ignore[repor
 
         return venv_paths
 
+    @staticmethod
+    def _python_command_key(command: str) -> str:
+        """Return what a find_python_command() result depends on, as a string.
+
+        The interpreter, PATH and VIRTUAL_ENV decide which command is found.
+        """
+        return json.dumps(
+            [
+                command,
+                sys.executable,
+                os.environ.get("PATH", ""),
+                os.environ.get("VIRTUAL_ENV", ""),
+            ]
+        )
+
+    @staticmethod
+    def _may_be_runnable_module(command: str) -> bool:
+        """Cheaply check whether `python -m <command>` could find a module to run.
+
+        Only a hint, answered without starting an interpreter: a top-level
+        name is looked up with importlib.util.find_spec() (packages also need
+        a __main__.py). Dotted names are not looked up, since that would
+        import their parent packages.
+        """
+        if "." in command:
+            return True
+        try:
+            spec = importlib.util.find_spec(command)
+        except (ImportError, ValueError):
+            return True  # Cannot tell; let _is_runnable_module() decide
+        if spec is None:
+            return False
+        if spec.submodule_search_locations is None:
+            return True
+        return any(
+            (Path(location) / "__main__.py").is_file()
+            for location in spec.submodule_search_locations
+        )
+
+    @staticmethod
+    def _is_runnable_module(command: str) -> bool:
+        """Check whether `python -m <command> --help` succeeds."""
+        try:
+            result = subprocess.run(  # noqa: S603
+                [sys.executable, "-m", command, "--help"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except Exception:  # noqa: BLE001
+            return False
+        return result.returncode == 0
+
+    @staticmethod
+    def _is_usable_python_command(cmd: list[str], *, confirmed: bool) -> bool:
+        """Check whether a remembered find_python_command() result still works.
+
+        The executable must exist. For `python -m <module>`, the module must
+        still look runnable (see _may_be_runnable_module()) and, unless this
+        process already ran it (`confirmed`), actually run.
+        """
+        if not Path(cmd[0]).exists():
+            return False
+        if len(cmd) == 3 and cmd[1] == "-m":  # noqa: PLR2004
+            # A module only a fresh interpreter found fails the hint; it is
+            # then searched for again, which finds it again
+            if not ApatheticUtils_Internal_Subprocess._may_be_runnable_module(cmd[2]):
+                return False
+            if not confirmed:
+                return ApatheticUtils_Internal_Subprocess._is_runnable_module(cmd[2])
+        return True
+
+    @staticmethod
+    def _read_python_command_cache(cache_file: Path) -> dict[str, list[str]]:
+        """Return the commands stored in `cache_file` (empty if unusable)."""
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version")
+            != ApatheticUtils_Internal_Subprocess._PYTHON_COMMAND_CACHE_VERSION
+            or not isinstance(data.get("commands"), dict)
+        ):
+            return {}
+        return {
+            key: cmd
+            for key, cmd in data["commands"].items()
+            if isinstance(cmd, list) and cmd and all(isinstance(a, str) for a in cmd)
+        }
+
+    @staticmethod
+    def _write_python_command_cache(
+        cache_file: Path, key: str, cmd: list[str] | None
+    ) -> None:
+        """Set `key` to `cmd` in `cache_file` (None drops it), best effort.
+
+        The file is re-read, updated and atomically replaced while holding
+        `<cache_file>.lock`, so concurrent writers keep each other's entries.
+        """
+        lock_path = cache_file.with_name(cache_file.name + ".lock")
+        # The cache only saves time; the next lookup just searches again
+        with suppress(OSError), ApatheticUtils_Internal_Shared.file_lock(lock_path):
+            commands = ApatheticUtils_Internal_Subprocess._read_python_command_cache(
+                cache_file
+            )
+            if cmd is not None:
+                commands[key] = cmd
+            elif commands.pop(key, None) is None:
+                return
+            data = {
+                "version": (
+                    ApatheticUtils_Internal_Subprocess._PYTHON_COMMAND_CACHE_VERSION
+                ),
+                "commands": commands,
+            }
+            text = json.dumps(data, indent=2, sort_keys=True) + "\n"
+            ApatheticUtils_Internal_Shared.write_atomic(
+                cache_file, text.encode("utf-8")
+            )
+
+    @staticmethod
+    def _search_python_command(command: str) -> list[str] | None:
+        """Search for `command` (see find_python_command()); None if not found."""
+        # Try python -m <command> first (most reliable). Always run it: a
+        # fresh interpreter can differ from this one (e.g. sys.path changed
+        # since startup), and a module that imports may still fail to run
+        if ApatheticUtils_Internal_Subprocess._is_runnable_module(command):
+            return [sys.executable, "-m", command]
+
+        # Fall back to command directly in PATH
+        cmd_path = shutil.which(command)
+        if cmd_path:
+            return [cmd_path]
+
+        # Try to find in common virtual environment providers
+        venv_paths = ApatheticUtils_Internal_Subprocess._find_venv_paths()
+
+        # Check each venv for the command
+        for venv_path in venv_paths:
+            # Try both bin/ and Scripts/ (Windows)
+            for bin_dir_name in ("bin", "Scripts"):
+                bin_dir = venv_path / bin_dir_name
+                cmd_in_venv = bin_dir / command
+                if cmd_in_venv.exists():
+                    return [str(cmd_in_venv)]
+        return None
+
     @staticmethod
     def find_python_command(
         command: str,
@@ -173,6 +337,14 @@ class ApatheticUtils_Internal_Subprocess:  # noqa: N801  # pyright: ignore[repor
         - virtualenv/venv (via `VIRTUAL_ENV` environment variable)
         - conda (via `CONDA_PREFIX` environment variable)
 
+        Results are remembered for the rest of the process, keyed by the
+        command, sys.executable, PATH and VIRTUAL_ENV, and also stored in the
+        cache file set by set_python_command_cache(), if any. A remembered
+        command is reused while its executable still exists and, for
+        `python -m`, its module still looks runnable; a `python -m` command
+        read from the cache file is also run once with --help. Otherwise it is
+        dropped and searched for again. Failed lookups are not remembered.
+
         Args:
             command: Name of the command to find (e.g., "zipbundler", "serger")
             error_hint: Optional hint message to include in error if command not found.
@@ -195,43 +367,74 @@ class ApatheticUtils_Internal_Subprocess:  # noqa: N801  # pyright: ignore[repor
             # Returns: ["python", "-m", "serger"] or ["serger"] or
             # ["/path/to/venv/bin/serger"]
         """
-        # Try python -m <command> first (most reliable)
-        try:
-            result = subprocess.run(  # noqa: S603
-                [sys.executable, "-m", command, "--help"],
-                capture_output=True,
-                text=True,
-                check=False,
+        key = ApatheticUtils_Internal_Subprocess._python_command_key(command)
+        memo = ApatheticUtils_Internal_Subprocess._python_commands
+        cache_file = ApatheticUtils_Internal_Subprocess._python_command_cache_file
+
+        cmd = memo.get(key)
+        # Memo entries were found (and run) by this process
+        confirmed = cmd is not None
+        if cmd is None and cache_file is not None:
+            cmd = ApatheticUtils_Internal_Subprocess._read_python_command_cache(
+                cache_file
+            ).get(key)
+        stale = False
+        if cmd is not None:
+            if ApatheticUtils_Internal_Subprocess._is_usable_python_command(
+                cmd, confirmed=confirmed
+            ):
+                memo[key] = cmd
+                return list(cmd)  # Callers extend the list
+            # Uninstalled or moved: forget it
+            memo.pop(key, None)
+            stale = True
+
+        cmd = ApatheticUtils_Internal_Subprocess._search_python_command(command)
+        if cmd is None:
+            if stale and cache_file is not None:
+                ApatheticUtils_Internal_Subprocess._write_python_command_cache(
+                    cache_file, key, None
+                )
+            # Command not found
+            if error_hint is None:
+                error_hint = (
+                    f"{command} not found. "
+                    f"Ensure {command} is installed in your virtual environment."
+                )
+            raise RuntimeError(error_hint)
+
+        memo[key] = cmd
+        if cache_file is not None:
+            ApatheticUtils_Internal_Subprocess._write_python_command_cache(
+                cache_file, key, cmd
             )
-            if result.returncode == 0:
-                return [sys.executable, "-m", command]
-        except Exception:  # noqa: BLE001, S110
-            pass
+        return list(cmd)
 
-        # Fall back to command directly in PATH
-        cmd_path = shutil.which(command)
-        if cmd_path:
-            return [cmd_path]
+    @staticmethod
+    def set_python_command_cache(path: Path | str | None) -> None:
+        """Share find_python_command() results between processes via `path`.
 
-        # Try to find in common virtual environment providers
-        venv_paths = ApatheticUtils_Internal_Subprocess._find_venv_paths()
+        `path` is a JSON file mapping each lookup (command, interpreter, PATH,
+        VIRTUAL_ENV) to the command found. It is created when needed and may
+        be deleted at any time. Writers hold `<path>.lock` while updating it,
+        so processes sharing the file do not lose each other's entries. The
+        initial file is taken from the APATHETIC_UTILS_PYTHON_COMMAND_CACHE
+        environment variable at import time.
 
-        # Check each venv for the command
-        for venv_path in venv_paths:
-            # Try both bin/ and Scripts/ (Windows)
-            for bin_dir_name in ("bin", "Scripts"):
-                bin_dir = venv_path / bin_dir_name
-                cmd_in_venv = bin_dir / command
-                if cmd_in_venv.exists():
-                    return [str(cmd_in_venv)]
+        Args:
+            path: Cache file, or None to stop using one
+        """
+        ApatheticUtils_Internal_Subprocess._python_command_cache_file = (
+            None if path is None else Path(path).expanduser()
+        )
 
-        # Command not found
-        if error_hint is None:
-            error_hint = (
-                f"{command} not found. "
-                f"Ensure {command} is installed in your virtual environment."
-            )
-        raise RuntimeError(error_hint)
+    @staticmethod
+    def clear_python_command_cache() -> None:
+        """Forget the find_python_command() results of this process.
+
+        The cache file set by set_python_command_cache() is left alone.
+        """
+        ApatheticUtils_Internal_Subprocess._python_commands.clear()
 
     @dataclass
     class CapturedOutput:
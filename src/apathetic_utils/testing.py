@@ -9,13 +9,15 @@ from collections.abc import Callable, Sequence
 from contextlib import suppress
 from pathlib import Path
 from types import ModuleType
-from typing import Any
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING, Any
 
-import pytest
 from apathetic_logging import safeTrace
 
 
+if TYPE_CHECKING:
+    import pytest
+
+
 class ApatheticUtils_Internal_Testing:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Mixin class providing reusable test utilities.
 
@@ -88,6 +90,12 @@ class ApatheticUtils_Internal_Testing:  # noqa: N801  # pyright: ignore[reportUn
         Raises:
             AssertionError: If the camelCase method was not called as expected
         """
+        # Imported here, not at module level, so that importing apathetic_utils
+        # outside of tests does not import pytest or unittest.mock
+        from unittest.mock import MagicMock  # noqa: PLC0415
+
+        import pytest  # noqa: PLC0415
+
         # Get the real camelCase method from parent class to use as the base
         # implementation. Check if the method exists first.
         if not hasattr(parent_class, camel_case_method_name):
@@ -0,0 +1,279 @@
+# src/apathetic_utils/walk.py
+"""Filesystem walking utilities."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from .logs import ApatheticUtils_Internal_Logs
+from .matching import ApatheticUtils_Internal_Matching
+from .paths import ApatheticUtils_Internal_Paths
+
+
+class ApatheticUtils_Internal_Walk:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides filesystem walking functionality.
+
+    This class contains utilities for finding files by include / exclude
+    patterns. When mixed into apathetic_utils, it provides walking methods.
+    """
+
+    @staticmethod
+    def _include_rules(
+        include_patterns: Iterable[str],
+        root: Path,
+    ) -> dict[Path, ApatheticUtils_Internal_Matching.GlobSet | None]:
+        """Split include patterns into walk starts and globs below each start.
+
+        Each pattern's non-glob prefix (see get_glob_root()) is resolved against
+        `root` to give the directory (or file) the walk starts from. The glob
+        remainder is matched against paths relative to that start. A pattern
+        without glob characters maps to None: everything under the start.
+        """
+        _paths = ApatheticUtils_Internal_Paths
+
+        tails: dict[Path, list[str] | None] = {}
+        for pattern in include_patterns:
+            normalized = _paths.normalize_path_string(pattern)
+            base = _paths.get_glob_root(normalized)
+            start = _paths.resolve_path(root / base)
+            tail = "/".join(Path(normalized).parts[len(base.parts) :])
+
+            if not tail:
+                tails[start] = None
+                continue
+            existing = tails.setdefault(start, [])
+            if existing is not None:
+                existing.append(tail)
+
+        return {
+            start: None
+            if globs is None
+            else ApatheticUtils_Internal_Matching.compile_glob_set(globs)
+            for start, globs in tails.items()
+        }
+
+    @staticmethod
+    def _scan_dir(path: str) -> list[tuple[os.DirEntry[str], bool]]:
+        """List a directory with os.scandir(), sorted by entry name.
+
+        Returns ``(entry, is_dir)`` pairs for subdirectories (symlinks are not
+        followed) and files; anything else is dropped. The type checks run here
+        so that, in parallel walks, any stat calls they need run in the worker.
+        Unreadable directories are logged and treated as empty.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            ApatheticUtils_Internal_Logs.get_logger().debug(
+                "Cannot scan directory %s: %s", path, e
+            )
+            return []
+
+        listing: list[tuple[os.DirEntry[str], bool]] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                listing.append((entry, True))
+            elif entry.is_file():
+                listing.append((entry, False))
+        return listing
+
+    @staticmethod
+    def _rule_matches(
+        rules: list[tuple[str, ApatheticUtils_Internal_Matching.GlobSet | None]],
+        file_path: str,
+    ) -> bool:
+        """Return True if `file_path` is selected by any (start, globs) rule."""
+        for start_str, globs in rules:
+            if file_path == start_str:
+                return True
+            # A filesystem root ("/", "C:\\") already ends with a separator
+            prefix = start_str if start_str.endswith(os.sep) else start_str + os.sep
+            if not file_path.startswith(prefix):
+                continue
+            if globs is None:
+                return True
+            if globs.is_match(file_path[len(prefix) :].replace(os.sep, "/")):
+                return True
+        return False
+
+    class _DirScan:
+        """A subdirectory the walk will enter, with its scan once submitted."""
+
+        __slots__ = ("future", "path", "taken")
+
+        def __init__(self, path: str) -> None:
+            self.path = path
+            self.future: Future[list[tuple[os.DirEntry[str], bool]]] | None = None
+            # Entered by the walk before a pool thread picked it up
+            self.taken = False
+
+    @staticmethod
+    def _walk_tree(
+        top: str,
+        excludes: ApatheticUtils_Internal_Matching.CompiledExcludes,
+        executor: ThreadPoolExecutor | None = None,
+        prefetch: int = 0,
+    ) -> Iterator[os.DirEntry[str]]:
+        """Yield file entries under `top` depth-first, pruning excluded dirs.
+
+        With an executor, up to `prefetch` subdirectory scans run in the pool
+        ahead of the walk, chosen in the order the depth-first walk will enter
+        them; more are submitted as their results are consumed. Results are
+        consumed in the same sorted depth-first order as a sequential walk.
+        """
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        scan = ApatheticUtils_Internal_Walk._scan_dir
+        dir_scan = ApatheticUtils_Internal_Walk._DirScan
+
+        # Dirs not submitted yet; the last one is the next the walk enters
+        unsubmitted: list[ApatheticUtils_Internal_Walk._DirScan] = []
+        in_flight = 0
+
+        def _submit_more() -> None:
+            nonlocal in_flight
+            while executor is not None and in_flight < prefetch and unsubmitted:
+                pending = unsubmitted.pop()
+                if not pending.taken:
+                    pending.future = executor.submit(scan, pending.path)
+                    in_flight += 1
+
+        def _expand(
+            listing: list[tuple[os.DirEntry[str], bool]],
+        ) -> Iterator[
+            tuple[os.DirEntry[str], ApatheticUtils_Internal_Walk._DirScan | None]
+        ]:
+            # Keep files and unpruned dirs
+            items: list[
+                tuple[os.DirEntry[str], ApatheticUtils_Internal_Walk._DirScan | None]
+            ] = []
+            for entry, is_dir in listing:
+                if not is_dir:
+                    items.append((entry, None))
+                elif excludes.is_dir_excluded(entry.path):
+                    logger.trace("[iter_included_files] Pruned %s", entry.path)
+                else:
+                    items.append((entry, dir_scan(entry.path)))
+            if executor is not None:
+                unsubmitted.extend(
+                    pending for _, pending in reversed(items) if pending is not None
+                )
+                _submit_more()
+            return iter(items)
+
+        stack = [_expand(scan(top))]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                continue
+            entry, pending = item
+            if pending is None:
+                yield entry
+            elif pending.future is None:
+                pending.taken = True
+                stack.append(_expand(scan(entry.path)))
+            else:
+                listing = pending.future.result()
+                in_flight -= 1
+                stack.append(_expand(listing))
+
+    @staticmethod
+    def iter_included_files(
+        root: Path | str,
+        include_patterns: Iterable[str],
+        exclude_patterns: Iterable[str],
+        *,
+        workers: int | None = None,
+    ) -> Generator[Path, None, None]:
+        """Yield files under `root` matching an include and no exclude pattern.
+
+        Walks with os.scandir() starting only from each include pattern's glob
+        root (see get_glob_root()), and prunes whole directories when every
+        path beneath them is excluded (e.g. 'node_modules/', '.git/**',
+        '**/__pycache__/**'), so excluded subtrees are never listed.
+
+        Pattern semantics match the rest of the library: includes use
+        fnmatchcase_portable() on the path relative to their glob root, and
+        excludes use compile_excludes() / is_excluded_raw() semantics
+        ('**/', '../', trailing '/') relative to `root`. An include without
+        glob characters selects that file, or everything under that directory.
+
+        Symlinked directories are not descended into (avoids cycles); symlinked
+        files are yielded.
+
+        With `workers` > 1, directory scans are fanned out to a thread pool
+        (os.scandir releases the GIL during the syscall), which mostly helps on
+        network filesystems and cold caches. At most 2 * `workers` scans run
+        ahead of the walk, so memory does not grow with the tree. Output order
+        is unchanged.
+
+        Args:
+            root: Directory the include and exclude patterns are relative to
+            include_patterns: Glob patterns selecting files
+            exclude_patterns: Glob patterns removing files
+            workers: Number of scanning threads; None or 1 walks sequentially
+
+        Yields:
+            Absolute paths, in a deterministic order (directories walked
+            depth-first, entries sorted by name), whatever `workers` is
+
+        Raises:
+            ValueError: If `workers` is less than 1
+
+        Example:
+            for path in iter_included_files(root, ["src/**/*.py"], ["**/tests/"]):
+                ...
+        """
+        if workers is not None and workers < 1:
+            xmsg = f"workers must be at least 1, got {workers}"
+            raise ValueError(xmsg)
+
+        logger = ApatheticUtils_Internal_Logs.get_logger()
+        root_path = ApatheticUtils_Internal_Paths.resolve_path(root)
+        excludes = ApatheticUtils_Internal_Matching.compile_excludes(
+            exclude_patterns, root_path
+        )
+        rules = ApatheticUtils_Internal_Walk._include_rules(include_patterns, root_path)
+        rule_items = [(str(start), globs) for start, globs in rules.items()]
+
+        # Walk each start once: starts nested inside another are covered by it
+        tops: list[Path] = []
+        for start in sorted(rules, key=lambda p: p.parts):
+            if not any(start.is_relative_to(top) for top in tops):
+                tops.append(start)
+
+        # Scans allowed ahead of the walk: enough to keep every thread busy,
+        # without holding listings for the whole tree
+        prefetch = 2 * workers if workers is not None else 0
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="iter_included_files"
+            )
+            if workers is not None and workers > 1
+            else None
+        )
+        try:
+            for top in tops:
+                if top.is_file():
+                    if ApatheticUtils_Internal_Walk._rule_matches(
+                        rule_items, str(top)
+                    ) and not excludes.is_excluded(top):
+                        yield top
+                elif not top.is_dir():
+                    logger.trace("[iter_included_files] No such start: %s", top)
+                elif not excludes.is_dir_excluded(top):
+                    for entry in ApatheticUtils_Internal_Walk._walk_tree(
+                        str(top), excludes, executor, prefetch
+                    ):
+                        if ApatheticUtils_Internal_Walk._rule_matches(
+                            rule_items, entry.path
+                        ) and not excludes.is_excluded(entry.path):
+                            yield Path(entry.path)
+        finally:
+            # Stop scans nobody will read if the caller stops iterating early
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
@@ -204,8 +204,8 @@ def test_private_function_naming_convention() -> None:
     Examples:
       ✅ Test suite primarily for `_compile_glob_recursive` →
         `test_priv__compile_glob_recursive.py`
-      ✅ Test suite primarily for `_strip_jsonc_comments` →
-        `test_priv__strip_jsonc_comments.py`
+      ✅ Test suite primarily for `_blank_jsonc` →
+        `test_priv__blank_jsonc.py`
       ❌ Test suite primarily for `_private_func` in file `test_utils.py` →
         Should be `test_priv__private_func.py`
 
@@ -249,8 +249,8 @@ def test_private_function_naming_convention() -> None:
             "\nExamples:"
             "\n  ✅ Test suite primarily for `_compile_glob_recursive` →"
             "\n    `test_priv__compile_glob_recursive.py`"
-            "\n  ✅ Test suite primarily for `_strip_jsonc_comments` →"
-            "\n    `test_priv__strip_jsonc_comments.py`"
+            "\n  ✅ Test suite primarily for `_blank_jsonc` →"
+            "\n    `test_priv__blank_jsonc.py`"
             "\n  ❌ Test suite primarily for `_private_func` in `test_utils.py` →"
             "\n    Should rename to `test_priv__private_func.py`"
         )
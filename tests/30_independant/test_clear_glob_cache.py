@@ -0,0 +1,38 @@
+# tests/30_independant/test_clear_glob_cache.py
+"""Tests for clear_glob_cache.
+
+Checklist:
+- resets_entries_and_stats — entries and counters go back to zero.
+- recompiles_after_clear — the next lookup compiles a fresh regex.
+"""
+
+import apathetic_utils as mod_autils
+
+
+def test_clear_glob_cache_resets_entries_and_stats() -> None:
+    """Clearing drops compiled patterns and resets all counters."""
+    # --- setup ---
+    mod_autils.fnmatchcase_portable("a/b/c.py", "a/**/*.py")
+    mod_autils.fnmatchcase_portable("a/b/c.py", "a/**/*.py")
+
+    # --- execute ---
+    mod_autils.clear_glob_cache()
+    info = mod_autils.glob_cache_info()
+
+    # --- verify ---
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (0, 0, 0, 0)
+
+
+def test_clear_glob_cache_recompiles_after_clear() -> None:
+    """After clearing, the next match is a miss again."""
+    # --- setup ---
+    mod_autils.fnmatchcase_portable("x1.txt", "x?.txt")
+    mod_autils.clear_glob_cache()
+
+    # --- execute ---
+    result = mod_autils.fnmatchcase_portable("x1.txt", "x?.txt")
+    info = mod_autils.glob_cache_info()
+
+    # --- verify ---
+    assert result is True
+    assert info.misses == 1
@@ -0,0 +1,77 @@
+# tests/30_independant/test_clear_parse_cache.py
+"""Tests for clear_parse_cache.
+
+Checklist:
+- resets_entries_and_stats — entries and counters go back to zero.
+- single_path — only the given file is forgotten, for every loader.
+- reparses_after_clear — the next load reads the file again.
+"""
+
+import os
+from pathlib import Path
+
+import apathetic_utils as mod_autils
+
+
+_OLD_NS = 1_000_000_000_000_000_000
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(_OLD_NS, _OLD_NS))
+    return path
+
+
+def test_clear_parse_cache_resets_entries_and_stats(tmp_path: Path) -> None:
+    """Clearing drops parsed files and resets all counters."""
+    # --- setup ---
+    cfg = _write(tmp_path / "cfg.toml", "n = 1\n")
+    mod_autils.load_toml(cfg, cache=True)
+    mod_autils.load_toml(cfg, cache=True)
+
+    # --- execute ---
+    mod_autils.clear_parse_cache()
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (0, 0, 0, 0)
+
+
+def test_clear_parse_cache_single_path(tmp_path: Path) -> None:
+    """Passing a path forgets that file only and keeps the statistics."""
+    # --- setup ---
+    mod_autils.clear_parse_cache()
+    cfg = _write(tmp_path / "cfg.txt", "")
+    other = _write(tmp_path / "other.toml", "n = 1\n")
+    mod_autils.load_toml(cfg, cache=True)
+    mod_autils.load_jsonc(cfg, cache=True)
+    mod_autils.load_toml(other, cache=True)
+
+    # --- execute ---
+    mod_autils.clear_parse_cache(str(cfg))
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert (info.misses, info.currsize) == (3, 1)
+    mod_autils.clear_parse_cache()
+
+
+def test_clear_parse_cache_reparses_after_clear(tmp_path: Path) -> None:
+    """After invalidation, the next load is a miss that sees the new content."""
+    # --- setup ---
+    mod_autils.clear_parse_cache()
+    cfg = _write(tmp_path / "cfg.jsonc", '{"a": 1}')
+    mod_autils.load_jsonc(cfg, cache=True)
+    _write(cfg, '{"a": 2}')  # same size and mtime: invisible to stat()
+
+    # --- execute ---
+    stale = mod_autils.load_jsonc(cfg, cache=True)
+    mod_autils.clear_parse_cache(cfg)
+    fresh = mod_autils.load_jsonc(cfg, cache=True)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert stale == {"a": 1}
+    assert fresh == {"a": 2}
+    assert (info.hits, info.misses) == (1, 2)
+    mod_autils.clear_parse_cache()
@@ -0,0 +1,296 @@
+# tests/30_independant/test_compile_excludes.py
+"""Tests for compile_excludes and the CompiledExcludes matcher.
+
+Checklist:
+- parity_with_is_excluded_raw — same result as is_excluded_raw for a mixed
+  pattern list over paths inside, nested under, and outside the root.
+- relative_path — relative paths are resolved against the root.
+- file_root_special_case — a file root matches only itself.
+- no_patterns — empty pattern list never excludes.
+- dir_only_pattern — 'foo/' excludes everything under foo/.
+- parent_pattern — '../' patterns are resolved once against the root.
+- match_reports_pattern — match() returns the original pattern string.
+- immutable — matcher cannot be mutated and ignores later list changes.
+- dir_excluded_is_sound — a pruned directory only holds excluded files.
+- dir_excluded_prunes — common directory excludes are recognized.
+- lexical_parity — lexical=True matches is_excluded_raw(..., lexical=True).
+"""
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_PATTERNS = [
+    "*.pyc",
+    "build/",
+    "dist/*",
+    "**/__init__.py",
+    "**/subdir/**/*.py",
+    "docs/**/*.md",
+    "../shared/**/*.txt",
+    "**/__pycache__/**",
+    "src/pkg/skip?.py",
+    "src/[ab]*.cfg",
+]
+
+
+def _make_tree(tmp_path: Path) -> tuple[Path, list[Path]]:
+    root = tmp_path / "project"
+    rel_files = [
+        "main.py",
+        "main.pyc",
+        "build/out.txt",
+        "dist/app.py",
+        "pkg/__init__.py",
+        "pkg/subdir/deep/mod.py",
+        "pkg/subdir/mod.py",
+        "docs/a/b/readme.md",
+        "docs/readme.md",
+        "pkg/__pycache__/mod.cpython-311.pyc",
+        "src/pkg/skip1.py",
+        "src/pkg/skip12.py",
+        "src/alpha.cfg",
+        "src/gamma.cfg",
+    ]
+    outside_files = [
+        "shared/x/notes.txt",
+        "shared/notes.md",
+        "external/pkg/__init__.py",
+        "external/pkg/subdir/deep/mod.py",
+        "external/pkg/module.py",
+    ]
+    files: list[Path] = []
+    for rel in rel_files:
+        f = root / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.touch()
+        files.append(f)
+    for rel in outside_files:
+        f = tmp_path / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.touch()
+        files.append(f)
+    return root, files
+
+
+def test_compile_excludes_parity_with_is_excluded_raw(tmp_path: Path) -> None:
+    """Compiled matcher agrees with is_excluded_raw on a mixed pattern list."""
+    # --- setup ---
+    root, files = _make_tree(tmp_path)
+    root_abs_pattern = str(root / "pkg" / "*.py")
+    patterns = [*_PATTERNS, root_abs_pattern]
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes(patterns, root)
+
+    # --- verify ---
+    for f in files:
+        expected = mod_autils.is_excluded_raw(f, patterns, root)
+        assert excludes.is_excluded(f) is expected, f
+        # Single-pattern parity catches differences hidden by other matches
+        for pattern in patterns:
+            single = mod_autils.compile_excludes([pattern], root)
+            assert single.is_excluded(f) is mod_autils.is_excluded_raw(
+                f, [pattern], root
+            ), (f, pattern)
+
+
+def test_compile_excludes_relative_path(tmp_path: Path) -> None:
+    """Relative paths are resolved against the root, like is_excluded_raw."""
+    # --- setup ---
+    root = tmp_path
+    (root / "src").mkdir()
+    (root / "src/file.txt").touch()
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes(["src/*"], root)
+
+    # --- verify ---
+    assert excludes.is_excluded(Path("src/file.txt"))
+    assert excludes.is_excluded("src/file.txt")
+    assert not excludes.is_excluded(Path("dist/file.txt"))
+
+
+def test_compile_excludes_file_root_special_case(tmp_path: Path) -> None:
+    """If the root itself is a file, only that file is excluded."""
+    # --- setup ---
+    root_file = tmp_path / "data.csv"
+    root_file.touch()
+    other = tmp_path / "other.csv"
+    other.touch()
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes([], root_file)
+
+    # --- verify ---
+    assert excludes.is_excluded(Path("data.csv"))
+    assert excludes.is_excluded(root_file)
+    assert not excludes.is_excluded(other)
+
+
+def test_compile_excludes_no_patterns(tmp_path: Path) -> None:
+    """An empty pattern list never excludes anything."""
+    # --- setup ---
+    f = tmp_path / "a.py"
+    f.touch()
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes([], tmp_path)
+
+    # --- verify ---
+    assert not excludes.is_excluded(f)
+    assert excludes.match(f) is None
+
+
+def test_compile_excludes_dir_only_pattern(tmp_path: Path) -> None:
+    """Trailing-slash patterns exclude everything beneath that directory."""
+    # --- setup ---
+    nested = tmp_path / "build" / "lib" / "x.py"
+    nested.parent.mkdir(parents=True)
+    nested.touch()
+    sibling = tmp_path / "builder.py"
+    sibling.touch()
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes(["build/"], tmp_path)
+
+    # --- verify ---
+    assert excludes.is_excluded(nested)
+    assert not excludes.is_excluded(sibling)
+
+
+def test_compile_excludes_parent_pattern(tmp_path: Path) -> None:
+    """'../' patterns match files outside the root once resolved."""
+    # --- setup ---
+    root = tmp_path / "config_dir"
+    root.mkdir()
+    target = tmp_path / "src" / "pkg" / "__init__.py"
+    target.parent.mkdir(parents=True)
+    target.touch()
+    other = tmp_path / "src" / "pkg" / "module.py"
+    other.touch()
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes(["../src/**/__init__.py"], root)
+
+    # --- verify ---
+    assert excludes.is_excluded(target)
+    assert not excludes.is_excluded(other)
+
+
+def test_compile_excludes_match_reports_pattern(tmp_path: Path) -> None:
+    """match() returns the original (unnormalized) pattern that matched."""
+    # --- setup ---
+    f = tmp_path / "pkg" / "mod.pyc"
+    f.parent.mkdir()
+    f.touch()
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes(["docs/*", "pkg\\*.pyc"], tmp_path)
+
+    # --- verify ---
+    assert excludes.match(f) == "pkg\\*.pyc"
+    assert excludes.match(tmp_path / "pkg" / "mod.py") is None
+
+
+def test_compile_excludes_immutable(tmp_path: Path) -> None:
+    """The matcher is frozen and does not track the caller's list."""
+    # --- setup ---
+    f = tmp_path / "a.log"
+    f.touch()
+    patterns = ["*.txt"]
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes(patterns, tmp_path)
+    patterns.append("*.log")
+
+    # --- verify ---
+    assert excludes.patterns == ("*.txt",)
+    assert not excludes.is_excluded(f)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        excludes.patterns = ("*.log",)  # type: ignore[misc]
+
+
+def test_compile_excludes_dir_excluded_is_sound(tmp_path: Path) -> None:
+    """is_dir_excluded() never hides a file that is_excluded_raw keeps."""
+    # --- setup ---
+    root, files = _make_tree(tmp_path)
+    patterns = [
+        *_PATTERNS,
+        "pkg/**",
+        "docs/a*",
+        "**/subdir/*",
+        "src/*/",
+        "*",
+        "src**",
+    ]
+    dirs = {d for f in files for d in f.parents if d.is_relative_to(tmp_path)}
+
+    # --- execute / verify ---
+    for pattern in patterns:
+        excludes = mod_autils.compile_excludes([pattern], root)
+        for d in dirs:
+            if not excludes.is_dir_excluded(d):
+                continue
+            for f in files:
+                if f.is_relative_to(d):
+                    assert mod_autils.is_excluded_raw(f, [pattern], root), (
+                        pattern,
+                        d,
+                        f,
+                    )
+
+
+@pytest.mark.parametrize(
+    ("pattern", "directory"),
+    [
+        ("build/", "build"),
+        ("build/", "build/lib"),
+        ("dist/*", "dist"),
+        ("dist/**", "dist/sub"),
+        ("**/__pycache__/**", "pkg/__pycache__"),
+        ("../shared/**", "../shared/x"),
+        ("*", "anything"),
+    ],
+)
+def test_compile_excludes_dir_excluded_prunes(
+    tmp_path: Path, pattern: str, directory: str
+) -> None:
+    """Directory-wide excludes let walkers skip the whole subtree."""
+    # --- setup ---
+    root = tmp_path / "project"
+    root.mkdir()
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes([pattern], root)
+
+    # --- verify ---
+    assert excludes.is_dir_excluded(root / directory)
+    assert not excludes.is_dir_excluded(root)
+    assert not mod_autils.compile_excludes(["**/__pycache__"], root).is_dir_excluded(
+        root / "__pycache__"
+    )
+
+
+def test_compile_excludes_lexical_parity(tmp_path: Path) -> None:
+    """Lexical matchers agree with lexical is_excluded_raw, path by path."""
+    # --- setup ---
+    root, files = _make_tree(tmp_path)
+    paths: list[Path | str] = [*files, "src/pkg/../pkg/skip1.py", "./main.pyc"]
+
+    # --- execute ---
+    excludes = mod_autils.compile_excludes(_PATTERNS, root, lexical=True)
+
+    # --- verify ---
+    assert excludes.lexical
+    for p in paths:
+        assert excludes.is_excluded(p) is mod_autils.is_excluded_raw(
+            p, _PATTERNS, root, lexical=True
+        ), p
+        assert excludes.is_excluded(p) is mod_autils.is_excluded_raw(
+            p, _PATTERNS, root
+        ), p
@@ -0,0 +1,165 @@
+# tests/30_independant/test_compile_glob_set.py
+"""Tests for compile_glob_set and the GlobSet combined matcher.
+
+Checklist:
+- parity_with_fnmatchcase_portable — every pattern behaves exactly as
+  fnmatchcase_portable() would on its own.
+- reports_first_match — match() returns the earliest matching pattern.
+- labels — labels are reported instead of patterns when given.
+- labels_length_mismatch — mismatched labels raise ValueError.
+- duplicates_merged — duplicate patterns keep their first occurrence.
+- empty_set — an empty set never matches.
+- single_regex — a large set compiles into one regex object.
+- fast_paths_keep_input_order — string fast paths respect first-match order.
+"""
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_PATTERNS = [
+    "*.pyc",
+    "src/*.py",
+    "src/**/main.py",
+    "**/__pycache__/**",
+    "file?.py",
+    "file[0-9].txt",
+    "file[!0-9].md",
+    "docs/**",
+    "**",
+    "literal/path.py",
+    "a.b+c(d)",
+]
+
+_PATHS = [
+    "main.pyc",
+    "src/a/b/c.pyc",
+    "src/main.py",
+    "src/sub/main.py",
+    "src/a/b/main.py",
+    "pkg/__pycache__/mod.pyc",
+    "file1.py",
+    "file/.py",
+    "file12.py",
+    "file5.txt",
+    "fileA.md",
+    "file5.md",
+    "docs/index.md",
+    "literal/path.py",
+    "literal/path.pyx",
+    "a.b+c(d)",
+    "ab+c(d)",
+    "",
+]
+
+
+@pytest.mark.parametrize("pattern", _PATTERNS)
+def test_compile_glob_set_parity_with_fnmatchcase_portable(pattern: str) -> None:
+    """A single-pattern set matches exactly like fnmatchcase_portable()."""
+    # --- execute ---
+    globs = mod_autils.compile_glob_set([pattern])
+
+    # --- verify ---
+    for path in _PATHS:
+        expected = mod_autils.fnmatchcase_portable(path, pattern)
+        assert globs.is_match(path) is expected, (path, pattern)
+        assert (globs.match(path) == pattern) is expected, (path, pattern)
+
+
+def test_compile_glob_set_reports_first_match() -> None:
+    """match() reports the earliest pattern (in input order) that matches."""
+    # --- setup ---
+    patterns = [p for p in _PATTERNS if p != "**"]
+
+    # --- execute ---
+    globs = mod_autils.compile_glob_set(patterns)
+
+    # --- verify ---
+    for path in _PATHS:
+        expected = next(
+            (p for p in patterns if mod_autils.fnmatchcase_portable(path, p)), None
+        )
+        assert globs.match(path) == expected, path
+
+
+def test_compile_glob_set_labels() -> None:
+    """Labels are reported instead of the pattern strings."""
+    # --- execute ---
+    globs = mod_autils.compile_glob_set(
+        ["*.pyc", "src/**"], labels=["bytecode", "sources"]
+    )
+
+    # --- verify ---
+    assert globs.match("x.pyc") == "bytecode"
+    assert globs.match("src/a/b.py") == "sources"
+    assert globs.match("other.py") is None
+
+
+def test_compile_glob_set_labels_length_mismatch() -> None:
+    """Labels must line up with patterns."""
+    # --- execute + verify ---
+    with pytest.raises(ValueError, match="labels length"):
+        mod_autils.compile_glob_set(["*.py", "*.pyc"], labels=["one"])
+
+
+def test_compile_glob_set_duplicates_merged() -> None:
+    """Duplicate patterns are merged, keeping the first label."""
+    # --- execute ---
+    globs = mod_autils.compile_glob_set(
+        ["*.py", "*.py", "*.txt"], labels=["first", "second", "third"]
+    )
+
+    # --- verify ---
+    assert globs.patterns == ("*.py", "*.txt")
+    assert globs.match("a.py") == "first"
+
+
+def test_compile_glob_set_empty_set() -> None:
+    """An empty set never matches."""
+    # --- execute ---
+    globs = mod_autils.compile_glob_set([])
+
+    # --- verify ---
+    assert globs.regex is None
+    assert globs.match("anything") is None
+    assert not globs.is_match("anything")
+
+
+def test_compile_glob_set_single_regex() -> None:
+    """A 200-pattern set needs one combined regex plus suffix checks."""
+    # --- setup ---
+    patterns = [f"pkg{i}/**/*.py" for i in range(100)] + [
+        f"*.ext{i}" for i in range(100)
+    ]
+
+    # --- execute ---
+    globs = mod_autils.compile_glob_set(patterns)
+
+    # --- verify ---
+    assert globs.regex is not None
+    assert globs.regex.groups >= 100  # noqa: PLR2004
+    assert len(globs.suffixes) == 100  # noqa: PLR2004
+    assert globs.match("pkg42/a/b.py") == "pkg42/**/*.py"
+    assert globs.match("dir/file.ext99") == "*.ext99"
+    assert globs.match("pkg42/b.py") is None
+
+
+def test_compile_glob_set_fast_paths_keep_input_order() -> None:
+    """Literal, suffix, prefix and regex patterns still report the first match."""
+    # --- setup ---
+    patterns = ["src/**/*.py", "src/**", "*.py", "src/main.py", "*"]
+
+    # --- execute ---
+    globs = mod_autils.compile_glob_set(patterns)
+
+    # --- verify ---
+    assert globs.literals == {"src/main.py": 3}
+    assert globs.suffixes == (".py",)
+    assert globs.prefixes == ("src/",)
+    assert globs.any_index == 4  # noqa: PLR2004
+    assert globs.match("src/pkg/main.py") == "src/**/*.py"
+    assert globs.match("src/main.py") == "src/**"
+    assert globs.match("src/data.txt") == "src/**"
+    assert globs.match("lib/x.py") == "*.py"
+    assert globs.match("README") == "*"
@@ -0,0 +1,79 @@
+# tests/30_independant/test_default_parse_cache_dir.py
+"""Tests for default_parse_cache_dir.
+
+Checklist:
+- xdg_cache_home — $XDG_CACHE_HOME is used on Linux when set.
+- home_cache — ~/.cache is the Linux fallback.
+- macos — ~/Library/Caches on macOS.
+- windows — %LOCALAPPDATA% on Windows.
+- no_side_effects — the directory is not created.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_SUFFIX = Path("apathetic_utils", "parse")
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    return tmp_path
+
+
+def test_default_parse_cache_dir_xdg_cache_home(
+    home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home / "xdg"))
+
+    # --- execute / verify ---
+    assert mod_autils.default_parse_cache_dir() == home / "xdg" / _SUFFIX
+
+
+def test_default_parse_cache_dir_home_cache(
+    home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+    # --- execute / verify ---
+    assert mod_autils.default_parse_cache_dir() == home / ".cache" / _SUFFIX
+
+
+def test_default_parse_cache_dir_macos(
+    home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    monkeypatch.setattr(sys, "platform", "darwin")
+
+    # --- execute / verify ---
+    assert mod_autils.default_parse_cache_dir() == home / "Library" / "Caches" / _SUFFIX
+
+
+def test_default_parse_cache_dir_windows(
+    home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setenv("LOCALAPPDATA", str(home / "Local"))
+
+    # --- execute / verify ---
+    assert mod_autils.default_parse_cache_dir() == home / "Local" / _SUFFIX
+
+
+def test_default_parse_cache_dir_no_side_effects(home: Path) -> None:
+    # --- execute ---
+    directory = mod_autils.default_parse_cache_dir()
+
+    # --- verify ---
+    assert not directory.exists()
+    assert list(home.iterdir()) == []
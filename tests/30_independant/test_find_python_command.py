@@ -0,0 +1,385 @@
+# tests/30_independant/test_find_python_command.py
+"""Tests for find_python_command and its caches.
+
+Checklist:
+- module_confirmed_by_running — `python -m <module> --help` is run first.
+- module_found_but_not_runnable — a module this interpreter can import but
+  `python -m` cannot run: other places are searched.
+- dotted_name_not_imported — looking up `pkg.tool` never imports `pkg`.
+- package_without_main — not runnable with -m; other places are searched.
+- memoized — a second call does not search again, and returns a new list.
+- key_includes_path — a different PATH searches again.
+- persistent_cache — another process (a cleared memo) reuses the cache file,
+  running a `-m` module once to confirm it.
+- stale_cached_command — a cached executable that disappeared is replaced.
+- stale_module — a remembered `-m` module that is no longer runnable is
+  searched for again, in the memo and in the cache file.
+- stale_module_in_cache_file — a cached `-m` module that still imports but no
+  longer runs is searched for again.
+- stale_dropped — a stale cache file entry with no replacement is removed.
+- concurrent_writers — processes sharing the cache file keep all entries.
+- not_found — raises with the hint; failures are not remembered.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Container, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import apathetic_utils as mod_autils
+import apathetic_utils.subprocess_utils as amod_utils_subprocess
+
+
+_subprocess = amod_utils_subprocess.ApatheticUtils_Internal_Subprocess
+
+
+@pytest.fixture(autouse=True)
+def fresh_python_command_cache() -> Iterator[None]:
+    """Start each test with no remembered commands and no cache file."""
+    mod_autils.clear_python_command_cache()
+    mod_autils.set_python_command_cache(None)
+    yield
+    mod_autils.clear_python_command_cache()
+    mod_autils.set_python_command_cache(None)
+
+
+def _make_package(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str, *, main: bool
+) -> None:
+    pkg_dir = tmp_path / name
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("", encoding="utf-8")
+    if main:
+        (pkg_dir / "__main__.py").write_text("", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+
+def _fake_spawn(
+    monkeypatch: pytest.MonkeyPatch, runnable: Container[str] = ()
+) -> list[list[str]]:
+    """Record subprocess.run() calls; only `-m <name>` for `runnable` succeeds."""
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], **_kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append(args)
+        returncode = 0 if args[1:2] == ["-m"] and args[2] in runnable else 1
+        return subprocess.CompletedProcess(args, returncode, "", "")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(_subprocess, "_find_venv_paths", staticmethod(list))
+    return calls
+
+
+def _count_searches(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record _search_python_command() calls (still searching)."""
+    calls: list[str] = []
+    real_search = _subprocess._search_python_command  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def counting_search(command: str) -> list[str] | None:
+        calls.append(command)
+        return real_search(command)
+
+    monkeypatch.setattr(
+        _subprocess, "_search_python_command", staticmethod(counting_search)
+    )
+    return calls
+
+
+def _make_script(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str) -> Path:
+    """Put an executable `name` on a PATH of its own; return its path."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / name
+    script.write_text("#!/bin/sh\n", encoding="utf-8")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    return script
+
+
+def test_find_python_command_module_confirmed_by_running(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    spawned = _fake_spawn(monkeypatch, {"fake_cli_tool"})
+
+    # --- execute ---
+    cmd = mod_autils.find_python_command("fake_cli_tool")
+
+    # --- verify ---
+    assert cmd == [sys.executable, "-m", "fake_cli_tool"]
+    assert spawned == [[sys.executable, "-m", "fake_cli_tool", "--help"]]
+
+
+def test_find_python_command_module_found_but_not_runnable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    script = _make_script(tmp_path, monkeypatch, "fake_cli_tool")
+    spawned = _fake_spawn(monkeypatch)  # e.g. its __main__ fails to import
+
+    # --- execute ---
+    cmd = mod_autils.find_python_command("fake_cli_tool")
+
+    # --- verify ---
+    assert spawned == [[sys.executable, "-m", "fake_cli_tool", "--help"]]
+    assert cmd == [str(script)]
+
+
+def test_find_python_command_dotted_name_not_imported(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_parent_pkg", main=False)
+    (tmp_path / "fake_parent_pkg" / "tool.py").write_text("", encoding="utf-8")
+    spawned = _fake_spawn(monkeypatch, {"fake_parent_pkg.tool"})
+
+    # --- execute ---
+    first = mod_autils.find_python_command("fake_parent_pkg.tool")
+    second = mod_autils.find_python_command("fake_parent_pkg.tool")  # Memo hit
+
+    # --- verify ---
+    assert first == second == [sys.executable, "-m", "fake_parent_pkg.tool"]
+    assert len(spawned) == 1
+    assert "fake_parent_pkg" not in sys.modules
+
+
+def test_find_python_command_package_without_main(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_lib_only", main=False)
+    script = _make_script(tmp_path, monkeypatch, "fake_lib_only")
+    spawned = _fake_spawn(monkeypatch)
+
+    # --- execute ---
+    cmd = mod_autils.find_python_command("fake_lib_only")
+
+    # --- verify ---
+    assert spawned == [[sys.executable, "-m", "fake_lib_only", "--help"]]
+    assert cmd == [str(script)]
+
+
+def test_find_python_command_memoized(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    _fake_spawn(monkeypatch, {"fake_cli_tool"})
+    searches = _count_searches(monkeypatch)
+
+    # --- execute ---
+    first = mod_autils.find_python_command("fake_cli_tool")
+    first.append("--extra")
+    second = mod_autils.find_python_command("fake_cli_tool")
+
+    # --- verify ---
+    assert searches == ["fake_cli_tool"]
+    assert second == [sys.executable, "-m", "fake_cli_tool"]
+
+
+def test_find_python_command_key_includes_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    _fake_spawn(monkeypatch, {"fake_cli_tool"})
+    searches = _count_searches(monkeypatch)
+
+    # --- execute ---
+    mod_autils.find_python_command("fake_cli_tool")
+    monkeypatch.setenv("PATH", str(tmp_path))
+    mod_autils.find_python_command("fake_cli_tool")
+
+    # --- verify ---
+    assert searches == ["fake_cli_tool", "fake_cli_tool"]
+
+
+def test_find_python_command_persistent_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    cache_file = tmp_path / "cache" / "python_commands.json"
+    mod_autils.set_python_command_cache(cache_file)
+    spawned = _fake_spawn(monkeypatch, {"fake_cli_tool"})
+    mod_autils.find_python_command("fake_cli_tool")
+    mod_autils.clear_python_command_cache()  # As if in a new process
+    searches = _count_searches(monkeypatch)
+    spawned.clear()
+
+    # --- execute ---
+    cmd = mod_autils.find_python_command("fake_cli_tool")
+    mod_autils.find_python_command("fake_cli_tool")  # Memo hit: not run again
+
+    # --- verify ---
+    assert cmd == [sys.executable, "-m", "fake_cli_tool"]
+    assert searches == []
+    assert spawned == [[sys.executable, "-m", "fake_cli_tool", "--help"]]
+    stored = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert list(stored["commands"].values()) == [cmd]
+
+
+def test_find_python_command_stale_cached_command(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    _fake_spawn(monkeypatch, {"fake_cli_tool"})
+    cache_file = tmp_path / "python_commands.json"
+    key = _subprocess._python_command_key("fake_cli_tool")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    cache_file.write_text(
+        json.dumps(
+            {"version": 1, "commands": {key: [str(tmp_path / "gone" / "tool")]}}
+        ),
+        encoding="utf-8",
+    )
+    mod_autils.set_python_command_cache(cache_file)
+
+    # --- execute ---
+    cmd = mod_autils.find_python_command("fake_cli_tool")
+
+    # --- verify ---
+    assert cmd == [sys.executable, "-m", "fake_cli_tool"]
+    stored = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert stored["commands"][key] == cmd
+
+
+def test_find_python_command_stale_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    script = _make_script(tmp_path, monkeypatch, "fake_cli_tool")
+    runnable = {"fake_cli_tool"}
+    _fake_spawn(monkeypatch, runnable)
+    cache_file = tmp_path / "python_commands.json"
+    mod_autils.set_python_command_cache(cache_file)
+    first = mod_autils.find_python_command("fake_cli_tool")
+    (tmp_path / "fake_cli_tool" / "__main__.py").unlink()
+    runnable.clear()
+    key = _subprocess._python_command_key("fake_cli_tool")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    # --- execute ---
+    second = mod_autils.find_python_command("fake_cli_tool")
+
+    # --- verify ---
+    assert first == [sys.executable, "-m", "fake_cli_tool"]
+    assert second == [str(script)]
+    stored = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert stored["commands"][key] == second
+
+
+def test_find_python_command_stale_module_in_cache_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    _make_package(tmp_path, monkeypatch, "fake_cli_tool", main=True)
+    script = _make_script(tmp_path, monkeypatch, "fake_cli_tool")
+    spawned = _fake_spawn(monkeypatch)  # Imports here, but no longer runs
+    cache_file = tmp_path / "python_commands.json"
+    key = _subprocess._python_command_key("fake_cli_tool")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    cache_file.write_text(
+        json.dumps(
+            {"version": 1, "commands": {key: [sys.executable, "-m", "fake_cli_tool"]}}
+        ),
+        encoding="utf-8",
+    )
+    mod_autils.set_python_command_cache(cache_file)
+
+    # --- execute ---
+    cmd = mod_autils.find_python_command("fake_cli_tool")
+
+    # --- verify ---
+    assert cmd == [str(script)]
+    assert spawned[0] == [sys.executable, "-m", "fake_cli_tool", "--help"]
+    stored = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert stored["commands"][key] == cmd
+
+
+def test_find_python_command_stale_dropped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    monkeypatch.setenv("PATH", "")
+    _fake_spawn(monkeypatch)
+    cache_file = tmp_path / "python_commands.json"
+    key = _subprocess._python_command_key("no_such_tool_xyz")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    cache_file.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "commands": {
+                    key: [sys.executable, "-m", "no_such_tool_xyz"],
+                    "other": [sys.executable],
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    mod_autils.set_python_command_cache(cache_file)
+
+    # --- execute ---
+    with pytest.raises(RuntimeError, match="no_such_tool_xyz"):
+        mod_autils.find_python_command("no_such_tool_xyz")
+
+    # --- verify ---
+    stored = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert stored["commands"] == {"other": [sys.executable]}
+
+
+_CONCURRENT_WRITER = """
+import sys
+from pathlib import Path
+import apathetic_utils
+for i in range(25):
+    apathetic_utils.apathetic_utils._write_python_command_cache(
+        Path(sys.argv[1]), f"{sys.argv[2]}-{i}", [sys.executable]
+    )
+"""
+
+
+def test_find_python_command_concurrent_writers(tmp_path: Path) -> None:
+    # --- setup ---
+    cache_file = tmp_path / "python_commands.json"
+    # Import the module under test from where it came from (src/, dist/, .pyz)
+    module_file = Path(amod_utils_subprocess.__file__)
+    stitched = module_file.name != "subprocess_utils.py"
+    import_root = module_file.parent if stitched else module_file.parent.parent
+    env = {**os.environ, "PYTHONPATH": str(import_root)}
+
+    # --- execute ---
+    procs = [
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, "-c", _CONCURRENT_WRITER, str(cache_file), f"w{n}"],
+            env=env,
+        )
+        for n in range(4)
+    ]
+    returncodes = [proc.wait() for proc in procs]
+
+    # --- verify ---
+    assert returncodes == [0, 0, 0, 0]
+    stored = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert len(stored["commands"]) == 4 * 25
+
+
+def test_find_python_command_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
+    # --- setup ---
+    monkeypatch.setenv("PATH", "")
+    _fake_spawn(monkeypatch)
+    searches = _count_searches(monkeypatch)
+
+    # --- execute and verify ---
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="install no_such_tool_xyz"):
+            mod_autils.find_python_command(
+                "no_such_tool_xyz", error_hint="install no_such_tool_xyz"
+            )
+    assert searches == ["no_such_tool_xyz", "no_such_tool_xyz"]
@@ -2,9 +2,9 @@
 """Tests for fnmatchcase_portable utility function.
 
 fnmatchcase_portable() is a drop-in replacement for fnmatch.fnmatch that:
-- Always uses case-sensitive matching (via fnmatchcase from stdlib)
+- Always uses case-sensitive matching (fnmatchcase semantics from stdlib)
 - Backports Python 3.11's recursive '**' support to Python 3.10
-- Uses the Python stdlib's fnmatchcase for non-** patterns
+- Uses the Python stdlib's fnmatch.translate for non-** patterns
 - Handles *, **, ?, and [] glob patterns
 
 IMPORTANT: fnmatchcase (unlike shell globbing) does allow * to cross directory
@@ -13,13 +13,12 @@ not shell glob semantics.
 """
 
 import sys
-from fnmatch import fnmatchcase
+from fnmatch import fnmatchcase, translate
 from types import SimpleNamespace
 
 import pytest
 
 import apathetic_utils as mod_autils
-import apathetic_utils.matching as amod_utils_matching
 from tests.utils.constants import PATCH_STITCH_HINTS, PROGRAM_PACKAGE
 
 
@@ -164,62 +163,27 @@ def test_fnmatchcase_portable_python_311_plus() -> None:
     assert not mod_autils.fnmatchcase_portable("src/file.py", "src/**/*.py")
 
 
-def test_fnmatchcase_portable_no_glob_chars_delegates_to_fnmatchcase(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Patterns without ** delegate to fnmatchcase directly.
+def test_fnmatchcase_portable_non_recursive_uses_glob_cache() -> None:
+    """Patterns without ** are compiled once, like fnmatchcase, and cached.
 
-    This is an optimization: if there's no '**', we don't need the
-    custom regex compiler, so we use the standard library.
+    The regex is fnmatch.translate()'s (so '*' still crosses '/'), but it
+    lives in the shared glob cache rather than fnmatch's private one.
     """
-    # --- setup: track fnmatchcase calls ---
-    call_count = 0
-    original_fnmatchcase = fnmatchcase
-
-    def counting_fnmatchcase(name: str, pattern: str) -> bool:
-        nonlocal call_count
-        call_count += 1
-        return original_fnmatchcase(name, pattern)
-
-    # --- patch  ---
-    mod_autils.patch_everywhere(
-        monkeypatch,
-        amod_utils_matching,
-        "fnmatchcase",
-        counting_fnmatchcase,
-        package_prefix=PROGRAM_PACKAGE,
-        stitch_hints=PATCH_STITCH_HINTS,
-    )
+    # --- setup ---
+    mod_autils.clear_glob_cache()
 
     # --- execute ---
-    # Pattern without '**' should use fnmatchcase
-    # First verify behavior works correctly
     result1 = mod_autils.fnmatchcase_portable("src/main.py", "src/*.py")
-    assert result1 is True, "Function should work correctly for patterns without **"
-    fnmatchcase_calls_without_double_star = call_count
-
-    # Pattern with '**' on Python 3.10 - verify it works
-    # (implementation details may vary in external package)
-    fake_sys = SimpleNamespace(version_info=(3, 10, 0))
-    mod_autils.patch_everywhere(
-        monkeypatch,
-        mod_autils.apathetic_utils,
-        "get_sys_version_info",
-        lambda: fake_sys.version_info,
-        package_prefix=PROGRAM_PACKAGE,
-        stitch_hints=PATCH_STITCH_HINTS,
-    )
-    # Verify the function works correctly (behavior, not implementation)
-    result2 = mod_autils.fnmatchcase_portable("src/a/b/main.py", "src/**/main.py")
-    assert result2 is True, "Function should work correctly for patterns with **"
+    result2 = mod_autils.fnmatchcase_portable("src/a/main.py", "src/*.py")
+    info = mod_autils.glob_cache_info()
 
     # --- verify ---
-    # Verify behavior is correct (always checked above)
-    # Implementation detail: patterns without ** should delegate to fnmatchcase
-    assert fnmatchcase_calls_without_double_star > 0, (
-        "Expected fnmatchcase to be called for patterns without **. "
-        f"call_count={fnmatchcase_calls_without_double_star}"
-    )
+    assert result1 is True
+    assert result2 is fnmatchcase("src/a/main.py", "src/*.py")
+    assert info.misses == 1
+    assert info.hits == 1
+    compiled = mod_autils.apathetic_utils._compile_glob("src/*.py")  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert compiled.pattern == translate("src/*.py")
 
 
 def test_fnmatchcase_portable_recursive_backport_python310(
@@ -0,0 +1,70 @@
+# tests/30_independant/test_get_logger.py
+"""Tests for get_logger (cached library logger lookup).
+
+Checklist:
+- reuses_instance — repeated calls return the same logger object.
+- follows_registry_swap — replacing the logger in the logging registry is
+  picked up on the next call.
+- follows_registered_name — registering a different logger name drops the
+  cached logger.
+"""
+
+import logging
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+def test_get_logger_reuses_instance() -> None:
+    """The logger is looked up once and then reused."""
+    # --- execute ---
+    first = mod_autils.get_logger()
+    second = mod_autils.get_logger()
+
+    # --- verify ---
+    assert first is second
+
+
+def test_get_logger_follows_registry_swap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A logger swapped into the registry replaces the cached one."""
+    # --- setup ---
+    # Register a name explicitly: stitched builds register none and use root,
+    # which the logging registry does not hold
+    name = "test_get_logger_swap"
+    logs_globals = mod_autils.get_logger.__globals__
+    monkeypatch.setitem(logs_globals, "getRegisteredLoggerName", lambda: name)
+    monkeypatch.setitem(logs_globals, "getLogger", lambda: logging.getLogger(name))
+    original = mod_autils.get_logger()
+    replacement = type(original)(name)
+
+    # --- execute ---
+    cached = mod_autils.get_logger()
+    with monkeypatch.context() as swap:
+        swap.setitem(logging.Logger.manager.loggerDict, name, replacement)
+        swapped = mod_autils.get_logger()
+    restored = mod_autils.get_logger()
+
+    # --- verify ---
+    assert cached is original
+    assert swapped is replacement
+    assert restored is original
+
+
+def test_get_logger_follows_registered_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A different registered logger name looks the logger up again."""
+    # --- setup ---
+    original = mod_autils.get_logger()
+    other = type(original)("test_get_logger_other")
+    logs_globals = mod_autils.get_logger.__globals__
+    monkeypatch.setitem(logs_globals, "getRegisteredLoggerName", lambda: other.name)
+    monkeypatch.setitem(logs_globals, "getLogger", lambda: other)
+
+    # --- execute ---
+    renamed = mod_autils.get_logger()
+    monkeypatch.undo()
+    restored = mod_autils.get_logger()
+
+    # --- verify ---
+    assert renamed is other
+    assert restored is original
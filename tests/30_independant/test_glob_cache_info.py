@@ -0,0 +1,89 @@
+# tests/30_independant/test_glob_cache_info.py
+"""Tests for glob_cache_info, the shared glob cache statistics.
+
+Checklist:
+- hits_and_misses — repeated patterns are hits, new patterns are misses.
+- shared_by_matchers — compile_glob_set() and compile_excludes() reuse
+  patterns already compiled by fnmatchcase_portable().
+- fast_paths_skip_compile — literal / suffix / prefix patterns are classified
+  once (cached like any pattern) but never compile a regex.
+- frozen — the returned snapshot cannot be modified.
+"""
+
+import dataclasses
+import re
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+def test_glob_cache_info_hits_and_misses() -> None:
+    """Each distinct pattern misses once, then hits."""
+    # --- setup ---
+    mod_autils.clear_glob_cache()
+
+    # --- execute ---
+    for _ in range(3):
+        mod_autils.fnmatchcase_portable("src/a/b.py", "src/**/*.py")
+        mod_autils.fnmatchcase_portable("src/b.py", "src/[ab].py")
+    info = mod_autils.glob_cache_info()
+
+    # --- verify ---
+    assert info.misses == 2  # noqa: PLR2004
+    assert info.hits == 4  # noqa: PLR2004
+    assert info.currsize == 2  # noqa: PLR2004
+    assert info.evictions == 0
+
+
+def test_glob_cache_info_shared_by_matchers() -> None:
+    """Compiled matchers reuse translations from the shared cache."""
+    # --- setup ---
+    mod_autils.clear_glob_cache()
+    mod_autils.fnmatchcase_portable("docs/x/a.md", "docs/**/*.md")
+    mod_autils.fnmatchcase_portable("file1.txt", "file?.txt")
+
+    # --- execute ---
+    mod_autils.compile_glob_set(["docs/**/*.md", "file?.txt"])
+    info = mod_autils.glob_cache_info()
+
+    # --- verify ---
+    assert info.misses == 2  # noqa: PLR2004
+    assert info.hits == 2  # noqa: PLR2004
+
+
+def test_glob_cache_info_fast_paths_skip_compile(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Patterns answered with string operations are never compiled."""
+    # --- setup ---
+    mod_autils.clear_glob_cache()
+
+    def no_compile(*_args: object, **_kwargs: object) -> None:
+        xmsg = "fast-path pattern was compiled"
+        raise AssertionError(xmsg)
+
+    monkeypatch.setattr(re, "compile", no_compile)
+
+    # --- execute ---
+    for _ in range(2):
+        assert mod_autils.fnmatchcase_portable("a.pyc", "*.pyc")
+        assert mod_autils.fnmatchcase_portable("dist/x", "dist/**")
+        assert mod_autils.fnmatchcase_portable("setup.py", "setup.py")
+    info = mod_autils.glob_cache_info()
+
+    # --- verify ---
+    assert info.misses == 3  # noqa: PLR2004
+    assert info.hits == 3  # noqa: PLR2004
+    assert info.currsize == 3  # noqa: PLR2004
+
+
+def test_glob_cache_info_frozen() -> None:
+    """The statistics snapshot is immutable."""
+    # --- execute ---
+    info = mod_autils.glob_cache_info()
+
+    # --- verify ---
+    assert isinstance(info, mod_autils.GlobCacheInfo)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.hits = 0  # type: ignore[misc]
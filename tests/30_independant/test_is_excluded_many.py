@@ -0,0 +1,119 @@
+# tests/30_independant/test_is_excluded_many.py
+"""Tests for is_excluded_many, the batch form of is_excluded_raw.
+
+Checklist:
+- parity_with_is_excluded_raw — one result per path, same as the loop.
+- empty_input — no paths gives an empty list.
+- trace_enabled_logs_matches — matched patterns are traced when enabled.
+- trace_disabled_skips_logging — no per-path trace calls otherwise.
+- process_pool — workers > 1 gives identical results.
+- invalid_workers — workers < 1 raises ValueError.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_PATTERNS = ["*.pyc", "build/", "**/__init__.py", "docs/**/*.md", "../other/*"]
+
+
+def _paths(root: Path) -> list[Path | str]:
+    return [
+        "main.py",
+        "main.pyc",
+        root / "build" / "x.txt",
+        root / "pkg" / "__init__.py",
+        "docs/a/b.md",
+        "docs/b.md",
+        root.parent / "other" / "file.txt",
+        root.parent / "elsewhere" / "file.txt",
+    ]
+
+
+def test_is_excluded_many_parity_with_is_excluded_raw(tmp_path: Path) -> None:
+    """Batch results equal calling is_excluded_raw per path."""
+    # --- setup ---
+    root = tmp_path / "project"
+    root.mkdir()
+    paths = _paths(root)
+
+    # --- execute ---
+    result = mod_autils.is_excluded_many(paths, _PATTERNS, root)
+
+    # --- verify ---
+    assert result == [mod_autils.is_excluded_raw(p, _PATTERNS, root) for p in paths]
+    assert result == [False, True, True, True, True, False, True, False]
+
+
+def test_is_excluded_many_empty_input(tmp_path: Path) -> None:
+    """No paths, no results."""
+    # --- execute / verify ---
+    assert mod_autils.is_excluded_many([], _PATTERNS, tmp_path) == []
+
+
+def _patch_trace(monkeypatch: pytest.MonkeyPatch, *, enabled: bool) -> list[Any]:
+    """Force TRACE on/off for the logger used by the library; record trace()."""
+    calls: list[Any] = []
+    logger_cls = type(mod_autils.apathetic_utils.get_logger())
+    monkeypatch.setattr(logger_cls, "isEnabledFor", lambda _self, _level: enabled)
+    monkeypatch.setattr(
+        logger_cls, "trace", lambda _self, *args, **_kw: calls.append(args)
+    )
+    return calls
+
+
+def test_is_excluded_many_trace_enabled_logs_matches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With TRACE enabled, each excluded path is traced with its pattern."""
+    # --- setup ---
+    calls = _patch_trace(monkeypatch, enabled=True)
+
+    # --- execute ---
+    mod_autils.is_excluded_many(["a.pyc", "a.py"], ["*.pyc"], tmp_path)
+
+    # --- verify ---
+    per_path = [c for c in calls if "[is_excluded_many]" in str(c[0])]
+    assert len(per_path) == 1
+    assert per_path[0][1:] == ("a.pyc", "*.pyc")
+
+
+def test_is_excluded_many_trace_disabled_skips_logging(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With TRACE disabled, no per-path trace call is made at all."""
+    # --- setup ---
+    calls = _patch_trace(monkeypatch, enabled=False)
+
+    # --- execute ---
+    result = mod_autils.is_excluded_many(["a.pyc"] * 50, ["*.pyc"], tmp_path)
+
+    # --- verify ---
+    assert all(result)
+    assert not [c for c in calls if "[is_excluded_many]" in str(c[0])]
+
+
+def test_is_excluded_many_process_pool(tmp_path: Path) -> None:
+    """A process pool returns the same results, in input order."""
+    # --- setup ---
+    root = tmp_path / "project"
+    root.mkdir()
+    paths = _paths(root) * 5
+    expected = mod_autils.is_excluded_many(paths, _PATTERNS, root)
+
+    # --- execute ---
+    result = mod_autils.is_excluded_many(paths, _PATTERNS, root, workers=2)
+
+    # --- verify ---
+    assert result == expected
+
+
+def test_is_excluded_many_invalid_workers(tmp_path: Path) -> None:
+    """A worker count below one is rejected."""
+    # --- execute / verify ---
+    with pytest.raises(ValueError, match="workers"):
+        mod_autils.is_excluded_many(["a"], ["*"], tmp_path, workers=0)
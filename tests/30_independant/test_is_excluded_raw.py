@@ -16,6 +16,12 @@ Checklist:
 - double_star_nested_pattern — nested **/ patterns work correctly.
 - double_star_outside_root_negative — **/ patterns don't match when they shouldn't.
 - double_star_mixed_patterns — mix of **/ and non-**/ patterns work correctly.
+- lexical_matches_resolving — lexical=True agrees with resolving mode on a
+  symlink-free tree (relative, absolute, './' and '../' paths and patterns).
+- lexical_never_resolves — lexical=True makes no Path.resolve() calls.
+- lexical_does_not_follow_symlinks — documents the one semantic difference.
+- trace_disabled_skips_pattern_loop_logging — with TRACE off, the per-pattern
+  loop makes no trace() calls.
 """
 
 from pathlib import Path
@@ -617,3 +623,115 @@ def test_is_excluded_raw_directory_only_pattern_edge_case(tmp_path: Path) -> Non
     other_file.parent.mkdir()
     other_file.touch()
     assert not mod_autils.is_excluded_raw(other_file, ["dir/"], root)
+
+
+_LEXICAL_PATTERNS = [
+    "*.pyc",
+    "build/",
+    "dist/*",
+    "**/__init__.py",
+    "**/sub/**/*.py",
+    "docs/**/*.md",
+    "../shared/**/*.txt",
+    "../shared/notes.md",
+    "src/[ab]*.cfg",
+]
+
+_LEXICAL_PATHS = [
+    "main.py",
+    "main.pyc",
+    "./build/out.txt",
+    "dist/app.py",
+    "pkg/__init__.py",
+    "pkg/sub/deep/mod.py",
+    "pkg/other/../sub/x/mod.py",
+    "docs/a/b/readme.md",
+    "src/alpha.cfg",
+    "src/gamma.cfg",
+    "../shared/x/notes.txt",
+    "../shared/notes.md",
+    "../elsewhere/pkg/__init__.py",
+]
+
+
+@pytest.mark.parametrize("pattern", _LEXICAL_PATTERNS)
+@pytest.mark.parametrize("rel_path", _LEXICAL_PATHS)
+@pytest.mark.parametrize("absolute", [False, True])
+def test_is_excluded_raw_lexical_matches_resolving(
+    tmp_path: Path, pattern: str, rel_path: str, *, absolute: bool
+) -> None:
+    """On a symlink-free tree, lexical mode gives the same answer."""
+    # --- setup ---
+    root = tmp_path / "project"
+    root.mkdir()
+    path: Path | str = (root / rel_path) if absolute else rel_path
+
+    # --- execute ---
+    resolved = mod_autils.is_excluded_raw(path, [pattern], root)
+    lexical = mod_autils.is_excluded_raw(path, [pattern], root, lexical=True)
+
+    # --- verify ---
+    assert lexical is resolved
+
+
+def test_is_excluded_raw_lexical_never_resolves(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Lexical mode makes no Path.resolve() calls."""
+    # --- setup ---
+    root = tmp_path / "project"
+    root.mkdir()
+
+    def _no_resolve(*_args: object, **_kwargs: object) -> Path:
+        xmsg = "resolve() called in lexical mode"
+        raise AssertionError(xmsg)
+
+    monkeypatch.setattr(Path, "resolve", _no_resolve)
+
+    # --- execute ---
+    results = [
+        mod_autils.is_excluded_raw(p, _LEXICAL_PATTERNS, root, lexical=True)
+        for p in _LEXICAL_PATHS
+    ]
+
+    # --- verify ---
+    assert any(results)
+    assert not all(results)
+
+
+def test_is_excluded_raw_lexical_does_not_follow_symlinks(tmp_path: Path) -> None:
+    """With symlinks, lexical mode matches the link path, not its target."""
+    # --- setup ---
+    root = tmp_path / "project"
+    (root / "real").mkdir(parents=True)
+    (root / "real" / "mod.py").touch()
+    (root / "link").symlink_to(root / "real")
+
+    # --- execute ---
+    resolved = mod_autils.is_excluded_raw("link/mod.py", ["real/*"], root)
+    lexical = mod_autils.is_excluded_raw("link/mod.py", ["real/*"], root, lexical=True)
+
+    # --- verify ---
+    assert resolved is True
+    assert lexical is False
+
+
+def test_is_excluded_raw_trace_disabled_skips_pattern_loop_logging(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With TRACE disabled, trace() is not called for each tested pattern."""
+    # --- setup ---
+    calls: list[tuple[object, ...]] = []
+    logger_cls = type(mod_autils.apathetic_utils.get_logger())
+    monkeypatch.setattr(logger_cls, "isEnabledFor", lambda _self, _level: False)
+    monkeypatch.setattr(
+        logger_cls, "trace", lambda _self, *args, **_kw: calls.append(args)
+    )
+    patterns = [f"dir{i}/*.txt" for i in range(20)]
+
+    # --- execute ---
+    result = mod_autils.is_excluded_raw("src/file.py", patterns, tmp_path)
+
+    # --- verify ---
+    assert result is False
+    assert calls == []
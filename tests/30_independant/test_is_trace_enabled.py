@@ -0,0 +1,29 @@
+# tests/30_independant/test_is_trace_enabled.py
+"""Tests for is_trace_enabled.
+
+Checklist:
+- follows_level_changes — reflects setLevel() immediately, both ways.
+"""
+
+import apathetic_utils as mod_autils
+
+
+def test_is_trace_enabled_follows_level_changes() -> None:
+    """Raising or lowering the logger level flips the answer right away."""
+    # --- setup ---
+    logger = mod_autils.get_logger()
+    original_level = logger.level
+
+    try:
+        # --- execute ---
+        logger.setLevel("INFO")
+        at_info = mod_autils.is_trace_enabled()
+        logger.setLevel("TRACE")
+        at_trace = mod_autils.is_trace_enabled()
+        logger.setLevel("INFO")
+        back_at_info = mod_autils.is_trace_enabled()
+    finally:
+        logger.setLevel(original_level)
+
+    # --- verify ---
+    assert (at_info, at_trace, back_at_info) == (False, True, False)
@@ -0,0 +1,317 @@
+# tests/30_independant/test_iter_included_files.py
+"""Tests for iter_included_files, the pruning scandir walker.
+
+Checklist:
+- parity_with_rglob — same files as rglob + fnmatchcase_portable +
+  is_excluded_raw for a mixed include / exclude pattern list.
+- prunes_excluded_dirs — excluded subtrees are never scanned.
+- starts_at_glob_root — only the include patterns' glob roots are scanned.
+- literal_includes — a plain file or directory include selects it.
+- deterministic_order — output is sorted depth-first by name.
+- missing_start — include roots that don't exist yield nothing.
+- parallel_matches_sequential — workers > 1 yields the same files in the
+  same order, run after run.
+- parallel_prunes_excluded_dirs — parallel scans skip excluded subtrees too.
+- parallel_early_stop — closing the generator early shuts the pool down.
+- parallel_bounded_prefetch — scans run at most 2 * workers ahead of the
+  walk, however wide the tree.
+- invalid_workers — workers < 1 raises ValueError.
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_FILES = [
+    "setup.py",
+    "README.md",
+    "src/pkg/__init__.py",
+    "src/pkg/mod.py",
+    "src/pkg/mod.pyc",
+    "src/pkg/__pycache__/mod.cpython-311.pyc",
+    "src/pkg/sub/deep.py",
+    "src/pkg/sub/data.json",
+    "tests/test_mod.py",
+    "node_modules/lib/index.js",
+    "node_modules/lib/setup.py",
+    ".git/objects/ab/cdef",
+    "dist/pkg.py",
+    "build/lib/pkg/mod.py",
+]
+
+
+def _make_tree(root: Path) -> None:
+    for rel in _FILES:
+        f = root / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.touch()
+
+
+def _record_scandir(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    scanned: list[str] = []
+    real_scandir: Callable[..., Any] = os.scandir
+
+    def _scandir(path: Any = ".") -> Any:
+        scanned.append(os.fspath(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    return scanned
+
+
+@pytest.mark.parametrize(
+    ("includes", "excludes"),
+    [
+        (["**/*.py", "*.md"], ["node_modules/", ".git/**", "**/__pycache__/**"]),
+        (["src/**", "tests/*.py"], ["*.pyc", "src/pkg/sub/*"]),
+        (["**"], ["dist/*", "build/", "**/sub/**", "**/__init__.py"]),
+        (["src/pkg/**/*.py", "setup.py"], ["**/*.pyc", "src/**/deep.py"]),
+        (["*"], ["src*", "node_*/**", ".git/*"]),
+    ],
+)
+def test_iter_included_files_parity_with_rglob(
+    tmp_path: Path, includes: list[str], excludes: list[str]
+) -> None:
+    """Yields exactly what a full rglob + per-file matching would."""
+    # --- setup ---
+    _make_tree(tmp_path)
+    expected: list[Path] = []
+    for f in sorted(tmp_path.rglob("*")):
+        if not f.is_file():
+            continue
+        rel = f.relative_to(tmp_path).as_posix()
+        included = any(
+            rel == pattern
+            or (
+                mod_autils.has_glob_chars(pattern)
+                and mod_autils.fnmatchcase_portable(rel, pattern)
+            )
+            for pattern in includes
+        )
+        if included and not mod_autils.is_excluded_raw(f, excludes, tmp_path):
+            expected.append(f)
+
+    # --- execute ---
+    result = list(mod_autils.iter_included_files(tmp_path, includes, excludes))
+
+    # --- verify ---
+    assert sorted(result) == expected
+
+
+def test_iter_included_files_prunes_excluded_dirs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Directories whose whole subtree is excluded are never scanned."""
+    # --- setup ---
+    _make_tree(tmp_path)
+    scanned = _record_scandir(monkeypatch)
+
+    # --- execute ---
+    result = list(
+        mod_autils.iter_included_files(
+            tmp_path,
+            ["**/*.py"],
+            ["node_modules/", ".git/**", "**/__pycache__/**", "build/*"],
+        )
+    )
+
+    # --- verify ---
+    assert tmp_path / "src/pkg/mod.py" in result
+    scanned_rel = {Path(p).relative_to(tmp_path).as_posix() for p in scanned}
+    assert "src/pkg" in scanned_rel
+    for pruned in ("node_modules", ".git", "src/pkg/__pycache__", "build"):
+        assert not any(
+            p == pruned or p.startswith(pruned + "/") for p in scanned_rel
+        ), pruned
+
+
+def test_iter_included_files_starts_at_glob_root(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only directories under the include patterns' glob roots are scanned."""
+    # --- setup ---
+    _make_tree(tmp_path)
+    scanned = _record_scandir(monkeypatch)
+
+    # --- execute ---
+    result = list(
+        mod_autils.iter_included_files(tmp_path, ["src/pkg/**/*.py", "tests/*"], [])
+    )
+
+    # --- verify ---
+    assert result == [
+        tmp_path / "src/pkg/sub/deep.py",
+        tmp_path / "tests/test_mod.py",
+    ]
+    scanned_rel = sorted(Path(p).relative_to(tmp_path).as_posix() for p in scanned)
+    assert scanned_rel == [
+        "src/pkg",
+        "src/pkg/__pycache__",
+        "src/pkg/sub",
+        "tests",
+    ]
+
+
+def test_iter_included_files_literal_includes(tmp_path: Path) -> None:
+    """Plain file and directory includes select that file / whole directory."""
+    # --- setup ---
+    _make_tree(tmp_path)
+
+    # --- execute ---
+    result = list(
+        mod_autils.iter_included_files(
+            tmp_path, ["setup.py", "src/pkg/sub/", "tests"], ["*.json"]
+        )
+    )
+
+    # --- verify ---
+    assert result == [
+        tmp_path / "setup.py",
+        tmp_path / "src/pkg/sub/deep.py",
+        tmp_path / "tests/test_mod.py",
+    ]
+
+
+def test_iter_included_files_deterministic_order(tmp_path: Path) -> None:
+    """Files come out depth-first with entries sorted by name."""
+    # --- setup ---
+    for rel in ["b/2.txt", "a/z.txt", "a/b/1.txt", "c.txt", "a.txt"]:
+        f = tmp_path / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.touch()
+
+    # --- execute ---
+    result = list(mod_autils.iter_included_files(tmp_path, ["**"], []))
+
+    # --- verify ---
+    assert [p.relative_to(tmp_path).as_posix() for p in result] == [
+        "a/b/1.txt",
+        "a/z.txt",
+        "a.txt",
+        "b/2.txt",
+        "c.txt",
+    ]
+
+
+def test_iter_included_files_missing_start(tmp_path: Path) -> None:
+    """Include patterns whose glob root does not exist yield nothing."""
+    # --- execute ---
+    result = list(mod_autils.iter_included_files(tmp_path, ["missing/**/*.py"], []))
+
+    # --- verify ---
+    assert result == []
+
+
+def _make_wide_tree(root: Path) -> None:
+    for i in range(8):
+        for j in range(6):
+            d = root / f"pkg{i}" / f"sub{j}"
+            d.mkdir(parents=True)
+            for name in ("a.py", "b.txt", "c.pyc"):
+                (d / name).touch()
+        (root / f"pkg{i}" / "__pycache__").mkdir()
+        (root / f"pkg{i}" / "__pycache__" / "x.pyc").touch()
+
+
+def test_iter_included_files_parallel_matches_sequential(tmp_path: Path) -> None:
+    """A thread-pool walk yields exactly the sequential output, in order."""
+    # --- setup ---
+    _make_wide_tree(tmp_path)
+    includes = ["**/*.py", "pkg3/**"]
+    excludes = ["**/__pycache__/**", "pkg5/", "*.pyc"]
+    expected = list(mod_autils.iter_included_files(tmp_path, includes, excludes))
+
+    # --- execute ---
+    runs = [
+        list(mod_autils.iter_included_files(tmp_path, includes, excludes, workers=4))
+        for _ in range(3)
+    ]
+
+    # --- verify ---
+    assert expected
+    for result in runs:
+        assert result == expected
+
+
+def test_iter_included_files_parallel_prunes_excluded_dirs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Parallel walks never scan excluded directories either."""
+    # --- setup ---
+    _make_wide_tree(tmp_path)
+    scanned = _record_scandir(monkeypatch)
+
+    # --- execute ---
+    list(
+        mod_autils.iter_included_files(
+            tmp_path, ["**"], ["**/__pycache__/**", "pkg5/"], workers=3
+        )
+    )
+
+    # --- verify ---
+    scanned_rel = {Path(p).relative_to(tmp_path).as_posix() for p in scanned}
+    assert "pkg4/sub2" in scanned_rel
+    assert not any("__pycache__" in p or p.startswith("pkg5") for p in scanned_rel)
+
+
+def test_iter_included_files_parallel_early_stop(tmp_path: Path) -> None:
+    """Stopping iteration early still shuts the worker threads down."""
+    # --- setup ---
+    _make_wide_tree(tmp_path)
+    walker = mod_autils.iter_included_files(tmp_path, ["**"], [], workers=4)
+
+    # --- execute ---
+    first = next(walker)
+    walker.close()
+
+    # --- verify ---
+    assert first == tmp_path / "pkg0/__pycache__/x.pyc"
+    assert not any(
+        t.name.startswith("iter_included_files") for t in threading.enumerate()
+    )
+
+
+def test_iter_included_files_parallel_bounded_prefetch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A wide tree is not queued for scanning all at once."""
+    # --- setup ---
+    for i in range(50):
+        (tmp_path / f"dir{i:02}").mkdir()
+        (tmp_path / f"dir{i:02}" / "f.py").touch()
+    submitted: list[object] = []
+    real_submit = ThreadPoolExecutor.submit
+
+    def counting_submit(self: ThreadPoolExecutor, *args: Any, **kwargs: Any) -> Any:
+        submitted.append(args)
+        return real_submit(self, *args, **kwargs)
+
+    monkeypatch.setattr(ThreadPoolExecutor, "submit", counting_submit)
+    walker = mod_autils.iter_included_files(tmp_path, ["**"], [], workers=2)
+
+    # --- execute ---
+    first = next(walker)
+    submitted_before_more = len(submitted)
+    rest = list(walker)
+
+    # --- verify ---
+    assert first == tmp_path / "dir00" / "f.py"
+    # At most 2 * workers scans ahead, refilled by one as the first is read
+    assert submitted_before_more <= 2 * 2 + 1
+    assert len(rest) == 49  # noqa: PLR2004
+    assert len(submitted) == 50  # noqa: PLR2004
+
+
+def test_iter_included_files_invalid_workers(tmp_path: Path) -> None:
+    """A worker count below one is rejected."""
+    # --- execute / verify ---
+    with pytest.raises(ValueError, match="workers"):
+        list(mod_autils.iter_included_files(tmp_path, ["**"], [], workers=0))
@@ -0,0 +1,324 @@
+# tests/30_independant/test_iter_jsonc_items.py
+"""Tests for apathetic_utils.iter_jsonc_items (streaming JSONC reader).
+
+Checklist:
+- array_elements — a root array yields its elements.
+- object_members — a root object yields (key, value) pairs, repeats included.
+- comments_and_trailing_commas — same semantics as load_jsonc().
+- matches_load_jsonc — any chunk size gives load_jsonc()'s result, with
+  tokens, strings and UTF-8 characters split across chunks.
+- empty_inputs — empty / comment-only files and empty containers yield nothing.
+- nested_deeper_than_three — deeply nested items, split across chunks.
+- long_strings — multi-KB strings with escapes, split across chunks.
+- error_position — syntax errors report the file's line and column.
+- errors_match_load_jsonc — malformed input (scalar root, extra data,
+  unclosed or mismatched brackets, bad items) raises load_jsonc()'s error.
+- items_before_error — items before a syntax error are still yielded.
+- blank_quirks_match_load_jsonc — apostrophes, escaped backslashes before a
+  quote and unterminated block comments give load_jsonc()'s result or error.
+- quirk_keeps_duplicate_keys — after such a quirk, repeated keys are kept.
+- trailing_comma_across_chunks — a comma only known to be trailing in the
+  next chunk gives load_jsonc()'s error position.
+- bad_arguments — missing file, directory, chunk_size < 1.
+- bounded_memory — peak allocations stay far below the file size.
+"""
+
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_MIXED = """// header, with a ] bracket
+{
+  "name": "demo", # hash comment
+  "urls": ["http://example.com/a//b", "/* not a comment */", "c:\\\\tmp"],
+  /* block, { */ "nested": {"a": [1, 2, {"b": [3, [4, [5]]]},], "é": "ü",},
+  "deep": [[[[[["six"]]]]]], "esc": "quote \\" and ] and }",
+  "n": -1.5e3, "t": true, "z": null, // trailing
+}
+"""
+
+
+def _write(tmp_path: Path, text: str) -> Path:
+    path = tmp_path / "data.jsonc"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_iter_jsonc_items_array_elements(tmp_path: Path) -> None:
+    # --- setup ---
+    path = _write(tmp_path, '[1, "two", {"three": [3]}, [4], null]')
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path))
+
+    # --- verify ---
+    assert result == [1, "two", {"three": [3]}, [4], None]
+
+
+def test_iter_jsonc_items_object_members(tmp_path: Path) -> None:
+    # --- setup ---
+    path = _write(tmp_path, '{"a": 1, "b": {"c": 2}, "a": 3}')
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path))
+
+    # --- verify ---
+    assert result == [("a", 1), ("b", {"c": 2}), ("a", 3)]
+
+
+def test_iter_jsonc_items_comments_and_trailing_commas(tmp_path: Path) -> None:
+    # --- setup ---
+    path = _write(
+        tmp_path,
+        '/* head */ [\n  1, // one, ]\n  [2, 3,], # two\n  "a,]b", /* x */\n]\n',
+    )
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path))
+
+    # --- verify ---
+    assert result == [1, [2, 3], "a,]b"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, None])
+def test_iter_jsonc_items_matches_load_jsonc(
+    tmp_path: Path, chunk_size: int | None
+) -> None:
+    # --- setup ---
+    path = _write(tmp_path, _MIXED)
+    expected = mod_autils.load_jsonc(path)
+    assert isinstance(expected, dict)
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path, chunk_size=chunk_size))
+
+    # --- verify ---
+    assert dict(result) == expected
+    assert [key for key, _ in result] == list(expected)
+
+
+@pytest.mark.parametrize(
+    "text", ["", "  \n", "// only\n/* comments */", "[]", "{}", "[,]", "[ // c\n]"]
+)
+def test_iter_jsonc_items_empty_inputs(tmp_path: Path, text: str) -> None:
+    # --- setup ---
+    path = _write(tmp_path, text)
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path))
+
+    # --- verify ---
+    assert result == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, None])
+def test_iter_jsonc_items_nested_deeper_than_three(
+    tmp_path: Path, chunk_size: int | None
+) -> None:
+    # --- setup ---
+    item = '{"a": [{"b": {"c": [[{"d": ["e", {"f": [1, 2,]}]}]]}}], /* ] */ "g": 0}'
+    path = _write(tmp_path, "[" + ", ".join([item] * 5) + "]")
+    expected = mod_autils.load_jsonc(path)
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path, chunk_size=chunk_size))
+
+    # --- verify ---
+    assert result == expected
+    assert len(result) == 5  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 4096, None])
+def test_iter_jsonc_items_long_strings(tmp_path: Path, chunk_size: int | None) -> None:
+    # --- setup ---
+    long = "x" * 20_000
+    escaped = 'say \\"hi\\" // not a comment, ] } ' * 500
+    path = _write(tmp_path, f'{{"long": "{long}", "escaped": "{escaped}", "n": 1}}')
+    expected = mod_autils.load_jsonc(path)
+    assert isinstance(expected, dict)
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path, chunk_size=chunk_size))
+
+    # --- verify ---
+    assert result == list(expected.items())
+    assert len(expected["escaped"]) > 10_000  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("chunk_size", [1, None])
+def test_iter_jsonc_items_error_position(
+    tmp_path: Path, chunk_size: int | None
+) -> None:
+    # --- setup ---
+    path = _write(tmp_path, '{\n  "a": 1, // note\n  "b" /* é */ 2\n}\n')
+
+    message = r"Expecting ':' delimiter \(line 3, column 15\)"
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=message):
+        list(mod_autils.iter_jsonc_items(path, chunk_size=chunk_size))
+
+    # Same line and column as load_jsonc()
+    with pytest.raises(ValueError, match=message):
+        mod_autils.load_jsonc(path)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '"scalar"',
+        "// c\n  42",
+        "x",
+        "[1] [2]",
+        "[1] /x",
+        "[1] /* open",
+        '{"a": 1',
+        '[1, "open',
+        "[1, 2,",
+        "[1}",
+        "[1]]",
+        '[{"a": 1]]',
+        "[[[[1]]]",
+        "[1,,2]",
+        "[1, /* c */ , 2]",
+        '{"a" 1}',
+        "[1 2]",
+        "[1, 2, 3, oops]",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, None])
+def test_iter_jsonc_items_errors_match_load_jsonc(
+    tmp_path: Path, text: str, chunk_size: int | None
+) -> None:
+    # --- setup ---
+    path = _write(tmp_path, text)
+    with pytest.raises(ValueError, match="Invalid JSONC") as expected:
+        mod_autils.load_jsonc(path)
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="Invalid JSONC") as raised:
+        list(mod_autils.iter_jsonc_items(path, chunk_size=chunk_size))
+    assert str(raised.value) == str(expected.value)
+
+
+def _outcome(load: object, path: Path) -> tuple[str, object]:
+    """Return ("ok", items) or ("error", message) for one loader."""
+    assert callable(load)
+    try:
+        return ("ok", load(path))
+    except ValueError as e:
+        return ("error", str(e))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Apostrophes end a string for _blank_jsonc()
+        '["it\'s", 1]',
+        '["it\'s", // c\n 1]',
+        '["it\'s"] // c',
+        '["it\'s", "x // y"]',
+        "['a // b', 1]",
+        '[1, {"a": "it\'s"}, /* c */ 2,]',
+        # A quote after an escaped backslash does not end it
+        '["a\\\\", 1]',
+        '["a\\\\", // c\n 1]',
+        # An unterminated block comment keeps its final character
+        "[1, 2 /* x ]",
+        "[1, /* x",
+        '{"a": 1 /*',
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, None])
+def test_iter_jsonc_items_blank_quirks_match_load_jsonc(
+    tmp_path: Path, text: str, chunk_size: int | None
+) -> None:
+    # --- setup ---
+    path = _write(tmp_path, text)
+    expected = _outcome(mod_autils.load_jsonc, path)
+
+    # --- execute ---
+    result = _outcome(
+        lambda p: list(mod_autils.iter_jsonc_items(p, chunk_size=chunk_size)), path
+    )
+
+    # --- verify ---
+    assert result == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, None])
+def test_iter_jsonc_items_quirk_keeps_duplicate_keys(
+    tmp_path: Path, chunk_size: int | None
+) -> None:
+    # --- setup ---
+    path = _write(tmp_path, '{"k": 1, "k": 2, "q": "it\'s", "k": 3}')
+
+    # --- execute ---
+    result = list(mod_autils.iter_jsonc_items(path, chunk_size=chunk_size))
+
+    # --- verify ---
+    assert result == [("k", 1), ("k", 2), ("q", "it's"), ("k", 3)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, None])
+def test_iter_jsonc_items_trailing_comma_across_chunks(
+    tmp_path: Path, chunk_size: int | None
+) -> None:
+    # --- setup ---
+    path = _write(tmp_path, '{"a": true, "b" // c\n, /* c */}')
+    with pytest.raises(ValueError, match="Invalid JSONC") as expected:
+        mod_autils.load_jsonc(path)
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="Invalid JSONC") as raised:
+        list(mod_autils.iter_jsonc_items(path, chunk_size=chunk_size))
+    assert str(raised.value) == str(expected.value)
+
+
+def test_iter_jsonc_items_items_before_error(tmp_path: Path) -> None:
+    # --- setup ---
+    path = _write(tmp_path, "[1, 2, 3, oops]")
+    items = mod_autils.iter_jsonc_items(path, chunk_size=4)
+
+    # --- execute ---
+    first = next(items)
+
+    # --- verify ---
+    assert first == 1
+    with pytest.raises(ValueError, match="Invalid JSONC syntax"):
+        list(items)
+
+
+def test_iter_jsonc_items_bad_arguments(tmp_path: Path) -> None:
+    # --- execute and verify ---
+    with pytest.raises(FileNotFoundError):
+        list(mod_autils.iter_jsonc_items(tmp_path / "missing.jsonc"))
+    with pytest.raises(ValueError, match="Expected a file"):
+        list(mod_autils.iter_jsonc_items(tmp_path))
+    with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+        list(mod_autils.iter_jsonc_items(_write(tmp_path, "[]"), chunk_size=0))
+
+
+def test_iter_jsonc_items_bounded_memory(tmp_path: Path) -> None:
+    """Streaming a ~4 MB file never holds more than a few chunks of it."""
+    # --- setup ---
+    entry = '  // entry {i}\n  {{"name": "item_{i}", "tags": ["a", "b",]}},\n'
+    text = "[\n" + "".join(entry.format(i=i) for i in range(80_000)) + "]\n"
+    path = _write(tmp_path, text)
+    del text
+
+    # --- execute ---
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in mod_autils.iter_jsonc_items(path, chunk_size=65536))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # --- verify ---
+    assert count == 80_000  # noqa: PLR2004
+    assert peak < path.stat().st_size // 4
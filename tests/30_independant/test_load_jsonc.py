@@ -144,3 +144,70 @@ def test_load_jsonc_directory_path_raises(tmp_path: Path) -> None:
     # --- execute and verify ---
     with pytest.raises(ValueError, match="Expected a file"):
         mod_autils.load_jsonc(cfg_dir)
+
+
+def test_load_jsonc_error_position_matches_source(tmp_path: Path) -> None:
+    """Syntax errors report the line / column of the original file."""
+    # --- setup ---
+    cfg = tmp_path / "bad.jsonc"
+    cfg.write_text(
+        '// header\n/* multi\n   line */ {\n  "a": 1, /* x */ "b": ]\n}\n',
+        encoding="utf-8",
+    )
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"\(line 4, column 24\)"):
+        mod_autils.load_jsonc(cfg)
+
+
+def test_load_jsonc_error_position_after_non_ascii_comment(tmp_path: Path) -> None:
+    """Columns count characters, also after comments with non-ASCII text."""
+    # --- setup ---
+    cfg = tmp_path / "bad.jsonc"
+    cfg.write_text('{ /* héllo */ "a": }', encoding="utf-8")
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"\(line 1, column 20\)"):
+        mod_autils.load_jsonc(cfg)
+
+
+def test_load_jsonc_trailing_comma_before_comment(tmp_path: Path) -> None:
+    """A comma followed only by comments and a closing bracket is trailing."""
+    # --- setup ---
+    cfg = tmp_path / "trailing.jsonc"
+    cfg.write_text(
+        '{"a": [1, 2, // two\n], "b": 3, /* last */ # done\n}',
+        encoding="utf-8",
+    )
+
+    # --- execute ---
+    result = mod_autils.load_jsonc(cfg)
+
+    # --- verify ---
+    assert result == {"a": [1, 2], "b": 3}
+
+
+def test_load_jsonc_keeps_commas_inside_strings(tmp_path: Path) -> None:
+    """String contents that look like trailing commas are left alone."""
+    # --- setup ---
+    cfg = tmp_path / "strings.jsonc"
+    cfg.write_text('{"a": "x, ]", "b": ",}", "c": ", // ]"}', encoding="utf-8")
+
+    # --- execute ---
+    result = mod_autils.load_jsonc(cfg)
+
+    # --- verify ---
+    assert result == {"a": "x, ]", "b": ",}", "c": ", // ]"}
+
+
+def test_load_jsonc_comma_before_bracket_in_comment_is_kept(tmp_path: Path) -> None:
+    """A bracket inside a comment does not make the comma before it trailing."""
+    # --- setup ---
+    cfg = tmp_path / "comment.jsonc"
+    cfg.write_text("[1, // ]\n 2]", encoding="utf-8")
+
+    # --- execute ---
+    result = mod_autils.load_jsonc(cfg)
+
+    # --- verify ---
+    assert result == [1, 2]
@@ -0,0 +1,133 @@
+# tests/30_independant/test_load_many.py
+"""Tests for apathetic_utils.load_many (batch JSONC / TOML loading).
+
+Checklist:
+- auto_loader — suffix picks load_jsonc() or load_toml(), in input order.
+- explicit_loader — loader= overrides the suffix.
+- errors_aggregated — failures are reported per file, others still load.
+- thread_pool — workers > 1 gives identical results.
+- process_pool — processes=True gives identical results.
+- empty_input — no paths gives an empty list.
+- invalid_arguments — unknown loader or workers < 1 raise ValueError.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+def _write_configs(tmp_path: Path) -> list[Path]:
+    """Write a mix of JSON, JSONC and TOML files; return them in order."""
+    files = {
+        "a.toml": 'name = "a"\n[tool]\nn = 1\n',
+        "b.jsonc": '{"name": "b", // comment\n "n": 2,}\n',
+        "c.json": '{"name": "c", "n": 3}',
+        "d.TOML": 'name = "d"\n',
+    }
+    paths: list[Path] = []
+    for name, text in files.items():
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _expected(paths: list[Path]) -> list[object]:
+    return [
+        mod_autils.load_toml(p, required=True)
+        if p.suffix.lower() == ".toml"
+        else mod_autils.load_jsonc(p)
+        for p in paths
+    ]
+
+
+def test_load_many_auto_loader(tmp_path: Path) -> None:
+    # --- setup ---
+    paths = _write_configs(tmp_path)
+
+    # --- execute ---
+    results = mod_autils.load_many([str(p) for p in reversed(paths)])
+
+    # --- verify ---
+    assert [r.path for r in results] == list(reversed(paths))
+    assert all(r.ok for r in results)
+    assert [r.data for r in results] == list(reversed(_expected(paths)))
+    assert results[-1].data == {"name": "a", "tool": {"n": 1}}
+
+
+def test_load_many_explicit_loader(tmp_path: Path) -> None:
+    # --- setup ---
+    path = tmp_path / "settings.conf"
+    path.write_text('{"x": 1, /* c */}', encoding="utf-8")
+
+    # --- execute ---
+    jsonc_result = mod_autils.load_many([path], loader="jsonc")
+    toml_result = mod_autils.load_many([path], loader="toml")
+
+    # --- verify ---
+    assert jsonc_result[0].data == {"x": 1}
+    assert isinstance(toml_result[0].error, ValueError)
+
+
+def test_load_many_errors_aggregated(tmp_path: Path) -> None:
+    # --- setup ---
+    good = tmp_path / "good.json"
+    good.write_text('{"ok": true}', encoding="utf-8")
+    broken = tmp_path / "broken.jsonc"
+    broken.write_text('{"a": }', encoding="utf-8")
+    unknown = tmp_path / "notes.txt"
+    unknown.write_text("hello", encoding="utf-8")
+    missing = tmp_path / "missing.toml"
+
+    # --- execute ---
+    results = mod_autils.load_many([broken, missing, unknown, good])
+
+    # --- verify ---
+    assert [r.ok for r in results] == [False, False, False, True]
+    assert isinstance(results[0].error, ValueError)
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert isinstance(results[2].error, ValueError)
+    assert "No loader for .txt" in str(results[2].error)
+    assert results[3].data == {"ok": True}
+    assert results[3].error is None
+
+
+def test_load_many_thread_pool(tmp_path: Path) -> None:
+    # --- setup ---
+    paths = [*_write_configs(tmp_path), tmp_path / "missing.json"]
+
+    # --- execute ---
+    sequential = mod_autils.load_many(paths)
+    threaded = mod_autils.load_many(paths, workers=3)
+
+    # --- verify ---
+    assert [r.data for r in threaded] == [r.data for r in sequential]
+    assert [r.ok for r in threaded] == [True, True, True, True, False]
+
+
+def test_load_many_process_pool(tmp_path: Path) -> None:
+    # --- setup ---
+    paths = [*_write_configs(tmp_path), tmp_path / "missing.json"]
+
+    # --- execute ---
+    results = mod_autils.load_many(paths, workers=2, processes=True)
+
+    # --- verify ---
+    assert [r.path for r in results] == paths
+    assert [r.data for r in results[:-1]] == _expected(paths[:-1])
+    assert isinstance(results[-1].error, FileNotFoundError)
+
+
+def test_load_many_empty_input() -> None:
+    # --- execute / verify ---
+    assert mod_autils.load_many([], workers=4) == []
+
+
+def test_load_many_invalid_arguments(tmp_path: Path) -> None:
+    # --- execute / verify ---
+    with pytest.raises(ValueError, match="Unknown loader 'yaml'"):
+        mod_autils.load_many([tmp_path / "a.yaml"], loader="yaml")
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        mod_autils.load_many([], workers=0)
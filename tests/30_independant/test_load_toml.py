@@ -2,6 +2,7 @@
 """Tests for load_toml utility function."""
 
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,14 @@ import pytest
 import apathetic_utils as mod_autils
 
 
+@pytest.fixture
+def fresh_toml_backend() -> Iterator[None]:
+    """Look the TOML backend up again during the test, and again after it."""
+    mod_autils.set_toml_backend(None)
+    yield
+    mod_autils.set_toml_backend(None)
+
+
 def test_load_toml_valid_file() -> None:
     """Should load valid TOML file."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
@@ -59,6 +68,7 @@ def test_load_toml_invalid_syntax() -> None:
         path.unlink()
 
 
+@pytest.mark.usefixtures("fresh_toml_backend")
 def test_load_toml_missing_tomli_required_false(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -86,6 +96,7 @@ def test_load_toml_missing_tomli_required_false(
     assert result is None
 
 
+@pytest.mark.usefixtures("fresh_toml_backend")
 def test_load_toml_missing_tomli_required_true(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -107,3 +118,45 @@ def test_load_toml_missing_tomli_required_true(
     # With required=True, should raise RuntimeError
     with pytest.raises(RuntimeError, match="TOML parsing requires 'tomli' package"):
         mod_autils.load_toml(toml_file, required=True)
+
+
+@pytest.mark.usefixtures("fresh_toml_backend")
+def test_load_toml_missing_file_without_backend(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A missing file is reported even when no TOML backend is available."""
+    # --- setup ---
+    real_import = __import__
+
+    def mock_import(name: str, *args: Any, **kwargs: Any) -> Any:
+        if name in ("tomllib", "tomli"):
+            msg = f"No module named '{name}'"
+            raise ImportError(msg)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.__import__", mock_import)
+
+    # --- execute and verify ---
+    with pytest.raises(FileNotFoundError, match="not found"):
+        mod_autils.load_toml(tmp_path / "missing.toml")
+
+
+@pytest.mark.usefixtures("fresh_toml_backend")
+def test_load_toml_missing_file_without_backend_required(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With required=True, a missing file wins over the missing backend."""
+    # --- setup ---
+    real_import = __import__
+
+    def mock_import(name: str, *args: Any, **kwargs: Any) -> Any:
+        if name in ("tomllib", "tomli"):
+            msg = f"No module named '{name}'"
+            raise ImportError(msg)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.__import__", mock_import)
+
+    # --- execute and verify ---
+    with pytest.raises(FileNotFoundError, match="not found"):
+        mod_autils.load_toml(tmp_path / "missing.toml", required=True)
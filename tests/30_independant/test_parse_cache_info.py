@@ -0,0 +1,199 @@
+# tests/30_independant/test_parse_cache_info.py
+"""Tests for parse_cache_info and the cache=True loaders it reports on.
+
+Checklist:
+- hits_and_misses — an unchanged file misses once, then hits.
+- opt_in — loaders without cache=True never touch the cache.
+- copy_on_read — mutating a returned result does not affect later calls.
+- modified_file_reparsed — a changed size / mtime is a miss.
+- racy_rewrite_detected — a same-size rewrite that keeps a recent mtime is
+  caught by the content hash.
+- settled_mtime_skips_read — hits on an old file only stat() it.
+- loaders_separate — load_jsonc() and load_toml() never share entries.
+- errors_not_cached — a parse error is raised again on the next call.
+- frozen — the returned snapshot cannot be modified.
+"""
+
+import dataclasses
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_OLD_NS = 1_000_000_000_000_000_000  # 2001-09-09, long settled
+
+
+@pytest.fixture(autouse=True)
+def _clean_parse_cache() -> Iterator[None]:
+    mod_autils.clear_parse_cache()
+    yield
+    mod_autils.clear_parse_cache()
+
+
+def _write(path: Path, text: str, mtime_ns: int | None = None) -> None:
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_parse_cache_info_hits_and_misses(tmp_path: Path) -> None:
+    """The first load parses, later loads of the unchanged file hit."""
+    # --- setup ---
+    cfg = tmp_path / "cfg.jsonc"
+    _write(cfg, '{"a": 1, // c\n}', _OLD_NS)
+
+    # --- execute ---
+    results = [mod_autils.load_jsonc(cfg, cache=True) for _ in range(3)]
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert results == [{"a": 1}] * 3
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+def test_parse_cache_info_opt_in(tmp_path: Path) -> None:
+    """Loaders called without cache=True do not use the cache."""
+    # --- setup ---
+    cfg = tmp_path / "cfg.toml"
+    _write(cfg, 'name = "x"\n', _OLD_NS)
+
+    # --- execute ---
+    mod_autils.load_toml(cfg)
+    mod_autils.load_toml(cfg)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_parse_cache_info_copy_on_read(tmp_path: Path) -> None:
+    """Each call returns its own copy of the parsed data."""
+    # --- setup ---
+    cfg = tmp_path / "cfg.toml"
+    _write(cfg, '[tool]\nitems = ["a"]\n', _OLD_NS)
+
+    # --- execute ---
+    first = mod_autils.load_toml(cfg, cache=True)
+    assert first is not None
+    first["tool"]["items"].append("b")
+    second = mod_autils.load_toml(cfg, cache=True)
+    assert second is not None
+    second["tool"]["extra"] = True
+    third = mod_autils.load_toml(cfg, cache=True)
+
+    # --- verify ---
+    assert third == {"tool": {"items": ["a"]}}
+    assert mod_autils.parse_cache_info().hits == 2  # noqa: PLR2004
+
+
+def test_parse_cache_info_modified_file_reparsed(tmp_path: Path) -> None:
+    """A new mtime or size invalidates the entry."""
+    # --- setup ---
+    cfg = tmp_path / "cfg.jsonc"
+    _write(cfg, '{"a": 1}', _OLD_NS)
+    mod_autils.load_jsonc(cfg, cache=True)
+
+    # --- execute ---
+    _write(cfg, '{"a": 2}', _OLD_NS + 1)
+    changed_mtime = mod_autils.load_jsonc(cfg, cache=True)
+    _write(cfg, '{"a": 30}', _OLD_NS + 1)
+    changed_size = mod_autils.load_jsonc(cfg, cache=True)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert changed_mtime == {"a": 2}
+    assert changed_size == {"a": 30}
+    assert (info.hits, info.misses, info.currsize) == (0, 3, 1)
+
+
+def test_parse_cache_info_racy_rewrite_detected(tmp_path: Path) -> None:
+    """A same-size rewrite within the same (recent) mtime is not missed."""
+    # --- setup ---
+    cfg = tmp_path / "cfg.jsonc"
+    mtime_ns = time.time_ns()
+    _write(cfg, '{"a": 1}', mtime_ns)
+    mod_autils.load_jsonc(cfg, cache=True)
+
+    # --- execute ---
+    unchanged = mod_autils.load_jsonc(cfg, cache=True)
+    _write(cfg, '{"a": 2}', mtime_ns)
+    rewritten = mod_autils.load_jsonc(cfg, cache=True)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert unchanged == {"a": 1}
+    assert rewritten == {"a": 2}
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_parse_cache_info_settled_mtime_skips_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Once the mtime is old enough, a hit does not read the file."""
+    # --- setup ---
+    cfg = tmp_path / "cfg.toml"
+    _write(cfg, "n = 1\n", _OLD_NS)
+    mod_autils.load_toml(cfg, cache=True)
+
+    def _no_read(path: Path) -> bytearray:
+        raise AssertionError(path)
+
+    # Patch the mixin that defines it: the cache calls it through that class
+    files_cls = next(
+        cls
+        for cls in mod_autils.apathetic_utils.__mro__
+        if "_read_file_buffer" in vars(cls)
+    )
+    monkeypatch.setattr(files_cls, "_read_file_buffer", staticmethod(_no_read))
+
+    # --- execute ---
+    result = mod_autils.load_toml(cfg, cache=True)
+
+    # --- verify ---
+    assert result == {"n": 1}
+
+
+def test_parse_cache_info_loaders_separate(tmp_path: Path) -> None:
+    """The same file loaded by both loaders gets one entry per loader."""
+    # --- setup ---
+    cfg = tmp_path / "cfg.txt"
+    _write(cfg, "", _OLD_NS)
+
+    # --- execute ---
+    as_jsonc = mod_autils.load_jsonc(cfg, cache=True)
+    as_toml = mod_autils.load_toml(cfg, cache=True)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert as_jsonc is None
+    assert as_toml == {}
+    assert (info.misses, info.currsize) == (2, 2)
+
+
+def test_parse_cache_info_errors_not_cached(tmp_path: Path) -> None:
+    """Invalid files raise on every call and leave no entry behind."""
+    # --- setup ---
+    cfg = tmp_path / "bad.jsonc"
+    _write(cfg, '{"a": }', _OLD_NS)
+
+    # --- execute / verify ---
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid JSONC syntax"):
+            mod_autils.load_jsonc(cfg, cache=True)
+    info = mod_autils.parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+
+
+def test_parse_cache_info_frozen() -> None:
+    """The statistics snapshot is immutable."""
+    # --- execute ---
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.hits = 1  # type: ignore[misc]
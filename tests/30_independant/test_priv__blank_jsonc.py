@@ -0,0 +1,174 @@
+# tests/30_independant/test_priv__blank_jsonc.py
+"""Tests for apathetic_utils._blank_jsonc (private helper).
+
+Checklist:
+- comments_become_spaces — comments are blanked, code is untouched.
+- newlines_preserved — newlines inside block comments stay in place.
+- trailing_commas — commas before '}' / ']' (through comments) are blanked.
+- commas_kept — separators, commas in strings and before brackets inside
+  comments are kept.
+- urls_kept — '://' is not a comment.
+- non_ascii_comment — one space per character, not per UTF-8 byte.
+- positions_preserved — every non-comment character keeps its line/column.
+- strings_kept — comment syntax inside either kind of string is kept.
+- exact_quirks — pinned outputs for the scanner's compatibility quirks.
+- large_input — megabytes of strings and comments are blanked in one pass.
+"""
+
+# we import `_` private for testing purposes only
+# ruff: noqa: SLF001
+# pyright: reportPrivateUsage=false
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+def _blank(text: str) -> str:
+    data = bytearray(text.encode("utf-8"))
+    mod_autils.apathetic_utils._blank_jsonc(data)
+    return data.decode("utf-8")
+
+
+def test_blank_jsonc_comments_become_spaces() -> None:
+    # --- execute ---
+    result = _blank('{"a": 1} // line\n# hash\n/* block */')
+
+    # --- verify ---
+    assert result == '{"a": 1}        \n      \n           '
+
+
+def test_blank_jsonc_newlines_preserved() -> None:
+    # --- execute ---
+    result = _blank('{/* one\ntwo\n*/"a": 1}')
+
+    # --- verify ---
+    assert result == '{      \n   \n  "a": 1}'
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("[1, 2,]", "[1, 2 ]"),
+        ('{"a": 1,\n}', '{"a": 1 \n}'),
+        ("[1, // c\n]", "[1      \n]"),
+        ("[1, /* c */ # d\n]", "[1             \n]"),
+    ],
+)
+def test_blank_jsonc_trailing_commas(text: str, expected: str) -> None:
+    # --- execute ---
+    result = _blank(text)
+
+    # --- verify ---
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['[1, 2, "x,]", ",}"]', "[1, 2, 3]"],
+)
+def test_blank_jsonc_commas_kept(text: str) -> None:
+    # --- execute ---
+    result = _blank(text)
+
+    # --- verify ---
+    assert result == text
+
+
+def test_blank_jsonc_comma_before_bracket_in_comment_kept() -> None:
+    # --- execute ---
+    result = _blank("[1, // ]\n 2]")
+
+    # --- verify ---
+    assert result == "[1,     \n 2]"
+
+
+def test_blank_jsonc_urls_kept() -> None:
+    # --- setup ---
+    text = '{"url": "http://x//y", "u": http://z}'
+
+    # --- execute ---
+    result = _blank(text)
+
+    # --- verify ---
+    assert result == text
+
+
+def test_blank_jsonc_non_ascii_comment() -> None:
+    # --- execute ---
+    result = _blank('/* héllo */ {"é": 1, // ü\n}')
+
+    # --- verify ---
+    assert result == '            {"é": 1      \n}'
+
+
+def test_blank_jsonc_positions_preserved() -> None:
+    # --- setup ---
+    text = '// top\n{\n  "a": [1, 2, /* x\n y */],  # z\n  "b": "é" /* ü */\n}\n'
+
+    # --- execute ---
+    result = _blank(text)
+
+    # --- verify ---
+    assert len(result) == len(text)
+    for original, blanked in zip(text, result, strict=True):
+        assert blanked in (original, " ")
+        assert (original == "\n") is (blanked == "\n")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"text": "// not a comment"}',
+        '{"license": "MIT # clause"}',
+        '{"regex": "/* pattern */"}',
+        "{'url': 'http://example.com'}",
+        r'{"text": "say \"hello\" // x"}',
+        '{"license": "MIT License — Copyright"}',
+    ],
+)
+def test_blank_jsonc_strings_kept(text: str) -> None:
+    # --- execute ---
+    result = _blank(text)
+
+    # --- verify ---
+    assert result == text
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # Unterminated block comment keeps only the final character
+        ('{"a": 1} /* unclosed', '{"a": 1}           d'),
+        ("/*", "  "),
+        ("/*/", "  /"),
+        ("/* é", "   é"),
+        # A quote right after an escaped backslash stays in the string
+        ('"a\\\\"//x"\n', '"a\\\\"//x"\n'),
+        # Either quote character ends a string
+        ('"it\'s" // gone\n', '"it\'s" // gone\n'),
+        # Only the '/' right after ':' is protected; ':///' starts a comment
+        ("a:///c\nb", "a:/   \nb"),
+        (":/* x */y", ":       y"),
+        # Line comments end before their newline, even at the end
+        ("# c\n", "   \n"),
+        ("1 // c", "1     "),
+    ],
+)
+def test_blank_jsonc_exact_quirks(text: str, expected: str) -> None:
+    # --- execute ---
+    result = _blank(text)
+
+    # --- verify ---
+    assert result == expected
+
+
+def test_blank_jsonc_large_input() -> None:
+    # --- setup ---
+    entry = '"k": "http://x/y", // c\n"s": \'a # b\', /* z */\n'
+
+    # --- execute ---
+    result = _blank(entry * 50_000)
+
+    # --- verify ---
+    assert result == '"k": "http://x/y",     \n"s": \'a # b\',        \n' * 50_000
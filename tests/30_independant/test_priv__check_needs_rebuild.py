@@ -0,0 +1,328 @@
+# tests/30_independant/test_priv__check_needs_rebuild.py
+"""Tests for apathetic_utils._check_needs_rebuild (build manifest staleness).
+
+Checklist:
+- fresh_build — nothing changed since _record_build(): no rebuild.
+- missing_output_or_manifest — either missing forces a rebuild.
+- touched_input — new mtime, same content: no rebuild, mtime recorded.
+- read_only_precheck — without refresh, nothing is written; a due refresh
+  sends the caller to the locked check.
+- changed_input — different content of the same size: rebuild.
+- input_changed_during_build — inputs are fingerprinted before the build,
+  so an edit made while it runs triggers the next rebuild.
+- added_or_removed_input — the input set differs: rebuild.
+- pruned_dirs — nested sources count; __pycache__ and hidden dirs do not.
+- symlinked_dir — a symlinked directory is not followed.
+- bundled_dependency — packages the config stitches from sys.path are inputs.
+- created_extra_input — a listed input that did not exist now does.
+- changed_command — a different bundler command: rebuild.
+- modified_output — the artifact itself was edited: rebuild.
+- corrupt_manifest — unreadable or foreign manifest: rebuild.
+"""
+
+# we import `_` private for testing purposes only
+# ruff: noqa: SLF001
+# pyright: reportPrivateUsage=false
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_COMMAND = ["serger", "--config", ".serger.jsonc"]
+_OLD_NS = 1_600_000_000 * 10**9  # Well outside the racy window
+
+
+def _age(path: Path) -> None:
+    os.utime(path, ns=(_OLD_NS, _OLD_NS))
+
+
+def _project(tmp_path: Path) -> tuple[Path, Path, list[Path]]:
+    """Create sources, config and a built output; return (root, output, inputs)."""
+    src_dir = tmp_path / "src" / "pkg"
+    (src_dir / "__pycache__").mkdir(parents=True, exist_ok=True)
+    (src_dir / "__init__.py").write_text("A = 1\n", encoding="utf-8")
+    (src_dir / "data.json").write_text("{}\n", encoding="utf-8")
+    (src_dir / "__pycache__" / "__init__.cpython-311.pyc").write_bytes(b"junk")
+    (tmp_path / ".serger.jsonc").write_text("{}\n", encoding="utf-8")
+    output = tmp_path / "dist" / "pkg.py"
+    output.parent.mkdir()
+    output.write_text("# built\n", encoding="utf-8")
+    for path in [*src_dir.iterdir(), tmp_path / ".serger.jsonc", output]:
+        if path.is_file():
+            _age(path)
+    inputs = _inputs(tmp_path)
+    _record(output, tmp_path, inputs)
+    return tmp_path, output, inputs
+
+
+def _record(output: Path, root: Path, inputs: list[Path]) -> None:
+    fingerprints = mod_autils.apathetic_utils._fingerprint_inputs(root, inputs)
+    mod_autils.apathetic_utils._record_build(output, fingerprints, _COMMAND)
+
+
+def _extra_inputs(root: Path) -> list[Path]:
+    return [root / ".serger.jsonc", root / "pyproject.toml"]
+
+
+def _source_dirs(root: Path) -> list[Path]:
+    bundled = mod_autils.apathetic_utils._bundled_dependency_dirs(
+        root / ".serger.jsonc", root
+    )
+    return [root / "src" / "pkg", *bundled]
+
+
+def _inputs(root: Path) -> list[Path]:
+    return mod_autils.apathetic_utils._build_inputs(
+        _source_dirs(root), _extra_inputs(root)
+    )
+
+
+def _needs_rebuild(
+    root: Path, output: Path, command: list[str] = _COMMAND, *, refresh: bool = True
+) -> bool:
+    return mod_autils.apathetic_utils._check_needs_rebuild(
+        output, root, _source_dirs(root), _extra_inputs(root), command, refresh=refresh
+    )
+
+
+def _manifest(output: Path) -> dict[str, Any]:
+    path = output.with_name(output.name + ".manifest.json")
+    result: dict[str, Any] = json.loads(path.read_text())
+    return result
+
+
+def test_check_needs_rebuild_fresh_build(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, inputs = _project(tmp_path)
+
+    # --- execute / verify ---
+    assert not _needs_rebuild(root, output)
+    # Bytecode is not an input; missing extras are recorded as absent
+    assert sorted(_manifest(output)["inputs"]) == [
+        ".serger.jsonc",
+        "pyproject.toml",
+        "src/pkg/__init__.py",
+        "src/pkg/data.json",
+    ]
+    assert _manifest(output)["inputs"]["pyproject.toml"] is None
+    assert len(inputs) == 4  # noqa: PLR2004
+
+
+def test_check_needs_rebuild_missing_output_or_manifest(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+    manifest = output.with_name(output.name + ".manifest.json")
+
+    # --- execute ---
+    manifest.unlink()
+    without_manifest = _needs_rebuild(root, output)
+    output.unlink()
+    without_output = _needs_rebuild(root, output)
+
+    # --- verify ---
+    assert without_manifest
+    assert without_output
+
+
+def test_check_needs_rebuild_touched_input(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+    init = root / "src" / "pkg" / "__init__.py"
+    new_ns = _OLD_NS + 10**9
+    os.utime(init, ns=(new_ns, new_ns))
+
+    # --- execute ---
+    result = _needs_rebuild(root, output)
+
+    # --- verify ---
+    assert not result
+    assert _manifest(output)["inputs"]["src/pkg/__init__.py"]["mtime_ns"] == new_ns
+
+
+def test_check_needs_rebuild_read_only_precheck(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+    manifest = output.with_name(output.name + ".manifest.json")
+    recorded = manifest.read_bytes()
+    init = root / "src" / "pkg" / "__init__.py"
+    new_ns = _OLD_NS + 10**9
+    os.utime(init, ns=(new_ns, new_ns))
+
+    # --- execute ---
+    precheck = _needs_rebuild(root, output, refresh=False)
+    unchanged_after_precheck = manifest.read_bytes() == recorded
+    locked = _needs_rebuild(root, output, refresh=True)
+    precheck_after_refresh = _needs_rebuild(root, output, refresh=False)
+
+    # --- verify ---
+    assert precheck
+    assert unchanged_after_precheck
+    assert not locked
+    assert not precheck_after_refresh
+
+
+def test_check_needs_rebuild_changed_input(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+    init = root / "src" / "pkg" / "__init__.py"
+
+    # --- execute ---
+    init.write_text("A = 2\n", encoding="utf-8")  # Same size, new mtime
+
+    # --- verify ---
+    assert _needs_rebuild(root, output)
+
+
+def test_check_needs_rebuild_input_changed_during_build(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, inputs = _project(tmp_path)
+    source = root / "src" / "pkg" / "__init__.py"
+    source.write_text("A = 2\n", encoding="utf-8")
+    _age(source)
+    fingerprints = mod_autils.apathetic_utils._fingerprint_inputs(root, inputs)
+
+    # --- execute ---
+    # The bundler runs here; the source is edited before it finishes
+    source.write_text("A = 3\n", encoding="utf-8")
+    output.write_text("# built from A = 2\n", encoding="utf-8")
+    mod_autils.apathetic_utils._record_build(output, fingerprints, _COMMAND)
+
+    # --- verify ---
+    assert _needs_rebuild(root, output)
+
+
+def test_check_needs_rebuild_added_or_removed_input(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+    src_dir = root / "src" / "pkg"
+
+    # --- execute ---
+    (src_dir / "extra.py").write_text("", encoding="utf-8")
+    after_add = _needs_rebuild(root, output)
+    (src_dir / "extra.py").unlink()
+    (src_dir / "data.json").unlink()
+    after_remove = _needs_rebuild(root, output)
+
+    # --- verify ---
+    assert after_add
+    assert after_remove
+
+
+def test_check_needs_rebuild_pruned_dirs(tmp_path: Path) -> None:
+    # --- setup ---
+    src_dir = tmp_path / "src" / "pkg"
+    (src_dir / "sub" / "__pycache__").mkdir(parents=True)
+    (src_dir / ".mypy_cache").mkdir()
+    (src_dir / "sub" / "mod.py").write_text("", encoding="utf-8")
+    root, output, inputs = _project(tmp_path)
+
+    # --- execute ---
+    (src_dir / "sub" / "__pycache__" / "mod.cpython-311.pyc").write_bytes(b"")
+    (src_dir / ".mypy_cache" / "cache.json").write_text("{}", encoding="utf-8")
+    after_junk = _needs_rebuild(root, output)
+    (src_dir / "sub" / "mod.py").write_text("B = 1\n", encoding="utf-8")
+    after_edit = _needs_rebuild(root, output)
+
+    # --- verify ---
+    assert src_dir / "sub" / "mod.py" in inputs
+    assert not after_junk
+    assert after_edit
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+def test_check_needs_rebuild_symlinked_dir(tmp_path: Path) -> None:
+    # --- setup ---
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "mod.py").write_text("", encoding="utf-8")
+    src_dir = tmp_path / "src" / "pkg"
+    src_dir.mkdir(parents=True)
+    (src_dir / "linked").symlink_to(outside)
+    (src_dir / "loop").symlink_to(src_dir)
+    root, output, inputs = _project(tmp_path)
+
+    # --- execute ---
+    (outside / "mod.py").write_text("B = 1\n", encoding="utf-8")
+
+    # --- verify ---
+    assert not any("linked" in p.parts or "loop" in p.parts for p in inputs)
+    assert not _needs_rebuild(root, output)
+
+
+def test_check_needs_rebuild_bundled_dependency(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    site = tmp_path / "site"
+    (site / "fake_bundled_dep").mkdir(parents=True)
+    dep_init = site / "fake_bundled_dep" / "__init__.py"
+    dep_init.write_text("A = 1\n", encoding="utf-8")
+    _age(dep_init)
+    monkeypatch.syspath_prepend(str(site))
+    root, output, _ = _project(tmp_path / "project")
+    config = root / ".serger.jsonc"
+    config.write_text(
+        '{"include": ["src/pkg/**/*.py", "fake_bundled_dep/**/*.py"]}\n',
+        encoding="utf-8",
+    )
+    _age(config)
+    _record(output, root, _inputs(root))
+
+    # --- execute ---
+    before_edit = _needs_rebuild(root, output)
+    dep_init.write_text("A = 2\n", encoding="utf-8")  # e.g. an upgrade
+    after_edit = _needs_rebuild(root, output)
+
+    # --- verify ---
+    assert dep_init.as_posix() in _manifest(output)["inputs"]
+    assert not before_edit
+    assert after_edit
+
+
+def test_check_needs_rebuild_created_extra_input(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+
+    # --- execute ---
+    (root / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+
+    # --- verify ---
+    assert _needs_rebuild(root, output)
+
+
+def test_check_needs_rebuild_changed_command(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+
+    # --- execute / verify ---
+    assert _needs_rebuild(root, output, ["python", "dev/make_script.py"])
+
+
+def test_check_needs_rebuild_modified_output(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+
+    # --- execute ---
+    output.write_text("# edited\n", encoding="utf-8")
+
+    # --- verify ---
+    assert _needs_rebuild(root, output)
+
+
+def test_check_needs_rebuild_corrupt_manifest(tmp_path: Path) -> None:
+    # --- setup ---
+    root, output, _ = _project(tmp_path)
+    manifest = output.with_name(output.name + ".manifest.json")
+
+    # --- execute / verify ---
+    manifest.write_text("{not json", encoding="utf-8")
+    assert _needs_rebuild(root, output)
+    manifest.write_text('{"version": 999}', encoding="utf-8")
+    assert _needs_rebuild(root, output)
@@ -0,0 +1,82 @@
+# tests/30_independant/test_priv__classify_glob.py
+"""Tests for _classify_glob(), the regex-free fast-path classifier.
+
+Checklist:
+- kinds — each pattern shape maps to the expected (kind, text).
+- parity_with_regex — fast-path kinds agree with the regex translators.
+"""
+
+# We import `_` private for testing purposes only
+# ruff: noqa: SLF001
+# pyright: reportPrivateUsage=false
+
+import re
+from fnmatch import translate
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("setup.py", ("literal", "setup.py")),
+        ("", ("literal", "")),
+        ("*.pyc", ("suffix", ".pyc")),
+        ("**/__pycache__", ("suffix", "/__pycache__")),
+        ("**/*.egg-info", ("regex", "**/*.egg-info")),
+        ("dist/**", ("prefix", "dist/")),
+        ("build/*", ("prefix", "build/")),
+        ("*", ("any", "")),
+        ("***", ("any", "")),
+        ("*cache*", ("regex", "*cache*")),
+        ("src/*.py", ("regex", "src/*.py")),
+        ("file?.txt", ("regex", "file?.txt")),
+        ("[ab].cfg", ("regex", "[ab].cfg")),
+    ],
+)
+def test_classify_glob_kinds(pattern: str, expected: tuple[str, str]) -> None:
+    """Pattern shapes are classified into the right fast-path kind."""
+    # --- execute ---
+    result = mod_autils.apathetic_utils._classify_glob(pattern)
+
+    # --- verify ---
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["setup.py", "*.pyc", "**/__pycache__", "dist/**", "build/*", "*", "**", "a.b"],
+)
+@pytest.mark.parametrize(
+    "path",
+    [
+        "setup.py",
+        "x.pyc",
+        "a/b/c.pyc",
+        "__pycache__",
+        "pkg/__pycache__",
+        "dist/",
+        "dist/a/b",
+        "distx",
+        "build/a/b.o",
+        "",
+        "a.b",
+        "axb",
+    ],
+)
+def test_classify_glob_parity_with_regex(pattern: str, path: str) -> None:
+    """Fast-path answers equal the regex translation for the same pattern."""
+    # --- setup ---
+    if "**" in pattern:
+        regex = mod_autils.apathetic_utils._compile_glob_recursive(pattern)
+    else:
+        regex = re.compile(translate(pattern))
+
+    # --- execute ---
+    result = mod_autils.fnmatchcase_portable(path, pattern)
+
+    # --- verify ---
+    assert mod_autils.apathetic_utils._classify_glob(pattern)[0] != "regex"
+    assert result is (regex.match(path) is not None)
@@ -16,7 +16,7 @@ Test Coverage:
 - edge_cases_escaped_chars — regex metacharacters are escaped
 - edge_cases_empty_pattern — empty pattern behavior
 - edge_cases_run_of_stars — *** or more collapse to **
-- caching_behavior — @lru_cache(maxsize=512) caches patterns
+- caching_behavior — shared glob cache (maxsize=512) caches patterns
 - regex_anchoring — pattern is anchored with \Z
 """
 
@@ -24,7 +24,6 @@ Test Coverage:
 # ruff: noqa: SLF001
 # pyright: reportPrivateUsage=false
 
-from functools import _lru_cache_wrapper
 from typing import Any
 
 import apathetic_utils as mod_autils
@@ -453,18 +452,13 @@ class TestCompileGlobRecursiveEdgeCases:
 
 
 class TestCompileGlobRecursiveCaching:
-    """Test @lru_cache behavior with maxsize=512."""
+    """Test the shared glob cache (default maxsize=512)."""
 
-    def test_lru_cache_is_enabled(self) -> None:
-        """Function should have @lru_cache decorator."""
-        # --- verify ---
-        assert isinstance(mod_utils._compile_glob_recursive, _lru_cache_wrapper)
-
-    def test_lru_cache_has_correct_maxsize(self) -> None:
-        """lru_cache should have correct maxsize."""
+    def test_default_maxsize(self) -> None:
+        """The glob cache defaults to 512 entries."""
         # --- verify ---
         assert (
-            mod_utils._compile_glob_recursive.cache_info().maxsize
+            mod_autils.apathetic_utils.DEFAULT_GLOB_CACHE_SIZE
             == _COMPILE_GLOB_RECURSIVE_CACHE_MAXSIZE
         )
 
@@ -492,40 +486,51 @@ class TestCompileGlobRecursiveCaching:
     def test_cache_info_tracks_hits_and_misses(self) -> None:
         """Cache info should track hits and misses."""
         # --- setup ---
-        mod_utils._compile_glob_recursive.cache_clear()
+        mod_autils.clear_glob_cache()
 
         # --- execute: first call is a miss ---
         mod_utils._compile_glob_recursive("pattern1")
-        info1 = mod_utils._compile_glob_recursive.cache_info()
+        info1 = mod_autils.glob_cache_info()
         assert info1.hits == 0
         assert info1.misses == 1
 
         # --- execute: second call is a hit ---
         mod_utils._compile_glob_recursive("pattern1")
-        info2 = mod_utils._compile_glob_recursive.cache_info()
+        info2 = mod_autils.glob_cache_info()
         assert info2.hits == 1
         assert info2.misses == 1
 
         # --- cleanup ---
-        mod_utils._compile_glob_recursive.cache_clear()
+        mod_autils.clear_glob_cache()
 
     def test_cache_clear_works(self) -> None:
-        """cache_clear() should reset cache."""
+        """clear_glob_cache() should reset cache."""
         # --- setup ---
-        mod_utils._compile_glob_recursive.cache_clear()
+        mod_autils.clear_glob_cache()
 
         # --- execute ---
         mod_utils._compile_glob_recursive("pattern")
-        info_before = mod_utils._compile_glob_recursive.cache_info()
-        mod_utils._compile_glob_recursive.cache_clear()
-        info_after = mod_utils._compile_glob_recursive.cache_info()
+        info_before = mod_autils.glob_cache_info()
+        mod_autils.clear_glob_cache()
+        info_after = mod_autils.glob_cache_info()
 
         # --- verify ---
         assert info_before.currsize > 0
         assert info_after.currsize == 0
 
-        # --- cleanup ---
-        mod_utils._compile_glob_recursive.cache_clear()
+    def test_cache_shared_with_fnmatchcase_portable(self) -> None:
+        """'**' patterns compiled here are reused by fnmatchcase_portable()."""
+        # --- setup ---
+        mod_autils.clear_glob_cache()
+
+        # --- execute ---
+        mod_utils._compile_glob_recursive("src/**/test_*.py")
+        mod_autils.fnmatchcase_portable("src/a/test_x.py", "src/**/test_*.py")
+        info = mod_autils.glob_cache_info()
+
+        # --- verify ---
+        assert info.misses == 1
+        assert info.hits == 1
 
 
 class TestCompileGlobRecursiveRegexAnchorAndMode:
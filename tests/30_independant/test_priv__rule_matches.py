@@ -0,0 +1,64 @@
+# tests/30_independant/test_priv__rule_matches.py
+"""Tests for _rule_matches(), the include-rule check of iter_included_files().
+
+Checklist:
+- start_itself — a path equal to the start matches.
+- below_start — globs are matched relative to the start.
+- sibling_prefix — a sibling sharing the start's name prefix does not match.
+- filesystem_root — a start that already ends in a separator ("/").
+"""
+
+# We import `_` private for testing purposes only
+# ruff: noqa: SLF001
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+
+import apathetic_utils as mod_autils
+
+
+_START = Path("/proj/src").absolute()
+
+
+def _rules(start: Path, *globs: str) -> list[tuple[str, mod_autils.GlobSet | None]]:
+    return [(str(start), mod_autils.compile_glob_set(list(globs)) if globs else None)]
+
+
+def test_rule_matches_start_itself() -> None:
+    """The start path itself is selected."""
+    # --- execute / verify ---
+    assert mod_autils.apathetic_utils._rule_matches(_rules(_START, "*.py"), str(_START))
+
+
+def test_rule_matches_below_start() -> None:
+    """Globs see the path relative to the start, with '/' separators."""
+    # --- setup ---
+    rules = _rules(_START, "pkg/*.py")
+    match = mod_autils.apathetic_utils._rule_matches
+
+    # --- execute / verify ---
+    assert match(rules, str(_START / "pkg" / "mod.py"))
+    assert not match(rules, str(_START / "pkg" / "mod.txt"))
+    assert not match(rules, str(_START / "mod.py"))
+
+
+def test_rule_matches_sibling_prefix() -> None:
+    """A sibling whose name starts with the start's name is not below it."""
+    # --- execute / verify ---
+    assert not mod_autils.apathetic_utils._rule_matches(
+        _rules(_START), str(_START.parent / "src2" / "mod.py")
+    )
+
+
+def test_rule_matches_filesystem_root() -> None:
+    """A start ending in a separator is not given a second one."""
+    # --- setup ---
+    root = Path(_START.anchor)  # "/" or the drive root, e.g. "C:\\"
+    match = mod_autils.apathetic_utils._rule_matches
+
+    # --- execute / verify ---
+    assert str(root).endswith(("/", "\\"))
+    assert match(_rules(root), str(root / "etc" / "hosts"))
+    assert match(_rules(root, "etc/*"), str(root / "etc" / "hosts"))
+    assert match(_rules(root, "*.txt"), str(root / "notes.txt"))
+    assert not match(_rules(root, "etc/*"), str(root / "etc2" / "hosts"))
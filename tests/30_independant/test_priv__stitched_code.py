@@ -0,0 +1,148 @@
+# tests/30_independant/test_priv__stitched_code.py
+"""Tests for apathetic_utils._stitched_code (stitched-mode bytecode cache).
+
+Checklist:
+- cache_written_and_reused — first load compiles and writes, second reads.
+- validated_by_source_hash — an edit is seen even with an unchanged mtime.
+- corrupt_cache_recompiled — a damaged cache is replaced.
+- unwritable_cache_dir — still returns the code.
+- default_location — __pycache__ next to the script, or sys.pycache_prefix.
+- dont_write_bytecode — the default location is then left alone.
+"""
+
+# we import `_` private for testing purposes only
+# ruff: noqa: SLF001
+# pyright: reportPrivateUsage=false
+
+import os
+import sys
+from pathlib import Path
+from types import CodeType
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+def _write_script(tmp_path: Path, value: int) -> Path:
+    script = tmp_path / "dist" / "tool.py"
+    script.parent.mkdir(exist_ok=True)
+    script.write_text(f"VALUE = {value}\n", encoding="utf-8")
+    return script
+
+
+def _load(script: Path, bytecode_dir: Path | None) -> tuple[CodeType, list[str]]:
+    traces: list[str] = []
+    code = mod_autils.apathetic_utils._stitched_code(
+        script, bytecode_dir, traces.append
+    )
+    return code, traces
+
+
+def _value(code: CodeType) -> object:
+    namespace: dict[str, object] = {}
+    exec(code, namespace)  # noqa: S102
+    return namespace["VALUE"]
+
+
+def test_stitched_code_cache_written_and_reused(tmp_path: Path) -> None:
+    # --- setup ---
+    script = _write_script(tmp_path, 1)
+    cache_dir = tmp_path / "bytecode"
+
+    # --- execute ---
+    first, first_traces = _load(script, cache_dir)
+    second, second_traces = _load(script, cache_dir)
+
+    # --- verify ---
+    assert _value(first) == _value(second) == 1
+    assert "Wrote stitched bytecode" in first_traces[0]
+    assert "Loaded stitched bytecode" in second_traces[0]
+    assert [p.name for p in cache_dir.iterdir()] == [
+        f"tool.{sys.implementation.cache_tag}.pyc"
+    ]
+
+
+def test_stitched_code_validated_by_source_hash(tmp_path: Path) -> None:
+    # --- setup ---
+    script = _write_script(tmp_path, 1)
+    cache_dir = tmp_path / "bytecode"
+    _load(script, cache_dir)
+    stat = script.stat()
+
+    # --- execute ---
+    _write_script(tmp_path, 2)
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    code, traces = _load(script, cache_dir)
+
+    # --- verify ---
+    assert _value(code) == 2  # noqa: PLR2004
+    assert "Wrote stitched bytecode" in traces[0]
+
+
+def test_stitched_code_corrupt_cache_recompiled(tmp_path: Path) -> None:
+    # --- setup ---
+    script = _write_script(tmp_path, 3)
+    cache_dir = tmp_path / "bytecode"
+    _load(script, cache_dir)
+    (pyc,) = cache_dir.iterdir()
+    pyc.write_bytes(pyc.read_bytes()[:20])
+
+    # --- execute ---
+    code, traces = _load(script, cache_dir)
+
+    # --- verify ---
+    assert _value(code) == 3  # noqa: PLR2004
+    assert "Wrote stitched bytecode" in traces[0]
+    assert "Loaded stitched bytecode" in _load(script, cache_dir)[1][0]
+
+
+def test_stitched_code_unwritable_cache_dir(tmp_path: Path) -> None:
+    # --- setup ---
+    script = _write_script(tmp_path, 4)
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("", encoding="utf-8")
+
+    # --- execute ---
+    code, traces = _load(script, not_a_dir)
+
+    # --- verify ---
+    assert _value(code) == 4  # noqa: PLR2004
+    assert "Cannot write stitched bytecode" in traces[0]
+    assert list(tmp_path.glob("**/*.tmp")) == []
+
+
+@pytest.mark.parametrize("use_prefix", [False, True])
+def test_stitched_code_default_location(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, use_prefix: bool
+) -> None:
+    # --- setup ---
+    script = _write_script(tmp_path, 5)
+    prefix = tmp_path / "prefix"
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    monkeypatch.setattr(sys, "pycache_prefix", str(prefix) if use_prefix else None)
+
+    # --- execute ---
+    _load(script, None)
+
+    # --- verify ---
+    pycache = script.parent / "__pycache__"
+    assert pycache.exists() is not use_prefix
+    assert any(prefix.glob("**/tool.*.pyc")) is use_prefix
+
+
+def test_stitched_code_dont_write_bytecode(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    script = _write_script(tmp_path, 6)
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.setattr(sys, "pycache_prefix", None)
+
+    # --- execute ---
+    code, traces = _load(script, None)
+
+    # --- verify ---
+    assert _value(code) == 6  # noqa: PLR2004
+    assert traces == []
+    assert not (script.parent / "__pycache__").exists()
@@ -0,0 +1,126 @@
+# tests/30_independant/test_resolve_cache.py
+"""Tests for resolve_cache and the ResolveCache scope.
+
+Checklist:
+- resolves_each_path_once — repeated lookups hit the cache.
+- dropped_on_exit — entries are cleared and resolve_path stops caching.
+- nested_shares_outer — an inner block reuses the outer cache.
+- relative_paths_follow_cwd — relative paths are keyed by the current dir.
+- detect_packages_resolves_once — package detection resolves each path once.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+def _count_resolves(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every Path.resolve() call made while the patch is active."""
+    calls: list[Path] = []
+    original = Path.resolve
+
+    def counting_resolve(self: Path, strict: bool = False) -> Path:  # noqa: FBT001, FBT002
+        calls.append(self)
+        return original(self, strict=strict)
+
+    monkeypatch.setattr(Path, "resolve", counting_resolve)
+    return calls
+
+
+def test_resolve_cache_resolves_each_path_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Inside the block, each distinct path is resolved a single time."""
+    # --- setup ---
+    calls = _count_resolves(monkeypatch)
+    target = tmp_path / "a" / ".." / "b.txt"
+
+    # --- execute ---
+    with mod_autils.resolve_cache() as cache:
+        first = mod_autils.resolve_path(target)
+        second = mod_autils.resolve_path(str(target))
+
+    # --- verify ---
+    assert first == second == (tmp_path / "b.txt")
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_resolve_cache_dropped_on_exit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Leaving the block clears the cache; later calls resolve every time."""
+    # --- setup ---
+    calls = _count_resolves(monkeypatch)
+
+    # --- execute ---
+    with mod_autils.resolve_cache() as cache:
+        mod_autils.resolve_path(tmp_path)
+    mod_autils.resolve_path(tmp_path)
+    mod_autils.resolve_path(tmp_path)
+
+    # --- verify ---
+    assert cache.entries == {}
+    assert len(calls) == 3  # noqa: PLR2004
+
+
+def test_resolve_cache_nested_shares_outer(tmp_path: Path) -> None:
+    """A nested block yields the outer cache and does not clear it."""
+    # --- execute ---
+    with mod_autils.resolve_cache() as outer:
+        with mod_autils.resolve_cache() as inner:
+            mod_autils.resolve_path(tmp_path)
+        after_inner = len(outer.entries)
+
+    # --- verify ---
+    assert inner is outer
+    assert after_inner == 1
+
+
+def test_resolve_cache_relative_paths_follow_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The same relative path resolves against whichever dir is current."""
+    # --- setup ---
+    (tmp_path / "one").mkdir()
+    (tmp_path / "two").mkdir()
+
+    # --- execute ---
+    with mod_autils.resolve_cache():
+        monkeypatch.chdir(tmp_path / "one")
+        in_one = mod_autils.resolve_path("file.txt")
+        monkeypatch.chdir(tmp_path / "two")
+        in_two = mod_autils.resolve_path("file.txt")
+
+    # --- verify ---
+    assert in_one == Path(os.path.realpath(tmp_path / "one" / "file.txt"))
+    assert in_two == Path(os.path.realpath(tmp_path / "two" / "file.txt"))
+
+
+def test_resolve_cache_detect_packages_resolves_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """detect_packages_from_files() resolves each file and base only once."""
+    # --- setup ---
+    src = tmp_path / "src"
+    files: list[Path] = []
+    for pkg in ("alpha", "beta"):
+        for sub in ("core", "util"):
+            for name in ("a.py", "b.py"):
+                f = src / "ns" / pkg / sub / name
+                f.parent.mkdir(parents=True, exist_ok=True)
+                f.touch()
+                files.append(f)
+    calls = _count_resolves(monkeypatch)
+
+    # --- execute ---
+    detected, _parents = mod_autils.detect_packages_from_files(
+        files, "app", source_bases=[str(src)]
+    )
+
+    # --- verify ---
+    assert {"ns", "alpha", "beta", "core", "util"} <= detected
+    assert len(calls) == len(set(calls))
@@ -0,0 +1,47 @@
+# tests/30_independant/test_resolve_path.py
+"""Tests for resolve_path.
+
+Checklist:
+- matches_path_resolve — same result as Path.resolve() for str and Path.
+- uncached_outside_scope — without resolve_cache(), every call resolves.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+@pytest.mark.parametrize("rel", [".", "a/../b", "a/./b/", "missing/file.txt"])
+def test_resolve_path_matches_path_resolve(tmp_path: Path, rel: str) -> None:
+    """resolve_path() returns exactly what Path.resolve() returns."""
+    # --- setup ---
+    (tmp_path / "a").mkdir()
+    target = tmp_path / rel
+
+    # --- execute / verify ---
+    assert mod_autils.resolve_path(target) == target.resolve()
+    assert mod_autils.resolve_path(str(target)) == target.resolve()
+
+
+def test_resolve_path_uncached_outside_scope(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Outside a resolve_cache() block nothing is memoized."""
+    # --- setup ---
+    calls: list[Path] = []
+    original = Path.resolve
+
+    def counting_resolve(self: Path, strict: bool = False) -> Path:  # noqa: FBT001, FBT002
+        calls.append(self)
+        return original(self, strict=strict)
+
+    monkeypatch.setattr(Path, "resolve", counting_resolve)
+
+    # --- execute ---
+    mod_autils.resolve_path(tmp_path)
+    mod_autils.resolve_path(tmp_path)
+
+    # --- verify ---
+    assert len(calls) == 2  # noqa: PLR2004
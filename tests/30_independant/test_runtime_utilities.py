@@ -6,6 +6,9 @@ and runtime_swap functions, including optional script_name parameter behavior.
 """
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -134,6 +137,58 @@ out_path.write_text("# Mock bundled script\\n")
     assert script_path.exists()
 
 
+_CONCURRENT_CALLER = """
+import sys
+from pathlib import Path
+import apathetic_utils
+apathetic_utils.ensure_stitched_script_up_to_date(
+    root=Path(sys.argv[1]), package_name="testpkg", command_path="bin/bundle.py"
+)
+"""
+
+
+def test_ensure_stitched_script_up_to_date_concurrent_build_once(
+    tmp_path: Path,
+) -> None:
+    """Processes racing on a stale script build it once, then all use it."""
+    # --- setup ---
+    pkg_dir = tmp_path / "src" / "testpkg"
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text('"""Test package."""\n')
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "bundle.py").write_text(
+        """import time
+from pathlib import Path
+
+with Path("builds.log").open("a") as f:
+    f.write("build\\n")
+time.sleep(0.5)  # Long enough for the other callers to find it stale
+Path("dist").mkdir(exist_ok=True)
+Path("dist/testpkg.py").write_text("# Mock bundled script\\n")
+"""
+    )
+    # Import the module under test from where it came from (src/, dist/, .pyz)
+    module_file = Path(amod_utils_runtime.__file__)
+    stitched = module_file.name != "runtime.py"
+    import_root = module_file.parent if stitched else module_file.parent.parent
+    env = {**os.environ, "PYTHONPATH": str(import_root)}
+
+    # --- execute ---
+    procs = [
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, "-c", _CONCURRENT_CALLER, str(tmp_path)], env=env
+        )
+        for _ in range(4)
+    ]
+    returncodes = [proc.wait() for proc in procs]
+
+    # --- verify ---
+    assert returncodes == [0, 0, 0, 0]
+    assert (tmp_path / "builds.log").read_text() == "build\n"
+    assert (tmp_path / "dist" / "testpkg.py").exists()
+
+
 # ---------------------------------------------------------------------------
 # Tests for ensure_zipapp_up_to_date
 # ---------------------------------------------------------------------------
@@ -196,6 +251,88 @@ testpkg = "testpkg:main"
     assert zipapp_path.exists()
 
 
+# ---------------------------------------------------------------------------
+# Tests for ensure_artifacts_up_to_date
+# ---------------------------------------------------------------------------
+
+# Mock bundler that only finishes once the other one has started, so the
+# builds must overlap
+_RENDEZVOUS_BUNDLER = """import sys
+import time
+from pathlib import Path
+
+Path("{mode}.started").touch()
+deadline = time.monotonic() + 30
+while not Path("{other}.started").exists():
+    if time.monotonic() > deadline:
+        sys.exit("{other} never started")
+    time.sleep(0.01)
+print("built {mode}")
+Path("dist").mkdir(exist_ok=True)
+Path("{output}").write_text("# Mock bundled {mode}\\n")
+"""
+
+
+def test_ensure_artifacts_up_to_date_builds_concurrently(
+    tmp_path: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    """Both bundlers run at the same time; every output line names its build."""
+    # --- setup ---
+    pkg_dir = tmp_path / "src" / "testpkg"
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text('"""Test package."""\n')
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "stitch.py").write_text(
+        _RENDEZVOUS_BUNDLER.format(
+            mode="stitched", other="zipapp", output="dist/testpkg.py"
+        )
+    )
+    (bin_dir / "zipapp.py").write_text(
+        _RENDEZVOUS_BUNDLER.format(
+            mode="zipapp", other="stitched", output="dist/testpkg.pyz"
+        )
+    )
+
+    # --- execute ---
+    paths = _runtime.ensure_artifacts_up_to_date(
+        root=tmp_path,
+        package_name="testpkg",
+        modes=["stitched", "zipapp", "package"],
+        stitch_command="bin/stitch.py",
+        zipapp_command="bin/zipapp.py",
+    )
+
+    # --- verify ---
+    assert paths == {
+        "stitched": tmp_path / "dist" / "testpkg.py",
+        "zipapp": tmp_path / "dist" / "testpkg.pyz",
+        "package": pkg_dir,
+    }
+    assert all(path.exists() for path in paths.values())
+    out = capfd.readouterr().out
+    assert "[stitched] ⚙️  Rebuilding stitched script (python bin/stitch.py)..." in out
+    assert "[zipapp] ⚙️  Rebuilding zipapp (python bin/zipapp.py)..." in out
+    assert "[stitched] built stitched\n" in out
+    assert "[zipapp] built zipapp\n" in out
+    unattributed = [
+        line
+        for line in out.splitlines()
+        if line and not line.startswith(("[stitched] ", "[zipapp] "))
+    ]
+    assert unattributed == []
+
+
+def test_ensure_artifacts_up_to_date_unknown_mode(tmp_path: Path) -> None:
+    """Unknown modes are rejected before anything is built."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="Unknown runtime mode"):
+        _runtime.ensure_artifacts_up_to_date(
+            root=tmp_path, package_name="testpkg", modes=["stitched", "frozen"]
+        )
+    assert not (tmp_path / "dist").exists()
+
+
 # ---------------------------------------------------------------------------
 # Tests for runtime_swap
 # ---------------------------------------------------------------------------
@@ -260,6 +397,44 @@ def test_runtime_swap_stitched_without_script_name(
     assert expected_script.exists()
 
 
+def test_runtime_swap_stitched_bytecode_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test runtime_swap caches the stitched script's bytecode in bytecode_dir."""
+    # --- setup ---
+    pkg_dir = tmp_path / "src" / "testpkg"
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text('"""Test package."""\n')
+    (pkg_dir / "module.py").write_text('"""Test module."""\n\nvalue = 42\n')
+
+    config = tmp_path / ".serger.jsonc"
+    config_data = {
+        "package": "testpkg",
+        "include": ["src/testpkg/**/*.py"],
+        "out": "dist/testpkg.py",
+        "disable_build_timestamp": True,
+    }
+    config.write_text(json.dumps(config_data, indent=2))
+    bytecode_dir = tmp_path / "bytecode"
+
+    monkeypatch.chdir(tmp_path)
+
+    # --- execute ---
+    result = _runtime.runtime_swap(
+        root=tmp_path,
+        package_name="testpkg",
+        mode="stitched",
+        bytecode_dir=bytecode_dir,
+    )
+
+    # --- verify ---
+    assert result is True
+    assert [p.name for p in bytecode_dir.iterdir()] == [
+        f"testpkg.{sys.implementation.cache_tag}.pyc"
+    ]
+
+
 def test_runtime_swap_zipapp_without_script_name(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -0,0 +1,45 @@
+# tests/30_independant/test_set_glob_cache_size.py
+"""Tests for set_glob_cache_size (the LRU itself: test_sized_lru.py).
+
+Checklist:
+- shrink_evicts — shrinking the cache evicts down to the new size.
+- negative_raises — negative sizes are rejected.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+@pytest.fixture(autouse=True)
+def _restore_glob_cache_size() -> Iterator[None]:
+    size = mod_autils.glob_cache_info().maxsize
+    mod_autils.clear_glob_cache()
+    yield
+    mod_autils.set_glob_cache_size(size)
+    mod_autils.clear_glob_cache()
+
+
+def test_set_glob_cache_size_shrink_evicts() -> None:
+    """Shrinking the cache immediately drops the oldest entries."""
+    # --- setup ---
+    for i in range(10):
+        mod_autils.fnmatchcase_portable("x", f"p{i}?")
+
+    # --- execute ---
+    mod_autils.set_glob_cache_size(3)
+    info = mod_autils.glob_cache_info()
+
+    # --- verify ---
+    assert info.maxsize == 3  # noqa: PLR2004
+    assert info.currsize == 3  # noqa: PLR2004
+    assert info.evictions == 7  # noqa: PLR2004
+
+
+def test_set_glob_cache_size_negative_raises() -> None:
+    """Negative sizes are a ValueError."""
+    # --- execute / verify ---
+    with pytest.raises(ValueError, match=">= 0"):
+        mod_autils.set_glob_cache_size(-1)
@@ -0,0 +1,276 @@
+# tests/30_independant/test_set_parse_cache_dir.py
+"""Tests for set_parse_cache_dir, the on-disk parse cache.
+
+Checklist:
+- shared_between_caches — a cold in-memory cache is served from disk.
+- info_reports_directory — parse_cache_info() shows the directory in use.
+- content_checked — a record is not used once the content differs, even with
+  the same size and mtime.
+- corrupt_record_reparsed — garbage records are misses and get rewritten.
+- unwritable_dir_ignored — write failures do not break loading.
+- no_temp_files_left — atomic writes leave only the final records.
+- concurrent_threads — many writers and readers never see partial records.
+- concurrent_processes — separate processes share the directory.
+- disable — None stops using the directory.
+- env_var — APATHETIC_UTILS_PARSE_CACHE_DIR is read at import time.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_OLD_NS = 1_000_000_000_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _restore_parse_cache_dir() -> Iterator[None]:
+    directory = mod_autils.parse_cache_info().directory
+    mod_autils.clear_parse_cache()
+    yield
+    mod_autils.set_parse_cache_dir(directory)
+    mod_autils.clear_parse_cache()
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(_OLD_NS, _OLD_NS))
+    return path
+
+
+def _import_root() -> Path:
+    """Return the sys.path entry that imports the apathetic_utils under test."""
+    module_file = Path(mod_autils.__file__)
+    # Package / zipapp: .../apathetic_utils/__init__.py; stitched: one file
+    if module_file.name == "__init__.py":
+        return module_file.parent.parent
+    return module_file.parent
+
+
+def _records(cache_dir: Path) -> list[Path]:
+    return sorted(cache_dir.iterdir()) if cache_dir.exists() else []
+
+
+def test_set_parse_cache_dir_shared_between_caches(tmp_path: Path) -> None:
+    """After the in-memory cache is dropped, the disk record is reused."""
+    # --- setup ---
+    cache_dir = tmp_path / "cache"
+    cfg = _write(tmp_path / "pyproject.toml", '[project]\nname = "x"\n')
+    mod_autils.set_parse_cache_dir(cache_dir)
+    first = mod_autils.load_toml(cfg, cache=True)
+    mod_autils.clear_parse_cache()  # as if in a new process
+
+    # --- execute ---
+    second = mod_autils.load_toml(cfg, cache=True)
+    third = mod_autils.load_toml(cfg, cache=True)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert first == second == third == {"project": {"name": "x"}}
+    assert (info.misses, info.disk_hits, info.hits) == (1, 1, 1)
+    assert len(_records(cache_dir)) == 1
+
+
+def test_set_parse_cache_dir_info_reports_directory(tmp_path: Path) -> None:
+    """The configured directory is part of the statistics snapshot."""
+    # --- execute ---
+    mod_autils.set_parse_cache_dir(str(tmp_path))
+    enabled = mod_autils.parse_cache_info().directory
+    mod_autils.set_parse_cache_dir(None)
+    disabled = mod_autils.parse_cache_info().directory
+
+    # --- verify ---
+    assert enabled == tmp_path
+    assert disabled is None
+
+
+def test_set_parse_cache_dir_content_checked(tmp_path: Path) -> None:
+    """A same-size, same-mtime rewrite is caught by the content hash."""
+    # --- setup ---
+    cache_dir = tmp_path / "cache"
+    cfg = _write(tmp_path / "cfg.jsonc", '{"a": 1}')
+    mod_autils.set_parse_cache_dir(cache_dir)
+    mod_autils.load_jsonc(cfg, cache=True)
+    mod_autils.clear_parse_cache()
+    _write(cfg, '{"a": 2}')
+
+    # --- execute ---
+    result = mod_autils.load_jsonc(cfg, cache=True)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert result == {"a": 2}
+    assert info.disk_hits == 0
+
+
+def test_set_parse_cache_dir_corrupt_record_reparsed(tmp_path: Path) -> None:
+    """Truncated or garbage records are misses and get replaced."""
+    # --- setup ---
+    cache_dir = tmp_path / "cache"
+    cfg = _write(tmp_path / "cfg.toml", "n = 1\n")
+    mod_autils.set_parse_cache_dir(cache_dir)
+    mod_autils.load_toml(cfg, cache=True)
+    (record,) = _records(cache_dir)
+
+    # --- execute / verify ---
+    for garbage in (b"", b"AUPC", record.read_bytes()[:-3]):
+        record.write_bytes(garbage)
+        mod_autils.clear_parse_cache()
+        assert mod_autils.load_toml(cfg, cache=True) == {"n": 1}
+        assert mod_autils.parse_cache_info().disk_hits == 0
+
+    mod_autils.clear_parse_cache()
+    assert mod_autils.load_toml(cfg, cache=True) == {"n": 1}
+    assert mod_autils.parse_cache_info().disk_hits == 1
+
+
+def test_set_parse_cache_dir_unwritable_dir_ignored(tmp_path: Path) -> None:
+    """A cache directory that cannot be created does not break loading."""
+    # --- setup ---
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("x")
+    cfg = _write(tmp_path / "cfg.toml", "n = 1\n")
+    mod_autils.set_parse_cache_dir(blocker / "cache")
+
+    # --- execute ---
+    result = mod_autils.load_toml(cfg, cache=True)
+
+    # --- verify ---
+    assert result == {"n": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cfg.toml", "not_a_dir"]
+
+
+def test_set_parse_cache_dir_no_temp_files_left(tmp_path: Path) -> None:
+    """Every write ends in a rename: no temporary files remain."""
+    # --- setup ---
+    cache_dir = tmp_path / "cache"
+    mod_autils.set_parse_cache_dir(cache_dir)
+
+    # --- execute ---
+    for i in range(5):
+        cfg = _write(tmp_path / f"cfg{i}.toml", f"n = {i}\n")
+        mod_autils.load_toml(cfg, cache=True)
+
+    # --- verify ---
+    names = [p.name for p in _records(cache_dir)]
+    assert len(names) == 5  # noqa: PLR2004
+    assert all(name.endswith(".pickle") for name in names)
+
+
+def test_set_parse_cache_dir_concurrent_threads(tmp_path: Path) -> None:
+    """Concurrent rewrites of one record never yield a torn result."""
+    # --- setup ---
+    cache_dir = tmp_path / "cache"
+    cfg = _write(tmp_path / "cfg.toml", 'items = ["' + "x" * 50_000 + '"]\n')
+    expected = mod_autils.load_toml(cfg)
+    mod_autils.set_parse_cache_dir(cache_dir)
+
+    def _load(_: int) -> object:
+        # A fresh in-memory cache per call, like a separate process
+        mod_autils.clear_parse_cache()
+        return mod_autils.load_toml(cfg, cache=True)
+
+    # --- execute ---
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(_load, range(64)))
+
+    # --- verify ---
+    assert all(result == expected for result in results)
+    assert [p.suffix for p in _records(cache_dir)] == [".pickle"]
+
+
+def test_set_parse_cache_dir_concurrent_processes(tmp_path: Path) -> None:
+    """Processes started together share records through the directory."""
+    # --- setup ---
+    cache_dir = tmp_path / "cache"
+    cfg = _write(tmp_path / "pyproject.toml", "[tool.x]\nvalues = [1, 2, 3]\n")
+    import_root = _import_root()
+    script = textwrap.dedent(
+        f"""
+        import json, sys
+        from pathlib import Path
+        sys.path.insert(0, {str(import_root)!r})
+        import apathetic_utils as au
+        au.set_parse_cache_dir({str(cache_dir)!r})
+        data = au.load_toml(Path({str(cfg)!r}), cache=True)
+        print(json.dumps([data, au.parse_cache_info().disk_hits]))
+        """
+    )
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    env.pop(mod_autils.apathetic_utils.PARSE_CACHE_DIR_ENV_VAR, None)
+
+    def _run_all(count: int) -> list[list[object]]:
+        procs = [
+            subprocess.Popen(  # noqa: S603
+                [sys.executable, "-c", script],
+                stdout=subprocess.PIPE,
+                env=env,
+                text=True,
+            )
+            for _ in range(count)
+        ]
+        return [json.loads(proc.communicate(timeout=60)[0]) for proc in procs]
+
+    # --- execute ---
+    together = _run_all(4)
+    later = _run_all(1)
+
+    # --- verify ---
+    expected = {"tool": {"x": {"values": [1, 2, 3]}}}
+    assert all(data == expected for data, _ in together + later)
+    assert later[0][1] == 1
+    assert [p.suffix for p in _records(cache_dir)] == [".pickle"]
+
+
+def test_set_parse_cache_dir_disable(tmp_path: Path) -> None:
+    """With None, nothing is read from or written to disk."""
+    # --- setup ---
+    cache_dir = tmp_path / "cache"
+    cfg = _write(tmp_path / "cfg.toml", "n = 1\n")
+    mod_autils.set_parse_cache_dir(cache_dir)
+    mod_autils.set_parse_cache_dir(None)
+
+    # --- execute ---
+    mod_autils.load_toml(cfg, cache=True)
+
+    # --- verify ---
+    assert not cache_dir.exists()
+
+
+def test_set_parse_cache_dir_env_var(tmp_path: Path) -> None:
+    """The env var names the initial cache directory."""
+    # --- setup ---
+    import_root = _import_root()
+    env_var = mod_autils.apathetic_utils.PARSE_CACHE_DIR_ENV_VAR
+    script = (
+        f"import sys; sys.path.insert(0, {str(import_root)!r}); "
+        "import apathetic_utils as au; print(au.parse_cache_info().directory)"
+    )
+
+    # --- execute ---
+    def _directory(value: str | None) -> str:
+        env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+        env.pop(env_var, None)
+        if value is not None:
+            env[env_var] = value
+        return subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        ).stdout.strip()
+
+    # --- verify ---
+    assert _directory(str(tmp_path)) == str(tmp_path)
+    assert _directory("") == "None"
+    assert _directory(None) == "None"
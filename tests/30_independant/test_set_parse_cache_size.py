@@ -0,0 +1,60 @@
+# tests/30_independant/test_set_parse_cache_size.py
+"""Tests for set_parse_cache_size (the LRU itself: test_sized_lru.py).
+
+Checklist:
+- shrink_evicts — shrinking the cache evicts down to the new size.
+- negative_raises — negative sizes are rejected.
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+_OLD_NS = 1_000_000_000_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _restore_parse_cache_size() -> Iterator[None]:
+    size = mod_autils.parse_cache_info().maxsize
+    mod_autils.clear_parse_cache()
+    yield
+    mod_autils.set_parse_cache_size(size)
+    mod_autils.clear_parse_cache()
+
+
+def _files(tmp_path: Path, count: int) -> list[Path]:
+    paths: list[Path] = []
+    for i in range(count):
+        path = tmp_path / f"cfg{i}.toml"
+        path.write_text(f"n = {i}\n", encoding="utf-8")
+        os.utime(path, ns=(_OLD_NS, _OLD_NS))
+        paths.append(path)
+    return paths
+
+
+def test_set_parse_cache_size_shrink_evicts(tmp_path: Path) -> None:
+    """Shrinking the cache immediately drops the oldest entries."""
+    # --- setup ---
+    for path in _files(tmp_path, 5):
+        mod_autils.load_toml(path, cache=True)
+
+    # --- execute ---
+    mod_autils.set_parse_cache_size(2)
+    info = mod_autils.parse_cache_info()
+
+    # --- verify ---
+    assert info.maxsize == 2  # noqa: PLR2004
+    assert info.currsize == 2  # noqa: PLR2004
+    assert info.evictions == 3  # noqa: PLR2004
+
+
+def test_set_parse_cache_size_negative_raises() -> None:
+    """Negative sizes are a ValueError."""
+    # --- execute / verify ---
+    with pytest.raises(ValueError, match=">= 0"):
+        mod_autils.set_parse_cache_size(-1)
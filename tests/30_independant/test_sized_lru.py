@@ -0,0 +1,115 @@
+# tests/30_independant/test_sized_lru.py
+"""Tests for SizedLRU, the bounded LRU behind the glob and parse caches.
+
+Checklist:
+- lookup_counts — lookup() counts hits and misses.
+- evicts_lru — a full cache evicts the least recently used entry.
+- resize_evicts — shrinking evicts down to the new size.
+- zero_disables — size 0 keeps nothing but still counts.
+- clear_resets — clear() drops entries and statistics.
+- size_from_env — the env var gives the size; bad values use the default.
+"""
+
+import pytest
+
+import apathetic_utils.caching as amod_utils_caching
+
+
+SizedLRU = amod_utils_caching.ApatheticUtils_Internal_Caching.SizedLRU
+
+
+def test_sized_lru_lookup_counts() -> None:
+    """Present keys are hits, absent keys are misses."""
+    # --- setup ---
+    cache: SizedLRU[str, int] = SizedLRU(4)
+    cache.store("a", 1)
+
+    # --- execute ---
+    found = cache.lookup("a")
+    missing = cache.lookup("b")
+
+    # --- verify ---
+    assert (found, missing) == (1, None)
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 0)
+
+
+def test_sized_lru_evicts_lru() -> None:
+    """A full cache evicts the least recently used entry."""
+    # --- setup ---
+    cache: SizedLRU[str, int] = SizedLRU(2)
+
+    # --- execute ---
+    cache.store("a", 1)
+    cache.store("b", 2)
+    cache.lookup("a")  # refresh 'a'
+    cache.store("c", 3)  # evicts 'b'
+
+    # --- verify ---
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.evictions == 1
+
+
+def test_sized_lru_resize_evicts() -> None:
+    """Shrinking the cache immediately drops the oldest entries."""
+    # --- setup ---
+    cache: SizedLRU[int, int] = SizedLRU(10)
+    for i in range(10):
+        cache.store(i, i)
+
+    # --- execute ---
+    cache.resize(3)
+
+    # --- verify ---
+    assert cache.maxsize == 3  # noqa: PLR2004
+    assert list(cache.entries) == [7, 8, 9]
+    assert cache.evictions == 7  # noqa: PLR2004
+
+
+def test_sized_lru_zero_disables() -> None:
+    """With size 0 nothing is kept."""
+    # --- setup ---
+    cache: SizedLRU[str, int] = SizedLRU(0)
+
+    # --- execute ---
+    cache.store("a", 1)
+    found = cache.lookup("a")
+
+    # --- verify ---
+    assert found is None
+    assert not cache.entries
+    assert (cache.misses, cache.evictions) == (1, 1)
+
+
+def test_sized_lru_clear_resets() -> None:
+    """clear() drops every entry and zeroes the statistics."""
+    # --- setup ---
+    cache: SizedLRU[str, int] = SizedLRU(1)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    cache.lookup("b")
+    cache.lookup("a")
+
+    # --- execute ---
+    cache.clear()
+
+    # --- verify ---
+    assert not cache.entries
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("64", 64), (" 0 ", 0), ("", 512), ("lots", 512), ("-5", 512), ("²", 512)],
+)
+def test_sized_lru_size_from_env(
+    monkeypatch: pytest.MonkeyPatch, value: str, expected: int
+) -> None:
+    """The env var gives the size; bad values use the default."""
+    # --- setup ---
+    monkeypatch.setenv("APATHETIC_UTILS_TEST_CACHE_SIZE", value)
+
+    # --- execute ---
+    size = SizedLRU.size_from_env("APATHETIC_UTILS_TEST_CACHE_SIZE", 512)
+
+    # --- verify ---
+    assert size == expected
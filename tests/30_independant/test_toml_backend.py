@@ -0,0 +1,116 @@
+# tests/30_independant/test_toml_backend.py
+"""Tests for toml_backend / set_toml_backend (TOML module used by load_toml).
+
+Checklist:
+- default — tomllib on Python 3.11+.
+- resolved_once — later calls do not import again.
+- override_module — load_toml() parses with the module that was set.
+- override_by_name — a module name is imported.
+- reset — None looks the backend up again.
+- invalid_backend — unknown name or module without loads() is rejected.
+"""
+
+import sys
+import types
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import apathetic_utils as mod_autils
+
+
+@pytest.fixture(autouse=True)
+def fresh_toml_backend() -> Iterator[None]:
+    """Start each test unresolved, and leave no override behind."""
+    mod_autils.set_toml_backend(None)
+    yield
+    mod_autils.set_toml_backend(None)
+
+
+def _count_toml_imports(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record imports of tomllib / tomli from here on."""
+    calls: list[str] = []
+    real_import = __import__
+
+    def counting_import(name: str, *args: Any, **kwargs: Any) -> Any:
+        if name in ("tomllib", "tomli"):
+            calls.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.__import__", counting_import)
+    return calls
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="tomllib is 3.11+")
+def test_toml_backend_default() -> None:
+    # --- execute / verify ---
+    assert mod_autils.toml_backend() == "tomllib"
+
+
+def test_toml_backend_resolved_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # --- setup ---
+    path = tmp_path / "a.toml"
+    path.write_text("x = 1\n", encoding="utf-8")
+    calls = _count_toml_imports(monkeypatch)
+
+    # --- execute ---
+    for _ in range(3):
+        assert mod_autils.load_toml(path) == {"x": 1}
+    mod_autils.toml_backend()
+
+    # --- verify ---
+    assert 1 <= len(calls) <= 2  # noqa: PLR2004  # tomllib, or tomllib then tomli
+
+
+def test_toml_backend_override_module(tmp_path: Path) -> None:
+    # --- setup ---
+    path = tmp_path / "a.toml"
+    path.write_text("anything", encoding="utf-8")
+    fake = types.ModuleType("fake_toml")
+    fake.loads = lambda text: {"text": text}  # type: ignore[attr-defined]
+
+    # --- execute ---
+    mod_autils.set_toml_backend(fake)
+    result = mod_autils.load_toml(path)
+
+    # --- verify ---
+    assert mod_autils.toml_backend() == "fake_toml"
+    assert result == {"text": "anything"}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="tomllib is 3.11+")
+def test_toml_backend_override_by_name() -> None:
+    # --- execute ---
+    mod_autils.set_toml_backend("tomllib")
+
+    # --- verify ---
+    assert mod_autils.toml_backend() == "tomllib"
+
+
+def test_toml_backend_reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    # --- setup ---
+    fake = types.ModuleType("fake_toml")
+    fake.loads = dict  # type: ignore[attr-defined]
+    mod_autils.set_toml_backend(fake)
+    calls = _count_toml_imports(monkeypatch)
+
+    # --- execute ---
+    mod_autils.set_toml_backend(None)
+    name = mod_autils.toml_backend()
+
+    # --- verify ---
+    assert name in ("tomllib", "tomli", None)
+    assert name != "fake_toml"
+    assert calls
+
+
+def test_toml_backend_invalid_backend() -> None:
+    # --- execute and verify ---
+    with pytest.raises(ImportError):
+        mod_autils.set_toml_backend("no_such_toml_module_xyz")
+    with pytest.raises(TypeError, match="has no loads"):
+        mod_autils.set_toml_backend(types.ModuleType("not_toml"))
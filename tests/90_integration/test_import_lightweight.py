@@ -0,0 +1,57 @@
+# tests/90_integration/test_import_lightweight.py
+"""Integration test: importing apathetic_utils does not import test tooling.
+
+Production CLIs import apathetic_utils for helpers like load_jsonc(); the
+testing / runtime helpers must import pytest and unittest.mock only when
+they are used. The import runs in a fresh interpreter, from the same
+location as the module under test (src/, dist/apathetic_utils.py or
+dist/apathetic_utils.pyz), so it covers every runtime mode.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import apathetic_utils as mod_autils
+
+
+# Too slow to import for a CLI that does not need them
+_HEAVY_MODULES = ("pytest", "_pytest", "unittest.mock", "multiprocessing")
+
+_SCRIPT = f"""
+import json, sys
+import apathetic_utils
+print(json.dumps({{
+    "file": apathetic_utils.__file__,
+    "loaded": [m for m in {_HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def _import_root() -> str:
+    """Return the sys.path entry the module under test was imported from."""
+    module_file = Path(mod_autils.__file__)
+    if module_file.name == "__init__.py":
+        return str(module_file.parent.parent)  # package dir (also in a .pyz)
+    return str(module_file.parent)  # stitched single file
+
+
+def test_import_does_not_load_test_tooling() -> None:
+    # --- setup ---
+    env = {**os.environ, "PYTHONPATH": _import_root()}
+
+    # --- execute ---
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # --- verify ---
+    report = json.loads(result.stdout)
+    assert Path(report["file"]) == Path(mod_autils.__file__)
+    assert report["loaded"] == []
@@ -0,0 +1,93 @@
+# tests/95_benchmark/test_bench__fnmatchcase_portable.py
+"""Benchmarks for fnmatchcase_portable() string fast paths.
+
+Compares the current matcher against the previous regex-only implementation
+on a realistic exclude/include pattern mix. Run with:
+
+    pytest tests/95_benchmark/test_bench__fnmatchcase_portable.py \
+        --benchmark-group-by=group
+
+There is no fixed speedup assertion: on a warm cache both sides take well
+under a microsecond per call, so their ratio swings with machine noise. To
+catch regressions, compare against a saved run:
+
+    pytest tests/95_benchmark/test_bench__fnmatchcase_portable.py \
+        --benchmark-autosave
+    pytest tests/95_benchmark/test_bench__fnmatchcase_portable.py \
+        --benchmark-compare --benchmark-compare-fail=median:15%
+
+Checklist:
+- regex_only_baseline — previous implementation (always regex / fnmatchcase).
+- fast_paths — current implementation (literal / suffix / prefix first).
+"""
+
+from fnmatch import fnmatchcase
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+
+
+_PATTERNS = [
+    "**/__pycache__",
+    "*.pyc",
+    "**/*.egg-info",
+    "dist/**",
+    "build/**",
+    ".git/**",
+    "node_modules/**",
+    "*.so",
+    "setup.py",
+    "pyproject.toml",
+    "src/**/test_*.py",
+    "docs/*.md",
+]
+
+_PATHS = [
+    f"{top}/{sub}/{name}"
+    for top in ("src", "tests", "dist", "docs", ".git")
+    for sub in ("pkg", "pkg/sub", "__pycache__", "x.egg-info")
+    for name in ("mod.py", "mod.pyc", "test_mod.py", "README.md", "lib.so")
+] + ["setup.py", "pyproject.toml", "README.md"]
+
+
+def _baseline_fnmatchcase_portable(path: str, pattern: str) -> bool:
+    """Regex-only matcher as it was before the string fast paths."""
+    if "**" in pattern:
+        compiled = mod_autils.apathetic_utils._compile_glob_recursive(pattern)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        return bool(compiled.match(path))
+    return fnmatchcase(path, pattern)
+
+
+def _count_matches(match: object) -> int:
+    assert callable(match)
+    return sum(1 for path in _PATHS for pattern in _PATTERNS if match(path, pattern))
+
+
+@pytest.mark.slow
+def test_bench_fnmatchcase_portable_regex_only_baseline(
+    benchmark: BenchmarkFixture,
+) -> None:
+    """Previous implementation: every pattern goes through a regex."""
+    # --- setup ---
+    benchmark.group = "fnmatchcase_portable"
+
+    # --- execute ---
+    result = benchmark(_count_matches, _baseline_fnmatchcase_portable)
+
+    # --- verify ---
+    assert result == _count_matches(mod_autils.fnmatchcase_portable)
+
+
+@pytest.mark.slow
+def test_bench_fnmatchcase_portable_fast_paths(benchmark: BenchmarkFixture) -> None:
+    """Current implementation: simple patterns use string operations."""
+    # --- setup ---
+    benchmark.group = "fnmatchcase_portable"
+
+    # --- execute ---
+    result = benchmark(_count_matches, mod_autils.fnmatchcase_portable)
+
+    # --- verify ---
+    assert result == _count_matches(_baseline_fnmatchcase_portable)
@@ -0,0 +1,186 @@
+# tests/95_benchmark/test_bench__import_time.py
+r"""Benchmarks for the startup cost of `import apathetic_utils` per runtime mode.
+
+Each round starts a fresh interpreter (run_with_output) that imports the
+package from src/ (package), dist/apathetic_utils.py (stitched) or
+dist/apathetic_utils.pyz (zipapp). The latter two are built once per session
+from a copy of the project in a temporary directory, so the repository's own
+dist/ is left alone. The benchmark time is the wall clock of the whole
+subprocess; extra_info (shown with --benchmark-json) holds:
+
+- import_ms — median cumulative time of the `apathetic_utils` import,
+  parsed from `python -X importtime`
+- peak_rss_kib — largest peak RSS of the child (None on Windows)
+- rss_over_bare_kib — that peak minus a bare interpreter's
+
+There are no fixed budgets (absolute times depend on the machine); to catch
+regressions, compare against a saved run:
+
+    pytest tests/95_benchmark/test_bench__import_time.py --benchmark-autosave
+    pytest tests/95_benchmark/test_bench__import_time.py --benchmark-compare \
+        --benchmark-compare-fail=median:15%
+
+Checklist:
+- bare_interpreter — `python -c` without the import (baseline).
+- package — src/apathetic_utils.
+- stitched — dist/apathetic_utils.py.
+- zipapp — dist/apathetic_utils.pyz.
+"""
+
+import json
+import re
+import shutil
+import statistics
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+from tests.utils.constants import PROGRAM_PACKAGE, PROGRAM_SCRIPT, PROJ_ROOT
+
+
+_ROUNDS = 10
+
+# What the bundlers read (see .serger.jsonc and pyproject.toml)
+_BUILD_INPUTS = ("src", "pyproject.toml", ".serger.jsonc")
+
+_SCRIPT = """
+import json, sys
+{import_line}
+def peak_rss_kib():
+    # VmHWM is this process's own peak; ru_maxrss can include the peak of the
+    # parent it was forked from (Linux keeps it across exec)
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss // 1024 if sys.platform == "darwin" else maxrss
+print(json.dumps({{
+    "file": getattr(sys.modules.get("{package}"), "__file__", None),
+    "peak_rss_kib": peak_rss_kib(),
+}}))
+"""
+
+# Last `import time:` line for the package itself: self | cumulative | name
+_IMPORTTIME_LINE = re.compile(
+    rf"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+{PROGRAM_PACKAGE}$", re.MULTILINE
+)
+
+
+def _run_import(import_root: Path | None) -> dict[str, Any]:
+    """Import the package in a fresh interpreter; return what it reported."""
+    script = _SCRIPT.format(
+        import_line=f"import {PROGRAM_PACKAGE}" if import_root else "",
+        package=PROGRAM_PACKAGE,
+    )
+    env = {"PYTHONPATH": str(import_root)} if import_root else None
+    result = mod_autils.run_with_output(
+        [sys.executable, "-X", "importtime", "-c", script],
+        env=env,
+        forward_to=None,
+        check=True,
+    )
+    report: dict[str, Any] = json.loads(result.stdout)
+    matches = _IMPORTTIME_LINE.findall(result.stderr)
+    report["import_us"] = int(matches[-1]) if matches else None
+    return report
+
+
+def _bench_imports(
+    benchmark: BenchmarkFixture, import_root: Path | None
+) -> list[dict[str, Any]]:
+    """Benchmark _ROUNDS cold imports; return every round's report."""
+    reports: list[dict[str, Any]] = []
+
+    def run() -> None:
+        reports.append(_run_import(import_root))
+
+    benchmark.group = "import_time"
+    benchmark.pedantic(run, rounds=_ROUNDS)  # type: ignore[no-untyped-call]
+    return reports
+
+
+def _peak_rss(reports: list[dict[str, Any]]) -> int | None:
+    values = [r["peak_rss_kib"] for r in reports if r["peak_rss_kib"] is not None]
+    return max(values) if values else None
+
+
+@pytest.fixture(scope="module")
+def bare_rss_kib() -> int | None:
+    """Peak RSS of an interpreter that imports nothing."""
+    return _peak_rss([_run_import(None) for _ in range(3)])
+
+
+@pytest.fixture(scope="module")
+def import_roots(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """sys.path entry to import the package from, per runtime mode."""
+    # Build from a copy, so the benchmark never writes into the repo's dist/
+    build_root = tmp_path_factory.mktemp("import_time")
+    for name in _BUILD_INPUTS:
+        source = PROJ_ROOT / name
+        if source.is_dir():
+            shutil.copytree(
+                source,
+                build_root / name,
+                ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+            )
+        else:
+            shutil.copy2(source, build_root / name)
+    return {
+        "package": PROJ_ROOT / "src",
+        "stitched": mod_autils.ensure_stitched_script_up_to_date(
+            root=build_root, package_name=PROGRAM_PACKAGE, script_name=PROGRAM_SCRIPT
+        ).parent,
+        "zipapp": mod_autils.ensure_zipapp_up_to_date(
+            root=build_root, package_name=PROGRAM_PACKAGE, script_name=PROGRAM_SCRIPT
+        ),
+    }
+
+
+@pytest.mark.slow
+def test_bench_import_time_bare_interpreter(benchmark: BenchmarkFixture) -> None:
+    """Baseline: interpreter startup alone."""
+    # --- execute ---
+    reports = _bench_imports(benchmark, None)
+
+    # --- verify ---
+    assert all(r["file"] is None for r in reports)
+    benchmark.extra_info["peak_rss_kib"] = _peak_rss(reports)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["package", "stitched", "zipapp"])
+def test_bench_import_time(
+    benchmark: BenchmarkFixture,
+    import_roots: dict[str, Path],
+    bare_rss_kib: int | None,
+    mode: str,
+) -> None:
+    """Cold `import apathetic_utils` from one runtime mode's build."""
+    # --- setup ---
+    import_root = import_roots[mode]
+
+    # --- execute ---
+    reports = _bench_imports(benchmark, import_root)
+
+    # --- verify ---
+    # Imported from the build under test, not an installed copy
+    assert all(str(r["file"]).startswith(str(import_root)) for r in reports)
+
+    import_ms = statistics.median(r["import_us"] for r in reports) / 1000
+    peak_rss = _peak_rss(reports)
+    benchmark.extra_info["import_ms"] = round(import_ms, 2)
+    benchmark.extra_info["peak_rss_kib"] = peak_rss
+    if peak_rss is not None and bare_rss_kib is not None:
+        benchmark.extra_info["rss_over_bare_kib"] = peak_rss - bare_rss_kib
@@ -0,0 +1,110 @@
+# tests/95_benchmark/test_bench__iter_included_files.py
+"""Benchmarks for iter_included_files() against rglob + is_excluded_raw.
+
+The tree mimics a project with large excluded directories (node_modules,
+.git, __pycache__) next to the sources that are actually wanted.
+
+Checklist:
+- rglob_baseline — walk everything, then filter each file.
+- sequential — pruning scandir walk.
+- parallel — pruning scandir walk with a thread pool.
+"""
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+
+
+_INCLUDES = ["**/*.py"]
+_EXCLUDES = ["node_modules/", ".git/**", "**/__pycache__/**", "dist/*"]
+
+
+@pytest.fixture(scope="module")
+def project_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("bench_walk")
+    for i in range(10):
+        for j in range(10):
+            pkg = root / "src" / f"pkg{i}" / f"sub{j}"
+            pkg.mkdir(parents=True)
+            (pkg / "mod.py").touch()
+            (pkg / "__pycache__").mkdir()
+            (pkg / "__pycache__" / "mod.cpython-311.pyc").touch()
+    for i in range(200):
+        lib = root / "node_modules" / f"lib{i}"
+        lib.mkdir(parents=True)
+        for name in ("index.js", "setup.py", "README.md"):
+            (lib / name).touch()
+    for i in range(100):
+        obj = root / ".git" / "objects" / f"{i:02x}"
+        obj.mkdir(parents=True)
+        (obj / "blob").touch()
+    return root
+
+
+def _rglob_baseline(root: Path) -> list[Path]:
+    return [
+        f
+        for f in sorted(root.rglob("*"))
+        if f.is_file()
+        and any(
+            mod_autils.fnmatchcase_portable(f.relative_to(root).as_posix(), p)
+            for p in _INCLUDES
+        )
+        and not mod_autils.is_excluded_raw(f, _EXCLUDES, root)
+    ]
+
+
+@pytest.mark.slow
+def test_bench_iter_included_files_rglob_baseline(
+    benchmark: BenchmarkFixture, project_tree: Path
+) -> None:
+    """Previous approach: rglob the whole tree and filter every file."""
+    # --- setup ---
+    benchmark.group = "iter_included_files"
+
+    # --- execute ---
+    result = benchmark(_rglob_baseline, project_tree)
+
+    # --- verify ---
+    assert len(result) == 100  # noqa: PLR2004
+
+
+@pytest.mark.slow
+def test_bench_iter_included_files_sequential(
+    benchmark: BenchmarkFixture, project_tree: Path
+) -> None:
+    """Pruning walk, one thread."""
+    # --- setup ---
+    benchmark.group = "iter_included_files"
+
+    # --- execute ---
+    result = benchmark(
+        lambda: list(mod_autils.iter_included_files(project_tree, _INCLUDES, _EXCLUDES))
+    )
+
+    # --- verify ---
+    assert result == _rglob_baseline(project_tree)
+
+
+@pytest.mark.slow
+def test_bench_iter_included_files_parallel(
+    benchmark: BenchmarkFixture, project_tree: Path
+) -> None:
+    """Pruning walk, scandir fanned out over a thread pool."""
+    # --- setup ---
+    benchmark.group = "iter_included_files"
+
+    # --- execute ---
+    result = benchmark(
+        lambda: list(
+            mod_autils.iter_included_files(
+                project_tree, _INCLUDES, _EXCLUDES, workers=8
+            )
+        )
+    )
+
+    # --- verify ---
+    assert result == _rglob_baseline(project_tree)
@@ -0,0 +1,111 @@
+# tests/95_benchmark/test_bench__iter_jsonc_items.py
+"""Benchmarks for iter_jsonc_items() against load_jsonc() on a 10 MB file.
+
+Both read the same generated manifest: a root array of small objects with
+line and block comments and trailing commas. Peak traced allocations are
+stored in each benchmark's extra_info (shown with --benchmark-json). Run with:
+
+    pytest tests/95_benchmark --benchmark-group-by=group
+
+Checklist:
+- load_jsonc — whole document in memory (bytes, text and parsed result).
+- stream — iter_jsonc_items(), one chunk and its items at a time.
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+
+
+_TARGET_SIZE = 10 * 1024 * 1024
+_ROUNDS = 3
+
+_ENTRY = """  // entry {i}
+  {{"name": "item_{i}", "url": "https://example.com/{i}", /* c */
+    "tags": ["a", "b",], "n": {i}}},
+"""
+
+
+def _load_all(path: Path) -> int:
+    result = mod_autils.load_jsonc(path)
+    assert isinstance(result, list)
+    return len(result)
+
+
+def _stream_all(path: Path) -> int:
+    return sum(1 for _ in mod_autils.iter_jsonc_items(path))
+
+
+def _peak_bytes(func: Callable[[Path], int], path: Path) -> int:
+    tracemalloc.start()
+    try:
+        func(path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture(scope="module")
+def manifest(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, int]:
+    """Write a ~10 MB JSONC array; return its path and item count."""
+    parts = ["[\n"]
+    size = 0
+    i = 0
+    while size < _TARGET_SIZE:
+        entry = _ENTRY.format(i=i)
+        parts.append(entry)
+        size += len(entry)
+        i += 1
+    parts.append("]\n")
+    path = tmp_path_factory.mktemp("jsonc") / "manifest.jsonc"
+    path.write_text("".join(parts), encoding="utf-8")
+    return path, i
+
+
+@pytest.mark.slow
+def test_bench_iter_jsonc_items_load_jsonc(
+    benchmark: BenchmarkFixture, manifest: tuple[Path, int]
+) -> None:
+    """Baseline: load_jsonc() of the whole file."""
+    # --- setup ---
+    benchmark.group = "iter_jsonc_items"
+    path, count = manifest
+
+    # --- execute ---
+    result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        _load_all, args=(path,), rounds=_ROUNDS
+    )
+
+    # --- verify ---
+    assert result == count
+    benchmark.extra_info["peak_bytes"] = _peak_bytes(_load_all, path)
+
+
+@pytest.mark.slow
+# Tracing every allocation of ~100k streamed items alone can take a minute
+@pytest.mark.timeout(300)
+def test_bench_iter_jsonc_items_stream(
+    benchmark: BenchmarkFixture, manifest: tuple[Path, int]
+) -> None:
+    """Streaming: iter_jsonc_items() over the same file."""
+    # --- setup ---
+    benchmark.group = "iter_jsonc_items"
+    path, count = manifest
+
+    # --- execute ---
+    result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        _stream_all, args=(path,), rounds=_ROUNDS
+    )
+
+    # --- verify ---
+    assert result == count
+    peak = _peak_bytes(_stream_all, path)
+    benchmark.extra_info["peak_bytes"] = peak
+    # A few chunks (buffer, blanked batch, its text and items), not the file
+    chunk_size = mod_autils.apathetic_utils.DEFAULT_JSONC_CHUNK_SIZE
+    assert peak < 16 * chunk_size
@@ -0,0 +1,138 @@
+# tests/95_benchmark/test_bench__load_jsonc.py
+"""Benchmarks for load_jsonc() on a 10 MB JSONC file.
+
+Compares the current load (comments and trailing commas blanked in place by
+_blank_jsonc(), then one decode) against the previous pipeline (regex
+tokenizer stripping comments into a new string, a second regex pass for
+trailing commas, then a trim) on a generated config with line, hash and
+block comments, URLs and escaped strings. Run with:
+
+    pytest tests/95_benchmark --benchmark-group-by=group
+
+The speedup test also times both sides in the same run (best of several
+rounds) and asserts the current load is not slower than the pipeline.
+
+Checklist:
+- regex_strip_baseline — previous load: strip, remove commas, trim, decode.
+- blank_in_place — current load_jsonc().
+- speedup — load_jsonc() at least as fast as the previous pipeline.
+"""
+
+import json
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+
+
+_TARGET_SIZE = 10 * 1024 * 1024
+_ROUNDS = 3
+
+_ENTRY = """  // entry {i}
+  "item_{i}": {{
+    "url": "https://example.com/{i}?q=a//b", # trailing hash comment
+    "path": "C:\\\\tools\\\\bin", /* inline block */ "n": {i},
+    "tags": ["a", "b", "c"], /* multi
+       line block */
+  }},
+"""
+
+# The previous comment stripper: a run of code, a line comment (keeping its
+# newline), or a block comment
+_BASELINE_STRING = r"""["'](?:[^"'\\]+|\\\\["']?|\\[^\\]|\\\Z)*(?:["']|\Z)"""
+_BASELINE_TOKEN = re.compile(
+    rf"""(?P<code>(?:[^"'/\#]+|{_BASELINE_STRING}|/(?![/*])|(?<=:)/(?=/))+)"""
+    r"""|(?:(?<!:)//|\#)[^\n]*(?P<newline>\n)?"""
+    r"""|/\*(?:[^*]*(?:\*(?!/)[^*]*)*\*/|(?:[\s\S]*(?=[\s\S]))?)"""
+)
+
+
+def _baseline_load_jsonc(path: Path) -> object:
+    """load_jsonc() as it was before blanking (three copies of the text)."""
+    parts: list[str] = []
+    for match in _BASELINE_TOKEN.finditer(path.read_text(encoding="utf-8")):
+        kind = match.lastgroup
+        if kind == "code":
+            parts.append(match.group())
+        elif kind == "newline":
+            parts.append("\n")
+    text = re.sub(r",(?=\s*[}\]])", "", "".join(parts)).strip()
+    return json.loads(text)
+
+
+def _best_time(func: Callable[[Path], object], path: Path) -> float:
+    """Return the fastest of _ROUNDS calls, least affected by noise."""
+    times: list[float] = []
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        func(path)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.fixture(scope="module")
+def jsonc_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a ~10 MB JSONC document with a mix of comments and strings."""
+    parts = ["{\n"]
+    size = 0
+    i = 0
+    while size < _TARGET_SIZE:
+        entry = _ENTRY.format(i=i)
+        parts.append(entry)
+        size += len(entry)
+        i += 1
+    parts.append('  "last": true\n}\n')
+    path = tmp_path_factory.mktemp("jsonc") / "big.jsonc"
+    path.write_text("".join(parts), encoding="utf-8")
+    return path
+
+
+@pytest.mark.slow
+def test_bench_load_jsonc_regex_strip_baseline(
+    benchmark: BenchmarkFixture, jsonc_file: Path
+) -> None:
+    """Previous load_jsonc(): stripped copy, comma-free copy, trimmed copy."""
+    # --- setup ---
+    benchmark.group = "load_jsonc"
+
+    # --- execute ---
+    result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        _baseline_load_jsonc, args=(jsonc_file,), rounds=_ROUNDS
+    )
+
+    # --- verify ---
+    assert result == mod_autils.load_jsonc(jsonc_file)
+
+
+@pytest.mark.slow
+def test_bench_load_jsonc_blank_in_place(
+    benchmark: BenchmarkFixture, jsonc_file: Path
+) -> None:
+    """Current load_jsonc(): blanked in place, decoded once."""
+    # --- setup ---
+    benchmark.group = "load_jsonc"
+
+    # --- execute ---
+    result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        mod_autils.load_jsonc, args=(jsonc_file,), rounds=_ROUNDS
+    )
+
+    # --- verify ---
+    assert isinstance(result, dict)
+    assert result["last"] is True
+
+
+@pytest.mark.slow
+def test_bench_load_jsonc_speedup(jsonc_file: Path) -> None:
+    """load_jsonc() is at least as fast as the previous pipeline."""
+    # --- execute ---
+    baseline = _best_time(_baseline_load_jsonc, jsonc_file)
+    current = _best_time(mod_autils.load_jsonc, jsonc_file)
+
+    # --- verify ---
+    assert current <= baseline, (current, baseline)
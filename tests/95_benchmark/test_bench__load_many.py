@@ -0,0 +1,111 @@
+# tests/95_benchmark/test_bench__load_many.py
+"""Benchmarks for load_many() on 400 generated TOML files.
+
+Each file is a small pyproject-style table (~6 KB), so the time is mostly
+tomllib parsing. Run with:
+
+    pytest tests/95_benchmark --benchmark-group-by=group
+
+Checklist:
+- sequential — one file after another (workers=None).
+- threads — thread pool; reads overlap, parsing is serialized by the GIL.
+- processes — process pool; parsing runs in parallel.
+"""
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+
+
+_FILE_COUNT = 400
+_WORKERS = 4
+_ROUNDS = 3
+
+_SECTION = """
+[tool.section_{j}]
+name = "section-{j}"
+enabled = true
+values = [1, 2, 3, 4, 5, 6, 7, 8]
+paths = ["src/{i}/a", "src/{i}/b", "tests/{i}"]
+options = {{ level = {j}, mode = "fast", tags = ["x", "y"] }}
+"""
+
+
+@pytest.fixture(scope="module")
+def toml_files(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    """Write the TOML files; return their paths."""
+    root = tmp_path_factory.mktemp("load_many")
+    paths: list[Path] = []
+    for i in range(_FILE_COUNT):
+        text = f'[project]\nname = "pkg-{i}"\n' + "".join(
+            _SECTION.format(i=i, j=j) for j in range(25)
+        )
+        path = root / f"pkg_{i}.toml"
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _check(results: list[mod_autils.LoadedFile]) -> None:
+    assert len(results) == _FILE_COUNT
+    assert all(r.ok for r in results)
+
+
+@pytest.mark.slow
+def test_bench_load_many_sequential(
+    benchmark: BenchmarkFixture, toml_files: list[Path]
+) -> None:
+    """Baseline: no pool."""
+    # --- setup ---
+    benchmark.group = "load_many"
+
+    # --- execute ---
+    results = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        mod_autils.load_many, args=(toml_files,), rounds=_ROUNDS
+    )
+
+    # --- verify ---
+    _check(results)
+
+
+@pytest.mark.slow
+def test_bench_load_many_threads(
+    benchmark: BenchmarkFixture, toml_files: list[Path]
+) -> None:
+    """Thread pool of _WORKERS threads."""
+    # --- setup ---
+    benchmark.group = "load_many"
+
+    # --- execute ---
+    results = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        mod_autils.load_many,
+        args=(toml_files,),
+        kwargs={"workers": _WORKERS},
+        rounds=_ROUNDS,
+    )
+
+    # --- verify ---
+    _check(results)
+
+
+@pytest.mark.slow
+def test_bench_load_many_processes(
+    benchmark: BenchmarkFixture, toml_files: list[Path]
+) -> None:
+    """Process pool of _WORKERS processes (includes pool startup)."""
+    # --- setup ---
+    benchmark.group = "load_many"
+
+    # --- execute ---
+    results = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        mod_autils.load_many,
+        args=(toml_files,),
+        kwargs={"workers": _WORKERS, "processes": True},
+        rounds=_ROUNDS,
+    )
+
+    # --- verify ---
+    _check(results)
@@ -0,0 +1,156 @@
+# tests/95_benchmark/test_bench__parse_cache.py
+"""Benchmarks for repeated load_toml() / load_jsonc() calls on one file.
+
+Compares re-reading and re-parsing a config file on every call (the default)
+with cache=True, where an unchanged file costs a stat() and an unpickle, and
+with an on-disk cache as seen by a fresh process (empty in-memory cache).
+Run with:
+
+    pytest tests/95_benchmark --benchmark-group-by=group
+
+Checklist:
+- toml_uncached / toml_cached — a pyproject.toml-sized TOML file.
+- toml_disk — cold in-memory cache, record found in the cache directory.
+- jsonc_uncached / jsonc_cached — a commented JSONC config.
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+
+
+_OLD_NS = 1_000_000_000_000_000_000
+
+_TOML_SECTION = """
+[tool.section{i}]
+name = "section-{i}"
+enabled = true
+paths = ["src/pkg{i}", "tests/pkg{i}", "docs/pkg{i}"]
+options = {{ level = {i}, mode = "strict", tags = ["a", "b"] }}
+"""
+
+_JSONC_ENTRY = """  // entry {i}
+  "item_{i}": {{"url": "https://example.com/{i}", "tags": ["a", "b"],}},
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clean_parse_cache() -> Iterator[None]:
+    directory = mod_autils.parse_cache_info().directory
+    mod_autils.clear_parse_cache()
+    yield
+    mod_autils.set_parse_cache_dir(directory)
+    mod_autils.clear_parse_cache()
+
+
+def _settled(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(_OLD_NS, _OLD_NS))
+    return path
+
+
+@pytest.fixture
+def toml_file(tmp_path: Path) -> Path:
+    """A ~15 KB TOML file, about the size of a real pyproject.toml."""
+    text = "".join(_TOML_SECTION.format(i=i) for i in range(80))
+    return _settled(tmp_path / "pyproject.toml", text)
+
+
+@pytest.fixture
+def jsonc_file(tmp_path: Path) -> Path:
+    """A ~15 KB JSONC config with comments and trailing commas."""
+    body = "".join(_JSONC_ENTRY.format(i=i) for i in range(200))
+    return _settled(tmp_path / ".serger.jsonc", "{\n" + body + "}\n")
+
+
+@pytest.mark.slow
+def test_bench_parse_cache_toml_uncached(
+    benchmark: BenchmarkFixture, toml_file: Path
+) -> None:
+    """Default: read and parse on every call."""
+    # --- setup ---
+    benchmark.group = "parse_cache_toml"
+
+    # --- execute ---
+    result = benchmark(mod_autils.load_toml, toml_file)
+
+    # --- verify ---
+    assert result is not None
+    assert mod_autils.parse_cache_info().misses == 0
+
+
+@pytest.mark.slow
+def test_bench_parse_cache_toml_cached(
+    benchmark: BenchmarkFixture, toml_file: Path
+) -> None:
+    """cache=True: stat() and unpickle after the first call."""
+    # --- setup ---
+    benchmark.group = "parse_cache_toml"
+
+    # --- execute ---
+    result = benchmark(mod_autils.load_toml, toml_file, cache=True)
+
+    # --- verify ---
+    assert result == mod_autils.load_toml(toml_file)
+    assert mod_autils.parse_cache_info().misses == 1
+
+
+@pytest.mark.slow
+def test_bench_parse_cache_toml_disk(
+    benchmark: BenchmarkFixture, toml_file: Path, tmp_path: Path
+) -> None:
+    """cache=True in a new process: read, hash and unpickle the record."""
+    # --- setup ---
+    benchmark.group = "parse_cache_toml"
+    mod_autils.set_parse_cache_dir(tmp_path / "cache")
+    mod_autils.load_toml(toml_file, cache=True)
+
+    # --- execute ---
+    result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        mod_autils.load_toml,
+        args=(toml_file,),
+        kwargs={"cache": True},
+        setup=mod_autils.clear_parse_cache,
+        rounds=200,
+    )
+
+    # --- verify ---
+    assert result == mod_autils.load_toml(toml_file)
+    assert mod_autils.parse_cache_info().disk_hits == 1
+
+
+@pytest.mark.slow
+def test_bench_parse_cache_jsonc_uncached(
+    benchmark: BenchmarkFixture, jsonc_file: Path
+) -> None:
+    """Default: read, blank and parse on every call."""
+    # --- setup ---
+    benchmark.group = "parse_cache_jsonc"
+
+    # --- execute ---
+    result = benchmark(mod_autils.load_jsonc, jsonc_file)
+
+    # --- verify ---
+    assert isinstance(result, dict)
+    assert mod_autils.parse_cache_info().misses == 0
+
+
+@pytest.mark.slow
+def test_bench_parse_cache_jsonc_cached(
+    benchmark: BenchmarkFixture, jsonc_file: Path
+) -> None:
+    """cache=True: stat() and unpickle after the first call."""
+    # --- setup ---
+    benchmark.group = "parse_cache_jsonc"
+
+    # --- execute ---
+    result = benchmark(mod_autils.load_jsonc, jsonc_file, cache=True)
+
+    # --- verify ---
+    assert result == mod_autils.load_jsonc(jsonc_file)
+    assert mod_autils.parse_cache_info().misses == 1
@@ -0,0 +1,177 @@
+# tests/95_benchmark/test_bench__trace_guard.py
+"""Benchmarks for trace-logging overhead with TRACE disabled.
+
+Compares the previous per-call logging pattern (getLogger() on every call and
+f-string trace messages built inside the pattern loop) against the cached
+logger plus is_trace_enabled() guard, at the default INFO level. Run with:
+
+    pytest tests/95_benchmark --benchmark-group-by=group
+
+The speedup tests also time both sides in the same run (best of several
+rounds, with timeit) and assert a conservative ratio, well below the 3-10x
+measured, so they only fail if the guard stops paying off.
+
+Checklist:
+- per_call_baseline — getLogger() per call, unguarded f-string traces.
+- per_call_guarded — get_logger() per call, traces behind is_trace_enabled().
+- normalize_baseline — normalize_path_string() as it was before the guard.
+- normalize_current — current normalize_path_string().
+- per_call_speedup — guarded pattern at most half the baseline's time.
+- normalize_speedup — current normalize at most half the baseline's time.
+"""
+
+import re
+import timeit
+from collections.abc import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_utils as mod_autils
+
+
+_PATTERNS = [f"dir{i}/**/*.py" for i in range(20)]
+_REL = "src/pkg/module.py"
+_PATH_STRINGS = [
+    "src/pkg/module.py",
+    "src\\pkg\\module.py",
+    "./tests/unit/test_x.py",
+    "docs/guide/index.md",
+    "file:///tmp/data.json",
+] * 20
+
+# Guarded / baseline time ratio the speedup tests allow
+_MAX_RATIO = 0.5
+
+_get_logger_uncached = mod_autils.apathetic_utils.get_logger.__globals__["getLogger"]
+
+
+def _per_call_baseline() -> int:
+    """One is_excluded_raw()-style call, logging as before the guard."""
+    logger = _get_logger_uncached()
+    logger.trace(f"[is_excluded_raw] Checking path={_REL} against {len(_PATTERNS)}")
+    tested = 0
+    for pattern in _PATTERNS:
+        logger.trace(f"[is_excluded_raw] Testing pattern {pattern!r} against {_REL}")
+        tested += 1
+    return tested
+
+
+def _per_call_guarded() -> int:
+    """One is_excluded_raw()-style call, logging as it does now."""
+    logger = mod_autils.apathetic_utils.get_logger()
+    trace = mod_autils.apathetic_utils.is_trace_enabled()
+    if trace:
+        logger.trace("[is_excluded_raw] Checking path=%s", _REL)
+    tested = 0
+    for pattern in _PATTERNS:
+        if trace:
+            logger.trace("[is_excluded_raw] Testing pattern %r", pattern)
+        tested += 1
+    return tested
+
+
+def _baseline_normalize_path_string(raw: str) -> str:
+    """normalize_path_string() as it was before the guard (logging elided)."""
+    _get_logger_uncached()
+    if not raw:
+        return ""
+    path = raw.strip()
+    if "\\ " in path:
+        path = path.replace("\\ ", " ")
+    path = path.replace("\\", "/")
+    return re.sub(r"(?<!:)//+", "/", path)
+
+
+def _normalize_all(normalize: object) -> list[str]:
+    assert callable(normalize)
+    return [normalize(s) for s in _PATH_STRINGS]
+
+
+def _best_time(func: Callable[[], object], *, number: int = 200) -> float:
+    """Return the fastest of several timeit rounds, least affected by noise."""
+    return min(timeit.repeat(func, number=number, repeat=7))
+
+
+@pytest.fixture(autouse=True)
+def _trace_off() -> None:
+    """Benchmarks measure the common case: TRACE disabled."""
+    mod_autils.apathetic_utils.get_logger().setLevel("INFO")
+
+
+@pytest.mark.slow
+def test_bench_trace_guard_per_call_baseline(benchmark: BenchmarkFixture) -> None:
+    """Previous pattern: logger lookup and message formatting every call."""
+    # --- setup ---
+    benchmark.group = "trace_guard"
+
+    # --- execute ---
+    result = benchmark(_per_call_baseline)
+
+    # --- verify ---
+    assert result == len(_PATTERNS)
+
+
+@pytest.mark.slow
+def test_bench_trace_guard_per_call_guarded(benchmark: BenchmarkFixture) -> None:
+    """Current pattern: cached logger, no formatting when TRACE is off."""
+    # --- setup ---
+    benchmark.group = "trace_guard"
+
+    # --- execute ---
+    result = benchmark(_per_call_guarded)
+
+    # --- verify ---
+    assert result == len(_PATTERNS)
+
+
+@pytest.mark.slow
+def test_bench_trace_guard_normalize_baseline(benchmark: BenchmarkFixture) -> None:
+    """Previous normalize_path_string(): getLogger() and a regex every call."""
+    # --- setup ---
+    benchmark.group = "normalize_path_string"
+
+    # --- execute ---
+    result = benchmark(_normalize_all, _baseline_normalize_path_string)
+
+    # --- verify ---
+    assert result == _normalize_all(mod_autils.normalize_path_string)
+
+
+@pytest.mark.slow
+def test_bench_trace_guard_normalize_current(benchmark: BenchmarkFixture) -> None:
+    """Current normalize_path_string()."""
+    # --- setup ---
+    benchmark.group = "normalize_path_string"
+
+    # --- execute ---
+    result = benchmark(_normalize_all, mod_autils.normalize_path_string)
+
+    # --- verify ---
+    assert result == _normalize_all(_baseline_normalize_path_string)
+
+
+@pytest.mark.slow
+def test_bench_trace_guard_per_call_speedup() -> None:
+    """The guarded pattern is clearly faster than the baseline."""
+    # --- execute ---
+    baseline = _best_time(_per_call_baseline)
+    guarded = _best_time(_per_call_guarded)
+
+    # --- verify ---
+    assert guarded < baseline * _MAX_RATIO, (guarded, baseline)
+
+
+@pytest.mark.slow
+def test_bench_trace_guard_normalize_speedup() -> None:
+    """The current normalize_path_string() is clearly faster than the baseline."""
+    # --- execute ---
+    baseline = _best_time(
+        lambda: _normalize_all(_baseline_normalize_path_string), number=20
+    )
+    current = _best_time(
+        lambda: _normalize_all(mod_autils.normalize_path_string), number=20
+    )
+
+    # --- verify ---
+    assert current < baseline * _MAX_RATIO, (current, baseline)